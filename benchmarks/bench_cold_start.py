@@ -0,0 +1,73 @@
+"""Time from process start to the first response, with and without LAZY_ROUTES.
+
+Usage:
+    DATABASE_URL=... python -m benchmarks.bench_cold_start [--runs 5] [--path /schools/]
+
+Each run starts uvicorn on a free port and polls `/` and then `--path` until they answer.
+"""
+
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+
+import httpx
+
+
+def free_port() -> int:
+    """An unused local TCP port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for(client: httpx.Client, path: str, start: float, timeout: float = 60) -> float:
+    """Poll `path` until it answers; returns seconds since `start`."""
+    while time.perf_counter() - start < timeout:
+        try:
+            client.get(path)
+            return time.perf_counter() - start
+        except httpx.TransportError:
+            time.sleep(0.005)
+    raise TimeoutError(path)
+
+
+def run_once(lazy: bool, path: str) -> Tuple[float, float]:
+    """Seconds to the first `/` response and to the first `path` response."""
+    port = free_port()
+    env = dict(os.environ, LAZY_ROUTES=str(lazy).lower())
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.api.main:app", "--port", str(port)],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=60) as client:
+            index = wait_for(client, "/", start)
+            route = wait_for(client, path, start)
+    finally:
+        process.terminate()
+        process.wait()
+    return index, route
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--path", default="/schools/")
+    args = parser.parse_args()
+
+    for lazy in (False, True):
+        results: List[Tuple[float, float]] = [run_once(lazy, args.path) for _ in range(args.runs)]
+        index = statistics.median(result[0] for result in results)
+        route = statistics.median(result[1] for result in results)
+        print(
+            f"LAZY_ROUTES={str(lazy).lower():<5}  first /: {index * 1000:6.0f} ms  "
+            f"first {args.path}: {route * 1000:6.0f} ms"
+        )
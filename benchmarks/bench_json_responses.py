@@ -0,0 +1,78 @@
+"""Benchmark rendering a payment list with the stdlib JSONResponse and FastJSONResponse.
+
+Usage:
+    python -m benchmarks.bench_json_responses [rows]
+"""
+
+import sys
+import time
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from typing import List
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from src.api.responses import FastJSONResponse
+from src.models.payments import PaymentPublic
+
+
+def payments(count: int) -> List[PaymentPublic]:
+    """Build a list of payments with Decimal amounts, UUID ids and datetimes."""
+    now = datetime.now()
+    school_id = uuid.uuid4()
+    return [
+        PaymentPublic(
+            id=uuid.uuid4(),
+            student_id=uuid.uuid4(),
+            school_id=school_id,
+            total_amount=Decimal("150.00"),
+            school_amount=Decimal("120.00"),
+            admin_amount=Decimal("30.00"),
+            payment_status="completed",
+            payment_method="momo",
+            transaction_reference=f"ref-{n:08d}",
+            paid_at=now,
+            created_at=now,
+            updated_at=now,
+        )
+        for n in range(count)
+    ]
+
+
+def run(label: str, function, repeat: int = 5) -> float:
+    """Time `function`, best of `repeat`, and print the result."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        body = function()
+        timings.append(time.perf_counter() - start)
+    elapsed = min(timings)
+    print(f"{label:<44} {elapsed * 1000:>8.1f} ms  {len(body) / 1024:>8.0f} KiB")
+    return elapsed
+
+
+def main(count: int) -> None:
+    """Render the same list through each path."""
+    rows = payments(count)
+    # What FastAPI hands the response class for `response_model=List[PaymentPublic]`.
+    content = TypeAdapter(List[PaymentPublic]).dump_python(rows, mode="json")
+    # Plain dicts, as a route returning rows without a response model would.
+    raw = [row.model_dump() for row in rows]
+
+    print(f"{count} payments")
+    stdlib = run("JSONResponse (response_model content)", lambda: JSONResponse(content).body)
+    fast = run("FastJSONResponse (response_model content)", lambda: FastJSONResponse(content).body)
+    print(f"{'speedup':<44} {stdlib / fast:>8.1f}x\n")
+    stdlib = run("JSONResponse(jsonable_encoder(raw))", lambda: JSONResponse(jsonable_encoder(raw)).body)
+    fast = run("FastJSONResponse(raw)", lambda: FastJSONResponse(raw).body)
+    print(f"{'speedup':<44} {stdlib / fast:>8.1f}x")
+
+    sample = FastJSONResponse(raw[:1]).body.decode()
+    assert '"total_amount":"150.00"' in sample, sample
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -0,0 +1,137 @@
+"""Benchmark request throughput with no logging, the old logging and the queued JSON logging.
+
+Requests go straight into the ASGI app, with no server or client, so the cost of logging is
+not hidden behind network time. Each request also writes one application log line. Logs go
+to a temporary file rather than the terminal.
+
+- old: the previous `@app.middleware("http")` logger (two lines per request) and a
+  StreamHandler that formats and writes on the event loop
+- queued: AccessLogMiddleware and the queue handler, every request logged
+- queued, sampled: the same with LOG_ACCESS_SAMPLE_RATE=0.1
+
+Usage:
+    python -m benchmarks.bench_logging [requests]
+"""
+
+import asyncio
+import logging
+import sys
+import tempfile
+import time
+from typing import Callable, Optional
+
+from fastapi import FastAPI, Request
+
+from src.api.access_log import AccessLogMiddleware
+from src.core.logs import JsonFormatter, LogQueueHandler
+
+app_logger = logging.getLogger("app")
+request_logger = logging.getLogger("request")
+
+
+def build_app(middleware: Optional[str], sample_rate: float = 1.0) -> FastAPI:
+    """A small JSON endpoint behind the given logging middleware."""
+    app = FastAPI()
+
+    @app.get("/schools/{school_id}")
+    async def get_school(school_id: str) -> dict:
+        app_logger.info(f"Fetched school {school_id}")
+        return {"id": school_id, "name": "Accra Academy", "region": "Greater Accra"}
+
+    if middleware == "old":
+
+        @app.middleware("http")
+        async def log_requests(request: Request, call_next: Callable):
+            request_logger.info(
+                f"Incoming request: {request.method} {request.url.path} from {request.client.host}"
+            )
+            response = await call_next(request)
+            request_logger.info(f"Response: {response.status_code}")
+            return response
+
+    elif middleware == "queued":
+        app.add_middleware(AccessLogMiddleware, sample_rate=sample_rate, slow_ms=1000)
+    return app
+
+
+async def drive(app: FastAPI, count: int) -> float:
+    """Send `count` GET requests through the ASGI interface and return the seconds taken."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/schools/5f0e1c1e",
+        "raw_path": b"/schools/5f0e1c1e",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict) -> None:
+        if message["type"] == "http.response.start":
+            assert message["status"] == 200
+
+    for _ in range(200):
+        await app(dict(scope), receive, send)
+    start = time.perf_counter()
+    for _ in range(count):
+        await app(dict(scope), receive, send)
+    return time.perf_counter() - start
+
+
+def use_handler(handler: Optional[logging.Handler]) -> None:
+    """Make `handler` the only root handler, or disable logging when it is None."""
+    root = logging.getLogger()
+    for existing in root.handlers[:]:
+        root.removeHandler(existing)
+    if handler is None:
+        root.setLevel(logging.CRITICAL + 1)
+    else:
+        root.addHandler(handler)
+        root.setLevel(logging.INFO)
+
+
+def main(count: int) -> None:
+    """Run every setup, best of 3, and print requests per second."""
+    log_file = tempfile.NamedTemporaryFile("w", suffix=".log", delete=False)
+    # setup_logging() turns off caller, thread and process lookups for every record;
+    # the old setup had them on.
+    collect = (logging._srcfile, logging.logThreads, logging.logProcesses)
+    sync_handler = logging.StreamHandler(log_file)
+    sync_handler.setFormatter(JsonFormatter())
+    queue_handler = LogQueueHandler(log_file, JsonFormatter())
+
+    setups = [
+        ("no logging", build_app(None), None),
+        ("old middleware, sync handler", build_app("old"), sync_handler),
+        ("access log, queue handler", build_app("queued"), queue_handler),
+        ("access log 10%, queue handler", build_app("queued", 0.1), queue_handler),
+    ]
+    print(f"{count} requests per run, logs in {log_file.name}")
+    baseline = None
+    for label, app, handler in setups:
+        use_handler(handler)
+        if handler is queue_handler:
+            logging._srcfile, logging.logThreads, logging.logProcesses = None, False, False
+            queue_handler.start()
+        else:
+            logging._srcfile, logging.logThreads, logging.logProcesses = collect
+        best = min(asyncio.run(drive(app, count)) for _ in range(3))
+        if handler is queue_handler:
+            queue_handler.stop()
+        rate = count / best
+        baseline = baseline or rate
+        print(f"{label:<32} {rate:>8,.0f} req/s  {best / count * 1e6:>6.0f} us/req  {rate / baseline:>5.0%}")
+    use_handler(None)
+    log_file.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,75 @@
+"""Benchmark Ghana phone number validation + normalization, phonenumbers/geocoder vs the cached pipeline.
+
+Usage:
+    python -m benchmarks.bench_phone_numbers [count] [distinct]
+
+Numbers are drawn from `distinct` subscribers (default 200000) in mixed formats, with a few invalid.
+"""
+
+import random
+import sys
+import time
+from typing import Callable, List, Optional
+
+import phonenumbers
+from phonenumbers import geocoder
+
+from src.utils.phone_numbers import parse_ghana_number
+
+PREFIXES = ["24", "54", "55", "59", "53", "20", "50", "26", "27", "56", "57", "30"]
+FORMATS = ["0{}", "+233{}", "233{}", "0{} ", "{}"]
+
+
+def numbers(count: int, distinct: int) -> List[str]:
+    """Random Ghana numbers in the formats parents type."""
+    rng = random.Random(7)
+    pool = [
+        rng.choice(FORMATS).format(rng.choice(PREFIXES) + f"{rng.randint(0, 9_999_999):07d}")
+        for _ in range(distinct)
+    ]
+    return [rng.choice(pool) for _ in range(count)]
+
+
+def baseline(phone_number: str) -> Optional[str]:
+    """The old per-call path: parse, validate, geocode, then format separately."""
+    try:
+        parsed = phonenumbers.parse(phone_number, "GH")
+    except phonenumbers.NumberParseException:
+        return None
+    if not phonenumbers.is_valid_number(parsed):
+        return None
+    if geocoder.description_for_number(parsed, "en") != "Ghana":
+        return None
+    return phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
+
+
+def pipeline(phone_number: str) -> Optional[str]:
+    """The cached fast-path pipeline."""
+    parsed = parse_ghana_number(phone_number)
+    return parsed.e164 if parsed else None
+
+
+def run(name: str, function: Callable[[str], Optional[str]], values: List[str]) -> float:
+    """Time one pass over `values`."""
+    start = time.perf_counter()
+    for value in values:
+        function(value)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<10} {elapsed:7.2f} s  {elapsed / len(values) * 1e6:6.2f} us/number")
+    return elapsed
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    distinct = int(sys.argv[2]) if len(sys.argv) > 2 else 200_000
+    values = numbers(count, distinct)
+
+    sample = values[:20_000]
+    # The pipeline only accepts mobile numbers; the old check let some landlines through.
+    mismatches = [value for value in sample if baseline(value) != pipeline(value)]
+    print(f"{len(mismatches)} differences in {len(sample)} numbers {mismatches[:5]}")
+    parse_ghana_number.cache_clear()
+
+    slow = run("baseline", baseline, values)
+    fast = run("pipeline", pipeline, values)
+    print(f"speedup    {slow / fast:7.1f}x  cache {parse_ghana_number.cache_info()}")
@@ -0,0 +1,95 @@
+"""Benchmark building models from database rows: full validation against the row mapper.
+
+Usage:
+    python -m benchmarks.bench_row_mapping [rows]
+"""
+
+import sys
+import time
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
+from src.db.mappers import map_rows
+from src.models.payments import PaymentInDb
+from src.models.schools import SchoolInDb
+
+
+def payment_rows(count: int, native_ids: bool = False) -> list:
+    """Rows shaped like asyncpg returns them for the payments table.
+
+    Ids are text in the current schema; `native_ids` gives the UUID objects
+    asyncpg returns for uuid columns.
+    """
+    new_id = uuid.uuid4 if native_ids else (lambda: str(uuid.uuid4()))
+    now = datetime.now()
+    school_id = new_id()
+    return [
+        {
+            "id": new_id(),
+            "student_id": new_id(),
+            "school_id": school_id,
+            "total_amount": Decimal("150.00"),
+            "school_amount": Decimal("120.00"),
+            "admin_amount": Decimal("30.00"),
+            "payment_status": "completed",
+            "payment_method": "momo",
+            "transaction_reference": f"ref-{n:08d}",
+            "paid_at": now,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for n in range(count)
+    ]
+
+
+def school_rows(count: int, sqlite: bool = True) -> list:
+    """Rows shaped like sqlite returns them for the schools table, or like asyncpg does."""
+    now = datetime.now().isoformat(sep=" ") if sqlite else datetime.now()
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "name": f"School {n}",
+            "location": "Accra",
+            "registration_fee": 100,
+            "created_at": now,
+            "updated_at": now,
+            "is_deleted": 0 if sqlite else False,
+        }
+        for n in range(count)
+    ]
+
+
+def run(label: str, function, rows: list, repeat: int = 3) -> float:
+    """Time `function` over the rows, best of `repeat`, and print throughput."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(rows)
+        timings.append(time.perf_counter() - start)
+    elapsed = min(timings)
+    print(f"{label:<34} {len(rows) / elapsed:>12.0f} rows/s  {elapsed:>7.3f}s")
+    return elapsed
+
+
+def main(count: int) -> None:
+    """Compare both paths on postgres-shaped payment rows and school rows from both drivers.
+
+    sqlite rows are validated by `map_rows` too, so that case shows no gain.
+    """
+    cases = (
+        ("payments, text ids", PaymentInDb, payment_rows(count)),
+        ("payments, uuid ids", PaymentInDb, payment_rows(count, native_ids=True)),
+        ("schools, postgres", SchoolInDb, school_rows(count, sqlite=False)),
+        ("schools, sqlite", SchoolInDb, school_rows(count)),
+    )
+    for title, model, rows in cases:
+        assert map_rows(model, rows[:1])[0] == model(**rows[0])
+        print(f"{title} ({len(rows)} rows)")
+        validated = run(f"{model.__name__}(**row)", lambda rs: [model(**r) for r in rs], rows)
+        mapped = run(f"map_rows({model.__name__})", lambda rs: map_rows(model, rs), rows)
+        print(f"{'speedup':<34} {validated / mapped:>12.1f}x\n")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
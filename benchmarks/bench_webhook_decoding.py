@@ -0,0 +1,155 @@
+"""Benchmark decoding a signed charge.success webhook the old way and with the typed decoder.
+
+The old path parsed the body twice (request.body() for the signature, then request.json()),
+built SuccessfulTransaction from the dict and rebuilt the custom fields with a scan.
+
+Usage:
+    python -m benchmarks.bench_webhook_decoding [events]
+"""
+
+import hashlib
+import hmac
+import json
+import sys
+import time
+from decimal import Decimal
+from uuid import UUID, uuid4
+
+from src.core.config import PAYSTACK_SECRET_KEY
+from src.models.paystack.transaction import (
+    ADMIN_AMOUNT_FIELD,
+    AMOUNT_PAID_FIELD,
+    SCHOOL_ID_FIELD,
+    SuccessfulTransaction,
+)
+from src.models.paystack.webhook import ChargeSuccessEvent
+from src.services.paystack_webhook import decode_webhook_event, verify_webhook_signature
+
+
+def charge_success_body() -> bytes:
+    """A charge.success body shaped like Paystack's, with the fields a USSD charge carries."""
+    fields = [
+        ("School name", "Accra Academy"),
+        ("Student name", "Ama Mensah"),
+        ("School ID", str(uuid4())),
+        ("Amount paid", 150.0),
+        ("School amount", 120.0),
+        ("Admin amount", 30.0),
+        ("Network provider", "MTN"),
+        ("Phone Number", "+233241234567"),
+    ]
+    event = {
+        "event": "charge.success",
+        "data": {
+            "id": 302961,
+            "domain": "live",
+            "status": "success",
+            "reference": "qTPrJoy9Bx",
+            "amount": 15000,
+            "message": None,
+            "gateway_response": "Approved by Financial Institution",
+            "paid_at": "2026-10-19T12:30:56.000Z",
+            "created_at": "2026-10-19T12:26:44.000Z",
+            "channel": "mobile_money",
+            "currency": "GHS",
+            "ip_address": "41.242.49.37",
+            "metadata": {
+                "custom_fields": [
+                    {"display_name": name, "variable_name": name, "value": value}
+                    for name, value in fields
+                ]
+            },
+            "log": None,
+            "fees": 295,
+            "customer": {
+                "id": 68324,
+                "first_name": None,
+                "last_name": None,
+                "email": "QuiverTech1@gmail.com",
+                "customer_code": "CUS_qo38as2hpsgk2r0",
+                "phone": None,
+                "metadata": None,
+                "risk_action": "default",
+            },
+            "authorization": {
+                "authorization_code": "AUTH_f5rnfq9p",
+                "bin": "055XXX",
+                "last4": "X567",
+                "channel": "mobile_money",
+                "bank": "MTN",
+                "country_code": "GH",
+                "reusable": False,
+                "mobile_money_number": "0241234567",
+                "account_name": None,
+            },
+            "plan": {},
+        },
+    }
+    return json.dumps(event).encode()
+
+
+def sign(body: bytes) -> str:
+    """The x-paystack-signature Paystack would send."""
+    return hmac.new(PAYSTACK_SECRET_KEY.encode(), msg=body, digestmod=hashlib.sha512).hexdigest()
+
+
+def decode_old(body: bytes, signature: str) -> tuple:
+    """The previous route: compare the digest, parse twice, build the model, scan the fields."""
+    computed = hmac.new(PAYSTACK_SECRET_KEY.encode(), msg=body, digestmod=hashlib.sha512).hexdigest()
+    assert computed == signature
+    json.loads(body)  # request.body() was read for the signature; request.json() parsed it again
+    event = json.loads(body)
+    data = event["data"]
+    for field in data["metadata"]["custom_fields"]:
+        # SuccessfulTransaction rejects numeric field values, so the old route needed them as text.
+        field["value"] = str(field["value"])
+    transaction = SuccessfulTransaction(**data)
+    custom_fields = {
+        field.variable_name: field.value for field in transaction.metadata.custom_fields
+    }
+    return (
+        UUID(custom_fields[SCHOOL_ID_FIELD]),
+        Decimal(custom_fields[AMOUNT_PAID_FIELD]),
+        Decimal(custom_fields[ADMIN_AMOUNT_FIELD]),
+    )
+
+
+def decode_new(body: bytes, signature: str) -> tuple:
+    """The typed decoder."""
+    assert verify_webhook_signature(body, signature)
+    event = decode_webhook_event(body)
+    assert isinstance(event, ChargeSuccessEvent)
+    custom_fields = event.data.metadata.fields
+    return (
+        UUID(custom_fields[SCHOOL_ID_FIELD]),
+        Decimal(custom_fields[AMOUNT_PAID_FIELD]),
+        Decimal(custom_fields[ADMIN_AMOUNT_FIELD]),
+    )
+
+
+def run(label: str, function, body: bytes, signature: str, count: int) -> float:
+    """Decode the body `count` times, best of 3, and print events per second."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(count):
+            function(body, signature)
+        best = min(best, time.perf_counter() - start)
+    rate = count / best
+    print(f"{label:<36} {rate:>10,.0f} events/s  {best / count * 1e6:>7.1f} us/event")
+    return rate
+
+
+def main(count: int) -> None:
+    """Decode the same signed body through both paths."""
+    body = charge_success_body()
+    signature = sign(body)
+    assert decode_old(body, signature) == decode_new(body, signature)
+    print(f"{len(body)} byte charge.success body, {count} events")
+    old = run("json.loads x2 + model + field scan", decode_old, body, signature, count)
+    new = run("typed single-parse decoder", decode_new, body, signature, count)
+    print(f"{'speedup':<36} {new / old:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
@@ -0,0 +1,82 @@
+"""Closed-loop load test of POST /paystack/ussd against a running server.
+
+Usage:
+    python -m benchmarks.load_ussd [--url http://127.0.0.1:8080] [--concurrency 64] [--duration 20]
+
+Run the app with PAYSTACK_BASE_URL pointing at benchmarks.stub_paystack.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from typing import List
+
+import httpx
+
+
+def payload() -> dict:
+    """A USSD payment request for a random phone number."""
+    return {
+        "phone_number": f"024{random.randint(0, 9_999_999):07d}",
+        "school_name": "Achimota School",
+        "school_id": str(uuid.uuid4()),
+        "student_name": "Kofi Mensah",
+        "amount": "150.00",
+        "network_provider": "MTN",
+    }
+
+
+async def client_loop(
+    client: httpx.AsyncClient, deadline: float, latencies: List[float], errors: List[int]
+) -> None:
+    """Send requests back to back until the deadline."""
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            response = await client.post("/paystack/ussd", json=payload())
+            if response.status_code != 200:
+                errors.append(response.status_code)
+                continue
+        except httpx.HTTPError:
+            errors.append(0)
+            continue
+        latencies.append(time.perf_counter() - start)
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def main(url: str, concurrency: int, duration: float) -> None:
+    """Run the load test and print throughput and latency percentiles."""
+    latencies: List[float] = []
+    errors: List[int] = []
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=30) as client:
+        deadline = time.perf_counter() + duration
+        await asyncio.gather(
+            *(client_loop(client, deadline, latencies, errors) for _ in range(concurrency))
+        )
+    if not latencies:
+        print(f"no successful requests, {len(errors)} errors")
+        return
+    print(
+        f"{len(latencies) / duration:8.1f} req/s  "
+        f"p50 {percentile(latencies, 0.5) * 1000:6.1f} ms  "
+        f"p95 {percentile(latencies, 0.95) * 1000:6.1f} ms  "
+        f"p99 {percentile(latencies, 0.99) * 1000:6.1f} ms  "
+        f"errors {len(errors)}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://127.0.0.1:8080")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.url, args.concurrency, args.duration))
@@ -0,0 +1,55 @@
+"""Import-time breakdown of the app, from `python -X importtime`.
+
+Usage:
+    python -m benchmarks.profile_imports [module] [--top 25]
+
+Prints self time per top-level package and cumulative time per project module.
+"""
+
+import argparse
+import collections
+import re
+import subprocess
+import sys
+from typing import Dict, Tuple
+
+LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+
+def profile(module: str) -> Tuple[Dict[str, int], Dict[str, int], int]:
+    """Import `module` in a fresh interpreter; returns per-package self, per-module cumulative and total us."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    packages: Dict[str, int] = collections.Counter()
+    modules: Dict[str, int] = {}
+    total = 0
+    for line in result.stderr.splitlines():
+        match = LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        packages[name.split(".")[0]] += int(self_us)
+        if name.startswith("src."):
+            modules[name] = int(cumulative_us)
+        if not indent:
+            total += int(cumulative_us)
+    return packages, modules, total
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("module", nargs="?", default="src.api.main")
+    parser.add_argument("--top", type=int, default=25)
+    args = parser.parse_args()
+
+    packages, modules, total = profile(args.module)
+    print(f"import {args.module}: {total / 1000:.1f} ms\n\nself time by package")
+    for name, us in collections.Counter(packages).most_common(args.top):
+        print(f"{us / 1000:8.1f} ms  {name}")
+    print("\ncumulative time by project module")
+    for name, us in sorted(modules.items(), key=lambda item: -item[1])[: args.top]:
+        print(f"{us / 1000:8.1f} ms  {name}")
@@ -0,0 +1,191 @@
+"""Stub of the Paystack charge, verify, bank and transfer APIs for load tests.
+
+Usage:
+    STUB_LATENCY_MS=150 uvicorn benchmarks.stub_paystack:app --port 9100
+
+Point the app at it with PAYSTACK_BASE_URL=http://127.0.0.1:9100/.
+"""
+
+import asyncio
+import os
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+LATENCY = int(os.environ.get("STUB_LATENCY_MS", "150")) / 1000
+# Status reported for every transaction verification; "not_found" answers as Paystack does
+# for an unknown reference.
+VERIFY_STATUS = os.environ.get("STUB_VERIFY_STATUS", "success")
+
+
+async def charge(request: Request) -> JSONResponse:
+    """Accept a mobile money charge after a simulated upstream delay."""
+    payload = await request.json()
+    await asyncio.sleep(LATENCY)
+    return JSONResponse(
+        {
+            "status": True,
+            "message": "Charge attempted",
+            "data": {
+                "reference": payload["reference"],
+                "status": "send_otp",
+                "display_text": "Please send the OTP",
+            },
+        }
+    )
+
+
+async def submit_otp(request: Request) -> JSONResponse:
+    """Accept any OTP."""
+    payload = await request.json()
+    await asyncio.sleep(LATENCY)
+    return JSONResponse(
+        {
+            "status": True,
+            "message": "Charge attempted",
+            "data": {"reference": payload["reference"], "status": "success"},
+        }
+    )
+
+
+async def verify_transaction(request: Request) -> JSONResponse:
+    """Report every transaction with STUB_VERIFY_STATUS."""
+    await asyncio.sleep(LATENCY)
+    if VERIFY_STATUS == "not_found":
+        return JSONResponse(
+            {"status": False, "message": "Transaction reference not found"}, status_code=400
+        )
+    return JSONResponse(
+        {
+            "status": True,
+            "message": "Verification successful",
+            "data": {
+                "id": 4099260516,
+                "reference": request.path_params["reference"],
+                "status": VERIFY_STATUS,
+            },
+        }
+    )
+
+
+async def list_banks(request: Request) -> JSONResponse:
+    """Two banks in whatever country and currency were asked for."""
+    await asyncio.sleep(LATENCY)
+    country = request.query_params.get("country", "ghana")
+    currency = request.query_params.get("currency", "GHS")
+    banks = [
+        (1, "GCB Bank Limited", "gcb-bank", "040100"),
+        (2, "Ecobank Ghana Limited", "ecobank-ghana", "130100"),
+    ]
+    return JSONResponse(
+        {
+            "status": True,
+            "message": "Banks retrieved",
+            "data": [
+                {
+                    "id": bank_id,
+                    "name": name,
+                    "slug": slug,
+                    "code": code,
+                    "active": True,
+                    "is_deleted": False,
+                    "country": country.title(),
+                    "currency": currency,
+                    "type": "ghipss",
+                }
+                for bank_id, name, slug, code in banks
+            ],
+        }
+    )
+
+
+async def resolve_account(request: Request) -> JSONResponse:
+    """Resolve any account number except all zeros."""
+    await asyncio.sleep(LATENCY)
+    account_number = request.query_params.get("account_number", "")
+    if not account_number.strip("0"):
+        return JSONResponse(
+            {"status": False, "message": "Could not resolve account name. Check parameters or try again."},
+            status_code=422,
+        )
+    return JSONResponse(
+        {
+            "status": True,
+            "message": "Account number resolved",
+            "data": {"account_number": account_number, "account_name": "ACHIMOTO SCHOOL", "bank_id": 1},
+        }
+    )
+
+
+async def create_transfer_recipient(request: Request) -> JSONResponse:
+    """Create a recipient whose code is derived from the account, as Paystack reuses them."""
+    payload = await request.json()
+    await asyncio.sleep(LATENCY)
+    return JSONResponse(
+        {
+            "status": True,
+            "message": "Transfer recipient created successfully",
+            "data": {
+                "domain": "test",
+                "type": payload["type"],
+                "currency": payload.get("currency", "GHS"),
+                "name": payload["name"],
+                "details": {
+                    "account_number": payload["account_number"],
+                    "account_name": payload["name"].upper(),
+                    "bank_code": payload["bank_code"],
+                    "bank_name": "GCB Bank Limited",
+                    "authorization_code": None,
+                },
+                "recipient_code": f"RCP_{payload['bank_code']}{payload['account_number']}",
+                "active": True,
+                "id": 1,
+                "integration": 1,
+                "createdAt": "2026-01-01T00:00:00.000Z",
+                "updatedAt": "2026-01-01T00:00:00.000Z",
+            },
+        },
+        status_code=201,
+    )
+
+
+async def transfer(request: Request) -> JSONResponse:
+    """Queue any transfer."""
+    payload = await request.json()
+    await asyncio.sleep(LATENCY)
+    return JSONResponse(
+        {
+            "status": True,
+            "message": "Transfer has been queued",
+            "data": {
+                "reference": payload["reference"],
+                "integration": 1,
+                "domain": "test",
+                "amount": payload["amount"],
+                "currency": "GHS",
+                "source": "balance",
+                "reason": payload.get("reason", ""),
+                "recipient": 1,
+                "status": "pending",
+                "transfer_code": "TRF_stub",
+                "id": 1,
+                "createdAt": "2026-01-01T00:00:00.000Z",
+                "updatedAt": "2026-01-01T00:00:00.000Z",
+            },
+        }
+    )
+
+
+app = Starlette(
+    routes=[
+        Route("/charge", charge, methods=["POST"]),
+        Route("/charge/submit_otp", submit_otp, methods=["POST"]),
+        Route("/transaction/verify/{reference}", verify_transaction, methods=["GET"]),
+        Route("/bank", list_banks, methods=["GET"]),
+        Route("/bank/resolve", resolve_account, methods=["GET"]),
+        Route("/transferrecipient", create_transfer_recipient, methods=["POST"]),
+        Route("/transfer", transfer, methods=["POST"]),
+    ]
+)
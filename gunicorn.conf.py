@@ -0,0 +1,42 @@
+"""Gunicorn server profile; every setting is read from the environment in src.core.config."""
+
+from src.core.config import (
+    SERVER_BIND,
+    SERVER_GRACEFUL_TIMEOUT,
+    SERVER_KEEPALIVE,
+    SERVER_MAX_REQUESTS,
+    SERVER_MAX_REQUESTS_JITTER,
+    SERVER_PRELOAD,
+    SERVER_TIMEOUT,
+    SERVER_WORKER_CLASS,
+    WEB_CONCURRENCY,
+    WORKER_MEMORY_MB,
+)
+from src.core.server import worker_count
+
+bind = SERVER_BIND
+workers = worker_count(WEB_CONCURRENCY, WORKER_MEMORY_MB)
+worker_class = SERVER_WORKER_CLASS
+
+timeout = SERVER_TIMEOUT
+graceful_timeout = SERVER_GRACEFUL_TIMEOUT
+keepalive = SERVER_KEEPALIVE
+
+max_requests = SERVER_MAX_REQUESTS
+max_requests_jitter = SERVER_MAX_REQUESTS_JITTER
+
+# Import the app once in the master so workers fork with it already loaded. Database
+# pools are still opened per worker, in the startup handler.
+preload_app = SERVER_PRELOAD
+
+# Worker heartbeats go to memory instead of a possibly slow container filesystem.
+worker_tmp_dir = "/dev/shm"
+
+# Access logs are written, sampled, by the app (src/api/access_log.py).
+accesslog = None
+errorlog = "-"
+
+
+def when_ready(server) -> None:  # noqa
+    """Log the effective worker setup once the master is ready."""
+    server.log.info(f"Serving with {workers} {worker_class} workers on {bind}")
@@ -3,4 +3,5 @@
 
 alembic upgrade head
 
-gunicorn -w 1 -k uvicorn.workers.UvicornWorker src.api.main:app --bind 0.0.0.0:8080
\ No newline at end of file
+# Workers, timeouts and recycling are configured in gunicorn.conf.py from env vars.
+gunicorn -c gunicorn.conf.py src.api.main:app
\ No newline at end of file
@@ -0,0 +1,89 @@
+"""Per-request correlation ids and sampled access logs."""
+
+import logging
+import random
+import re
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.logs import correlation_id
+
+request_logger = logging.getLogger("request")
+
+REQUEST_ID_HEADER = "X-Request-ID"
+
+# Ids from the client (or a proxy in front of us) are reused only if they look like ids.
+_VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9._:-]{1,128}$")
+
+# Probes answer 503 while the worker warms up or a pool is down; that is their job, not an error.
+PROBE_PATHS = frozenset({"/healthz", "/readyz"})
+
+
+class AccessLogMiddleware:
+    """Tag each request with a correlation id and log a sample of completed requests.
+
+    The id comes from the `X-Request-ID` request header or is generated, is returned in the
+    same response header and is attached to every log record written while handling the
+    request. Server errors and slow requests are always logged; other requests are logged
+    with probability `sample_rate`. A 503 from a health probe is sampled and logged as info.
+    """
+
+    def __init__(self, app: ASGIApp, sample_rate: float = 1.0, slow_ms: float = 1000) -> None:
+        """Initialize the middleware."""
+        self.app = app
+        self.sample_rate = sample_rate
+        self.slow_ms = slow_ms
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run the request with its correlation id set and log it once it is answered."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")
+                break
+        if request_id is None or not _VALID_REQUEST_ID.match(request_id):
+            # Not uuid4: os.urandom is a syscall per request, and the id needs no secrecy.
+            # `random` is reseeded in each forked worker, so workers do not repeat ids.
+            request_id = f"{random.getrandbits(128):032x}"
+        token = correlation_id.set(request_id)
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = request_id
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            failed = status_code >= 500 and not (
+                status_code == 503 and scope["path"] in PROBE_PATHS
+            )
+            if failed or elapsed_ms >= self.slow_ms or random.random() < self.sample_rate:
+                self._log(scope, status_code, elapsed_ms, failed)
+            correlation_id.reset(token)
+
+    def _log(self, scope: Scope, status_code: int, elapsed_ms: float, failed: bool) -> None:
+        """Write the access log record; at error level when the request failed."""
+        client = scope.get("client")
+        level = logging.ERROR if failed else logging.INFO
+        request_logger.log(
+            level,
+            f"{scope['method']} {scope['path']} {status_code} {elapsed_ms:.1f} ms",
+            extra={
+                "method": scope["method"],
+                "path": scope["path"],
+                "status": status_code,
+                "duration_ms": round(elapsed_ms, 2),
+                "client": client[0] if client else None,
+            },
+        )
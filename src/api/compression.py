@@ -0,0 +1,181 @@
+"""Brotli/gzip response compression."""
+
+import zlib
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available.
+    brotli = None
+
+# Suffixes added to strong ETags of compressed representations.
+ETAG_ENCODING_SUFFIXES = ("-br", "-gzip")
+
+
+class _GzipCompressor:
+    """Streaming gzip compressor."""
+
+    def __init__(self, level: int) -> None:
+        """Create a gzip stream."""
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk."""
+        return self._compressor.compress(data)
+
+    def finish(self) -> bytes:
+        """Flush the rest of the stream."""
+        return self._compressor.flush()
+
+
+class _BrotliCompressor:
+    """Streaming brotli compressor."""
+
+    def __init__(self, quality: int) -> None:
+        """Create a brotli stream."""
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk."""
+        return self._compressor.process(data)
+
+    def finish(self) -> bytes:
+        """Flush the rest of the stream."""
+        return self._compressor.finish()
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick brotli or gzip from an Accept-Encoding header."""
+    accepted = {
+        part.split(";")[0].strip().lower()
+        for part in accept_encoding.split(",")
+        if not part.replace(" ", "").endswith("q=0")
+    }
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+class CompressionMiddleware:
+    """Compress responses above a size threshold with brotli or gzip."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1000,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ) -> None:
+        """Initialize the middleware."""
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Wrap `send` when the client accepts a supported encoding."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        encoding = choose_encoding(headers.get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        # A client revalidating its compressed copy gets the matching ETag back on 304.
+        revalidating = f'-{encoding}"' in headers.get("if-none-match", "")
+        responder = _CompressionResponder(self, encoding, send, revalidating)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """Buffers the response start until it knows whether to compress the body."""
+
+    def __init__(
+        self,
+        middleware: CompressionMiddleware,
+        encoding: str,
+        send: Send,
+        revalidating: bool = False,
+    ) -> None:
+        """Initialize for one response."""
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self.revalidating = revalidating
+        self.start: Message = {}
+        self.compressor = None
+        self.passthrough = False
+
+    def _new_compressor(self) -> object:
+        """Create the compressor for the chosen encoding."""
+        if self.encoding == "br":
+            return _BrotliCompressor(self.middleware.brotli_quality)
+        return _GzipCompressor(self.middleware.gzip_level)
+
+    def _suffix_etag(self, headers: MutableHeaders) -> None:
+        """A compressed body is a different representation, so it gets its own strong ETag."""
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/") and etag.endswith('"'):
+            headers["ETag"] = f'{etag[:-1]}-{self.encoding}"'
+
+    def _set_headers(self, length: Optional[int]) -> None:
+        """Mark the response as compressed."""
+        headers = MutableHeaders(raw=self.start["headers"])
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if length is None:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(length)
+        self._suffix_etag(headers)
+
+    async def send(self, message: Message) -> None:
+        """Compress the body messages of the response."""
+        if message["type"] == "http.response.start":
+            self.start = message
+            self.passthrough = "content-encoding" in Headers(raw=message["headers"])
+            if message["status"] == 304:
+                self.passthrough = True
+                if self.revalidating:
+                    self._suffix_etag(MutableHeaders(raw=message["headers"]))
+            return
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+        if self.passthrough:
+            if self.start:
+                await self._send(self.start)
+                self.start = {}
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.compressor is None:
+            if not more_body and len(body) < self.middleware.minimum_size:
+                self.passthrough = True
+                await self.send(message)
+                return
+            self.compressor = self._new_compressor()
+            if more_body:
+                self._set_headers(None)
+                message["body"] = self.compressor.compress(body)
+            else:
+                body = self.compressor.compress(body) + self.compressor.finish()
+                self._set_headers(len(body))
+                message["body"] = body
+            await self._send(self.start)
+            await self._send(message)
+            return
+
+        chunk = self.compressor.compress(body)
+        if not more_body:
+            chunk += self.compressor.finish()
+        message["body"] = chunk
+        await self._send(message)
@@ -12,6 +12,7 @@ from fastapi import Depends
 from starlette.requests import Request
 
 from src.db.repositories.base import BaseRepository
+from src.db.router import DatabaseRouter
 
 app_logger = logging.getLogger("app")
 
@@ -21,11 +22,27 @@ def get_database(request: Request) -> Database:
     return request.app.state._db
 
 
+def get_database_router(request: Request) -> Union[Database, DatabaseRouter]:
+    """Get the request's database router, or the primary when no replica is set up.
+
+    The router is shared by every repository in the request so a write made by
+    one repository keeps the following reads on the primary.
+    """
+    replica = getattr(request.app.state, "_replica_db", None)
+    if replica is None:
+        return get_database(request)
+    router = getattr(request.state, "db_router", None)
+    if router is None:
+        router = DatabaseRouter(get_database(request), replica)
+        request.state.db_router = router
+    return router
+
+
 def get_repository(repo_type: Union[Type[BaseRepository], BaseRepository]) -> Callable:
     """Dependency for db."""
 
     def get_repo(
-        db: Database = Depends(get_database),
+        db: Union[Database, DatabaseRouter] = Depends(get_database_router),
     ) -> Type[BaseRepository]:
         return repo_type(db)  # type: ignore
 
@@ -0,0 +1,48 @@
+"""Conditional GET support for list endpoints."""
+
+import hashlib
+from typing import Any, Mapping
+
+from fastapi import Request, Response, status
+
+from src.api.compression import ETAG_ENCODING_SUFFIXES
+
+
+def compute_etag(resource: str, version: Mapping[str, Any]) -> str:
+    """Strong ETag for a list from its version marker (row count and max updated_at)."""
+    marker = f"{resource}:{version['count']}:{version['last_updated']}"
+    return f'"{hashlib.sha1(marker.encode()).hexdigest()}"'
+
+
+def _normalize(tag: str) -> str:
+    """Drop the weak prefix and the compression suffix from an entity tag."""
+    tag = tag.strip()
+    if tag.startswith("W/"):
+        tag = tag[2:]
+    for suffix in ETAG_ENCODING_SUFFIXES:
+        if tag.endswith(f'{suffix}"'):
+            return f'{tag[: -len(suffix) - 1]}"'
+    return tag
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check the request's If-None-Match header against an ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(_normalize(tag) == etag for tag in if_none_match.split(","))
+
+
+def set_etag(response: Response, etag: str) -> None:
+    """Attach the ETag and ask clients to revalidate before reusing the list."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+
+
+def not_modified(etag: str) -> Response:
+    """Empty 304 response for an unchanged list."""
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_etag(response, etag)
+    return response
@@ -14,8 +14,11 @@ def setup_exception_handlers(app: FastAPI) -> None:
     async def paystack_exception_handler(
         request: Request, exc: PaystackError
     ) -> JSONResponse:
+        retry_after = getattr(exc, "retry_after", None)
         return JSONResponse(
-            status_code=exc.status_code, content={"detail": exc.message}
+            status_code=exc.status_code,
+            content={"detail": exc.message},
+            headers={"Retry-After": str(retry_after)} if retry_after else None,
         )
 
     @app.exception_handler(CoreError)
@@ -0,0 +1,117 @@
+"""Deferred import of the API routers, so a cold worker can answer health checks right away."""
+
+import asyncio
+import importlib
+import logging
+import threading
+import time
+from typing import Awaitable, Callable, Iterable, Optional, Set, Tuple
+
+from fastapi import APIRouter, FastAPI
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+app_logger = logging.getLogger("app")
+
+# (module, router attribute, prefix, tags) in include order.
+ROUTERS: Tuple[Tuple[str, str, str, list], ...] = (
+    ("src.api.routes.crud_router", "crud_router", "/crud", ["CRUD"]),
+    ("src.api.routes.schools", "school_router", "/schools", ["Schools"]),
+    ("src.api.routes.paystack", "paystack_router", "/paystack", ["Paystack"]),
+    ("src.api.routes.users", "users_router", "/users", ["users"]),
+    ("src.api.routes.payment", "payment_router", "/payment", ["payment"]),
+    ("src.api.routes.role", "role_router", "/role", ["role"]),
+    ("src.api.routes.schools_wallet", "school_wallet_router", "/school_wallet", ["school_wallet"]),
+    ("src.api.routes.schools", "school_router", "/school_router", ["school_router"]),
+    ("src.api.routes.settings", "settings_router", "/settings", ["settings"]),
+    ("src.api.routes.students", "student_router", "/student", ["student"]),
+    (
+        "src.api.routes.super_admin_wallet",
+        "super_admin_wallet_router",
+        "/super_admin_wallet",
+        ["super_admin_wallet"],
+    ),
+    ("src.api.routes.transactions", "transaction_router", "/transaction", ["transaction"]),
+    ("src.api.routes.user_role", "user_roles_router", "/user_roles", ["user_roles"]),
+    ("src.api.routes.admin_wallet", "admin_wallet_router", "/admin_wallet", ["admin_wallet"]),
+    ("src.api.routes.jobs", "jobs_router", "/jobs", ["jobs"]),
+    ("src.api.routes.archive", "archive_router", "/archive", ["archive"]),
+)
+
+
+class RouteLoader:
+    """Imports the routers once, either in the background after startup or on first use."""
+
+    def __init__(self, app: FastAPI) -> None:
+        """Initialize for `app`; nothing is imported yet."""
+        self.app = app
+        self.loaded = False
+        self.seconds: Optional[float] = None
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Future] = None
+
+    def load(self) -> None:
+        """Import and mount every router; safe to call from any thread, runs once."""
+        with self._lock:
+            if self.loaded:
+                return
+            start = time.perf_counter()
+            # Build the routes off to the side and publish them with one list extend,
+            # so requests being routed meanwhile never see a half-mounted router.
+            staging = APIRouter(default_response_class=self.app.router.default_response_class)
+            for module, name, prefix, tags in ROUTERS:
+                router = getattr(importlib.import_module(module), name)
+                staging.include_router(router, prefix=prefix, tags=tags)
+            self.app.router.routes.extend(staging.routes)
+            self.app.openapi_schema = None
+            self.seconds = time.perf_counter() - start
+            self.loaded = True
+        app_logger.info(f"Loaded {len(ROUTERS)} routers in {self.seconds * 1000:.0f} ms")
+
+    def start(self) -> None:
+        """Begin loading in a worker thread without blocking the event loop."""
+        if self._task is None and not self.loaded:
+            self._task = asyncio.ensure_future(asyncio.to_thread(self.load))
+
+    async def wait(self) -> None:
+        """Return once the routers are mounted."""
+        if self.loaded:
+            return
+        self.start()
+        await asyncio.shield(self._task)
+
+
+class LazyRoutesMiddleware:
+    """Holds requests for not-yet-mounted routes until the loader finishes."""
+
+    def __init__(self, app: ASGIApp, loader: RouteLoader, ready_paths: Iterable[str]) -> None:
+        """Wrap `app`; `ready_paths` are served without waiting."""
+        self.app = app
+        self.loader = loader
+        self.ready_paths: Set[str] = set(ready_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Wait for the routers unless the path is already routable."""
+        if (
+            not self.loader.loaded
+            and scope["type"] in ("http", "websocket")
+            and scope["path"] not in self.ready_paths
+        ):
+            await self.loader.wait()
+        await self.app(scope, receive, send)
+
+
+def create_route_loader(
+    app: FastAPI, ready_paths: Iterable[str], lazy: bool
+) -> Callable[[], Awaitable[None]]:
+    """Mount the routers now, or set up deferred loading; returns a startup hook."""
+    loader = RouteLoader(app)
+    app.state.route_loader = loader
+    if not lazy:
+        loader.load()
+    else:
+        app.add_middleware(LazyRoutesMiddleware, loader=loader, ready_paths=ready_paths)
+
+    async def start_loading() -> None:
+        loader.start()
+
+    return start_loading
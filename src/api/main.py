@@ -1,16 +1,14 @@
 """Main module for FastAPI application."""
 
-import logging
-
 from fastapi import FastAPI
 
 from src.api.exception_handlers import setup_exception_handlers
 from src.api.middleware import setup_middleware
+from src.api.responses import FastJSONResponse
 from src.api.routes import setup_routes
 from src.core import config, tasks
-
-app = FastAPI()
-request_logger = logging.getLogger("request")
+from src.core.audit import setup_audit_log
+from src.core.logs import setup_logging
 
 
 def setup_event_handlers(app: FastAPI) -> None:
@@ -21,7 +19,13 @@ def setup_event_handlers(app: FastAPI) -> None:
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
-    app = FastAPI(title=config.PROJECT_NAME, version=config.VERSION)
+    setup_logging()
+    setup_audit_log()
+    app = FastAPI(
+        title=config.PROJECT_NAME,
+        version=config.VERSION,
+        default_response_class=FastJSONResponse,
+    )
 
     setup_routes(app)
     setup_middleware(app)
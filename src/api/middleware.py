@@ -1,14 +1,19 @@
 """Middleware configuration for the application."""
 
-import logging
-
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from starlette.middleware.cors import CORSMiddleware
 
-from src.core.config import SECRET_KEY
-
-request_logger = logging.getLogger("request")
+from src.api.access_log import REQUEST_ID_HEADER, AccessLogMiddleware
+from src.api.compression import CompressionMiddleware
+from src.core.config import (
+    BROTLI_QUALITY,
+    COMPRESSION_MINIMUM_SIZE,
+    GZIP_COMPRESS_LEVEL,
+    LOG_ACCESS_SAMPLE_RATE,
+    LOG_ACCESS_SLOW_MS,
+    SECRET_KEY,
+)
 
 
 def setup_middleware(app: FastAPI) -> None:
@@ -20,21 +25,20 @@ def setup_middleware(app: FastAPI) -> None:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["ETag", REQUEST_ID_HEADER],
+    )
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=COMPRESSION_MINIMUM_SIZE,
+        gzip_level=GZIP_COMPRESS_LEVEL,
+        brotli_quality=BROTLI_QUALITY,
+    )
+    # Added last so it is outermost: the correlation id covers every other middleware.
+    app.add_middleware(
+        AccessLogMiddleware,
+        sample_rate=LOG_ACCESS_SAMPLE_RATE,
+        slow_ms=LOG_ACCESS_SLOW_MS,
     )
-
-    @app.middleware("http")
-    async def log_requests(request: Request, call_next: callable) -> JSONResponse:
-        client_ip = request.client.host
-        method = request.method
-        path = request.url.path
-        request_logger.info(f"Incoming request: {method} {path} from {client_ip}")
-
-        response = await call_next(request)
-
-        status_code = response.status_code
-        request_logger.info(f"Response: {status_code}")
-
-        return response
 
     # app.add_middleware(APIKeyMiddleware)
 
@@ -1,13 +1,16 @@
 """Admin wallet routes."""
 
-from typing import List, Optional
+from typing import List, Optional, Union
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 
 from src.api.dependencies.auth import get_current_user, get_super_admin
 from src.api.dependencies.database import get_repository
+from src.api.etag import compute_etag, etag_matches, not_modified, set_etag
 from src.db.repositories.admin_wallet import AdminWalletRepository
+from src.db.repositories.transfer_recipients import TransferRecipientRepository
+from src.enums.wallet_type import WalletType
 from src.models.admin_wallet import (
     AdminWalletCreate,
     AdminWalletPublic,
@@ -34,10 +37,16 @@ async def create_admin_wallet(
     "/", response_model=List[AdminWalletPublic], status_code=status.HTTP_200_OK
 )
 async def get_all_admin_wallets(
+    request: Request,
+    response: Response,
     current_user: UserInDb = Depends(get_current_user),
     wallet_repo: AdminWalletRepository = Depends(get_repository(AdminWalletRepository)),
-) -> List[AdminWalletPublic]:
-    """Get all admin wallets."""
+) -> Union[List[AdminWalletPublic], Response]:
+    """Get all admin wallets; returns 304 when the list is unchanged."""
+    etag = compute_etag("admin_wallets", await wallet_repo.get_wallets_version())
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
     return await wallet_repo.get_wallets()
 
 
@@ -92,6 +101,7 @@ async def update_admin_wallet_balance(
 async def delete_admin_wallet(
     wallet_id: UUID,
     wallet_repo: AdminWalletRepository = Depends(get_repository(AdminWalletRepository)),
+    recipients: TransferRecipientRepository = Depends(get_repository(TransferRecipientRepository)),
     current_admin: UserInDb = Depends(get_super_admin),
 ) -> UUID:
     """Delete an admin wallet."""
@@ -100,4 +110,5 @@ async def delete_admin_wallet(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Wallet not found."
         )
+    await recipients.invalidate(wallet_type=WalletType.ADMIN, wallet_id=wallet_id)
     return wallet_id
@@ -0,0 +1,29 @@
+"""Archived row routes."""
+
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Response, status
+
+from src.api.dependencies.auth import get_super_admin
+from src.api.dependencies.database import get_repository
+from src.db.repositories.archive import ArchiveRepository
+from src.enums.archived_entity import ArchivedEntity
+
+archive_router = APIRouter()
+
+
+@archive_router.post(
+    "/admin/{entity}/{id}/restore",
+    response_model=None,
+    status_code=status.HTTP_200_OK,
+)
+async def restore_archived_row(
+    entity: ArchivedEntity,
+    id: UUID,
+    archive_repo: ArchiveRepository = Depends(get_repository(ArchiveRepository)),
+    get_super_admin: str = Depends(get_super_admin),
+) -> Response:
+    """Move an archived row back to its table, no longer deleted, and return it."""
+    restored = await archive_repo.restore(entity=entity, id=id)
+    # The row's model depends on the entity, so it is rendered here rather than by a response_model.
+    return Response(content=restored.model_dump_json(), media_type="application/json")
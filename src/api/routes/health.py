@@ -0,0 +1,32 @@
+"""Health and readiness routes."""
+
+from fastapi import APIRouter, Request, status
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+from src.core.metrics import render_metrics
+from src.core.readiness import readiness_snapshot
+
+health_router = APIRouter()
+
+
+@health_router.get("/healthz", name="healthz")
+async def healthz() -> JSONResponse:
+    """Report that the process is serving requests; does no I/O."""
+    return JSONResponse(content={"status": "ok"})
+
+
+@health_router.get("/readyz", name="readyz")
+async def readyz(request: Request) -> JSONResponse:
+    """Report the readiness status cached by the background refresher."""
+    readiness = readiness_snapshot(request.app)
+    ready = readiness["status"] == "ready"
+    return JSONResponse(
+        status_code=status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content=readiness,
+    )
+
+
+@health_router.get("/metrics", name="metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """Export pool and application metrics in the Prometheus text format."""
+    return PlainTextResponse(render_metrics())
@@ -0,0 +1,56 @@
+"""Background job routes."""
+
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, status
+
+from src.api.dependencies.auth import get_super_admin
+from src.api.dependencies.database import get_repository
+from src.db.repositories.jobs import JobRepository
+from src.enums.job_status import JobStatus
+from src.models.jobs import JobPublic
+
+jobs_router = APIRouter()
+
+
+@jobs_router.get(
+    "/admin",
+    response_model=List[JobPublic],
+    status_code=status.HTTP_200_OK,
+)
+async def get_jobs(
+    job_status: Optional[JobStatus] = Query(None, alias="status"),
+    limit: int = Query(100, ge=1, le=1000),
+    jobs_repo: JobRepository = Depends(get_repository(JobRepository)),
+    get_super_admin: str = Depends(get_super_admin),
+) -> List[JobPublic]:
+    """Get the most recent jobs, optionally filtered by status."""
+    return await jobs_repo.get_jobs(status=job_status, limit=limit)
+
+
+@jobs_router.get(
+    "/admin/stats",
+    response_model=Dict[str, int],
+    status_code=status.HTTP_200_OK,
+)
+async def get_job_stats(
+    jobs_repo: JobRepository = Depends(get_repository(JobRepository)),
+    get_super_admin: str = Depends(get_super_admin),
+) -> Dict[str, int]:
+    """Get the number of jobs in each status."""
+    return await jobs_repo.count_jobs()
+
+
+@jobs_router.get(
+    "/admin/{id}",
+    response_model=JobPublic,
+    status_code=status.HTTP_200_OK,
+)
+async def get_job(
+    id: UUID,
+    jobs_repo: JobRepository = Depends(get_repository(JobRepository)),
+    get_super_admin: str = Depends(get_super_admin),
+) -> JobPublic:
+    """Get a job's status, attempts, last error and result."""
+    return await jobs_repo.get_job(id=id)
@@ -1,19 +1,32 @@
 """Route to accept user payments."""
 
-from decimal import Decimal
-from uuid import UUID
+import logging
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from fastapi.responses import JSONResponse
 
-from src.errors.paystack import PaystackError
+from src.api.dependencies.auth import get_current_user
+from src.api.dependencies.database import get_repository
+from src.db.repositories.charge_intents import ChargeIntentRepository
+from src.db.repositories.wallet_withdrawals import WalletWithdrawalRepository
+from src.enums.paystack import AvailableBankCountries
+from src.errors.paystack import (
+    PaystackChargeMismatchError,
+    PaystackError,
+    PaystackWebhookPayloadError,
+    PaystackWebhookSignatureError,
+)
+from src.models.paystack.bank import BankAccountVerificationResponse, RetrieveBanksResponse
 from src.models.paystack.charge import ChargeOTPVerifyRequest, ChargeResponse
 from src.models.paystack.payment import CreateVotingUSSDPayment
-from src.models.paystack.transaction import SuccessfulTransaction
+from src.models.paystack.webhook import ChargeSuccessEvent, TransferEvent
+from src.models.users import UserInDb
+from src.services.charge_intents import settle_charge
 from src.services.paystack import PaystackService
-from src.db.repositories import payment, admin_wallet, transactions, schools_wallet
-from src.api.dependencies.database import get_repository
+from src.services.paystack_webhook import read_webhook_event
+from src.services.transfer_recipients import settle_withdrawal
 
+app_logger = logging.getLogger("app")
 
 paystack_router = APIRouter()
 
@@ -26,16 +39,20 @@ paystack_router = APIRouter()
 async def initiate_ussd_payment(
     create_payment: CreateVotingUSSDPayment,
     paystack_service: PaystackService = Depends(PaystackService),
+    charge_intents: ChargeIntentRepository = Depends(get_repository(ChargeIntentRepository)),
 ) -> ChargeResponse:
     """This function creates a ussd mobile money amount."""
     try:
-        value = await paystack_service.create_ussd_payment(create_payment)
+        value = await paystack_service.create_ussd_payment(create_payment, charge_intents)
         return value
+    except PaystackError as e:
+        app_logger.warning(f"USSD payment failed: {e.message}")
+        raise
     except HTTPException as e:
-        print(e)
+        app_logger.warning(f"USSD payment rejected: {e.detail}")
         raise
     except Exception as e:
-        print(e)
+        app_logger.exception("USSD payment failed")
         raise HTTPException(status_code=500, detail="Internal Server Error") from e
 
 
@@ -52,162 +69,117 @@ async def verify_ussd_otp(
     try:
         return await paystack_service.verify_ussd_otp_payment(otp_data=otp_data)
     except PaystackError as e:
-        print(e)
+        app_logger.warning(f"USSD OTP verification failed: {e.message}")
         raise
     except HTTPException as e:
-        print(e)
+        app_logger.warning(f"USSD OTP verification rejected: {e.detail}")
         raise HTTPException(status_code=400, detail="Invalid details") from e
     except Exception as e:
-        print(e)
+        app_logger.exception("USSD OTP verification failed")
         raise HTTPException(
             status_code=500, detail="Unexpected error. Please try again."
         ) from e
 
 
-@paystack_router.post("/webhook", status_code=status.HTTP_200_OK)
-async def paystack_webhook(
-    request: Request,
+@paystack_router.get(
+    "/banks",
+    response_model=RetrieveBanksResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def list_banks(
+    country: AvailableBankCountries = Query(AvailableBankCountries.GHANA),
+    currency: str = Query("GHS", min_length=3, max_length=3),
     paystack_service: PaystackService = Depends(PaystackService),
-) -> JSONResponse:
-    """This function creates a webhook, that'll receive a response from Paystack."""
-    try:
-        payload = await request.body()
-        signature = request.headers.get("x-paystack-signature")
-
-        if not await paystack_service.verify_webhook_signature(payload, signature):
-            raise HTTPException(status_code=400, detail="Invalid signature")  # noqa
-
-        event = await request.json()
-        paystack_event_type = event["event"]
-        if paystack_event_type.startswith("charge"):  # User completed a ussd prompt
-            transaction_data = SuccessfulTransaction(**event["data"])
-
-            custom_fields = {
-                field.variable_name: field.value
-                for field in transaction_data.metadata.custom_fields
-            }
-
-            student_name = custom_fields.get("Student Name", "")
-            school_name = custom_fields.get("School Name", "")
-            school_id = UUID(custom_fields.get("School ID", ""))
-            total_amount = Decimal(custom_fields.get("Amount paid", ""))
-            school_amount = Decimal(custom_fields.get("School amount", ""))
-            admin_amount = Decimal(custom_fields.get("Admin amount", ""))
-            phone_number = custom_fields.get("Phone Number", "")
-
-            print(
-                student_name,
-                school_name,
-                school_id,
-                total_amount,
-                school_amount,
-                admin_amount,
-                phone_number,
-            )
+    current_user: UserInDb = Depends(get_current_user),
+) -> RetrieveBanksResponse:
+    """List the banks payouts can be sent to."""
+    return await paystack_service.list_banks(country=country, currency=currency.upper())
 
 
-            return JSONResponse(
-                content={"message": "Transaction Payment processed successfully"},
-                status_code=200,
-            )
-        else:
-            return JSONResponse(
-                content={"message": "Invalid Webhook event"},
-                status_code=200,
-            )
-    except HTTPException as e:
-        print(e)
-        return JSONResponse(
-            content={"message": "Error processing transaction"}, status_code=200
-        )
-    except Exception as e:
-        print(e)
-        return JSONResponse(
-            content={"message": "Error processing transaction"}, status_code=500
-        )
+@paystack_router.get(
+    "/banks/resolve",
+    response_model=BankAccountVerificationResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def resolve_account_number(
+    account_number: str = Query(..., min_length=1, max_length=20),
+    bank_code: str = Query(..., min_length=1, max_length=20),
+    paystack_service: PaystackService = Depends(PaystackService),
+    current_user: UserInDb = Depends(get_current_user),
+) -> BankAccountVerificationResponse:
+    """Look up the name on a bank account before it is used for payouts."""
+    return await paystack_service.resolve_account_number(
+        account_number=account_number, bank_code=bank_code
+    )
 
 
 @paystack_router.post("/webhook", status_code=status.HTTP_200_OK)
 async def paystack_webhook(
     request: Request,
-    paystack_service: PaystackService = Depends(PaystackService),
-    payment_repo: payment = Depends(get_repository(payment)),
-    school_wallet_repo: schools_wallet = Depends(get_repository(schools_wallet)),
-    admin_wallet_repo: admin_wallet = Depends(get_repository(admin_wallet)),
-    transaction_repo: transactions = Depends(get_repository(transactions)),
+    charge_intents: ChargeIntentRepository = Depends(get_repository(ChargeIntentRepository)),
+    withdrawals: WalletWithdrawalRepository = Depends(get_repository(WalletWithdrawalRepository)),
 ) -> JSONResponse:
     """This function creates a webhook, that'll receive a response from Paystack."""
     try:
-        payload = await request.body()
-        signature = request.headers.get("x-paystack-signature")
-
-        if not await paystack_service.verify_webhook_signature(payload, signature):
-            raise HTTPException(status_code=400, detail="Invalid signature")  # noqa
-
-        event = await request.json()
-        paystack_event_type = event["event"]
-        
-        if paystack_event_type.startswith("charge"):  # User completed a ussd prompt
-            transaction_data = SuccessfulTransaction(**event["data"])
-
-            custom_fields = {
-                field.variable_name: field.value
-                for field in transaction_data.metadata.custom_fields
-            }
-
-            student_name = custom_fields.get("Student Name", "")
-            school_name = custom_fields.get("School Name", "")
-            school_id = UUID(custom_fields.get("School ID", ""))
-            total_amount = Decimal(custom_fields.get("Amount paid", ""))
-            school_amount = Decimal(custom_fields.get("School amount", ""))
-            admin_amount = Decimal(custom_fields.get("Admin amount", ""))
-            phone_number = custom_fields.get("Phone Number", "")
-
-            # Process the payment, update wallet balances and record the transaction
-            async with transaction_repo.TransactionUpdate:  # Start a DB transaction
-                # Insert payment details into the payment table
-                await payment.PaymentCreate(
-                    student_name=student_name,
-                    school_name=school_name,
-                    total_amount=total_amount,
-                    phone_number=phone_number,
-                )
-
-                # Update the school’s wallet balance
-                await school_wallet_repo.SchoolWalletUpdate(
-                    school_id=school_id,
-                    amount=school_amount
-                )
-
-                # Update the admin’s wallet balance
-                await admin_wallet_repo.update_wallet_balance(
-                    amount=admin_amount
+        event = await read_webhook_event(request)
+        if isinstance(event, ChargeSuccessEvent):  # User completed a ussd prompt
+            # Everything needed to settle was stored with the charge; one key lookup finds it.
+            intent = await settle_charge(
+                charge_intents,
+                reference=event.data.reference,
+                amount=event.data.amount,
+                currency=event.data.currency,
+                paystack_transaction_id=event.data.id,
+            )
+            if intent is None:
+                return JSONResponse(
+                    content={"message": "Transaction already processed or unknown"},
+                    status_code=200,
                 )
 
-                # Insert the transaction details into the transaction table
-                await transaction_repo.TransactionCreate(
-                    school_id=school_id,
-                    total_amount=total_amount,
-                    school_amount=school_amount,
-                    admin_amount=admin_amount,
-                )
+            app_logger.info(
+                "Charge settled",
+                extra={
+                    "reference": intent.reference,
+                    "school_id": intent.school_id,
+                    "amount": intent.amount,
+                    "school_amount": intent.school_amount,
+                    "admin_amount": intent.admin_amount,
+                },
+            )
 
             return JSONResponse(
                 content={"message": "Transaction Payment processed successfully"},
                 status_code=200,
             )
+        elif isinstance(event, TransferEvent):  # The outcome of a wallet withdrawal
+            withdrawal = await settle_withdrawal(
+                withdrawals, event=event.event, reference=event.data.reference
+            )
+            if withdrawal is None:
+                return JSONResponse(
+                    content={"message": "Transfer already processed or unknown"},
+                    status_code=200,
+                )
+            return JSONResponse(
+                content={"message": "Transfer processed successfully"}, status_code=200
+            )
         else:
             return JSONResponse(
                 content={"message": "Invalid Webhook event"},
                 status_code=200,
             )
-    except HTTPException as e:
-        print(e)
+    # Retrying either would fail the same way, so both are acknowledged.
+    except (PaystackWebhookSignatureError, PaystackWebhookPayloadError) as e:
+        app_logger.warning(f"Rejected Paystack webhook: {e.message}")
         return JSONResponse(
             content={"message": "Error processing transaction"}, status_code=200
         )
-    except Exception as e:
-        print(e)
+    except PaystackChargeMismatchError as e:
+        # Held for review; a retry would find the same amount.
+        return JSONResponse(content={"message": e.message}, status_code=200)
+    except Exception:
+        app_logger.exception("Processing Paystack webhook failed")
         return JSONResponse(
             content={"message": "Error processing transaction"}, status_code=500
-        )
\ No newline at end of file
+        )
@@ -1,10 +1,12 @@
 """Routes to manage schools."""
 
+from typing import List, Union
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, Response, status
 
 from src.api.dependencies.database import get_repository
+from src.api.etag import compute_etag, etag_matches, not_modified, set_etag
 from src.db.repositories.school import SchoolRepository
 from src.models.schools import SchoolCreate, SchoolPublic, SchoolUpdate
 
@@ -24,6 +26,24 @@ async def create_school(
     return await school_repo.create_school(new_school=new_school)
 
 
+@school_router.get(
+    "/",
+    response_model=List[SchoolPublic],
+    status_code=status.HTTP_200_OK,
+)
+async def get_schools(
+    request: Request,
+    response: Response,
+    school_repo: SchoolRepository = Depends(get_repository(SchoolRepository)),
+) -> Union[List[SchoolPublic], Response]:
+    """Get all schools; returns 304 when the list is unchanged."""
+    etag = compute_etag("schools", await school_repo.get_schools_version())
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    return await school_repo.get_schools()
+
+
 @school_router.get(
     "/{id}",
     response_model=SchoolPublic,
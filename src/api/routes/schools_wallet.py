@@ -6,9 +6,17 @@ from decimal import Decimal
 
 from fastapi import APIRouter, Depends, HTTPException, status
 
+from src.api.dependencies.auth import get_super_admin
 from src.api.dependencies.database import get_repository
 from src.db.repositories.schools_wallet import SchoolWalletRepository
+from src.db.repositories.transfer_recipients import TransferRecipientRepository
+from src.db.repositories.wallet_withdrawals import WalletWithdrawalRepository
+from src.enums.wallet_type import WalletType
+from src.models.paystack.transfer import TransferResponse
 from src.models.schools_wallet import SchoolWalletCreate, SchoolWalletPublic, SchoolWalletUpdate
+from src.models.transfer_recipients import PayoutAccount, WalletWithdrawal
+from src.services.paystack import PaystackService
+from src.services.transfer_recipients import payout_recipient, withdraw
 
 school_wallet_router = APIRouter()
 
@@ -61,11 +69,62 @@ async def update_school_wallet(
     id: UUID,
     wallet_update: SchoolWalletUpdate,
     wallet_repo: SchoolWalletRepository = Depends(get_repository(SchoolWalletRepository)),
+    get_super_admin: str = Depends(get_super_admin),
 ) -> SchoolWalletPublic:
     """Update a school wallet."""
     return await wallet_repo.update_school_wallet(id=id, wallet_update=wallet_update)
 
 
+@school_wallet_router.put(
+    "/{id}/payout_account",
+    response_model=SchoolWalletPublic,
+    status_code=status.HTTP_200_OK,
+)
+async def set_school_wallet_payout_account(
+    id: UUID,
+    account: PayoutAccount,
+    wallet_repo: SchoolWalletRepository = Depends(get_repository(SchoolWalletRepository)),
+    recipients: TransferRecipientRepository = Depends(get_repository(TransferRecipientRepository)),
+    get_super_admin: str = Depends(get_super_admin),
+) -> SchoolWalletPublic:
+    """Set the account a school wallet's withdrawals are paid to."""
+    wallet = await wallet_repo.set_payout_account(id=id, account=account)
+    await recipients.invalidate_other_accounts(
+        wallet_type=WalletType.SCHOOL,
+        wallet_id=id,
+        account_number=wallet.payout_account_number,
+        bank_code=wallet.payout_bank_code,
+    )
+    return wallet
+
+
+@school_wallet_router.post(
+    "/{id}/withdraw",
+    response_model=TransferResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def withdraw_from_school_wallet(
+    id: UUID,
+    withdrawal: WalletWithdrawal,
+    wallet_repo: SchoolWalletRepository = Depends(get_repository(SchoolWalletRepository)),
+    recipients: TransferRecipientRepository = Depends(get_repository(TransferRecipientRepository)),
+    withdrawals: WalletWithdrawalRepository = Depends(get_repository(WalletWithdrawalRepository)),
+    paystack_service: PaystackService = Depends(PaystackService),
+    get_super_admin: str = Depends(get_super_admin),
+) -> TransferResponse:
+    """Pay part of a school wallet's balance out to its payout account."""
+    recipient = payout_recipient(await wallet_repo.get_school_wallet_by_id(id=id))
+    return await withdraw(
+        recipients,
+        withdrawals,
+        paystack_service,
+        wallet_type=WalletType.SCHOOL,
+        wallet_id=id,
+        recipient=recipient,
+        withdrawal=withdrawal,
+    )
+
+
 @school_wallet_router.delete(
     "/{id}",
     response_model=SchoolWalletPublic,
@@ -74,6 +133,9 @@ async def update_school_wallet(
 async def delete_school_wallet(
     id: UUID,
     wallet_repo: SchoolWalletRepository = Depends(get_repository(SchoolWalletRepository)),
+    recipients: TransferRecipientRepository = Depends(get_repository(TransferRecipientRepository)),
 ) -> SchoolWalletPublic:
     """Delete a school wallet."""
-    return await wallet_repo.delete_school_wallet(id=id)
+    deleted_wallet = await wallet_repo.delete_school_wallet(id=id)
+    await recipients.invalidate(wallet_type=WalletType.SCHOOL, wallet_id=id)
+    return deleted_wallet
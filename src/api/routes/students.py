@@ -1,11 +1,12 @@
 """Routes to manage students."""
 
-from typing import Optional
+from typing import List, Optional, Union
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 
 from src.api.dependencies.database import get_repository
+from src.api.etag import compute_etag, etag_matches, not_modified, set_etag
 from src.db.repositories.students import StudentRepository
 from src.models.students import StudentCreate, StudentPublic, StudentUpdate
 
@@ -25,6 +26,26 @@ async def create_student(
     return await student_repo.create_student(new_student=new_student)
 
 
+@student_router.get(
+    "/",
+    response_model=List[StudentPublic],
+    status_code=status.HTTP_200_OK,
+)
+async def get_students(
+    request: Request,
+    response: Response,
+    school_id: Optional[UUID] = Query(None, description="Only list this school's students"),
+    student_repo: StudentRepository = Depends(get_repository(StudentRepository)),
+) -> Union[List[StudentPublic], Response]:
+    """Get all students; returns 304 when the list is unchanged."""
+    version = await student_repo.get_students_version(school_id=school_id)
+    etag = compute_etag(f"students:{school_id or ''}", version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    return await student_repo.get_students(school_id=school_id)
+
+
 @student_router.get(
     "/{id}",
     response_model=StudentPublic,
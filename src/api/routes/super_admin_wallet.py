@@ -5,9 +5,17 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
 
+from src.api.dependencies.auth import get_super_admin
 from src.api.dependencies.database import get_repository
 from src.db.repositories.super_admin_wallet import SuperAdminWalletRepository
-from src.models.super_admin_wallet import SuperAdminWalletCreate, SuperAdminWalletPublic, SuperAdminWalletUpdate
+from src.db.repositories.transfer_recipients import TransferRecipientRepository
+from src.db.repositories.wallet_withdrawals import WalletWithdrawalRepository
+from src.enums.wallet_type import WalletType
+from src.models.paystack.transfer import TransferResponse
+from src.models.super_admin_wallet import SuperAdminWalletCreate, SuperAdminWalletPublic
+from src.models.transfer_recipients import PayoutAccount, WalletWithdrawal
+from src.services.paystack import PaystackService
+from src.services.transfer_recipients import payout_recipient, withdraw
 
 super_admin_wallet_router = APIRouter()
 audit_logger = logging.getLogger("audit")
@@ -40,17 +48,54 @@ async def get_super_admin_wallet(
 
 
 @super_admin_wallet_router.put(
-    "/wallet/{user_id}",
+    "/wallet/{user_id}/payout_account",
     response_model=SuperAdminWalletPublic,
     status_code=status.HTTP_200_OK,
 )
-async def update_super_admin_wallet(
+async def set_super_admin_wallet_payout_account(
     user_id: UUID,
-    wallet_update: SuperAdminWalletUpdate,
+    account: PayoutAccount,
     wallet_repo: SuperAdminWalletRepository = Depends(get_repository(SuperAdminWalletRepository)),
+    recipients: TransferRecipientRepository = Depends(get_repository(TransferRecipientRepository)),
+    get_super_admin: str = Depends(get_super_admin),
 ) -> SuperAdminWalletPublic:
-    """Update a Super Admin Wallet."""
-    return await wallet_repo.update_super_admin_wallet(user_id=user_id, wallet_update=wallet_update)
+    """Set the account a Super Admin Wallet's withdrawals are paid to."""
+    wallet = await wallet_repo.set_payout_account(user_id=user_id, account=account)
+    await recipients.invalidate_other_accounts(
+        wallet_type=WalletType.SUPER_ADMIN,
+        wallet_id=wallet.id,
+        account_number=wallet.payout_account_number,
+        bank_code=wallet.payout_bank_code,
+    )
+    return wallet
+
+
+@super_admin_wallet_router.post(
+    "/wallet/{user_id}/withdraw",
+    response_model=TransferResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def withdraw_from_super_admin_wallet(
+    user_id: UUID,
+    withdrawal: WalletWithdrawal,
+    wallet_repo: SuperAdminWalletRepository = Depends(get_repository(SuperAdminWalletRepository)),
+    recipients: TransferRecipientRepository = Depends(get_repository(TransferRecipientRepository)),
+    withdrawals: WalletWithdrawalRepository = Depends(get_repository(WalletWithdrawalRepository)),
+    paystack_service: PaystackService = Depends(PaystackService),
+    get_super_admin: str = Depends(get_super_admin),
+) -> TransferResponse:
+    """Pay part of a Super Admin Wallet's balance out to its payout account."""
+    wallet = await wallet_repo.get_super_admin_wallet_by_user_id(user_id=user_id)
+    recipient = payout_recipient(wallet)
+    return await withdraw(
+        recipients,
+        withdrawals,
+        paystack_service,
+        wallet_type=WalletType.SUPER_ADMIN,
+        wallet_id=wallet.id,
+        recipient=recipient,
+        withdrawal=withdrawal,
+    )
 
 
 @super_admin_wallet_router.delete(
@@ -61,6 +106,9 @@ async def update_super_admin_wallet(
 async def delete_super_admin_wallet(
     user_id: UUID,
     wallet_repo: SuperAdminWalletRepository = Depends(get_repository(SuperAdminWalletRepository)),
+    recipients: TransferRecipientRepository = Depends(get_repository(TransferRecipientRepository)),
 ) -> SuperAdminWalletPublic:
     """Delete a Super Admin Wallet."""
-    return await wallet_repo.delete_super_admin_wallet(user_id=user_id)
+    deleted_wallet = await wallet_repo.delete_super_admin_wallet(user_id=user_id)
+    await recipients.invalidate(wallet_type=WalletType.SUPER_ADMIN, wallet_id=deleted_wallet.id)
+    return deleted_wallet
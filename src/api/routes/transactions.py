@@ -1,7 +1,9 @@
 import logging
+from datetime import datetime
+from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from src.api.dependencies.database import get_repository
 from src.db.repositories.transactions import TransactionRepository
@@ -24,6 +26,19 @@ async def create_transaction(
     return await transaction_repo.create_transaction(new_transaction=transaction_create)
 
 
+@transaction_router.get(
+    "/transactions",
+    response_model=List[TransactionPublic],
+    status_code=status.HTTP_200_OK,
+)
+async def get_transactions(
+    since: datetime = Query(..., description="Only transactions created at or after this time"),
+    transaction_repo: TransactionRepository = Depends(get_repository(TransactionRepository)),
+) -> List[TransactionPublic]:
+    """List the transactions created since a given time."""
+    return await transaction_repo.get_transactions(since=since)
+
+
 @transaction_router.get(
     "/transactions/{id}",
     response_model=TransactionPublic,
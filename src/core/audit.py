@@ -0,0 +1,193 @@
+"""Durable audit trail: records logged to the "audit" logger are written to audit_log in batches.
+
+Repositories keep calling `audit_logger.info(message, extra={...})`. The handler installed
+here turns each record into an `AuditEntry` and buffers it in memory, and the writer task
+inserts the buffer with one statement per batch: every `AUDIT_FLUSH_SECONDS`, as soon as
+`AUDIT_BATCH_SIZE` entries are waiting, and once more on shutdown.
+
+The `extra` fields an audit record may carry:
+
+- action: what happened (create, update, delete, settle, ...); defaults to "log"
+- entity: what it happened to (school, school_wallet, role, ...); defaults to "audit"
+- entity_id: the id of the row
+- details: anything JSON-serializable, stored as JSON text
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Deque, List, Optional, Union
+
+import orjson
+from databases import Database
+
+from src.core.config import AUDIT_BATCH_SIZE, AUDIT_BUFFER_SIZE, AUDIT_FLUSH_SECONDS
+from src.core.logs import correlation_id
+from src.core.metrics import Counter, Gauge, Histogram
+from src.db.repositories.audit_log import AuditLogRepository
+from src.db.router import DatabaseRouter
+from src.models.audit_log import AuditEntry
+
+app_logger = logging.getLogger("app")
+audit_logger = logging.getLogger("audit")
+
+AUDIT_ENTRIES = Counter(
+    "audit_entries_total",
+    "Audit entries by outcome (written, dropped).",
+)
+AUDIT_WRITE_SECONDS = Histogram(
+    "audit_write_seconds",
+    "Duration of audit_log batch inserts.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0),
+)
+AUDIT_BUFFERED = Gauge(
+    "audit_entries_buffered",
+    "Audit entries waiting to be written.",
+)
+
+
+class AuditWriter:
+    """Bounded in-memory buffer of audit entries and the task that writes it out."""
+
+    def __init__(self, *, max_size: int, batch_size: int, flush_interval: float) -> None:
+        """Initialize with an empty buffer and no database."""
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._entries: Deque[AuditEntry] = deque()
+        self._db: Optional[Union[Database, DatabaseRouter]] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+        self._dropped_since_warning = 0
+        AUDIT_BUFFERED.set_function(lambda: len(self._entries))
+
+    def add(self, entry: AuditEntry) -> None:
+        """Buffer an entry; drops it when the buffer is full. Safe from any thread."""
+        if len(self._entries) >= self.max_size:
+            AUDIT_ENTRIES.inc(status="dropped")
+            self._dropped_since_warning += 1
+            return
+        self._entries.append(entry)
+        if len(self._entries) >= self.batch_size and self._wake is not None:
+            if threading.get_ident() == self._loop_thread:
+                self._wake.set()
+            else:
+                self._loop.call_soon_threadsafe(self._wake.set)
+
+    def start(self, db: Union[Database, DatabaseRouter]) -> None:
+        """Start writing to `db` from the running event loop."""
+        self._db = db
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._wake = asyncio.Event()
+        self._lock = asyncio.Lock()
+        self._stopping = False
+        self._task = asyncio.create_task(self._run(), name="audit-writer")
+
+    async def stop(self) -> None:
+        """Stop the writer task and write what is left.
+
+        Entries that still cannot be written go to the app log, so they are not lost silently.
+        """
+        if self._task is None:
+            return
+        task, self._task = self._task, None
+        # Not cancelled: a batch cut off mid-insert would be lost.
+        self._stopping = True
+        self._wake.set()
+        await task
+        if not await self.flush():
+            for entry in self._entries:
+                app_logger.error("Unwritten audit entry", extra={"audit_entry": entry._asdict()})
+            self._entries.clear()
+        self._wake = None
+
+    async def _run(self) -> None:
+        """Flush every interval, or sooner once a full batch is waiting."""
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+
+    async def flush(self) -> bool:
+        """Write the buffer in batches; False when a batch failed and was put back."""
+        if self._lock is None:
+            return not self._entries
+        async with self._lock:
+            if self._dropped_since_warning:
+                app_logger.warning(
+                    f"Audit buffer full: dropped {self._dropped_since_warning} entries"
+                )
+                self._dropped_since_warning = 0
+            repository = AuditLogRepository(self._db)
+            while self._entries:
+                batch: List[AuditEntry] = []
+                while self._entries and len(batch) < self.batch_size:
+                    batch.append(self._entries.popleft())
+                start = time.perf_counter()
+                try:
+                    await repository.insert_entries(entries=batch)
+                except Exception as e:
+                    # Keep them for the next flush, ahead of anything logged since.
+                    self._entries.extendleft(reversed(batch))
+                    app_logger.warning(f"Writing {len(batch)} audit entries failed: {e!r}")
+                    return False
+                AUDIT_WRITE_SECONDS.observe(time.perf_counter() - start)
+                AUDIT_ENTRIES.inc(len(batch), status="written")
+        return True
+
+
+class AuditLogHandler(logging.Handler):
+    """Turn audit log records into audit_log entries for the writer."""
+
+    def __init__(self, writer: AuditWriter) -> None:
+        """Initialize with the writer to buffer entries in."""
+        super().__init__()
+        self.writer = writer
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Buffer the record as an entry."""
+        try:
+            entity_id = getattr(record, "entity_id", None)
+            details = getattr(record, "details", None)
+            self.writer.add(
+                AuditEntry(
+                    created_at=datetime.fromtimestamp(record.created, timezone.utc).replace(
+                        tzinfo=None
+                    ),
+                    action=getattr(record, "action", "log"),
+                    entity=getattr(record, "entity", "audit"),
+                    entity_id=None if entity_id is None else str(entity_id),
+                    correlation_id=correlation_id.get(),
+                    message=record.getMessage(),
+                    details=None if details is None else orjson.dumps(details, default=str).decode(),
+                )
+            )
+        except Exception:
+            self.handleError(record)
+
+
+audit_writer = AuditWriter(
+    max_size=AUDIT_BUFFER_SIZE,
+    batch_size=AUDIT_BATCH_SIZE,
+    flush_interval=AUDIT_FLUSH_SECONDS,
+)
+
+
+def setup_audit_log() -> None:
+    """Send the "audit" logger to the audit_log table instead of the application log."""
+    if not any(isinstance(handler, AuditLogHandler) for handler in audit_logger.handlers):
+        audit_logger.addHandler(AuditLogHandler(audit_writer))
+    audit_logger.setLevel(logging.INFO)
+    # Audit details can hold personal data; they belong in the table, not in stdout.
+    audit_logger.propagate = False
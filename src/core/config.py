@@ -27,6 +27,64 @@ else:
         default="",
     )
 
+# Optional read replica; read-only repository queries are sent here when set.
+REPLICA_DATABASE_URL = config("REPLICA_DATABASE_URL", cast=str, default="")
+
+# Database pool (postgres only)
+DB_POOL_MIN_SIZE = config("DB_POOL_MIN_SIZE", cast=int, default=2)
+DB_POOL_MAX_SIZE = config("DB_POOL_MAX_SIZE", cast=int, default=10)
+DB_POOL_ACQUIRE_TIMEOUT = config("DB_POOL_ACQUIRE_TIMEOUT", cast=float, default=10.0)
+DB_STATEMENT_TIMEOUT_MS = config("DB_STATEMENT_TIMEOUT_MS", cast=int, default=30000)
+# Idle connections are closed after this many seconds and recycled after MAX_QUERIES.
+DB_CONNECTION_IDLE_LIFETIME = config("DB_CONNECTION_IDLE_LIFETIME", cast=float, default=300.0)
+DB_CONNECTION_MAX_QUERIES = config("DB_CONNECTION_MAX_QUERIES", cast=int, default=50000)
+DB_CONNECT_RETRIES = config("DB_CONNECT_RETRIES", cast=int, default=3)
+
+# Partitioning (payments and transactions, postgres only)
+PARTITION_MONTHS_AHEAD = config("PARTITION_MONTHS_AHEAD", cast=int, default=3)
+PARTITION_RETENTION_MONTHS = config("PARTITION_RETENTION_MONTHS", cast=int, default=0)
+# Soft-deleted rows older than this move to the <table>_archive tables, ARCHIVE_BATCH_SIZE rows
+# per transaction; 0 keeps them in place.
+ARCHIVE_RETENTION_DAYS = config("ARCHIVE_RETENTION_DAYS", cast=int, default=90)
+ARCHIVE_BATCH_SIZE = config("ARCHIVE_BATCH_SIZE", cast=int, default=1000)
+
+# Response compression; responses smaller than the minimum size are sent as-is.
+COMPRESSION_MINIMUM_SIZE = config("COMPRESSION_MINIMUM_SIZE", cast=int, default=1000)
+GZIP_COMPRESS_LEVEL = config("GZIP_COMPRESS_LEVEL", cast=int, default=6)
+BROTLI_QUALITY = config("BROTLI_QUALITY", cast=int, default=4)
+
+# Server (gunicorn.conf.py); WEB_CONCURRENCY=0 derives the worker count from CPUs and memory.
+WEB_CONCURRENCY = config("WEB_CONCURRENCY", cast=int, default=0)
+WORKER_MEMORY_MB = config("WORKER_MEMORY_MB", cast=int, default=160)
+SERVER_BIND = config("SERVER_BIND", cast=str, default="0.0.0.0:8080")
+SERVER_WORKER_CLASS = config(
+    "SERVER_WORKER_CLASS", cast=str, default="src.core.workers.UvloopWorker"
+)
+SERVER_TIMEOUT = config("SERVER_TIMEOUT", cast=int, default=30)
+SERVER_GRACEFUL_TIMEOUT = config("SERVER_GRACEFUL_TIMEOUT", cast=int, default=30)
+SERVER_KEEPALIVE = config("SERVER_KEEPALIVE", cast=int, default=5)
+# Workers are recycled after MAX_REQUESTS (+ up to JITTER) requests; 0 disables it.
+SERVER_MAX_REQUESTS = config("SERVER_MAX_REQUESTS", cast=int, default=2000)
+SERVER_MAX_REQUESTS_JITTER = config("SERVER_MAX_REQUESTS_JITTER", cast=int, default=200)
+SERVER_PRELOAD = config("SERVER_PRELOAD", cast=bool, default=True)
+# Mount only health routes at import and load the other routers after startup.
+LAZY_ROUTES = config("LAZY_ROUTES", cast=bool, default=True)
+
+# Logging; LOG_FORMAT is json or text. Access logs of requests that are neither server
+# errors nor slower than LOG_ACCESS_SLOW_MS are kept with probability LOG_ACCESS_SAMPLE_RATE.
+LOG_LEVEL = config("LOG_LEVEL", cast=str, default="INFO")
+LOG_FORMAT = config("LOG_FORMAT", cast=str, default="json")
+LOG_ACCESS_SAMPLE_RATE = config("LOG_ACCESS_SAMPLE_RATE", cast=float, default=0.1)
+LOG_ACCESS_SLOW_MS = config("LOG_ACCESS_SLOW_MS", cast=float, default=1000.0)
+# Records beyond this many waiting to be written are dropped instead of blocking requests.
+LOG_QUEUE_SIZE = config("LOG_QUEUE_SIZE", cast=int, default=10000)
+
+# Audit log: entries are buffered and inserted in batches of up to AUDIT_BATCH_SIZE every
+# AUDIT_FLUSH_SECONDS; beyond AUDIT_BUFFER_SIZE waiting entries new ones are dropped.
+AUDIT_BATCH_SIZE = config("AUDIT_BATCH_SIZE", cast=int, default=200)
+AUDIT_FLUSH_SECONDS = config("AUDIT_FLUSH_SECONDS", cast=float, default=1.0)
+AUDIT_BUFFER_SIZE = config("AUDIT_BUFFER_SIZE", cast=int, default=50000)
+
 # JWT
 ACCESS_TOKEN_EXPIRE_MINUTES = config(
     "ACCESS_TOKEN_EXPIRE_MINUTES", cast=int, default=60
@@ -44,3 +102,57 @@ if PAYSTACK_ENV == "PROD":
 else:
     PAYSTACK_PUBLIC_KEY = config("PAYSTACK_TEST_PUBLIC_KEY")
     PAYSTACK_SECRET_KEY = config("PAYSTACK_TEST_SECRET_KEY")
+# Idle seconds a pooled Paystack connection is kept open for reuse.
+PAYSTACK_KEEPALIVE_EXPIRY = config("PAYSTACK_KEEPALIVE_EXPIRY", cast=float, default=60.0)
+# Cached bank lists and resolved account names (src/services/paystack_lookups.py). Entries past
+# PAYSTACK_CACHE_REFRESH_AFTER of their TTL are refreshed in the background; an empty sqlite path
+# keeps the cache in memory only.
+PAYSTACK_BANKS_CACHE_TTL_SECONDS = config("PAYSTACK_BANKS_CACHE_TTL_SECONDS", cast=float, default=86400.0)
+PAYSTACK_ACCOUNT_CACHE_TTL_SECONDS = config("PAYSTACK_ACCOUNT_CACHE_TTL_SECONDS", cast=float, default=604800.0)
+PAYSTACK_CACHE_REFRESH_AFTER = config("PAYSTACK_CACHE_REFRESH_AFTER", cast=float, default=0.8)
+PAYSTACK_CACHE_SQLITE_PATH = config("PAYSTACK_CACHE_SQLITE_PATH", cast=str, default="")
+
+# Startup warm-up; the Paystack probe is skipped when it takes longer than this.
+WARMUP_PAYSTACK_TIMEOUT = config("WARMUP_PAYSTACK_TIMEOUT", cast=float, default=5.0)
+# How often the cached /readyz status is recomputed in the background.
+READINESS_REFRESH_SECONDS = config("READINESS_REFRESH_SECONDS", cast=float, default=5.0)
+
+# In-process scheduler (src/core/scheduler.py).
+SCHEDULER_ENABLED = config("SCHEDULER_ENABLED", cast=bool, default=True)
+SCHEDULER_LEADER_RETRY_SECONDS = config("SCHEDULER_LEADER_RETRY_SECONDS", cast=float, default=15.0)
+SCHEDULER_SHUTDOWN_GRACE_SECONDS = config("SCHEDULER_SHUTDOWN_GRACE_SECONDS", cast=float, default=10.0)
+# sqlite only: the file the leader locks; empty means "<database file>.scheduler.lock".
+SCHEDULER_LOCK_FILE = config("SCHEDULER_LOCK_FILE", cast=str, default="")
+
+# Durable job queue (src/core/job_queue.py); JOB_WORKERS consumers per process, 0 turns them off.
+JOB_WORKERS = config("JOB_WORKERS", cast=int, default=2)
+JOB_POLL_SECONDS = config("JOB_POLL_SECONDS", cast=float, default=1.0)
+# A claimed job is hidden from other workers this long; the worker renews it while the job runs.
+JOB_VISIBILITY_TIMEOUT_SECONDS = config("JOB_VISIBILITY_TIMEOUT_SECONDS", cast=float, default=60.0)
+JOB_MAX_ATTEMPTS = config("JOB_MAX_ATTEMPTS", cast=int, default=5)
+JOB_RETRY_BASE_SECONDS = config("JOB_RETRY_BASE_SECONDS", cast=float, default=10.0)
+JOB_RETRY_MAX_SECONDS = config("JOB_RETRY_MAX_SECONDS", cast=float, default=3600.0)
+JOB_SHUTDOWN_GRACE_SECONDS = config("JOB_SHUTDOWN_GRACE_SECONDS", cast=float, default=10.0)
+# Finished jobs older than this are deleted by the purge-finished-jobs scheduled job.
+JOB_RETENTION_DAYS = config("JOB_RETENTION_DAYS", cast=int, default=7)
+
+# Charges still pending this long without a webhook are checked against Paystack.
+CHARGE_INTENT_RECONCILE_AFTER_MINUTES = config("CHARGE_INTENT_RECONCILE_AFTER_MINUTES", cast=int, default=15)
+CHARGE_INTENT_RECONCILE_BATCH = config("CHARGE_INTENT_RECONCILE_BATCH", cast=int, default=100)
+# Charges Paystack still has not settled after this long are marked expired.
+CHARGE_INTENT_EXPIRE_AFTER_HOURS = config("CHARGE_INTENT_EXPIRE_AFTER_HOURS", cast=int, default=24)
+
+# Settlements credit the school's wallet and, when set, this admin wallet with the admin share.
+SETTLEMENT_ADMIN_WALLET_ID = config("SETTLEMENT_ADMIN_WALLET_ID", cast=str, default="")
+# Admin and super-admin wallet credits are spread over this many rows per wallet and folded
+# into the wallet every WALLET_COMPACT_SECONDS.
+WALLET_BALANCE_STRIPES = config("WALLET_BALANCE_STRIPES", cast=int, default=16)
+WALLET_COMPACT_SECONDS = config("WALLET_COMPACT_SECONDS", cast=float, default=60.0)
+
+# USSD charge guard: per phone+school token bucket and duplicate-request window.
+USSD_RATE_LIMIT_CAPACITY = config("USSD_RATE_LIMIT_CAPACITY", cast=int, default=3)
+USSD_RATE_LIMIT_REFILL_SECONDS = config("USSD_RATE_LIMIT_REFILL_SECONDS", cast=float, default=20.0)
+USSD_DEDUP_WINDOW_SECONDS = config("USSD_DEDUP_WINDOW_SECONDS", cast=float, default=30.0)
+# Path of a sqlite file shared by the workers on this host; empty uses one in the temp
+# directory when more than one worker runs, and keeps the state in memory otherwise.
+USSD_GUARD_SQLITE_PATH = config("USSD_GUARD_SQLITE_PATH", cast=str, default="")
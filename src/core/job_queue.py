@@ -0,0 +1,232 @@
+"""Durable background jobs: a database-backed queue and the workers that drain it."""
+
+import asyncio
+import logging
+import os
+import socket
+import time
+import traceback
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+from databases import Database
+from fastapi import FastAPI
+
+from src.core.config import (
+    JOB_MAX_ATTEMPTS,
+    JOB_RETRY_BASE_SECONDS,
+    JOB_RETRY_MAX_SECONDS,
+)
+from src.core.logs import correlation_id
+from src.core.metrics import Counter, Histogram
+from src.db.repositories.jobs import JobRepository
+from src.db.router import DatabaseRouter
+from src.models.jobs import JobCreate, JobInDb
+
+app_logger = logging.getLogger("app")
+
+# Longest traceback kept in jobs.last_error.
+MAX_ERROR_LENGTH = 4000
+
+JOB_SECONDS = Histogram(
+    "job_seconds",
+    "Duration of background job attempts.",
+    buckets=(0.01, 0.1, 0.5, 1.0, 5.0, 15.0, 60.0, 300.0, 900.0),
+)
+JOB_RUNS = Counter(
+    "job_runs_total",
+    "Background job attempts by outcome (succeeded, retrying, failed, released, lost).",
+)
+
+JobHandler = Callable[[FastAPI, Dict[str, Any]], Awaitable[Any]]
+
+
+def retry_delay(attempts: int) -> float:
+    """Seconds before retrying a job that failed `attempts` times: doubling, capped."""
+    return min(JOB_RETRY_BASE_SECONDS * 2 ** (attempts - 1), JOB_RETRY_MAX_SECONDS)
+
+
+async def enqueue_job(
+    db: Union[Database, DatabaseRouter],
+    name: str,
+    payload: Optional[Dict[str, Any]] = None,
+    *,
+    priority: int = 0,
+    run_at: Optional[datetime] = None,
+    max_attempts: int = JOB_MAX_ATTEMPTS,
+) -> JobInDb:
+    """Queue a job for the workers; it is visible to them once this returns."""
+    new_job = JobCreate(
+        name=name,
+        payload=payload or {},
+        priority=priority,
+        run_at=run_at,
+        max_attempts=max_attempts,
+    )
+    return await JobRepository(db).enqueue(new_job=new_job)
+
+
+class JobWorkers:
+    """Consumers that claim and run queued jobs in this worker's event loop.
+
+    Each consumer claims one job at a time with `FOR UPDATE SKIP LOCKED`, so any number
+    of consumers across processes and machines share the queue without taking the same
+    job. A claimed job is leased for `visibility_timeout` seconds and the lease is renewed
+    while its handler runs; another consumer only picks it up again when the lease runs
+    out, i.e. when the worker that held it died. Handlers may therefore run more than
+    once for the same job and should be idempotent.
+    """
+
+    def __init__(
+        self,
+        app: FastAPI,
+        *,
+        concurrency: int,
+        poll_interval: float,
+        visibility_timeout: float,
+        shutdown_grace: float,
+    ) -> None:
+        """Initialize with no handlers."""
+        self.app = app
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.visibility_timeout = visibility_timeout
+        self.shutdown_grace = shutdown_grace
+        self.handlers: Dict[str, JobHandler] = {}
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._stopping = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+
+    def add_handler(self, name: str, function: JobHandler) -> None:
+        """Register the coroutine that runs jobs called `name`; it gets the app and the payload."""
+        if name in self.handlers:
+            raise ValueError(f"Job handler {name} is already registered")
+        self.handlers[name] = function
+
+    def start(self) -> None:
+        """Start `concurrency` consumers."""
+        self._stopping.clear()
+        self._tasks = [
+            asyncio.create_task(self._consume(f"{self.worker_id}:{index}"), name=f"job-worker-{index}")
+            for index in range(self.concurrency)
+        ]
+
+    async def stop(self) -> None:
+        """Stop claiming; running jobs get `shutdown_grace` seconds, then go back to the queue."""
+        self._stopping.set()
+        if not self._tasks:
+            return
+        _, pending = await asyncio.wait(self._tasks, timeout=self.shutdown_grace)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def run_until_stopped(self) -> None:
+        """Wait until `stop` is called; used by the standalone worker."""
+        await self._stopping.wait()
+
+    async def _sleep(self, seconds: float) -> bool:
+        """Sleep unless stopping; returns False once the workers are stopping."""
+        try:
+            await asyncio.wait_for(self._stopping.wait(), timeout=max(seconds, 0))
+        except asyncio.TimeoutError:
+            return True
+        return False
+
+    async def _consume(self, consumer: str) -> None:
+        """Claim and run jobs until stopping, polling while the queue is empty."""
+        repository = JobRepository(self.app.state._db)
+        while not self._stopping.is_set():
+            try:
+                jobs = await repository.claim(
+                    worker_id=consumer, visibility_timeout=self.visibility_timeout
+                )
+            except Exception as e:
+                app_logger.warning(f"Claiming jobs failed: {e!r}")
+                jobs = []
+            if not jobs:
+                if not await self._sleep(self.poll_interval):
+                    return
+                continue
+            try:
+                await self._process(repository, consumer, jobs[0])
+            except Exception as e:
+                # The job keeps its lease and is retried once that runs out.
+                app_logger.warning(f"Recording job {jobs[0].id} failed: {e!r}")
+
+    async def _renew(
+        self, repository: JobRepository, consumer: str, job: JobInDb, run: asyncio.Task
+    ) -> bool:
+        """Renew the lease every third of the timeout; cancels `run` and returns False if it was lost."""
+        while True:
+            await asyncio.sleep(self.visibility_timeout / 3)
+            try:
+                renewed = await repository.renew_lease(
+                    id=job.id, worker_id=consumer, visibility_timeout=self.visibility_timeout
+                )
+            except Exception as e:
+                # The lease is still ours until it expires; try again next round.
+                app_logger.warning(f"Renewing job {job.id} failed: {e!r}")
+                continue
+            if not renewed:
+                run.cancel()
+                return False
+
+    async def _process(self, repository: JobRepository, consumer: str, job: JobInDb) -> None:
+        """Run one claimed job and record the outcome of the attempt."""
+        correlation_id.set(f"job:{job.id}")
+        handler = self.handlers.get(job.name)
+        if handler is None:
+            await self._finish(repository, consumer, job, "failed", f"No handler for job {job.name}")
+            return
+        if job.attempts > job.max_attempts:
+            # Claimed again after a worker died during its last attempt.
+            await self._finish(repository, consumer, job, "failed", "Lease expired on the last attempt")
+            return
+        start = time.perf_counter()
+        run = asyncio.create_task(handler(self.app, job.payload), name=f"job-{job.id}")
+        renew = asyncio.create_task(self._renew(repository, consumer, job, run))
+        try:
+            result = await run
+        except asyncio.CancelledError:
+            if renew.done() and not renew.cancelled() and renew.result() is False:
+                app_logger.warning(f"Job {job.name} {job.id} lost its lease and was cancelled")
+                JOB_RUNS.inc(job=job.name, status="lost")
+                return
+            # Shutting down: hand the job back so another worker runs it right away.
+            await repository.release(id=job.id, worker_id=consumer)
+            JOB_RUNS.inc(job=job.name, status="released")
+            raise
+        except Exception:
+            error = traceback.format_exc()[-MAX_ERROR_LENGTH:]
+            if job.attempts >= job.max_attempts:
+                await self._finish(repository, consumer, job, "failed", error)
+            else:
+                await self._finish(
+                    repository, consumer, job, "retrying", error, retry_delay(job.attempts)
+                )
+        else:
+            if not await repository.complete(id=job.id, worker_id=consumer, result=result):
+                app_logger.warning(f"Job {job.name} {job.id} finished after losing its lease")
+            JOB_RUNS.inc(job=job.name, status="succeeded")
+        finally:
+            renew.cancel()
+            JOB_SECONDS.observe(time.perf_counter() - start, job=job.name)
+
+    async def _finish(
+        self,
+        repository: JobRepository,
+        consumer: str,
+        job: JobInDb,
+        status: str,
+        error: str,
+        retry_in: Optional[float] = None,
+    ) -> None:
+        """Record a failed attempt, queueing a retry when `retry_in` is given."""
+        app_logger.warning(
+            f"Job {job.name} {job.id} attempt {job.attempts}/{job.max_attempts} {status}: "
+            f"{error.strip().splitlines()[-1]}"
+        )
+        await repository.fail(id=job.id, worker_id=consumer, error=error, retry_in=retry_in)
+        JOB_RUNS.inc(job=job.name, status=status)
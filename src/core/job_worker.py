@@ -0,0 +1,58 @@
+"""Standalone job worker: drains the job queue without serving HTTP.
+
+Run `python -m src.core.job_worker [--concurrency N]` on as many machines as the
+queue needs; the consumers share it through `FOR UPDATE SKIP LOCKED`.
+"""
+
+import argparse
+import asyncio
+import logging
+import signal
+
+from fastapi import FastAPI
+
+from src.core.audit import audit_writer, setup_audit_log
+from src.core.config import JOB_WORKERS
+from src.core.logs import setup_logging, start_logging, stop_logging
+from src.core.tasks import create_job_workers
+from src.db.repositories.tasks import connect_database, disconnect_database
+
+app_logger = logging.getLogger("app")
+
+
+async def run_worker(concurrency: int) -> None:
+    """Connect to the database and run the consumers until SIGTERM or SIGINT."""
+    app = FastAPI()
+    await connect_database(app)
+    audit_writer.start(app.state._db)
+    workers = create_job_workers(app, concurrency)
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, lambda: asyncio.ensure_future(workers.stop()))
+    workers.start()
+    app_logger.info(f"Job worker {workers.worker_id} started with {concurrency} consumers")
+    try:
+        await workers.run_until_stopped()
+        await workers.stop()
+    finally:
+        await audit_writer.stop()
+        await disconnect_database(app)
+    app_logger.info(f"Job worker {workers.worker_id} stopped")
+
+
+def main() -> None:
+    """Parse the command line and run the worker."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=max(JOB_WORKERS, 1))
+    args = parser.parse_args()
+    setup_logging()
+    setup_audit_log()
+    start_logging()
+    try:
+        asyncio.run(run_worker(args.concurrency))
+    finally:
+        stop_logging()
+
+
+if __name__ == "__main__":
+    main()
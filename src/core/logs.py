@@ -0,0 +1,180 @@
+"""Logging setup: JSON records written by a background thread, tagged with a correlation id.
+
+Logging on the event loop only puts records on a queue; a writer thread formats them and
+writes them to stdout, so a slow or blocked stdout never stalls requests.
+"""
+
+import logging
+import sys
+import threading
+from collections import deque
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Deque, List, Optional, TextIO
+
+import orjson
+
+from src.core.config import LOG_FORMAT, LOG_LEVEL, LOG_QUEUE_SIZE
+from src.core.metrics import Counter
+
+# Id of the request (or job) the current task is working on; "-" outside of one.
+correlation_id: ContextVar[str] = ContextVar("correlation_id", default="-")
+
+LOG_RECORDS_DROPPED = Counter(
+    "log_records_dropped_total",
+    "Log records dropped because the log queue was full.",
+)
+
+TEXT_FORMAT = "%(asctime)s %(levelname)s [%(correlation_id)s] %(name)s: %(message)s"
+
+# Attributes every LogRecord has; anything else on a record came from `extra=`.
+# uvicorn adds color_message, a copy of the message with terminal colors.
+_RECORD_ATTRIBUTES = frozenset(
+    vars(logging.LogRecord("", 0, "", 0, "", None, None))
+) | {"message", "asctime", "correlation_id", "color_message"}
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line with the message, correlation id and any `extra` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Serialize the record."""
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "correlation_id": getattr(record, "correlation_id", "-"),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return orjson.dumps(entry, default=str).decode()
+
+
+class LogQueueHandler(logging.Handler):
+    """Queue records for a writer thread that formats and writes them in batches.
+
+    Emitting only appends to a deque; the writer wakes every `flush_interval` seconds
+    rather than on every record, so logging does not hand the GIL back and forth with it
+    on each request. Until the writer is started (each worker starts its own after
+    forking) records are written in place.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO,
+        formatter: logging.Formatter,
+        max_size: int = LOG_QUEUE_SIZE,
+        flush_interval: float = 0.05,
+    ) -> None:
+        """Initialize with the stream the writer thread writes to."""
+        super().__init__()
+        self.stream = stream
+        self.setFormatter(formatter)
+        self.max_size = max_size
+        self.flush_interval = flush_interval
+        self._records: Deque[logging.LogRecord] = deque()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Queue the record, dropping it when the queue is full."""
+        record.correlation_id = correlation_id.get()
+        if self._thread is None:
+            self._write([record])
+            return
+        if len(self._records) >= self.max_size:
+            LOG_RECORDS_DROPPED.inc()
+            return
+        # Freeze the message now; the arguments may change before the writer gets to it.
+        record.msg = record.getMessage()
+        record.args = None
+        self._records.append(record)
+
+    def _write(self, records: List[logging.LogRecord]) -> None:
+        """Format the records and write them with one write and one flush."""
+        lines = []
+        for record in records:
+            try:
+                lines.append(self.format(record))
+            except Exception:
+                self.handleError(record)
+        if lines:
+            try:
+                self.stream.write("\n".join(lines) + "\n")
+                self.stream.flush()
+            except Exception:
+                self.handleError(records[-1])
+
+    def _drain(self) -> None:
+        """Write everything queued so far."""
+        while self._records:
+            batch = []
+            while self._records and len(batch) < 1000:
+                batch.append(self._records.popleft())
+            self._write(batch)
+
+    def _run(self) -> None:
+        """Writer thread: drain the queue every flush interval until stopped."""
+        while not self._stopping.wait(self.flush_interval):
+            self._drain()
+        self._drain()
+
+    def start(self) -> None:
+        """Start the writer thread in this process."""
+        if self._thread is None:
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Write out the queued records and stop the writer thread."""
+        if self._thread is not None:
+            thread, self._thread = self._thread, None
+            self._stopping.set()
+            thread.join()
+            self._drain()
+
+
+_handler: Optional[LogQueueHandler] = None
+
+
+def setup_logging(level: str = LOG_LEVEL, log_format: str = LOG_FORMAT) -> LogQueueHandler:
+    """Route every logger through the queue handler on the root logger; safe to call twice."""
+    global _handler
+    if _handler is None:
+        # Neither format prints the caller, thread or process, so skip collecting them for
+        # every record (the stack walk in findCaller is the costly part).
+        logging._srcfile = None
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+        if log_format == "json":
+            formatter = JsonFormatter()
+        else:
+            formatter = logging.Formatter(TEXT_FORMAT)
+        _handler = LogQueueHandler(sys.stdout, formatter)
+        root = logging.getLogger()
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+        root.addHandler(_handler)
+    logging.getLogger().setLevel(level.upper())
+    return _handler
+
+
+def start_logging() -> None:
+    """Start writing logs from the background thread."""
+    setup_logging().start()
+
+
+def stop_logging() -> None:
+    """Flush the queue and go back to writing logs in place."""
+    if _handler is not None:
+        _handler.stop()
@@ -0,0 +1,147 @@
+"""In-process metrics exported in the Prometheus text format."""
+
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+LabelValues = Tuple[Tuple[str, str], ...]
+
+REGISTRY: List["Metric"] = []
+
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_labels(labels: LabelValues, extra: Optional[Tuple[str, str]] = None) -> str:
+    """Render labels as {name="value",...}."""
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{value}"' for name, value in pairs) + "}"
+
+
+class Metric:
+    """Base class for metrics held in the registry."""
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str) -> None:
+        """Register the metric under its name."""
+        self.name = name
+        self.documentation = documentation
+        self._lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def samples(self) -> List[str]:
+        """Return the exposition lines for this metric."""
+        raise NotImplementedError
+
+    def render(self) -> str:
+        """Render the metric with its HELP and TYPE header."""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+            *self.samples(),
+        ]
+        return "\n".join(lines)
+
+
+class Gauge(Metric):
+    """A value that can go up and down, set directly or read from a callback."""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str) -> None:
+        """Initialize an empty gauge."""
+        super().__init__(name, documentation)
+        self._values: Dict[LabelValues, float] = {}
+        self._functions: Dict[LabelValues, Callable[[], float]] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the gauge value."""
+        with self._lock:
+            self._values[tuple(sorted(labels.items()))] = value
+
+    def set_function(self, function: Callable[[], float], **labels: str) -> None:
+        """Read the gauge value from `function` at scrape time."""
+        with self._lock:
+            self._functions[tuple(sorted(labels.items()))] = function
+
+    def samples(self) -> List[str]:
+        """Return the current values."""
+        with self._lock:
+            values = dict(self._values)
+            functions = dict(self._functions)
+        for labels, function in functions.items():
+            values[labels] = function()
+        return [f"{self.name}{_format_labels(k)} {v}" for k, v in values.items()]
+
+
+class Counter(Metric):
+    """A value that only goes up."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str) -> None:
+        """Initialize an empty counter."""
+        super().__init__(name, documentation)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        """Add `amount` to the counter."""
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self) -> List[str]:
+        """Return the current totals."""
+        with self._lock:
+            values = dict(self._values)
+        return [f"{self.name}{_format_labels(k)} {v}" for k, v in values.items()]
+
+
+class Histogram(Metric):
+    """Cumulative histogram of observed values."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self, name: str, documentation: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> None:
+        """Initialize the histogram with its bucket upper bounds."""
+        super().__init__(name, documentation)
+        self.buckets = tuple(sorted(buckets))
+        self._counts: Dict[LabelValues, List[int]] = {}
+        self._sums: Dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record an observation."""
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            counts = self._counts.setdefault(key, [0] * (len(self.buckets) + 1))
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+                    break
+            else:
+                counts[-1] += 1
+            self._sums[key] = self._sums.get(key, 0.0) + value
+
+    def samples(self) -> List[str]:
+        """Return cumulative bucket counts, sum and count per label set."""
+        lines = []
+        with self._lock:
+            for labels, counts in self._counts.items():
+                cumulative = 0
+                for bound, count in zip(self.buckets + (float("inf"),), counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else str(bound)
+                    lines.append(
+                        f"{self.name}_bucket{_format_labels(labels, ('le', le))} {cumulative}"
+                    )
+                lines.append(f"{self.name}_sum{_format_labels(labels)} {self._sums[labels]}")
+                lines.append(f"{self.name}_count{_format_labels(labels)} {cumulative}")
+        return lines
+
+
+def render_metrics() -> str:
+    """Render every registered metric."""
+    return "\n".join(metric.render() for metric in REGISTRY) + "\n"
@@ -0,0 +1,53 @@
+"""Readiness status computed in the background, so probes only read a cached result."""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict
+
+from fastapi import FastAPI
+
+from src.core.config import READINESS_REFRESH_SECONDS
+from src.db.repositories.tasks import check_database_health
+from src.services.paystack_client import paystack_health
+
+app_logger = logging.getLogger("app")
+
+
+async def refresh_readiness(app: FastAPI) -> None:
+    """Check the database pools once and store the result in app.state.readiness."""
+    app.state.readiness = {
+        "database": await check_database_health(app),
+        "checked_at": time.time(),
+    }
+
+
+async def run_readiness_refresher(app: FastAPI) -> None:
+    """Refresh the readiness status every READINESS_REFRESH_SECONDS until cancelled."""
+    while True:
+        await asyncio.sleep(READINESS_REFRESH_SECONDS)
+        try:
+            await refresh_readiness(app)
+        except Exception as e:
+            app_logger.warning(f"Readiness refresh failed: {e!r}")
+
+
+def readiness_snapshot(app: FastAPI) -> Dict[str, Any]:
+    """The latest readiness status; ready once warm-up is done and the primary pool is healthy.
+
+    Paystack health is reported but does not affect readiness, since every worker
+    shares the same upstream.
+    """
+    state = app.state
+    readiness = getattr(state, "readiness", None)
+    warmup = getattr(state, "warmup", {})
+    if not getattr(state, "ready", False) or readiness is None:
+        return {"status": "warming_up", "warmup": warmup}
+    ready = readiness["database"]["status"] == "ok"
+    return {
+        "status": "ready" if ready else "unavailable",
+        **readiness,
+        "paystack": paystack_health.snapshot(),
+        "age_seconds": round(time.time() - readiness["checked_at"], 1),
+        "warmup": warmup,
+    }
@@ -0,0 +1,282 @@
+"""In-process scheduler for periodic jobs, run by one leader worker at a time."""
+
+import asyncio
+import logging
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, FrozenSet, List, Optional
+
+from databases import Database
+from fastapi import FastAPI
+
+from src.core.logs import correlation_id
+from src.core.metrics import Counter, Gauge, Histogram
+from src.db.locks import advisory_lock, file_lock
+from src.db.pool import is_postgres
+
+app_logger = logging.getLogger("app")
+
+LEADER_LOCK = "scheduler-leader"
+
+SCHEDULER_JOB_SECONDS = Histogram(
+    "scheduler_job_seconds",
+    "Duration of scheduled job runs.",
+    buckets=(0.01, 0.1, 0.5, 1.0, 5.0, 15.0, 60.0, 300.0, 900.0),
+)
+SCHEDULER_JOB_RUNS = Counter(
+    "scheduler_job_runs_total", "Scheduled job runs by outcome (ok, error, skipped)."
+)
+SCHEDULER_IS_LEADER = Gauge(
+    "scheduler_is_leader", "1 when this worker runs the leader-only scheduled jobs."
+)
+
+JobFunction = Callable[[FastAPI], Awaitable[None]]
+
+
+class CronSchedule:
+    """A five-field cron expression (minute hour day month weekday) evaluated in UTC.
+
+    Fields accept `*`, numbers, ranges `a-b`, steps `*/n` or `a-b/n` and comma lists.
+    Weekday 0 is Sunday. Like cron, when both day and weekday are restricted either may match.
+    """
+
+    RANGES = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 6))
+
+    def __init__(self, expression: str) -> None:
+        """Parse the expression; raises ValueError when it is malformed."""
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression needs 5 fields: {expression!r}")
+        self.expression = expression
+        parsed = [self._parse(field, low, high) for field, (low, high) in zip(fields, self.RANGES)]
+        self.minutes, self.hours, self.days, self.months, self.weekdays = parsed
+        self.any_day = fields[2] == "*"
+        self.any_weekday = fields[4] == "*"
+
+    @staticmethod
+    def _parse(field: str, low: int, high: int) -> FrozenSet[int]:
+        """Expand one field into the set of values it matches."""
+        values = set()
+        for part in field.split(","):
+            span, _, step = part.partition("/")
+            if span == "*":
+                start, end = low, high
+            elif "-" in span:
+                start, end = (int(value) for value in span.split("-"))
+            else:
+                start = end = int(span)
+            if start < low or end > high or start > end:
+                raise ValueError(f"Cron field {field!r} is out of range {low}-{high}")
+            values.update(range(start, end + 1, int(step) if step else 1))
+        return frozenset(values)
+
+    def _day_matches(self, moment: datetime) -> bool:
+        """Check the day-of-month and weekday fields."""
+        day = moment.day in self.days
+        weekday = (moment.isoweekday() % 7) in self.weekdays
+        if self.any_day or self.any_weekday:
+            return day and weekday
+        return day or weekday
+
+    def next_after(self, moment: datetime) -> datetime:
+        """The first matching minute strictly after `moment`."""
+        candidate = moment.astimezone(timezone.utc).replace(second=0, microsecond=0)
+        candidate += timedelta(minutes=1)
+        # Five years covers every valid expression, including Feb 29.
+        limit = candidate + timedelta(days=366 * 5)
+        while candidate < limit:
+            if candidate.month not in self.months:
+                candidate = (candidate.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+            elif not self._day_matches(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+            elif candidate.hour not in self.hours:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+            elif candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+            else:
+                return candidate
+        raise ValueError(f"Cron expression never matches: {self.expression!r}")
+
+
+class ScheduledJob:
+    """A job function with its schedule."""
+
+    def __init__(
+        self,
+        name: str,
+        function: JobFunction,
+        *,
+        every: Optional[float] = None,
+        cron: Optional[str] = None,
+        jitter: float = 0,
+        leader_only: bool = True,
+    ) -> None:
+        """Describe a job that runs every `every` seconds or on a `cron` expression."""
+        if (every is None) == (cron is None):
+            raise ValueError(f"Job {name} needs exactly one of every or cron")
+        self.name = name
+        self.function = function
+        self.every = every
+        self.cron = CronSchedule(cron) if cron else None
+        self.jitter = jitter
+        self.leader_only = leader_only
+
+    def next_due(self, after: datetime) -> datetime:
+        """The first scheduled time after `after`, without jitter."""
+        if self.cron is not None:
+            return self.cron.next_after(after)
+        return after + timedelta(seconds=self.every)
+
+
+class Scheduler:
+    """Runs scheduled jobs in this worker's event loop.
+
+    On postgres, leader-only jobs run in the one worker that holds the scheduler advisory
+    lock; the lock lives on a pooled connection kept for as long as the worker leads, so
+    it passes to another worker when this one exits. On sqlite the workers share the
+    database file, so the leader holds a lock on a file beside it. A job never overlaps itself: a run
+    that is still going when the next one is due makes that one count as skipped.
+    """
+
+    def __init__(
+        self, app: FastAPI, *, leader_retry: float, shutdown_grace: float, lock_file: str = ""
+    ) -> None:
+        """Initialize with no jobs; `lock_file` overrides the sqlite leader lock's path."""
+        self.app = app
+        self.leader_retry = leader_retry
+        self.lock_file = lock_file
+        self.shutdown_grace = shutdown_grace
+        self.jobs: Dict[str, ScheduledJob] = {}
+        self.is_leader = False
+        self._stopping = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+
+    def add_job(self, name: str, function: JobFunction, **schedule: object) -> ScheduledJob:
+        """Register a job; see ScheduledJob for the schedule options."""
+        if name in self.jobs:
+            raise ValueError(f"Job {name} is already scheduled")
+        job = self.jobs[name] = ScheduledJob(name, function, **schedule)
+        return job
+
+    def start(self) -> None:
+        """Start the leader election and one loop per job."""
+        self._stopping.clear()
+        self._tasks = [asyncio.create_task(self._lead(), name="scheduler-leader")]
+        self._tasks += [
+            asyncio.create_task(self._loop(job), name=f"job-{job.name}") for job in self.jobs.values()
+        ]
+
+    async def stop(self) -> None:
+        """Stop scheduling; running jobs get `shutdown_grace` seconds before they are cancelled."""
+        self._stopping.set()
+        if not self._tasks:
+            return
+        _, pending = await asyncio.wait(self._tasks, timeout=self.shutdown_grace)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _sleep(self, seconds: float) -> bool:
+        """Sleep unless stopping; returns False once the scheduler is stopping."""
+        try:
+            await asyncio.wait_for(self._stopping.wait(), timeout=max(seconds, 0))
+        except asyncio.TimeoutError:
+            return True
+        return False
+
+    def _database(self) -> Database:
+        """The primary database."""
+        return self.app.state._db
+
+    def _lock_file(self) -> Optional[str]:
+        """The sqlite leader lock's path, beside the database file; None for in-memory databases."""
+        if self.lock_file:
+            return self.lock_file
+        path = self._database().url.database
+        if not path or path == ":memory:":
+            return None
+        return f"{path}.scheduler.lock"
+
+    async def _lead_with_file_lock(self) -> None:
+        """Hold the sqlite leader lock while this worker can, retrying every `leader_retry` seconds."""
+        path = self._lock_file()
+        if path is None:
+            # An in-memory database is private to this process, so it has no one to share with.
+            self._set_leader(True)
+            await self._stopping.wait()
+            return
+        while not self._stopping.is_set():
+            try:
+                with file_lock(path) as acquired:
+                    if acquired:
+                        self._set_leader(True)
+                        await self._stopping.wait()
+            except OSError as e:
+                app_logger.warning(f"Scheduler could not lock {path}: {e!r}")
+            finally:
+                self._set_leader(False)
+            await self._sleep(self.leader_retry)
+
+    async def _lead(self) -> None:
+        """Hold the leader lock while this worker can, retrying every `leader_retry` seconds."""
+        database = self._database()
+        if not is_postgres(database.url):
+            await self._lead_with_file_lock()
+            return
+        while not self._stopping.is_set():
+            try:
+                async with advisory_lock(database, LEADER_LOCK) as acquired:
+                    if acquired:
+                        self._set_leader(True)
+                        # The lock is only as alive as its connection; ping it every round.
+                        while await self._sleep(self.leader_retry):
+                            await database.fetch_val(query="SELECT 1")
+            except Exception as e:
+                app_logger.warning(f"Scheduler lost its leader connection: {e!r}")
+            finally:
+                self._set_leader(False)
+            await self._sleep(self.leader_retry)
+
+    def _set_leader(self, leader: bool) -> None:
+        """Record leadership changes."""
+        if leader != self.is_leader:
+            app_logger.info(f"Scheduler {'acquired' if leader else 'released'} leadership")
+        self.is_leader = leader
+        SCHEDULER_IS_LEADER.set(1 if leader else 0)
+
+    async def _loop(self, job: ScheduledJob) -> None:
+        """Run one job on its schedule until stopping."""
+        due = job.next_due(datetime.now(timezone.utc))
+        while True:
+            delay = (due - datetime.now(timezone.utc)).total_seconds()
+            if not await self._sleep(delay + random.uniform(0, job.jitter)):
+                return
+            if not job.leader_only or self.is_leader:
+                await self._run(job)
+            due = job.next_due(due)
+            # Times that passed while the job was running are skipped rather than queued.
+            now = datetime.now(timezone.utc)
+            while due < now:
+                SCHEDULER_JOB_RUNS.inc(job=job.name, status="skipped")
+                due = job.next_due(due)
+
+    async def _run(self, job: ScheduledJob) -> None:
+        """Run a job once and record its duration and outcome."""
+        correlation_id.set(f"scheduled:{job.name}")
+        start = time.perf_counter()
+        status = "ok"
+        try:
+            await job.function(self.app)
+        except asyncio.CancelledError:
+            status = "cancelled"
+            raise
+        except Exception as e:
+            status = "error"
+            app_logger.exception(f"Scheduled job {job.name} failed", exc_info=e)
+        finally:
+            elapsed = time.perf_counter() - start
+            SCHEDULER_JOB_SECONDS.observe(elapsed, job=job.name)
+            SCHEDULER_JOB_RUNS.inc(job=job.name, status=status)
+            app_logger.info(f"Scheduled job {job.name}: {status} in {elapsed * 1000:.0f} ms")
@@ -0,0 +1,43 @@
+"""Sizing of the production server from the container's CPU and memory limits."""
+
+import math
+import os
+from typing import Optional
+
+
+def _read(path: str) -> Optional[str]:
+    """Read a cgroup file, or None when it does not exist."""
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def cpu_count() -> int:
+    """CPUs available to this process, honoring a cgroup CPU quota."""
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()
+    cpu_max = _read("/sys/fs/cgroup/cpu.max")
+    if cpu_max and not cpu_max.startswith("max"):
+        quota, period = (int(value) for value in cpu_max.split())
+        cpus = min(cpus, max(1, math.ceil(quota / period)))
+    return max(1, cpus or 1)
+
+
+def memory_mb() -> int:
+    """Memory available to this process in MiB, honoring a cgroup limit."""
+    total = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    for path in ("/sys/fs/cgroup/memory.max", "/sys/fs/cgroup/memory/memory.limit_in_bytes"):
+        limit = _read(path)
+        if limit and limit.isdigit():
+            total = min(total, int(limit))
+    return total // (1024 * 1024)
+
+
+def worker_count(requested: int = 0, worker_memory_mb: int = 160) -> int:
+    """Workers to run: `requested` if set, else 2 * CPUs + 1 capped by what fits in memory."""
+    if requested > 0:
+        return requested
+    by_cpu = 2 * cpu_count() + 1
+    by_memory = max(1, memory_mb() // worker_memory_mb)
+    return min(by_cpu, by_memory)
@@ -1,19 +1,202 @@
 """Core task: Connect and Disconnect to db when application starts and stops."""
 
-from typing import Callable
+import asyncio
+import logging
+from datetime import timedelta
+from typing import Any, Callable, Dict, Optional
 
 from fastapi import FastAPI
 
-from src.db.repositories.tasks import connect_database, disconnect_database
+from src.core.config import (
+    ARCHIVE_BATCH_SIZE,
+    ARCHIVE_RETENTION_DAYS,
+    CHARGE_INTENT_EXPIRE_AFTER_HOURS,
+    CHARGE_INTENT_RECONCILE_AFTER_MINUTES,
+    CHARGE_INTENT_RECONCILE_BATCH,
+    JOB_POLL_SECONDS,
+    JOB_RETENTION_DAYS,
+    JOB_SHUTDOWN_GRACE_SECONDS,
+    JOB_VISIBILITY_TIMEOUT_SECONDS,
+    JOB_WORKERS,
+    SCHEDULER_ENABLED,
+    SCHEDULER_LEADER_RETRY_SECONDS,
+    SCHEDULER_LOCK_FILE,
+    SCHEDULER_SHUTDOWN_GRACE_SECONDS,
+    SETTLEMENT_ADMIN_WALLET_ID,
+    WALLET_COMPACT_SECONDS,
+    WARMUP_PAYSTACK_TIMEOUT,
+)
+from src.core.audit import audit_writer
+from src.core.job_queue import JobWorkers
+from src.core.logs import start_logging, stop_logging
+from src.core.readiness import refresh_readiness, run_readiness_refresher
+from src.core.scheduler import Scheduler
+from src.core.warmup import run_warmup
+from src.db.repositories.base import utc_now
+from src.db.repositories.charge_intents import ChargeIntentRepository
+from src.db.repositories.jobs import JobRepository
+from src.db.repositories.tasks import (
+    connect_database,
+    disconnect_database,
+    load_reference_data,
+    maintain_partitioned_tables,
+    prime_database_pool,
+)
+from src.db.repositories.wallet_stripes import WalletStripeRepository
+from src.enums.wallet_type import WalletType
+from src.services.paystack_client import close_paystack_client, warm_paystack_client
+from src.services.paystack_lookups import close_lookup_caches
+
+app_logger = logging.getLogger("app")
+
+
+async def wait_for_routes(app: FastAPI) -> Optional[Dict[str, Any]]:
+    """Wait for the lazily loaded routers, when route loading is deferred."""
+    loader = getattr(app.state, "route_loader", None)
+    if loader is None:
+        return None
+    await loader.wait()
+    return {"load_ms": round(loader.seconds * 1000, 1)}
+
+
+async def connect_paystack(app: FastAPI) -> Dict[str, Any]:
+    """Resolve Paystack's host and open a pooled TLS connection to it."""
+    return {"status_code": await warm_paystack_client(WARMUP_PAYSTACK_TIMEOUT)}
+
+
+async def start_readiness_refresher(app: FastAPI) -> None:
+    """Compute the first readiness status, then keep it fresh in the background."""
+    await refresh_readiness(app)
+    app.state.readiness_task = asyncio.create_task(run_readiness_refresher(app))
+
+
+WARMUP_STEPS = (
+    ("routes", wait_for_routes),
+    ("database_pool", prime_database_pool),
+    ("paystack", connect_paystack),
+    ("reference_data", load_reference_data),
+    ("readiness", start_readiness_refresher),
+)
+
+
+async def purge_finished_jobs(app: FastAPI) -> None:
+    """Delete finished jobs older than JOB_RETENTION_DAYS."""
+    await JobRepository(app.state._db).purge_finished(older_than=timedelta(days=JOB_RETENTION_DAYS))
+
+
+async def reconcile_pending_charges(app: FastAPI) -> None:
+    """Settle, fail or expire charges whose webhook has not arrived."""
+    # Imported here so startup does not load the Paystack service before the routers do.
+    from src.services.charge_intents import reconcile_charge_intents
+    from src.services.paystack import PaystackService
+
+    await reconcile_charge_intents(
+        ChargeIntentRepository(app.state._db),
+        PaystackService(),
+        age=timedelta(minutes=CHARGE_INTENT_RECONCILE_AFTER_MINUTES),
+        max_age=timedelta(hours=CHARGE_INTENT_EXPIRE_AFTER_HOURS),
+        limit=CHARGE_INTENT_RECONCILE_BATCH,
+    )
+
+
+async def check_settlement_admin_wallet(app: FastAPI) -> None:
+    """Log loudly when settlements have no admin wallet to credit the admin share to."""
+    if not SETTLEMENT_ADMIN_WALLET_ID:
+        app_logger.error(
+            "SETTLEMENT_ADMIN_WALLET_ID is not set; settled charges will not credit the admin share"
+        )
+        return
+    # Imported here, like the archive job, so importing the app does not load the wallet models.
+    from src.db.repositories.admin_wallet import AdminWalletRepository
+
+    try:
+        await AdminWalletRepository(app.state._db).get_wallet(id=SETTLEMENT_ADMIN_WALLET_ID)
+    except Exception:
+        app_logger.error(
+            f"SETTLEMENT_ADMIN_WALLET_ID {SETTLEMENT_ADMIN_WALLET_ID} is not a live admin wallet; "
+            "admin shares credited to it will not show in any wallet"
+        )
+
+
+async def compact_wallet_stripes(app: FastAPI) -> None:
+    """Fold admin and super-admin wallet credits into the wallet rows."""
+    stripes = WalletStripeRepository(app.state._db)
+    for wallet_type in (WalletType.ADMIN, WalletType.SUPER_ADMIN):
+        await stripes.compact(wallet_type=wallet_type)
+
+
+async def archive_deleted_rows(app: FastAPI) -> None:
+    """Move rows soft-deleted more than ARCHIVE_RETENTION_DAYS ago to the archive tables."""
+    if ARCHIVE_RETENTION_DAYS <= 0:
+        return
+    # Imported here so startup does not load the models of every archived table.
+    from src.db.repositories.archive import ARCHIVED_TABLES, ArchiveRepository
+
+    archive = ArchiveRepository(app.state._db)
+    deleted_before = utc_now() - timedelta(days=ARCHIVE_RETENTION_DAYS)
+    for entity in ARCHIVED_TABLES:
+        # One table failing must not keep the others from being archived.
+        try:
+            await archive.archive_deleted(
+                entity=entity, deleted_before=deleted_before, batch_size=ARCHIVE_BATCH_SIZE
+            )
+        except Exception:
+            app_logger.exception(f"Archiving deleted {entity.value} failed")
+
+
+def create_scheduler(app: FastAPI) -> Scheduler:
+    """The periodic jobs; leader-only jobs run in one worker across the deployment."""
+    scheduler = Scheduler(
+        app,
+        leader_retry=SCHEDULER_LEADER_RETRY_SECONDS,
+        shutdown_grace=SCHEDULER_SHUTDOWN_GRACE_SECONDS,
+        lock_file=SCHEDULER_LOCK_FILE,
+    )
+    scheduler.add_job(
+        "maintain-partitions", maintain_partitioned_tables, cron="0 3 * * *", jitter=60
+    )
+    scheduler.add_job("purge-finished-jobs", purge_finished_jobs, cron="30 3 * * *", jitter=60)
+    scheduler.add_job("archive-deleted-rows", archive_deleted_rows, cron="0 4 * * *", jitter=60)
+    scheduler.add_job("reconcile-charges", reconcile_pending_charges, every=300, jitter=30)
+    scheduler.add_job("compact-wallet-stripes", compact_wallet_stripes, every=WALLET_COMPACT_SECONDS)
+    return scheduler
+
+
+def create_job_workers(app: FastAPI, concurrency: int = JOB_WORKERS) -> JobWorkers:
+    """The queue consumers and the handler for each job name."""
+    workers = JobWorkers(
+        app,
+        concurrency=concurrency,
+        poll_interval=JOB_POLL_SECONDS,
+        visibility_timeout=JOB_VISIBILITY_TIMEOUT_SECONDS,
+        shutdown_grace=JOB_SHUTDOWN_GRACE_SECONDS,
+    )
+    workers.add_handler(
+        "maintain-partitions", lambda app, payload: maintain_partitioned_tables(app)
+    )
+    workers.add_handler("archive-deleted-rows", lambda app, payload: archive_deleted_rows(app))
+    return workers
 
 
 def create_start_app_handler(app: FastAPI) -> Callable:
     """Connect to db."""
 
     async def start_app() -> None:
+        # Each worker writes logs from its own thread; threads do not survive the fork.
+        start_logging()
         await connect_database(app)
-        print("Application started")
-        print("Application started")
+        audit_writer.start(app.state._db)
+        await maintain_partitioned_tables(app)
+        await check_settlement_admin_wallet(app)
+        if SCHEDULER_ENABLED:
+            app.state.scheduler = create_scheduler(app)
+            app.state.scheduler.start()
+        if JOB_WORKERS > 0:
+            app.state.job_workers = create_job_workers(app)
+            app.state.job_workers.start()
+        # Serve health checks while warming up; /readyz reports ready once it finishes.
+        app.state.warmup_task = asyncio.create_task(run_warmup(app, WARMUP_STEPS))
+        app_logger.info("Application started")
 
     return start_app
 
@@ -22,8 +205,19 @@ def create_stop_app_handler(app: FastAPI) -> Callable:
     """Disconnect db."""
 
     async def stop_app() -> None:
+        for name in ("warmup_task", "readiness_task"):
+            task = getattr(app.state, name, None)
+            if task is not None and not task.done():
+                task.cancel()
+        for name in ("scheduler", "job_workers"):
+            service = getattr(app.state, name, None)
+            if service is not None:
+                await service.stop()
+        await close_lookup_caches()
+        await close_paystack_client()
+        await audit_writer.stop()
         await disconnect_database(app)
-        print("Application stopped")
-        print("Application stopped")
+        app_logger.info("Application stopped")
+        stop_logging()
 
     return stop_app
@@ -0,0 +1,36 @@
+"""Startup warm-up: timed steps that run before the app reports ready."""
+
+import logging
+import time
+from typing import Any, Awaitable, Callable, Sequence, Tuple
+
+from fastapi import FastAPI
+
+app_logger = logging.getLogger("app")
+
+WarmupStep = Tuple[str, Callable[[FastAPI], Awaitable[Any]]]
+
+
+async def run_warmup(app: FastAPI, steps: Sequence[WarmupStep]) -> None:
+    """Run each step in order, record its time in app.state.warmup, then mark the app ready.
+
+    A failed step is logged and reported but does not keep the app from becoming ready;
+    it only means the first real request pays that cost instead.
+    """
+    app.state.ready = False
+    app.state.warmup = report = {}
+    start = time.perf_counter()
+    for name, step in steps:
+        step_start = time.perf_counter()
+        try:
+            detail = await step(app)
+            report[name] = {"status": "ok"}
+            if detail is not None:
+                report[name]["detail"] = detail
+        except Exception as e:
+            app_logger.warning(f"Warm-up step {name} failed: {e!r}")
+            report[name] = {"status": "error", "detail": repr(e)}
+        report[name]["ms"] = round((time.perf_counter() - step_start) * 1000, 1)
+        app_logger.info(f"Warm-up {name}: {report[name]['ms']} ms ({report[name]['status']})")
+    app.state.ready = True
+    app_logger.info(f"Warm-up finished in {(time.perf_counter() - start) * 1000:.0f} ms")
@@ -0,0 +1,9 @@
+"""Gunicorn worker classes."""
+
+from uvicorn.workers import UvicornWorker
+
+
+class UvloopWorker(UvicornWorker):
+    """Uvicorn worker that requires uvloop and httptools instead of falling back silently."""
+
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools"}
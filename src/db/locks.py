@@ -0,0 +1,58 @@
+"""Locks for work that only one worker process should do.
+
+Postgres has advisory locks; sqlite deployments lock a file next to the database instead.
+"""
+
+import fcntl
+import hashlib
+import os
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Iterator
+
+from databases import Database
+
+TRY_ADVISORY_LOCK_QUERY = "SELECT pg_try_advisory_lock(:key)"
+ADVISORY_UNLOCK_QUERY = "SELECT pg_advisory_unlock(:key)"
+
+
+def lock_key(name: str) -> int:
+    """Stable signed 64-bit lock key for a lock name."""
+    digest = hashlib.sha1(name.encode()).digest()
+    return int.from_bytes(digest[:8], "big", signed=True)
+
+
+@asynccontextmanager
+async def advisory_lock(db: Database, name: str) -> AsyncIterator[bool]:
+    """Try to take a session advisory lock; yields whether this process holds it.
+
+    The lock is tied to one pooled connection, which is kept for the whole block.
+    """
+    key = lock_key(name)
+    async with db.connection() as connection:
+        acquired = await connection.fetch_val(
+            query=TRY_ADVISORY_LOCK_QUERY, values={"key": key}
+        )
+        try:
+            yield bool(acquired)
+        finally:
+            if acquired:
+                await connection.fetch_val(query=ADVISORY_UNLOCK_QUERY, values={"key": key})
+
+
+@contextmanager
+def file_lock(path: str) -> Iterator[bool]:
+    """Try to take an exclusive lock on `path`; yields whether this process holds it.
+
+    The lock belongs to the open file, so it is released when the block ends or the
+    process dies, and workers forked from one master still compete for it.
+    """
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            acquired = True
+        except BlockingIOError:
+            acquired = False
+        yield acquired
+    finally:
+        os.close(fd)
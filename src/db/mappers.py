@@ -0,0 +1,174 @@
+"""Build models from trusted database rows without running full validation.
+
+The generated builders only win where the driver already returns native values (asyncpg).
+sqlite returns timestamps as text, which pydantic parses faster than Python does, so those
+rows, and rows missing a required column, are validated as before.
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+from uuid import UUID
+
+from pydantic import BaseModel, Json, TypeAdapter
+from pydantic.fields import FieldInfo
+from pydantic_core import PydanticUndefined
+
+from src.models.base import DateTimeModelMixin
+
+Model = TypeVar("Model", bound=BaseModel)
+
+# Conversion from what sqlite/asyncpg return to the field type; `{0}` is the raw value.
+CONVERSIONS = {
+    UUID: "{0} if isinstance({0}, UUID) else UUID({0})",  # text on sqlite, uuid on postgres
+    datetime: "{0} if isinstance({0}, datetime) else datetime.fromisoformat({0})",
+    date: "{0} if isinstance({0}, date) else date.fromisoformat({0})",
+    Decimal: "{0} if isinstance({0}, Decimal) else Decimal(str({0}))",
+    float: "{0} if isinstance({0}, float) else float({0})",
+    bool: "{0} if isinstance({0}, bool) else bool({0})",
+}
+
+# Types the drivers already return as-is.
+PASSTHROUGH_TYPES = (str, int, Any)
+
+# Timestamps DateTimeModelMixin.default_datetime fills in when empty.
+DEFAULT_NOW_FIELDS = ("created_at", "updated_at")
+
+# Timestamp types; a column of one returned as text means the row came from sqlite.
+TIMESTAMP_TYPES = (datetime, Optional[datetime])
+
+# (builder, a timestamp column to check for text or None) per model and selected columns.
+_builders: Dict[Tuple[type, Tuple[str, ...]], Tuple[Callable[[Mapping], BaseModel], Optional[str]]] = {}
+
+
+def _annotation(field: FieldInfo) -> Any:
+    """The field's type, keeping the `Json` marker pydantic moves into the field metadata."""
+    if any(item is Json or isinstance(item, Json) for item in field.metadata):
+        return Json[field.annotation]
+    return field.annotation
+
+
+def _conversion(annotation: Any, var: str, namespace: Dict[str, Any]) -> str:
+    """Return a Python expression converting `var` to `annotation`."""
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            inner = _conversion(args[0], var, namespace)
+            return var if inner == var else f"None if {var} is None else ({inner})"
+    if annotation in PASSTHROUGH_TYPES:
+        return var
+    if annotation in CONVERSIONS:
+        return CONVERSIONS[annotation].format(var)
+    # Anything unusual goes through pydantic for that one field.
+    namespace[f"validate_{var}"] = TypeAdapter(annotation).validate_python
+    return f"validate_{var}({var})"
+
+
+def compile_builder(model: Type[Model], columns: Tuple[str, ...]) -> Callable[[Mapping], Model]:
+    """Generate a function that builds `model` from rows with the given columns.
+
+    The function converts each selected column to its field type and sets the
+    instance attributes directly, like `model_construct`, without re-inspecting
+    the model on every call.
+    """
+    namespace: Dict[str, Any] = {
+        "Model": model,
+        "UUID": UUID,
+        "datetime": datetime,
+        "date": date,
+        "Decimal": Decimal,
+        "new": object.__new__,
+        "setattr": object.__setattr__,
+    }
+    lines = ["def build(row):"]
+    items = []
+    fields_set = []
+    for index, (name, field) in enumerate(model.model_fields.items()):
+        var = f"v{index}"
+        if name in columns:
+            lines.append(f"    {var} = row[{name!r}]")
+            expression = _conversion(_annotation(field), var, namespace)
+            if issubclass(model, DateTimeModelMixin) and name in DEFAULT_NOW_FIELDS:
+                expression = f"({expression}) if {var} else datetime.now()"
+            items.append(f"{name!r}: {expression}")
+            fields_set.append(name)
+        elif field.default_factory is not None:
+            namespace[f"factory_{var}"] = field.default_factory
+            items.append(f"{name!r}: factory_{var}()")
+        elif field.default is not PydanticUndefined:
+            namespace[f"default_{var}"] = field.default
+            items.append(f"{name!r}: default_{var}")
+    namespace["FIELDS_SET"] = frozenset(fields_set)
+    lines += [
+        "    obj = new(Model)",
+        f"    setattr(obj, '__dict__', {{{', '.join(items)}}})",
+        "    setattr(obj, '__pydantic_fields_set__', set(FIELDS_SET))",
+        "    setattr(obj, '__pydantic_extra__', None)",
+        "    setattr(obj, '__pydantic_private__', None)",
+        "    return obj",
+    ]
+    exec("\n".join(lines), namespace)
+    return namespace["build"]
+
+
+def validating_builder(model: Type[Model]) -> Callable[[Mapping], Model]:
+    """Build `model` with full validation, as repositories did before the builders."""
+    return lambda row: model(**row)
+
+
+def row_builder(model: Type[Model], row: Mapping) -> Callable[[Mapping], Model]:
+    """Return how to build `model` from rows shaped like `row`.
+
+    Rows missing a required column are validated, so they raise like `model(**row)` does.
+    """
+    columns = tuple(row.keys())
+    key = (model, columns)
+    entry = _builders.get(key)
+    if entry is None:
+        missing = [
+            name
+            for name, field in model.model_fields.items()
+            if field.is_required() and name not in columns
+        ]
+        timestamp = next(
+            (
+                name
+                for name, field in model.model_fields.items()
+                if name in columns and field.annotation in TIMESTAMP_TYPES
+            ),
+            None,
+        )
+        build = validating_builder(model) if missing else compile_builder(model, columns)
+        entry = _builders[key] = (build, timestamp)
+    build, timestamp = entry
+    if timestamp is not None and isinstance(row[timestamp], str):
+        return validating_builder(model)
+    return build
+
+
+def map_row(model: Type[Model], row: Mapping) -> Model:
+    """Build `model` from one database row; API input keeps using validation."""
+    return row_builder(model, row)(row)
+
+
+def map_rows(model: Type[Model], rows: Iterable[Mapping]) -> List[Model]:
+    """Build `model` from each row of one query."""
+    rows = list(rows)
+    if not rows:
+        return []
+    build = row_builder(model, rows[0])
+    return [build(row) for row in rows]
@@ -0,0 +1,45 @@
+"""Create wallet_withdrawals table
+
+Revision ID: 1c7e4a9d3f60
+Revises: 9b6d2f4e8a17
+Create Date: 2026-10-20 15:47:22.815306
+"""
+
+from typing import Optional, Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "1c7e4a9d3f60"
+down_revision: Optional[str] = "9b6d2f4e8a17"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the wallet_withdrawals table, keyed by the Paystack transfer reference."""
+    op.create_table(
+        "wallet_withdrawals",
+        sa.Column("reference", sa.String(100), primary_key=True),
+        sa.Column("wallet_type", sa.String(30), nullable=False),
+        sa.Column("wallet_id", sa.Uuid, nullable=False),
+        sa.Column("amount", sa.BigInteger, nullable=False),
+        sa.Column("reason", sa.String(100), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False, server_default="pending"),
+        sa.Column(
+            "created_at", sa.TIMESTAMP, server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False
+        ),
+        sa.Column(
+            "updated_at", sa.TIMESTAMP, server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False
+        ),
+    )
+    op.create_index(
+        "ix_wallet_withdrawals_wallet", "wallet_withdrawals", ["wallet_type", "wallet_id"]
+    )
+
+
+def downgrade() -> None:
+    """Drop the wallet_withdrawals table."""
+    op.drop_index("ix_wallet_withdrawals_wallet", "wallet_withdrawals")
+    op.drop_table("wallet_withdrawals")
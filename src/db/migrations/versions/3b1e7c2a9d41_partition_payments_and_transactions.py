@@ -0,0 +1,180 @@
+"""Partition payments and transactions by month
+
+Revision ID: 3b1e7c2a9d41
+Revises: f06c85b28783
+Create Date: 2026-10-19 09:12:05.481230
+"""
+
+from datetime import date
+from typing import Optional, Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from src.core.config import PARTITION_MONTHS_AHEAD
+from src.db.partitions import (
+    add_months,
+    create_default_partition_sql,
+    create_partition_sql,
+    month_start,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "3b1e7c2a9d41"
+down_revision: Optional[str] = "f06c85b28783"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def is_postgres() -> bool:
+    """Partitioning is only available on postgres; sqlite keeps plain tables."""
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def create_monthly_partitions(table: str, source_table: str) -> None:
+    """Create partitions covering the existing rows up to the configured horizon."""
+    oldest = (
+        op.get_bind()
+        .execute(sa.text(f"SELECT MIN(created_at) FROM {source_table}"))
+        .scalar()
+    )
+    current = month_start(date.today())
+    month = month_start(oldest.date()) if oldest else current
+    op.execute(create_default_partition_sql(table))
+    while month <= add_months(current, PARTITION_MONTHS_AHEAD):
+        op.execute(create_partition_sql(table, month))
+        month = add_months(month, 1)
+
+
+def partition_payments_table() -> None:
+    """Rebuild payments as a table partitioned by created_at."""
+    op.rename_table("payments", "payments_unpartitioned")
+    # Free the index names so the partitioned table can reuse them.
+    op.drop_constraint("payments_pkey", "payments_unpartitioned", type_="primary")
+    op.drop_constraint(
+        "payments_transaction_reference_key", "payments_unpartitioned", type_="unique"
+    )
+    op.drop_index("ix_payments_is_deleted", "payments_unpartitioned")
+    op.execute(
+        """
+        CREATE TABLE payments (
+            LIKE payments_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+    # Unique constraints on a partitioned table must include the partition key.
+    op.create_primary_key("payments_pkey", "payments", ["id", "created_at"])
+    op.create_unique_constraint(
+        "uq_payments_transaction_reference_created_at",
+        "payments",
+        ["transaction_reference", "created_at"],
+    )
+    op.create_foreign_key(
+        "payments_student_id_fkey", "payments", "students", ["student_id"], ["id"]
+    )
+    op.create_foreign_key(
+        "payments_school_id_fkey", "payments", "schools", ["school_id"], ["id"]
+    )
+    op.create_index("ix_payments_created_at", "payments", ["created_at"])
+    op.create_index("ix_payments_is_deleted", "payments", ["is_deleted"])
+    create_monthly_partitions("payments", "payments_unpartitioned")
+    op.execute("INSERT INTO payments SELECT * FROM payments_unpartitioned")
+    op.drop_table("payments_unpartitioned")
+
+
+def partition_transactions_table() -> None:
+    """Rebuild transactions as a table partitioned by created_at."""
+    op.rename_table("transactions", "transactions_unpartitioned")
+    op.drop_constraint(
+        "transactions_pkey", "transactions_unpartitioned", type_="primary"
+    )
+    op.drop_index("uq_transactions_reference_is_deleted", "transactions_unpartitioned")
+    op.drop_index("ix_transactions_is_deleted", "transactions_unpartitioned")
+    op.execute(
+        """
+        CREATE TABLE transactions (
+            LIKE transactions_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+    op.create_primary_key("transactions_pkey", "transactions", ["id", "created_at"])
+    op.create_foreign_key(
+        "transactions_school_id_fkey", "transactions", "schools", ["school_id"], ["id"]
+    )
+    op.create_index(
+        "uq_transactions_reference_is_deleted",
+        "transactions",
+        ["reference", "is_deleted", "created_at"],
+        unique=True,
+    )
+    op.create_index("ix_transactions_created_at", "transactions", ["created_at"])
+    op.create_index("ix_transactions_is_deleted", "transactions", ["is_deleted"])
+    create_monthly_partitions("transactions", "transactions_unpartitioned")
+    op.execute("INSERT INTO transactions SELECT * FROM transactions_unpartitioned")
+    op.drop_table("transactions_unpartitioned")
+
+
+def unpartition_payments_table() -> None:
+    """Rebuild payments as a plain table."""
+    op.execute(
+        """
+        CREATE TABLE payments_unpartitioned (
+            LIKE payments INCLUDING DEFAULTS INCLUDING CONSTRAINTS
+        )
+        """
+    )
+    op.execute("INSERT INTO payments_unpartitioned SELECT * FROM payments")
+    op.execute("DROP TABLE payments CASCADE")
+    op.rename_table("payments_unpartitioned", "payments")
+    op.create_primary_key("payments_pkey", "payments", ["id"])
+    op.create_unique_constraint(
+        "payments_transaction_reference_key", "payments", ["transaction_reference"]
+    )
+    op.create_foreign_key(
+        "payments_student_id_fkey", "payments", "students", ["student_id"], ["id"]
+    )
+    op.create_foreign_key(
+        "payments_school_id_fkey", "payments", "schools", ["school_id"], ["id"]
+    )
+    op.create_index("ix_payments_is_deleted", "payments", ["is_deleted"])
+
+
+def unpartition_transactions_table() -> None:
+    """Rebuild transactions as a plain table."""
+    op.execute(
+        """
+        CREATE TABLE transactions_unpartitioned (
+            LIKE transactions INCLUDING DEFAULTS INCLUDING CONSTRAINTS
+        )
+        """
+    )
+    op.execute("INSERT INTO transactions_unpartitioned SELECT * FROM transactions")
+    op.execute("DROP TABLE transactions CASCADE")
+    op.rename_table("transactions_unpartitioned", "transactions")
+    op.create_primary_key("transactions_pkey", "transactions", ["id"])
+    op.create_foreign_key(
+        "transactions_school_id_fkey", "transactions", "schools", ["school_id"], ["id"]
+    )
+    op.create_index(
+        "uq_transactions_reference_is_deleted",
+        "transactions",
+        ["reference", "is_deleted"],
+        unique=True,
+    )
+    op.create_index("ix_transactions_is_deleted", "transactions", ["is_deleted"])
+
+
+def upgrade() -> None:
+    """Upgrade database."""
+    if not is_postgres():
+        return
+    partition_payments_table()
+    partition_transactions_table()
+
+
+def downgrade() -> None:
+    """Downgrade database."""
+    if not is_postgres():
+        return
+    unpartition_transactions_table()
+    unpartition_payments_table()
@@ -0,0 +1,50 @@
+"""Create charge_intents table
+
+Revision ID: 5d2e9b7c4f18
+Revises: 8c4f2d1a7b93
+Create Date: 2026-10-19 15:21:44.902137
+"""
+
+from typing import Optional, Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5d2e9b7c4f18"
+down_revision: Optional[str] = "8c4f2d1a7b93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the charge_intents table, keyed by the Paystack reference."""
+    op.create_table(
+        "charge_intents",
+        sa.Column("reference", sa.String(100), primary_key=True),
+        sa.Column("school_id", sa.String(36), sa.ForeignKey("schools.id"), nullable=False),
+        sa.Column("school_name", sa.String(100), nullable=False),
+        sa.Column("student_name", sa.String(100), nullable=False),
+        sa.Column("phone_number", sa.String(20), nullable=False),
+        sa.Column("network_provider", sa.String(10), nullable=False),
+        sa.Column("amount", sa.Numeric(10, 2), nullable=False),
+        sa.Column("school_amount", sa.Numeric(10, 2), nullable=False),
+        sa.Column("admin_amount", sa.Numeric(10, 2), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False, server_default="pending"),
+        sa.Column("paystack_transaction_id", sa.BigInteger, nullable=True),
+        sa.Column("settled_at", sa.TIMESTAMP, nullable=True),
+        sa.Column(
+            "created_at", sa.TIMESTAMP, server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False
+        ),
+        sa.Column(
+            "updated_at", sa.TIMESTAMP, server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False
+        ),
+    )
+    # Reconciliation reads pending intents oldest first.
+    op.create_index("ix_charge_intents_status_created_at", "charge_intents", ["status", "created_at"])
+
+
+def downgrade() -> None:
+    """Drop the charge_intents table."""
+    op.drop_index("ix_charge_intents_status_created_at", "charge_intents")
+    op.drop_table("charge_intents")
@@ -0,0 +1,32 @@
+"""Add checked_at to charge_intents
+
+Revision ID: 6f1a8d3c2e95
+Revises: 1c7e4a9d3f60
+Create Date: 2026-10-21 09:12:37.604118
+"""
+
+from typing import Optional, Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6f1a8d3c2e95"
+down_revision: Optional[str] = "1c7e4a9d3f60"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Record when reconciliation last asked Paystack about each intent."""
+    op.add_column("charge_intents", sa.Column("checked_at", sa.TIMESTAMP, nullable=True))
+    op.execute("UPDATE charge_intents SET checked_at = created_at")
+    # Reconciliation reads pending intents least recently checked first.
+    op.create_index("ix_charge_intents_status_checked_at", "charge_intents", ["status", "checked_at"])
+
+
+def downgrade() -> None:
+    """Drop the checked_at column."""
+    op.drop_index("ix_charge_intents_status_checked_at", "charge_intents")
+    with op.batch_alter_table("charge_intents") as batch_op:
+        batch_op.drop_column("checked_at")
@@ -0,0 +1,43 @@
+"""Create transfer_recipients table
+
+Revision ID: 7a4c1e9f2b63
+Revises: 9e3a6c1d2b57
+Create Date: 2026-10-19 17:02:15.318274
+"""
+
+from typing import Optional, Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7a4c1e9f2b63"
+down_revision: Optional[str] = "9e3a6c1d2b57"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the transfer_recipients table, one row per wallet payout account."""
+    op.create_table(
+        "transfer_recipients",
+        sa.Column("wallet_type", sa.String(30), primary_key=True),
+        sa.Column("wallet_id", sa.String(36), primary_key=True),
+        sa.Column("account_number", sa.String(50), primary_key=True),
+        sa.Column("bank_code", sa.String(20), primary_key=True),
+        sa.Column("recipient_type", sa.String(20), nullable=False),
+        sa.Column("currency", sa.String(3), nullable=False, server_default="GHS"),
+        sa.Column("account_name", sa.String(100), nullable=True),
+        sa.Column("recipient_code", sa.String(50), nullable=False),
+        sa.Column(
+            "created_at", sa.TIMESTAMP, server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False
+        ),
+        sa.Column(
+            "updated_at", sa.TIMESTAMP, server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop the transfer_recipients table."""
+    op.drop_table("transfer_recipients")
@@ -0,0 +1,51 @@
+"""Create jobs table for the background job queue
+
+Revision ID: 8c4f2d1a7b93
+Revises: 3b1e7c2a9d41
+Create Date: 2026-10-19 14:03:27.118402
+"""
+
+from typing import Optional, Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8c4f2d1a7b93"
+down_revision: Optional[str] = "3b1e7c2a9d41"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the jobs table and the index workers claim jobs through."""
+    op.create_table(
+        "jobs",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("name", sa.String(100), nullable=False),
+        sa.Column("payload", sa.Text, nullable=False, server_default="{}"),
+        sa.Column("status", sa.String(20), nullable=False, server_default="queued"),
+        sa.Column("priority", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("attempts", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("max_attempts", sa.Integer, nullable=False, server_default="5"),
+        sa.Column(
+            "run_at", sa.TIMESTAMP, server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False
+        ),
+        sa.Column("locked_until", sa.TIMESTAMP, nullable=True),
+        sa.Column("locked_by", sa.String(100), nullable=True),
+        sa.Column("last_error", sa.Text, nullable=True),
+        sa.Column("result", sa.Text, nullable=True),
+        sa.Column(
+            "created_at", sa.TIMESTAMP, server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False
+        ),
+        sa.Column(
+            "updated_at", sa.TIMESTAMP, server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False
+        ),
+    )
+    op.create_index("ix_jobs_status_priority_run_at", "jobs", ["status", "priority", "run_at"])
+
+
+def downgrade() -> None:
+    """Drop the jobs table."""
+    op.drop_index("ix_jobs_status_priority_run_at", "jobs")
+    op.drop_table("jobs")
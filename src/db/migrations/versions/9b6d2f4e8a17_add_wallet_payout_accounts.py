@@ -0,0 +1,57 @@
+"""Add payout accounts to school and super admin wallets
+
+Revision ID: 9b6d2f4e8a17
+Revises: f2b7d4c9e130
+Create Date: 2026-10-20 12:03:51.470926
+"""
+
+from typing import Optional, Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9b6d2f4e8a17"
+down_revision: Optional[str] = "f2b7d4c9e130"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The wallets and their archive tables, which keep the same columns.
+WALLET_TABLES = (
+    "school_wallets",
+    "school_wallets_archive",
+    "super_admin_wallet",
+    "super_admin_wallet_archive",
+)
+
+
+def payout_columns() -> Sequence[sa.Column]:
+    """The account a wallet's withdrawals are paid to, as Paystack's transfer recipient takes it."""
+    return (
+        sa.Column("payout_recipient_type", sa.String(20), nullable=True),
+        sa.Column("payout_account_number", sa.String(50), nullable=True),
+        sa.Column("payout_bank_code", sa.String(20), nullable=True),
+        sa.Column("payout_account_name", sa.String(100), nullable=True),
+    )
+
+
+def upgrade() -> None:
+    """Add the payout account columns."""
+    inspector = sa.inspect(op.get_bind())
+    for table in WALLET_TABLES:
+        if not inspector.has_table(table):
+            continue
+        with op.batch_alter_table(table) as batch_op:
+            for column in payout_columns():
+                batch_op.add_column(column)
+
+
+def downgrade() -> None:
+    """Drop the payout account columns."""
+    inspector = sa.inspect(op.get_bind())
+    for table in WALLET_TABLES:
+        if not inspector.has_table(table):
+            continue
+        with op.batch_alter_table(table) as batch_op:
+            for column in payout_columns():
+                batch_op.drop_column(column.name)
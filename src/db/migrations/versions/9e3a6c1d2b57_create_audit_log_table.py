@@ -0,0 +1,46 @@
+"""Create audit_log table for the batched audit writer
+
+Revision ID: 9e3a6c1d2b57
+Revises: 5d2e9b7c4f18
+Create Date: 2026-10-19 15:12:08.530917
+"""
+
+from typing import Optional, Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9e3a6c1d2b57"
+down_revision: Optional[str] = "5d2e9b7c4f18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the audit_log table and the indexes it is searched by."""
+    op.create_table(
+        "audit_log",
+        sa.Column(
+            "id",
+            sa.BigInteger().with_variant(sa.Integer, "sqlite"),
+            primary_key=True,
+            autoincrement=True,
+        ),
+        sa.Column("created_at", sa.TIMESTAMP, nullable=False),
+        sa.Column("action", sa.String(50), nullable=False),
+        sa.Column("entity", sa.String(50), nullable=False),
+        sa.Column("entity_id", sa.String(100), nullable=True),
+        sa.Column("correlation_id", sa.String(128), nullable=False, server_default="-"),
+        sa.Column("message", sa.Text, nullable=False),
+        sa.Column("details", sa.Text, nullable=True),
+    )
+    op.create_index("ix_audit_log_entity_entity_id", "audit_log", ["entity", "entity_id"])
+    op.create_index("ix_audit_log_created_at", "audit_log", ["created_at"])
+
+
+def downgrade() -> None:
+    """Drop the audit_log table."""
+    op.drop_index("ix_audit_log_created_at", "audit_log")
+    op.drop_index("ix_audit_log_entity_entity_id", "audit_log")
+    op.drop_table("audit_log")
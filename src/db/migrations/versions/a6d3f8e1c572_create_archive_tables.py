@@ -0,0 +1,59 @@
+"""Create archive tables for soft-deleted rows
+
+Revision ID: a6d3f8e1c572
+Revises: e5a9c3f7b214
+Create Date: 2026-10-19 23:02:47.159384
+"""
+
+from typing import Optional, Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a6d3f8e1c572"
+down_revision: Optional[str] = "e5a9c3f7b214"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ARCHIVED_TABLES = (
+    "payments",
+    "transactions",
+    "school_wallets",
+    "students",
+    "schools",
+    "admin_wallets",
+    "super_admin_wallet",
+    "settings",
+)
+
+
+def upgrade() -> None:
+    """Create `<table>_archive` with the table's columns, without its constraints, plus archived_at."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    for table in ARCHIVED_TABLES:
+        if not inspector.has_table(table):
+            continue
+        columns = [
+            sa.Column(
+                column["name"],
+                column["type"],
+                primary_key=column["name"] == "id",
+                nullable=column["nullable"],
+            )
+            for column in inspector.get_columns(table)
+        ]
+        op.create_table(
+            f"{table}_archive",
+            *columns,
+            sa.Column("archived_at", sa.TIMESTAMP, nullable=False, index=True),
+        )
+
+
+def downgrade() -> None:
+    """Drop the archive tables; archived rows are lost."""
+    inspector = sa.inspect(op.get_bind())
+    for table in ARCHIVED_TABLES:
+        if inspector.has_table(f"{table}_archive"):
+            op.drop_table(f"{table}_archive")
@@ -0,0 +1,53 @@
+"""Create wallet_balance_stripes table
+
+Revision ID: b81f3d6e0a24
+Revises: 7a4c1e9f2b63
+Create Date: 2026-10-19 18:40:03.517920
+"""
+
+from typing import Optional, Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b81f3d6e0a24"
+down_revision: Optional[str] = "7a4c1e9f2b63"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the credit stripes of the admin and super-admin wallets."""
+    # The first migration defines admin_wallets but never creates it; settlements credit it now.
+    if not sa.inspect(op.get_bind()).has_table("admin_wallets"):
+        op.create_table(
+            "admin_wallets",
+            sa.Column("id", sa.String(36), primary_key=True),
+            sa.Column("admin_id", sa.String(36), nullable=False),
+            sa.Column("provider", sa.String(50), default="Paystack"),
+            sa.Column("account_number", sa.String(50), nullable=False, unique=True),
+            sa.Column("balance", sa.Float, nullable=False, default=0),
+            sa.Column(
+                "created_at", sa.TIMESTAMP, server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False
+            ),
+            sa.Column(
+                "updated_at", sa.TIMESTAMP, server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False
+            ),
+            sa.Column("is_deleted", sa.Boolean, nullable=False, server_default=sa.false(), index=True),
+        )
+    op.create_table(
+        "wallet_balance_stripes",
+        sa.Column("wallet_type", sa.String(30), primary_key=True),
+        sa.Column("wallet_id", sa.String(36), primary_key=True),
+        sa.Column("stripe", sa.SmallInteger, primary_key=True),
+        sa.Column("amount", sa.Numeric(12, 2), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at", sa.TIMESTAMP, server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop the wallet_balance_stripes table; admin_wallets is left in place."""
+    op.drop_table("wallet_balance_stripes")
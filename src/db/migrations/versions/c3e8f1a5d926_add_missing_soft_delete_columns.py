@@ -0,0 +1,65 @@
+"""Add missing soft-delete columns to archived tables
+
+Revision ID: c3e8f1a5d926
+Revises: a6d3f8e1c572
+Create Date: 2026-10-20 09:12:35.208164
+"""
+
+from typing import Optional, Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3e8f1a5d926"
+down_revision: Optional[str] = "a6d3f8e1c572"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The first migration creates students, schools and super_admin_wallet without some of
+# these, but the soft deletes and the archive job use both.
+ARCHIVED_TABLES = (
+    "payments",
+    "transactions",
+    "school_wallets",
+    "students",
+    "schools",
+    "admin_wallets",
+    "super_admin_wallet",
+    "settings",
+)
+
+
+def soft_delete_columns() -> Sequence[sa.Column]:
+    """The columns every archived table and its archive table need."""
+    return (
+        sa.Column(
+            "updated_at", sa.TIMESTAMP, server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False
+        ),
+        sa.Column("is_deleted", sa.Boolean, nullable=False, server_default=sa.false()),
+    )
+
+
+def upgrade() -> None:
+    """Add updated_at and is_deleted where a table or its archive table lacks them."""
+    inspector = sa.inspect(op.get_bind())
+    for table in ARCHIVED_TABLES:
+        for name in (table, f"{table}_archive"):
+            if not inspector.has_table(name):
+                continue
+            existing = {column["name"] for column in inspector.get_columns(name)}
+            missing = [column for column in soft_delete_columns() if column.name not in existing]
+            if not missing:
+                continue
+            # sqlite cannot add a column defaulting to CURRENT_TIMESTAMP; batch mode copies the table.
+            with op.batch_alter_table(name) as batch_op:
+                for column in missing:
+                    batch_op.add_column(column)
+            if "updated_at" not in existing and "created_at" in existing:
+                op.execute(f"UPDATE {name} SET updated_at = created_at WHERE created_at IS NOT NULL")
+            if name == table and "is_deleted" not in existing:
+                op.create_index(f"ix_{table}_is_deleted", table, ["is_deleted"])
+
+
+def downgrade() -> None:
+    """Leave the columns in place; the tables that always had them cannot be told apart."""
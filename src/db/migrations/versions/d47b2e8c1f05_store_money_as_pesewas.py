@@ -0,0 +1,97 @@
+"""Store money as BIGINT pesewas
+
+Revision ID: d47b2e8c1f05
+Revises: b81f3d6e0a24
+Create Date: 2026-10-19 20:05:41.318062
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from src.db.partitions import ARCHIVE_SCHEMA, parse_partition_month
+
+# revision identifiers, used by Alembic.
+revision: str = "d47b2e8c1f05"
+down_revision: Optional[str] = "b81f3d6e0a24"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Money columns and the type they had in cedis, for the downgrade.
+MONEY_COLUMNS: Dict[str, Dict[str, sa.types.TypeEngine]] = {
+    "schools": {"registration_fee": sa.Numeric(10, 2)},
+    "transactions": {"amount": sa.Numeric(12, 2)},
+    "payments": {
+        "total_amount": sa.Numeric(10, 2),
+        "school_amount": sa.Numeric(10, 2),
+        "admin_amount": sa.Numeric(10, 2),
+    },
+    "charge_intents": {
+        "amount": sa.Numeric(10, 2),
+        "school_amount": sa.Numeric(10, 2),
+        "admin_amount": sa.Numeric(10, 2),
+    },
+    "school_wallets": {"current_balance": sa.Float(), "total_earned": sa.Float()},
+    "admin_wallets": {"balance": sa.Float()},
+    "super_admin_wallet": {"current_balance": sa.Float(), "total_earned": sa.Float()},
+    "wallet_balance_stripes": {"amount": sa.Numeric(12, 2)},
+}
+
+
+def is_postgres() -> bool:
+    """Postgres changes column types in place; sqlite rebuilds the table."""
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def money_tables() -> List[Tuple[str, Dict[str, sa.types.TypeEngine]]]:
+    """The tables to convert, with the partitions detached into the archive schema.
+
+    Attached partitions follow their parent; detached ones have to be altered on their own.
+    """
+    tables = list(MONEY_COLUMNS.items())
+    inspector = sa.inspect(op.get_bind())
+    if is_postgres() and ARCHIVE_SCHEMA in inspector.get_schema_names():
+        for name in inspector.get_table_names(schema=ARCHIVE_SCHEMA):
+            for table, columns in MONEY_COLUMNS.items():
+                if parse_partition_month(table, name):
+                    tables.append((f"{ARCHIVE_SCHEMA}.{name}", columns))
+    return tables
+
+
+def upgrade() -> None:
+    """Convert every money column from cedis to whole pesewas."""
+    for table, columns in money_tables():
+        if is_postgres():
+            changes = ", ".join(
+                f"ALTER COLUMN {column} TYPE BIGINT USING ROUND({column} * 100)::BIGINT"
+                for column in columns
+            )
+            op.execute(f"ALTER TABLE {table} {changes}")
+            continue
+        op.execute(
+            f"UPDATE {table} SET "
+            + ", ".join(f"{column} = CAST(ROUND({column} * 100) AS INTEGER)" for column in columns)
+        )
+        with op.batch_alter_table(table) as batch:
+            for column, old_type in columns.items():
+                batch.alter_column(column, type_=sa.BigInteger, existing_type=old_type)
+
+
+def downgrade() -> None:
+    """Convert the money columns back to cedis."""
+    for table, columns in money_tables():
+        if is_postgres():
+            dialect = op.get_bind().dialect
+            changes = ", ".join(
+                f"ALTER COLUMN {column} TYPE {old_type.compile(dialect=dialect)} USING {column} / 100.0"
+                for column, old_type in columns.items()
+            )
+            op.execute(f"ALTER TABLE {table} {changes}")
+            continue
+        with op.batch_alter_table(table) as batch:
+            for column, old_type in columns.items():
+                batch.alter_column(column, type_=old_type, existing_type=sa.BigInteger)
+        op.execute(
+            f"UPDATE {table} SET " + ", ".join(f"{column} = {column} / 100.0" for column in columns)
+        )
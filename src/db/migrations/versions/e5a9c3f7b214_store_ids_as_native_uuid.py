@@ -0,0 +1,103 @@
+"""Store ids as native uuid on postgres
+
+Revision ID: e5a9c3f7b214
+Revises: d47b2e8c1f05
+Create Date: 2026-10-19 21:34:12.604417
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from src.db.partitions import ARCHIVE_SCHEMA, parse_partition_month
+
+# revision identifiers, used by Alembic.
+revision: str = "e5a9c3f7b214"
+down_revision: Optional[str] = "d47b2e8c1f05"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Id columns and the varchar length they had, for the downgrade.
+ID_COLUMNS: Dict[str, Dict[str, Optional[int]]] = {
+    "roles": {"id": 36},
+    "schools": {"id": 36},
+    "users": {"user_id": 36, "role_id": 36, "school_id": 36},
+    "students": {"id": 36, "school_id": 36},
+    "user_roles": {"user_id": 36, "role_id": 36},
+    "settings": {"id": 36},
+    "payments": {"id": 36, "student_id": 36, "school_id": 36},
+    "transactions": {"id": 36, "school_id": 36},
+    "school_wallets": {"id": None, "school_admin_id": None, "school_id": 36},
+    "admin_wallets": {"id": 36, "admin_id": 36},
+    "super_admin_wallet": {"id": None, "user_id": None},
+    "charge_intents": {"school_id": 36},
+    "jobs": {"id": 36},
+    "transfer_recipients": {"wallet_id": 36},
+    "wallet_balance_stripes": {"wallet_id": 36},
+}
+
+# Foreign keys on or to the id columns, except the copies postgres keeps on each partition.
+GET_ID_FOREIGN_KEYS_QUERY = """
+SELECT conrelid::regclass::text AS table_name, conname AS name,
+       pg_get_constraintdef(oid) AS definition
+FROM pg_constraint
+WHERE contype = 'f' AND conparentid = 0
+  AND (confrelid = ANY(CAST(:tables AS regclass[])) OR conrelid = ANY(CAST(:tables AS regclass[])))
+"""
+
+
+def id_tables() -> List[Tuple[str, Dict[str, Optional[int]]]]:
+    """The tables to convert, with the partitions detached into the archive schema.
+
+    Attached partitions follow their parent; detached ones have to be altered on their own.
+    Tables the first migration defines but an install never created are skipped.
+    """
+    inspector = sa.inspect(op.get_bind())
+    tables = [(table, columns) for table, columns in ID_COLUMNS.items() if inspector.has_table(table)]
+    if ARCHIVE_SCHEMA in inspector.get_schema_names():
+        for name in inspector.get_table_names(schema=ARCHIVE_SCHEMA):
+            for table, columns in ID_COLUMNS.items():
+                if parse_partition_month(table, name):
+                    tables.append((f"{ARCHIVE_SCHEMA}.{name}", columns))
+    return tables
+
+
+def column_change(column: str, length: Optional[int], to_uuid: bool) -> str:
+    """The ALTER COLUMN clause converting one id column."""
+    if to_uuid:
+        return f"ALTER COLUMN {column} TYPE uuid USING {column}::uuid"
+    varchar = f"varchar({length})" if length else "varchar"
+    return f"ALTER COLUMN {column} TYPE {varchar} USING {column}::text"
+
+
+def change_id_types(to_uuid: bool) -> None:
+    """Convert every id column, dropping the foreign keys around the change."""
+    tables = id_tables()
+    foreign_keys = op.get_bind().execute(
+        sa.text(GET_ID_FOREIGN_KEYS_QUERY), {"tables": [table for table, _ in tables]}
+    ).fetchall()
+    for foreign_key in foreign_keys:
+        op.execute(f'ALTER TABLE {foreign_key.table_name} DROP CONSTRAINT "{foreign_key.name}"')
+    for table, columns in tables:
+        changes = ", ".join(
+            column_change(column, length, to_uuid) for column, length in columns.items()
+        )
+        op.execute(f"ALTER TABLE {table} {changes}")
+    for foreign_key in foreign_keys:
+        op.execute(
+            f'ALTER TABLE {foreign_key.table_name} ADD CONSTRAINT "{foreign_key.name}" '
+            f"{foreign_key.definition}"
+        )
+
+
+def upgrade() -> None:
+    """Convert the varchar(36) id columns to uuid; sqlite keeps them as text."""
+    if op.get_bind().dialect.name == "postgresql":
+        change_id_types(to_uuid=True)
+
+
+def downgrade() -> None:
+    """Convert the id columns back to varchar."""
+    if op.get_bind().dialect.name == "postgresql":
+        change_id_types(to_uuid=False)
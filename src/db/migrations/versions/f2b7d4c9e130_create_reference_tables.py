@@ -0,0 +1,118 @@
+"""Keep payment and transaction references unique across partitions
+
+Revision ID: f2b7d4c9e130
+Revises: c3e8f1a5d926
+Create Date: 2026-10-20 10:41:08.733592
+"""
+
+from typing import List, Optional, Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from src.db.partitions import ARCHIVE_SCHEMA, parse_partition_month
+
+# revision identifiers, used by Alembic.
+revision: str = "f2b7d4c9e130"
+down_revision: Optional[str] = "c3e8f1a5d926"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# A unique key on a partitioned table has to include created_at, so it only holds within a
+# month. Each reference is also written to a plain table keyed by it, by a trigger, so in
+# the same transaction as the row. References of months detached into the archive schema
+# stay taken.
+RESERVE_PAYMENT_REFERENCE_FUNCTION = """
+CREATE FUNCTION reserve_payment_reference() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        DELETE FROM payment_references WHERE transaction_reference = OLD.transaction_reference;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO payment_references (transaction_reference) VALUES (NEW.transaction_reference);
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+RESERVE_TRANSACTION_REFERENCE_FUNCTION = """
+CREATE FUNCTION reserve_transaction_reference() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        DELETE FROM transaction_references
+        WHERE reference = OLD.reference AND is_deleted = OLD.is_deleted;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO transaction_references (reference, is_deleted)
+        VALUES (NEW.reference, NEW.is_deleted);
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+
+def archived_partitions(table: str) -> List[str]:
+    """The months of `table` detached into the archive schema."""
+    inspector = sa.inspect(op.get_bind())
+    if ARCHIVE_SCHEMA not in inspector.get_schema_names():
+        return []
+    return [
+        f"{ARCHIVE_SCHEMA}.{name}"
+        for name in inspector.get_table_names(schema=ARCHIVE_SCHEMA)
+        if parse_partition_month(table, name)
+    ]
+
+
+def upgrade() -> None:
+    """Create the reference tables, fill them and keep them in step with triggers."""
+    if op.get_bind().dialect.name != "postgresql":
+        return  # sqlite tables are not partitioned and keep their unique keys
+    op.create_table(
+        "payment_references",
+        sa.Column("transaction_reference", sa.String(100), primary_key=True),
+    )
+    op.create_table(
+        "transaction_references",
+        sa.Column("reference", sa.String(50), primary_key=True),
+        sa.Column("is_deleted", sa.Boolean, primary_key=True),
+    )
+    for table in ["payments", *archived_partitions("payments")]:
+        op.execute(
+            f"INSERT INTO payment_references (transaction_reference) "
+            f"SELECT DISTINCT transaction_reference FROM {table} ON CONFLICT DO NOTHING"
+        )
+    for table in ["transactions", *archived_partitions("transactions")]:
+        op.execute(
+            f"INSERT INTO transaction_references (reference, is_deleted) "
+            f"SELECT DISTINCT reference, is_deleted FROM {table} ON CONFLICT DO NOTHING"
+        )
+    op.execute(RESERVE_PAYMENT_REFERENCE_FUNCTION)
+    op.execute(RESERVE_TRANSACTION_REFERENCE_FUNCTION)
+    op.execute(
+        """
+        CREATE TRIGGER payments_reserve_reference
+        AFTER INSERT OR DELETE OR UPDATE OF transaction_reference ON payments
+        FOR EACH ROW EXECUTE FUNCTION reserve_payment_reference()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER transactions_reserve_reference
+        AFTER INSERT OR DELETE OR UPDATE OF reference, is_deleted ON transactions
+        FOR EACH ROW EXECUTE FUNCTION reserve_transaction_reference()
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the triggers and the reference tables."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("DROP TRIGGER transactions_reserve_reference ON transactions")
+    op.execute("DROP TRIGGER payments_reserve_reference ON payments")
+    op.execute("DROP FUNCTION reserve_transaction_reference()")
+    op.execute("DROP FUNCTION reserve_payment_reference()")
+    op.drop_table("transaction_references")
+    op.drop_table("payment_references")
@@ -0,0 +1,118 @@
+"""Monthly range partitions for the payments and transactions tables."""
+
+import logging
+import re
+from datetime import date
+from typing import List, Optional
+
+from databases import Database
+
+PARTITIONED_TABLES = ("payments", "transactions")
+ARCHIVE_SCHEMA = "archive"
+
+GET_TABLE_PARTITIONS_QUERY = """
+SELECT child.relname AS name
+FROM pg_inherits
+JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+WHERE parent.relname = :table
+"""
+
+app_logger = logging.getLogger("app")
+
+
+def month_start(day: date) -> date:
+    """Return the first day of the month containing `day`."""
+    return day.replace(day=1)
+
+
+def add_months(day: date, months: int) -> date:
+    """Return the first day of the month `months` away from `day`."""
+    index = day.year * 12 + (day.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    """Name of the partition holding `month` for `table`, e.g. payments_y2024m10."""
+    return f"{table}_y{month.year:04d}m{month.month:02d}"
+
+
+def create_partition_sql(table: str, month: date) -> str:
+    """DDL creating the monthly partition of `table` that holds `month`."""
+    start = month_start(month)
+    end = add_months(start, 1)
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(table, start)} "
+        f"PARTITION OF {table} "
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    )
+
+
+def create_default_partition_sql(table: str) -> str:
+    """DDL creating the catch-all partition for rows outside the monthly ranges."""
+    return f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT"
+
+
+def parse_partition_month(table: str, name: str) -> Optional[date]:
+    """Return the month a partition name refers to, or None for other partitions."""
+    match = re.fullmatch(rf"{table}_y(\d{{4}})m(\d{{2}})", name)
+    if not match:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+async def create_future_partitions(
+    db: Database, *, table: str, months_ahead: int, today: Optional[date] = None
+) -> List[str]:
+    """Make sure partitions exist from the current month to `months_ahead` months out."""
+    current = month_start(today or date.today())
+    created = []
+    for offset in range(months_ahead + 1):
+        month = add_months(current, offset)
+        await db.execute(query=create_partition_sql(table, month))
+        created.append(partition_name(table, month))
+    return created
+
+
+async def archive_expired_partitions(
+    db: Database, *, table: str, retention_months: int, today: Optional[date] = None
+) -> List[str]:
+    """Detach partitions older than the retention window and move them to the archive schema."""
+    cutoff = add_months(month_start(today or date.today()), -retention_months)
+    partitions = await db.fetch_all(
+        query=GET_TABLE_PARTITIONS_QUERY, values={"table": table}
+    )
+    archived = []
+    for partition in partitions:
+        month = parse_partition_month(table, partition["name"])
+        if month is None or month >= cutoff:
+            continue
+        await db.execute(query=f"CREATE SCHEMA IF NOT EXISTS {ARCHIVE_SCHEMA}")
+        await db.execute(
+            query=f"ALTER TABLE {table} DETACH PARTITION {partition['name']}"
+        )
+        await db.execute(
+            query=f"ALTER TABLE {partition['name']} SET SCHEMA {ARCHIVE_SCHEMA}"
+        )
+        archived.append(partition["name"])
+    return archived
+
+
+async def maintain_partitions(
+    db: Database, *, months_ahead: int, retention_months: int
+) -> None:
+    """Create upcoming partitions and archive expired ones for every partitioned table.
+
+    A retention of 0 months keeps every partition attached.
+    """
+    for table in PARTITIONED_TABLES:
+        created = await create_future_partitions(
+            db, table=table, months_ahead=months_ahead
+        )
+        app_logger.info(f"Ensured partitions for {table}: {', '.join(created)}")
+        if retention_months > 0:
+            archived = await archive_expired_partitions(
+                db, table=table, retention_months=retention_months
+            )
+            if archived:
+                app_logger.info(f"Archived partitions of {table}: {', '.join(archived)}")
@@ -0,0 +1,105 @@
+"""Postgres connection pool with an acquire timeout and pool metrics."""
+
+import asyncio
+import time
+from typing import Any, Dict, Optional, Union
+
+from databases import Database, DatabaseURL
+from databases.backends.postgres import PostgresBackend, PostgresConnection
+
+from src.core.metrics import Gauge, Histogram
+from src.errors.database import DatabasePoolTimeoutError
+
+POSTGRES_DIALECTS = ("postgresql", "postgres")
+
+DB_POOL_CONNECTIONS_IN_USE = Gauge(
+    "db_pool_connections_in_use", "Connections currently checked out of the pool."
+)
+DB_POOL_CONNECTIONS_IDLE = Gauge(
+    "db_pool_connections_idle", "Open connections waiting in the pool."
+)
+DB_POOL_ACQUIRE_SECONDS = Histogram(
+    "db_pool_acquire_seconds", "Time spent waiting to acquire a pool connection."
+)
+
+
+class InstrumentedPostgresBackend(PostgresBackend):
+    """Postgres backend that bounds and times connection acquisition."""
+
+    def __init__(
+        self,
+        database_url: Union[DatabaseURL, str],
+        *,
+        acquire_timeout: Optional[float] = None,
+        pool_name: str = "primary",
+        **options: Any,
+    ) -> None:
+        """Initialize the backend; remaining options go to asyncpg.create_pool."""
+        super().__init__(database_url, **options)
+        self.acquire_timeout = acquire_timeout
+        self.pool_name = pool_name
+
+    def connection(self) -> "InstrumentedPostgresConnection":
+        """Create a connection bound to this backend."""
+        return InstrumentedPostgresConnection(self, self._dialect)
+
+
+class InstrumentedPostgresConnection(PostgresConnection):
+    """Connection that acquires from the pool with a timeout."""
+
+    async def acquire(self) -> None:
+        """Acquire a pool connection, recording the wait time."""
+        assert self._connection is None, "Connection is already acquired"
+        assert self._database._pool is not None, "DatabaseBackend is not running"
+        start = time.perf_counter()
+        try:
+            self._connection = await self._database._pool.acquire(
+                timeout=self._database.acquire_timeout
+            )
+        except asyncio.TimeoutError as e:
+            raise DatabasePoolTimeoutError() from e
+        finally:
+            DB_POOL_ACQUIRE_SECONDS.observe(
+                time.perf_counter() - start, pool=self._database.pool_name
+            )
+
+
+class PooledDatabase(Database):
+    """Database that uses the instrumented backend for postgres urls."""
+
+    SUPPORTED_BACKENDS = {
+        **Database.SUPPORTED_BACKENDS,
+        "postgresql": "src.db.pool:InstrumentedPostgresBackend",
+        "postgres": "src.db.pool:InstrumentedPostgresBackend",
+    }
+
+
+def is_postgres(url: DatabaseURL) -> bool:
+    """Check whether a database url points at postgres."""
+    return url.dialect in POSTGRES_DIALECTS
+
+
+def get_pool_stats(database: Database) -> Dict[str, int]:
+    """Return size, idle and in-use connection counts for a postgres pool."""
+    pool = getattr(database._backend, "_pool", None)
+    if pool is None or not hasattr(pool, "get_idle_size"):
+        return {}
+    size = pool.get_size()
+    idle = pool.get_idle_size()
+    return {
+        "min_size": pool.get_min_size(),
+        "max_size": pool.get_max_size(),
+        "size": size,
+        "idle": idle,
+        "in_use": size - idle,
+    }
+
+
+def register_pool_metrics(database: Database, pool_name: str = "primary") -> None:
+    """Export the pool's in-use and idle connection counts as gauges."""
+    DB_POOL_CONNECTIONS_IN_USE.set_function(
+        lambda: get_pool_stats(database).get("in_use", 0), pool=pool_name
+    )
+    DB_POOL_CONNECTIONS_IDLE.set_function(
+        lambda: get_pool_stats(database).get("idle", 0), pool=pool_name
+    )
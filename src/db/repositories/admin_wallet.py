@@ -1,13 +1,18 @@
 """Admin Wallet Repository."""
 
-from typing import List
+from typing import Dict, List
 from databases import Database
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
+from src.db.mappers import map_row, map_rows
 from src.db.repositories.base import BaseRepository
+from src.db.repositories.wallet_stripes import WalletStripeRepository
+from src.enums.wallet_type import WalletType
+from src.decorators.db import handle_get_database_exceptions
 from src.errors.core import InternalServerError
 from src.errors.database import AlreadyExistsError, NotFoundError
 from src.models.admin_wallet import AdminWalletCreate, AdminWalletInDb
+from src.utils.ids import new_id
 
 CREATE_ADMIN_WALLET_QUERY = """
 INSERT INTO admin_wallets (id, admin_id, provider, account_number, balance)
@@ -15,34 +20,50 @@ VALUES (:id, :admin_id, :provider, :account_number, :balance)
 RETURNING id, admin_id, provider, account_number, balance, created_at, updated_at, is_deleted
 """
 
-GET_ADMIN_WALLET_BY_ID_QUERY = """
-SELECT id, admin_id, provider, account_number, balance, created_at, updated_at, is_deleted
-FROM admin_wallets
-WHERE id = :id AND is_deleted = FALSE
+# Balances include the credits still in wallet_balance_stripes (see wallet_stripes.py).
+ADMIN_WALLET_SELECT = """
+SELECT w.id, w.admin_id, w.provider, w.account_number, w.balance + COALESCE(s.amount, 0) AS balance,
+       w.created_at, w.updated_at, w.is_deleted
+FROM admin_wallets w
+LEFT JOIN (
+    SELECT wallet_id, CAST(SUM(amount) AS BIGINT) AS amount
+    FROM wallet_balance_stripes
+    WHERE wallet_type = 'admin_wallet'
+    GROUP BY wallet_id
+) s ON s.wallet_id = w.id
 """
 
-GET_ADMIN_WALLET_BY_ACCOUNT_NUMBER_QUERY = """
-SELECT id, admin_id, provider, account_number, balance, created_at, updated_at, is_deleted
-FROM admin_wallets
-WHERE account_number = :account_number AND is_deleted = FALSE
+GET_ADMIN_WALLET_BY_ID_QUERY = f"""{ADMIN_WALLET_SELECT}
+WHERE w.id = :id AND w.is_deleted = FALSE
 """
 
-GET_ALL_ADMIN_WALLETS = """
-SELECT id, admin_id, provider, account_number, balance, created_at, updated_at, is_deleted
+GET_ADMIN_WALLET_BY_ACCOUNT_NUMBER_QUERY = f"""{ADMIN_WALLET_SELECT}
+WHERE w.account_number = :account_number AND w.is_deleted = FALSE
+"""
+
+GET_ALL_ADMIN_WALLETS = f"""{ADMIN_WALLET_SELECT}
+WHERE w.is_deleted = FALSE
+"""
+
+# Credits only touch the stripes, so their latest update is part of the list's version.
+GET_ADMIN_WALLETS_VERSION_QUERY = """
+SELECT COUNT(*) AS count, MAX(updated_at) AS last_updated,
+       (SELECT MAX(updated_at) FROM wallet_balance_stripes
+        WHERE wallet_type = 'admin_wallet') AS last_credited
 FROM admin_wallets
 WHERE is_deleted = FALSE
 """
 
 UPDATE_ADMIN_WALLET_BALANCE_QUERY = """
 UPDATE admin_wallets
-SET balance = :balance
+SET balance = :balance, updated_at = NOW()
 WHERE id = :id AND is_deleted = FALSE
 RETURNING id, admin_id, provider, account_number, balance, created_at, updated_at, is_deleted
 """
 
 DELETE_ADMIN_WALLET_QUERY = """
 UPDATE admin_wallets
-SET is_deleted = TRUE
+SET is_deleted = TRUE, updated_at = NOW()
 WHERE id = :id AND is_deleted = FALSE
 RETURNING id, admin_id, provider, account_number, balance, created_at, updated_at, is_deleted
 """
@@ -58,9 +79,10 @@ class AdminWalletRepository(BaseRepository):
         """Create a new admin wallet."""
         try:
             created_wallet = await self.db.fetch_one(
-                query=CREATE_ADMIN_WALLET_QUERY, values=new_wallet.model_dump()
+                query=CREATE_ADMIN_WALLET_QUERY,
+                values={**new_wallet.model_dump(), "id": new_wallet.id or new_id()},
             )
-            return AdminWalletInDb(**created_wallet)
+            return map_row(AdminWalletInDb, created_wallet)
         except IntegrityError as e:
             if "duplicate key value violates unique constraint" in str(e):
                 raise AlreadyExistsError(entity_name="Admin Wallet") from e
@@ -68,6 +90,7 @@ class AdminWalletRepository(BaseRepository):
         except SQLAlchemyError as e:
             raise InternalServerError("Failed to create admin wallet due to a database error.") from e
 
+    @handle_get_database_exceptions("Admin wallet")
     async def get_wallet(self, *, id: str = None, account_number: str = None) -> AdminWalletInDb:
         """Get an admin wallet."""
         search_criteria = {
@@ -76,30 +99,44 @@ class AdminWalletRepository(BaseRepository):
         }
         for field, (query, value) in search_criteria.items():
             if value:
-                wallet = await self.db.fetch_one(query=query, values={field: value})
+                wallet = await self._fetch_one(query=query, values={field: value})
                 if wallet:
-                    return AdminWalletInDb(**wallet)
+                    return map_row(AdminWalletInDb, wallet)
                 else:
                     raise NotFoundError(entity_name="Admin Wallet", entity_identifier=field)
         raise ValueError("No valid arguments provided to get admin wallet.")
 
+    @handle_get_database_exceptions("Admin wallet")
     async def get_wallets(self) -> List[AdminWalletInDb]:
         """Get all admin wallets."""
-        wallets = await self.db.fetch_all(query=GET_ALL_ADMIN_WALLETS)
-        return [AdminWalletInDb(**wallet) for wallet in wallets]
-
-    async def update_wallet_balance(self, *, wallet_id: str, new_balance: float) -> AdminWalletInDb:
-        """Update an admin wallet's balance."""
-        updated_wallet = await self.db.fetch_one(
-            query=UPDATE_ADMIN_WALLET_BALANCE_QUERY, values={"id": wallet_id, "balance": new_balance}
-        )
+        wallets = await self._fetch_all(query=GET_ALL_ADMIN_WALLETS)
+        return map_rows(AdminWalletInDb, wallets)
+
+    @handle_get_database_exceptions("Admin wallet")
+    async def get_wallets_version(self) -> Dict:
+        """Get the row count and latest update of the wallet list."""
+        version = dict(await self._fetch_one(query=GET_ADMIN_WALLETS_VERSION_QUERY))
+        last_credited = version.pop("last_credited")
+        version["last_updated"] = f"{version['last_updated']}:{last_credited}"
+        return version
+
+    async def update_wallet_balance(self, *, wallet_id: str, new_balance: int) -> AdminWalletInDb:
+        """Set an admin wallet's balance, replacing any credits not yet compacted."""
+        async with self.db.transaction():
+            await WalletStripeRepository(self.db).discard(
+                wallet_type=WalletType.ADMIN, wallet_id=wallet_id
+            )
+            updated_wallet = await self.db.fetch_one(
+                query=UPDATE_ADMIN_WALLET_BALANCE_QUERY,
+                values={"id": wallet_id, "balance": new_balance},
+            )
         if updated_wallet is None:
             raise NotFoundError(entity_name="Admin Wallet", entity_identifier="id")
-        return AdminWalletInDb(**updated_wallet)
+        return map_row(AdminWalletInDb, updated_wallet)
 
     async def delete_wallet(self, *, wallet_id: str) -> AdminWalletInDb:
         """Delete an admin wallet."""
         deleted_wallet = await self.db.fetch_one(query=DELETE_ADMIN_WALLET_QUERY, values={"id": wallet_id})
         if deleted_wallet is None:
             raise NotFoundError(detail="Admin Wallet not found.")
-        return AdminWalletInDb(**deleted_wallet)
+        return map_row(AdminWalletInDb, deleted_wallet)
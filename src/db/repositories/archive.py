@@ -0,0 +1,256 @@
+"""Archive repository module.
+
+Soft-deleted rows stay in their table, where every query filters them out and every index
+still carries them. Once a row has been deleted for longer than the retention window, the
+archive-deleted-rows job moves it to `<table>_archive`, which holds the same columns plus
+`archived_at`, and a restore moves it back.
+
+Tables are archived children first. A row is only moved once no row left in a table
+referencing it points at it, so the foreign keys of the hot tables always hold; restoring
+a row whose parent is archived fails on the foreign key until the parent is restored.
+"""
+
+import logging
+from datetime import datetime
+from typing import Dict, NamedTuple, Tuple, Type
+from uuid import UUID
+
+from databases import Database
+from pydantic import BaseModel
+
+from src.db.mappers import map_row
+from src.db.pool import is_postgres
+from src.db.repositories.base import BaseRepository, utc_now
+from src.decorators.db import handle_post_database_exceptions
+from src.enums.archived_entity import ArchivedEntity
+from src.errors.database import NotFoundError
+from src.models.admin_wallet import AdminWalletInDb
+from src.models.payments import PaymentInDb
+from src.models.schools import SchoolInDb
+from src.models.schools_wallet import SchoolWalletInDb
+from src.models.settings import SettingsInDb
+from src.models.students import StudentInDb
+from src.models.super_admin_wallet import SuperAdminWalletInDb
+from src.models.transactions import TransactionInDb
+
+
+class ArchivedTable(NamedTuple):
+    """A table whose soft-deleted rows are archived."""
+
+    columns: Tuple[str, ...]
+    # (table, column) pairs pointing at this table's id; referenced rows stay put.
+    references: Tuple[Tuple[str, str], ...]
+    model: Type[BaseModel]
+
+
+# In archival order: a table comes before the tables it references.
+ARCHIVED_TABLES: Dict[ArchivedEntity, ArchivedTable] = {
+    ArchivedEntity.PAYMENTS: ArchivedTable(
+        columns=(
+            "id", "student_id", "school_id", "total_amount", "school_amount", "admin_amount",
+            "payment_status", "payment_method", "transaction_reference", "paid_at",
+            "created_at", "updated_at", "is_deleted",
+        ),
+        references=(),
+        model=PaymentInDb,
+    ),
+    ArchivedEntity.TRANSACTIONS: ArchivedTable(
+        columns=(
+            "id", "amount", "student_name", "school_id", "school_name", "reference",
+            "created_at", "updated_at", "is_deleted",
+        ),
+        references=(),
+        model=TransactionInDb,
+    ),
+    ArchivedEntity.SCHOOL_WALLETS: ArchivedTable(
+        columns=(
+            "id", "school_admin_id", "school_id", "current_balance", "total_earned",
+            "last_updated", "payout_recipient_type", "payout_account_number", "payout_bank_code",
+            "payout_account_name", "created_at", "updated_at", "is_deleted",
+        ),
+        references=(),
+        model=SchoolWalletInDb,
+    ),
+    ArchivedEntity.STUDENTS: ArchivedTable(
+        columns=(
+            "id", "index_number", "name", "dob", "school_id", "location", "registration_paid",
+            "created_at", "updated_at", "is_deleted",
+        ),
+        references=(("payments", "student_id"),),
+        model=StudentInDb,
+    ),
+    ArchivedEntity.SCHOOLS: ArchivedTable(
+        columns=("id", "name", "location", "registration_fee", "created_at", "updated_at", "is_deleted"),
+        references=(
+            ("students", "school_id"),
+            ("payments", "school_id"),
+            ("transactions", "school_id"),
+            ("school_wallets", "school_id"),
+            ("charge_intents", "school_id"),
+        ),
+        model=SchoolInDb,
+    ),
+    # Uncompacted credits are keyed by wallet without a foreign key; they must not be orphaned.
+    ArchivedEntity.ADMIN_WALLETS: ArchivedTable(
+        columns=(
+            "id", "admin_id", "provider", "account_number", "balance",
+            "created_at", "updated_at", "is_deleted",
+        ),
+        references=(("wallet_balance_stripes", "wallet_id"),),
+        model=AdminWalletInDb,
+    ),
+    ArchivedEntity.SUPER_ADMIN_WALLET: ArchivedTable(
+        columns=(
+            "id", "user_id", "current_balance", "total_earned", "last_updated",
+            "payout_recipient_type", "payout_account_number", "payout_bank_code",
+            "payout_account_name", "created_at", "updated_at", "is_deleted",
+        ),
+        references=(("wallet_balance_stripes", "wallet_id"),),
+        model=SuperAdminWalletInDb,
+    ),
+    ArchivedEntity.SETTINGS: ArchivedTable(
+        columns=("id", "key", "value", "created_at", "updated_at", "is_deleted"),
+        references=(),
+        model=SettingsInDb,
+    ),
+}
+
+app_logger = logging.getLogger("app")
+audit_logger = logging.getLogger("audit")
+
+
+def eligible_rows_query(table: str, spec: ArchivedTable, lock: bool) -> str:
+    """Ids of a batch of rows deleted before :cutoff that nothing references any more."""
+    unreferenced = "".join(
+        f"\n  AND NOT EXISTS (SELECT 1 FROM {child} WHERE {child}.{column} = {table}.id)"
+        for child, column in spec.references
+    )
+    return (
+        f"SELECT id FROM {table}\n"
+        f"WHERE is_deleted = TRUE AND updated_at < :cutoff{unreferenced}\n"
+        "ORDER BY updated_at\n"
+        "LIMIT :batch_size" + ("\nFOR UPDATE SKIP LOCKED" if lock else "")
+    )
+
+
+def archive_queries(entity: ArchivedEntity) -> Tuple[str, ...]:
+    """Statements moving one batch of `entity` rows to its archive table."""
+    table, spec = entity.value, ARCHIVED_TABLES[entity]
+    columns = ", ".join(spec.columns)
+    return (
+        f"""
+WITH moved AS (
+    DELETE FROM {table}
+    WHERE id IN ({eligible_rows_query(table, spec, lock=True)})
+    RETURNING {columns}
+), archived AS (
+    INSERT INTO {table}_archive ({columns}, archived_at)
+    SELECT {columns}, :now FROM moved
+    RETURNING id
+)
+SELECT COUNT(*) FROM archived
+""",
+        # sqlite has no DELETE in a CTE; the batch's archived_at identifies its rows.
+        f"""
+INSERT INTO {table}_archive ({columns}, archived_at)
+SELECT {columns}, :now FROM {table}
+WHERE id IN ({eligible_rows_query(table, spec, lock=False)})
+""",
+        f"""
+DELETE FROM {table}
+WHERE id IN (SELECT id FROM {table}_archive WHERE archived_at = :now)
+""",
+        f"SELECT COUNT(*) FROM {table}_archive WHERE archived_at = :now",
+    )
+
+
+def restore_queries(entity: ArchivedEntity) -> Tuple[str, ...]:
+    """Statements moving one archived `entity` row back, no longer deleted."""
+    table, spec = entity.value, ARCHIVED_TABLES[entity]
+    columns = ", ".join(spec.columns)
+    restored = ", ".join(
+        "FALSE" if column == "is_deleted" else ":now" if column == "updated_at" else column
+        for column in spec.columns
+    )
+    return (
+        f"""
+WITH unarchived AS (
+    DELETE FROM {table}_archive WHERE id = :id RETURNING {columns}
+)
+INSERT INTO {table} ({columns})
+SELECT {restored} FROM unarchived
+RETURNING {columns}
+""",
+        f"""
+INSERT INTO {table} ({columns})
+SELECT {restored} FROM {table}_archive WHERE id = :id
+RETURNING {columns}
+""",
+        f"DELETE FROM {table}_archive WHERE id = :id",
+    )
+
+
+ARCHIVE_QUERIES = {entity: archive_queries(entity) for entity in ARCHIVED_TABLES}
+RESTORE_QUERIES = {entity: restore_queries(entity) for entity in ARCHIVED_TABLES}
+
+
+class ArchiveRepository(BaseRepository):
+    """Repository moving soft-deleted rows to and from the archive tables."""
+
+    def __init__(self, db: Database) -> None:
+        super().__init__(db)
+
+    @handle_post_database_exceptions("Archive")
+    async def archive_batch(
+        self, *, entity: ArchivedEntity, deleted_before: datetime, batch_size: int
+    ) -> int:
+        """Move up to `batch_size` rows deleted before `deleted_before`; returns how many moved."""
+        postgres_query, sqlite_insert, sqlite_delete, sqlite_count = ARCHIVE_QUERIES[entity]
+        values = {"cutoff": deleted_before, "batch_size": batch_size, "now": utc_now()}
+        async with self.db.transaction():
+            if is_postgres(self.db.url):
+                return await self.db.fetch_val(query=postgres_query, values=values)
+            await self.db.execute(query=sqlite_insert, values=values)
+            await self.db.execute(query=sqlite_delete, values={"now": values["now"]})
+            return await self.db.fetch_val(query=sqlite_count, values={"now": values["now"]})
+
+    async def archive_deleted(
+        self, *, entity: ArchivedEntity, deleted_before: datetime, batch_size: int
+    ) -> int:
+        """Archive every eligible row of `entity`, one batch per transaction."""
+        total = 0
+        while True:
+            moved = await self.archive_batch(
+                entity=entity, deleted_before=deleted_before, batch_size=batch_size
+            )
+            total += moved
+            if moved < batch_size:
+                break
+        if total:
+            audit_logger.info(
+                f"Archived {total} deleted {entity.value}",
+                extra={"action": "archive", "entity": entity.value, "details": {"rows": total}},
+            )
+        return total
+
+    @handle_post_database_exceptions(
+        "Archive", foreign_key_entity="Referenced row", already_exists_entity="Row"
+    )
+    async def restore(self, *, entity: ArchivedEntity, id: UUID) -> BaseModel:
+        """Move an archived row back to its table, no longer deleted."""
+        postgres_query, sqlite_insert, sqlite_delete = RESTORE_QUERIES[entity]
+        values = {"id": str(id), "now": utc_now()}
+        async with self.db.transaction():
+            if is_postgres(self.db.url):
+                row = await self.db.fetch_one(query=postgres_query, values=values)
+            else:
+                row = await self.db.fetch_one(query=sqlite_insert, values=values)
+                if row is not None:
+                    await self.db.execute(query=sqlite_delete, values={"id": values["id"]})
+        if row is None:
+            raise NotFoundError(entity_name=f"Archived {entity.value}", entity_identifier=str(id))
+        audit_logger.info(
+            f"Restored {entity.value} {id} from the archive",
+            extra={"action": "restore", "entity": entity.value, "entity_id": str(id)},
+        )
+        return map_row(ARCHIVED_TABLES[entity].model, row)
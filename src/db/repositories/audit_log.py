@@ -0,0 +1,61 @@
+"""Audit log repository module."""
+
+from functools import lru_cache
+from typing import Sequence
+
+from databases import Database
+
+from src.db.pool import is_postgres
+from src.db.repositories.base import BaseRepository
+from src.decorators.db import handle_post_database_exceptions
+from src.models.audit_log import AUDIT_LOG_COLUMNS, AuditEntry
+
+# One statement for the whole batch: each column is sent as an array and unnested into rows.
+INSERT_AUDIT_ENTRIES_QUERY = """
+INSERT INTO audit_log (created_at, action, entity, entity_id, correlation_id, message, details)
+SELECT * FROM unnest(
+    :created_at::timestamp[], :action::text[], :entity::text[], :entity_id::text[],
+    :correlation_id::text[], :message::text[], :details::text[]
+)
+"""
+
+
+@lru_cache(maxsize=16)
+def sqlite_insert_audit_entries_query(count: int) -> str:
+    """A multi-row INSERT for `count` entries; sqlite has no arrays to unnest."""
+    rows = ",\n".join(
+        "(" + ", ".join(f":{column}_{index}" for column in AUDIT_LOG_COLUMNS) + ")"
+        for index in range(count)
+    )
+    return f"INSERT INTO audit_log ({', '.join(AUDIT_LOG_COLUMNS)})\nVALUES {rows}"
+
+
+class AuditLogRepository(BaseRepository):
+    """Repository for the append-only audit log."""
+
+    def __init__(self, db: Database) -> None:
+        super().__init__(db)
+
+    @handle_post_database_exceptions("Audit log")
+    async def insert_entries(self, *, entries: Sequence[AuditEntry]) -> int:
+        """Insert a batch of entries with one statement; returns how many."""
+        if not entries:
+            return 0
+        if is_postgres(self.db.url):
+            await self._fetch_all(
+                query=INSERT_AUDIT_ENTRIES_QUERY,
+                values={
+                    column: list(values)
+                    for column, values in zip(AUDIT_LOG_COLUMNS, zip(*entries))
+                },
+            )
+        else:
+            await self.db.execute(
+                query=sqlite_insert_audit_entries_query(len(entries)),
+                values={
+                    f"{column}_{index}": value
+                    for index, entry in enumerate(entries)
+                    for column, value in zip(AUDIT_LOG_COLUMNS, entry)
+                },
+            )
+        return len(entries)
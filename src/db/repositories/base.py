@@ -1,18 +1,43 @@
 """Base Repository."""
 
+from datetime import datetime, timezone
+from typing import List, Mapping, Optional, Union
+
 # Third party imports
+from databases import Database
 
+from src.db import statements
+from src.db.router import DatabaseRouter
 
-from databases import Database
+
+def utc_now() -> datetime:
+    """The current UTC time as the naive timestamp the tables store.
+
+    Tables whose rows are compared by age get it from here rather than the server
+    default, so postgres and sqlite agree on the time zone.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
 
 
 class BaseRepository:
     """Base class for Postgres repositories."""
 
-    def __init__(self, db: Database) -> None:
+    def __init__(self, db: Union[Database, DatabaseRouter]) -> None:
         """Initialize with Postgres database instance.
 
         Args:
             db (Database): An instance of the Database database.
         """
         self.db = db
+
+    async def _fetch_one(
+        self, *, query: str, values: Optional[dict] = None
+    ) -> Optional[Mapping]:
+        """Fetch one row through the prepared-statement layer."""
+        return await statements.fetch_one(self.db, query=query, values=values)
+
+    async def _fetch_all(
+        self, *, query: str, values: Optional[dict] = None
+    ) -> List[Mapping]:
+        """Fetch all rows through the prepared-statement layer."""
+        return await statements.fetch_all(self.db, query=query, values=values)
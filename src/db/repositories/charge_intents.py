@@ -0,0 +1,191 @@
+"""Charge intents repository module."""
+
+import logging
+from datetime import timedelta
+from typing import List, Optional
+
+from databases import Database
+
+from src.db.mappers import map_row, map_rows
+from src.db.repositories.base import BaseRepository, utc_now
+from src.decorators.db import (
+    handle_get_database_exceptions,
+    handle_post_database_exceptions,
+)
+from src.enums.charge_intent_status import ChargeIntentStatus
+from src.errors.database import NotFoundError
+from src.models.charge_intents import ChargeIntentCreate, ChargeIntentInDb
+
+CHARGE_INTENT_COLUMNS = """reference, school_id, school_name, student_name, phone_number,
+       network_provider, amount, school_amount, admin_amount, status,
+       paystack_transaction_id, settled_at, checked_at, created_at, updated_at"""
+
+CREATE_CHARGE_INTENT_QUERY = f"""
+INSERT INTO charge_intents (reference, school_id, school_name, student_name, phone_number,
+                            network_provider, amount, school_amount, admin_amount,
+                            checked_at, created_at, updated_at)
+VALUES (:reference, :school_id, :school_name, :student_name, :phone_number,
+        :network_provider, :amount, :school_amount, :admin_amount, :now, :now, :now)
+RETURNING {CHARGE_INTENT_COLUMNS}
+"""
+
+GET_CHARGE_INTENT_QUERY = f"""
+SELECT {CHARGE_INTENT_COLUMNS}
+FROM charge_intents
+WHERE reference = :reference
+"""
+
+# Only a pending intent moves on, so a webhook Paystack delivers twice settles once; and
+# only for the amount it was created with.
+SETTLE_CHARGE_INTENT_QUERY = f"""
+UPDATE charge_intents
+SET status = 'succeeded', paystack_transaction_id = :paystack_transaction_id,
+    settled_at = :now, updated_at = :now
+WHERE reference = :reference AND status = 'pending' AND amount = :amount
+RETURNING {CHARGE_INTENT_COLUMNS}
+"""
+
+MISMATCH_CHARGE_INTENT_QUERY = f"""
+UPDATE charge_intents
+SET status = 'mismatched', paystack_transaction_id = :paystack_transaction_id,
+    updated_at = :now
+WHERE reference = :reference AND status = 'pending'
+RETURNING {CHARGE_INTENT_COLUMNS}
+"""
+
+CLOSE_CHARGE_INTENT_QUERY = f"""
+UPDATE charge_intents
+SET status = :status, updated_at = :now
+WHERE reference = :reference AND status = 'pending'
+RETURNING {CHARGE_INTENT_COLUMNS}
+"""
+
+MARK_CHARGE_INTENT_CHECKED_QUERY = """
+UPDATE charge_intents
+SET checked_at = :now
+WHERE reference = :reference
+"""
+
+# Least recently checked first, so intents Paystack keeps reporting as pending move to the
+# back of the queue instead of filling every batch.
+GET_CHARGE_INTENTS_BY_STATUS_QUERY = f"""
+SELECT {CHARGE_INTENT_COLUMNS}
+FROM charge_intents
+WHERE status = :status AND created_at < :before
+ORDER BY checked_at
+LIMIT :limit
+"""
+
+audit_logger = logging.getLogger("audit")
+
+
+class ChargeIntentRepository(BaseRepository):
+    """Repository for the charges sent to Paystack and what settling them needs."""
+
+    def __init__(self, db: Database) -> None:
+        super().__init__(db)
+
+    @handle_post_database_exceptions("Charge intent", "School", "Charge intent")
+    async def create_intent(self, *, new_intent: ChargeIntentCreate) -> ChargeIntentInDb:
+        """Record a charge before it is sent to Paystack."""
+        intent = await self._fetch_one(
+            query=CREATE_CHARGE_INTENT_QUERY,
+            values={
+                **new_intent.model_dump(),
+                "school_id": str(new_intent.school_id),
+                "network_provider": new_intent.network_provider.value,
+                "now": utc_now(),
+            },
+        )
+        return map_row(ChargeIntentInDb, intent)
+
+    @handle_get_database_exceptions("Charge intent")
+    async def get_intent(self, *, reference: str) -> ChargeIntentInDb:
+        """Get a charge intent by its Paystack reference."""
+        intent = await self._fetch_one(
+            query=GET_CHARGE_INTENT_QUERY, values={"reference": reference}
+        )
+        if not intent:
+            raise NotFoundError(entity_name="Charge intent", entity_identifier=reference)
+        return map_row(ChargeIntentInDb, intent)
+
+    @handle_post_database_exceptions("Charge intent")
+    async def settle(
+        self, *, reference: str, amount: int, paystack_transaction_id: Optional[int] = None
+    ) -> Optional[ChargeIntentInDb]:
+        """Mark a pending intent of `amount` as paid; None when there is no such intent."""
+        intent = await self._fetch_one(
+            query=SETTLE_CHARGE_INTENT_QUERY,
+            values={
+                "reference": reference,
+                "amount": amount,
+                "paystack_transaction_id": paystack_transaction_id,
+                "now": utc_now(),
+            },
+        )
+        return map_row(ChargeIntentInDb, intent) if intent else None
+
+    @handle_post_database_exceptions("Charge intent")
+    async def mark_mismatched(
+        self, *, reference: str, paystack_transaction_id: Optional[int] = None
+    ) -> Optional[ChargeIntentInDb]:
+        """Hold a pending intent Paystack paid differently; None when it is unknown or no longer pending."""
+        intent = await self._fetch_one(
+            query=MISMATCH_CHARGE_INTENT_QUERY,
+            values={
+                "reference": reference,
+                "paystack_transaction_id": paystack_transaction_id,
+                "now": utc_now(),
+            },
+        )
+        return map_row(ChargeIntentInDb, intent) if intent else None
+
+    @handle_post_database_exceptions("Charge intent")
+    async def mark_failed(self, *, reference: str) -> Optional[ChargeIntentInDb]:
+        """Mark a pending intent as failed; None when it is unknown or no longer pending."""
+        return await self._close(reference=reference, status=ChargeIntentStatus.FAILED)
+
+    @handle_post_database_exceptions("Charge intent")
+    async def mark_expired(self, *, reference: str) -> Optional[ChargeIntentInDb]:
+        """Give up on a pending intent; None when it is unknown or no longer pending."""
+        return await self._close(reference=reference, status=ChargeIntentStatus.EXPIRED)
+
+    async def _close(
+        self, *, reference: str, status: ChargeIntentStatus
+    ) -> Optional[ChargeIntentInDb]:
+        """Move a pending intent to a final `status` and audit it."""
+        intent = await self._fetch_one(
+            query=CLOSE_CHARGE_INTENT_QUERY,
+            values={"reference": reference, "status": status.value, "now": utc_now()},
+        )
+        if not intent:
+            return None
+        action = "fail" if status == ChargeIntentStatus.FAILED else "expire"
+        audit_logger.info(
+            f"Charge {status.value}",
+            extra={"action": action, "entity": "charge_intent", "entity_id": reference},
+        )
+        return map_row(ChargeIntentInDb, intent)
+
+    @handle_post_database_exceptions("Charge intent")
+    async def mark_checked(self, *, reference: str) -> None:
+        """Record that Paystack was asked about the intent, moving it to the back of the queue."""
+        await self.db.execute(
+            query=MARK_CHARGE_INTENT_CHECKED_QUERY,
+            values={"reference": reference, "now": utc_now()},
+        )
+
+    @handle_get_database_exceptions("Charge intent")
+    async def get_intents_older_than(
+        self,
+        *,
+        age: timedelta,
+        status: ChargeIntentStatus = ChargeIntentStatus.PENDING,
+        limit: int = 100,
+    ) -> List[ChargeIntentInDb]:
+        """Get the least recently checked intents with `status` created more than `age` ago."""
+        intents = await self._fetch_all(
+            query=GET_CHARGE_INTENTS_BY_STATUS_QUERY,
+            values={"status": status.value, "before": utc_now() - age, "limit": limit},
+        )
+        return map_rows(ChargeIntentInDb, intents)
@@ -0,0 +1,262 @@
+"""Jobs repository module."""
+
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from databases import Database
+
+from src.db.mappers import map_row, map_rows
+from src.db.pool import is_postgres
+from src.db.repositories.base import BaseRepository, utc_now
+from src.decorators.db import (
+    handle_get_database_exceptions,
+    handle_post_database_exceptions,
+)
+from src.enums.job_status import JobStatus
+from src.errors.database import NotFoundError
+from src.models.jobs import JobCreate, JobInDb
+from src.utils.ids import new_id
+
+JOB_COLUMNS = """id, name, payload, status, priority, attempts, max_attempts, run_at,
+       locked_until, locked_by, last_error, result, created_at, updated_at"""
+
+ENQUEUE_JOB_QUERY = f"""
+INSERT INTO jobs (id, name, payload, priority, max_attempts, run_at, created_at, updated_at)
+VALUES (:id, :name, :payload, :priority, :max_attempts, :run_at, :now, :now)
+RETURNING {JOB_COLUMNS}
+"""
+
+# Due queued jobs, plus running jobs whose worker let the lease run out, best first.
+# On postgres SKIP LOCKED lets concurrent workers each take different rows without waiting.
+_CLAIM_JOBS_QUERY = """
+UPDATE jobs
+SET status = 'running', attempts = attempts + 1, locked_by = :worker_id,
+    locked_until = :locked_until, updated_at = :now
+WHERE id IN (
+    SELECT id FROM jobs
+    WHERE (status = 'queued' AND run_at <= :now)
+       OR (status = 'running' AND locked_until < :now)
+    ORDER BY priority DESC, run_at
+    LIMIT :limit
+    {lock}
+)
+RETURNING {columns}
+"""
+CLAIM_JOBS_QUERY = _CLAIM_JOBS_QUERY.format(lock="FOR UPDATE SKIP LOCKED", columns=JOB_COLUMNS)
+# sqlite runs one writer at a time, so the plain update is already exclusive.
+SQLITE_CLAIM_JOBS_QUERY = _CLAIM_JOBS_QUERY.format(lock="", columns=JOB_COLUMNS)
+
+RENEW_JOB_LEASE_QUERY = """
+UPDATE jobs
+SET locked_until = :locked_until, updated_at = :now
+WHERE id = :id AND locked_by = :worker_id AND status = 'running'
+RETURNING id
+"""
+
+COMPLETE_JOB_QUERY = """
+UPDATE jobs
+SET status = 'succeeded', result = :result, locked_by = NULL, locked_until = NULL,
+    updated_at = :now
+WHERE id = :id AND locked_by = :worker_id AND status = 'running'
+RETURNING id
+"""
+
+FINISH_ATTEMPT_QUERY = """
+UPDATE jobs
+SET status = :status, run_at = :run_at, last_error = :last_error, locked_by = NULL,
+    locked_until = NULL, updated_at = :now
+WHERE id = :id AND locked_by = :worker_id AND status = 'running'
+RETURNING id
+"""
+
+RELEASE_JOB_QUERY = """
+UPDATE jobs
+SET status = 'queued', attempts = attempts - 1, run_at = :now, locked_by = NULL,
+    locked_until = NULL, updated_at = :now
+WHERE id = :id AND locked_by = :worker_id AND status = 'running'
+RETURNING id
+"""
+
+GET_JOB_BY_ID_QUERY = f"""
+SELECT {JOB_COLUMNS}
+FROM jobs
+WHERE id = :id
+"""
+
+GET_JOBS_QUERY = f"""
+SELECT {JOB_COLUMNS}
+FROM jobs
+ORDER BY created_at DESC
+LIMIT :limit
+"""
+
+GET_JOBS_BY_STATUS_QUERY = f"""
+SELECT {JOB_COLUMNS}
+FROM jobs
+WHERE status = :status
+ORDER BY created_at DESC
+LIMIT :limit
+"""
+
+COUNT_JOBS_BY_STATUS_QUERY = """
+SELECT status, COUNT(*) AS count
+FROM jobs
+GROUP BY status
+"""
+
+PURGE_FINISHED_JOBS_QUERY = """
+DELETE FROM jobs
+WHERE status IN ('succeeded', 'failed') AND updated_at < :before
+RETURNING id
+"""
+
+
+def to_utc(moment: datetime) -> datetime:
+    """Naive UTC timestamp for a naive (assumed UTC) or aware datetime."""
+    if moment.tzinfo is None:
+        return moment
+    return moment.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+class JobRepository(BaseRepository):
+    """Repository for the background job queue.
+
+    Timestamps are computed here rather than in SQL, so postgres and sqlite
+    compare them the same way.
+    """
+
+    def __init__(self, db: Database) -> None:
+        super().__init__(db)
+
+    @handle_post_database_exceptions("Job")
+    async def enqueue(self, *, new_job: JobCreate) -> JobInDb:
+        """Add a job to the queue."""
+        now = utc_now()
+        job = await self._fetch_one(
+            query=ENQUEUE_JOB_QUERY,
+            values={
+                "id": new_id(),
+                "name": new_job.name,
+                "payload": json.dumps(new_job.payload, default=str),
+                "priority": new_job.priority,
+                "max_attempts": new_job.max_attempts,
+                "run_at": to_utc(new_job.run_at) if new_job.run_at else now,
+                "now": now,
+            },
+        )
+        return map_row(JobInDb, job)
+
+    @handle_post_database_exceptions("Job")
+    async def claim(
+        self, *, worker_id: str, visibility_timeout: float, limit: int = 1
+    ) -> List[JobInDb]:
+        """Mark up to `limit` due jobs as running for `worker_id` and return them."""
+        now = utc_now()
+        query = CLAIM_JOBS_QUERY if is_postgres(self.db.url) else SQLITE_CLAIM_JOBS_QUERY
+        jobs = await self._fetch_all(
+            query=query,
+            values={
+                "worker_id": worker_id,
+                "locked_until": now + timedelta(seconds=visibility_timeout),
+                "now": now,
+                "limit": limit,
+            },
+        )
+        return map_rows(JobInDb, jobs)
+
+    @handle_post_database_exceptions("Job")
+    async def renew_lease(self, *, id: UUID, worker_id: str, visibility_timeout: float) -> bool:
+        """Extend a running job's lease; False when the worker no longer holds it."""
+        now = utc_now()
+        renewed = await self._fetch_one(
+            query=RENEW_JOB_LEASE_QUERY,
+            values={
+                "id": str(id),
+                "worker_id": worker_id,
+                "locked_until": now + timedelta(seconds=visibility_timeout),
+                "now": now,
+            },
+        )
+        return renewed is not None
+
+    @handle_post_database_exceptions("Job")
+    async def complete(self, *, id: UUID, worker_id: str, result: Any = None) -> bool:
+        """Mark a job as succeeded; False when the worker no longer holds it."""
+        completed = await self._fetch_one(
+            query=COMPLETE_JOB_QUERY,
+            values={
+                "id": str(id),
+                "worker_id": worker_id,
+                "result": None if result is None else json.dumps(result, default=str),
+                "now": utc_now(),
+            },
+        )
+        return completed is not None
+
+    @handle_post_database_exceptions("Job")
+    async def fail(
+        self, *, id: UUID, worker_id: str, error: str, retry_in: Optional[float] = None
+    ) -> bool:
+        """Record a failed attempt and queue a retry in `retry_in` seconds, or fail the job for good."""
+        now = utc_now()
+        finished = await self._fetch_one(
+            query=FINISH_ATTEMPT_QUERY,
+            values={
+                "id": str(id),
+                "worker_id": worker_id,
+                "status": (JobStatus.FAILED if retry_in is None else JobStatus.QUEUED).value,
+                "run_at": now if retry_in is None else now + timedelta(seconds=retry_in),
+                "last_error": error,
+                "now": now,
+            },
+        )
+        return finished is not None
+
+    @handle_post_database_exceptions("Job")
+    async def release(self, *, id: UUID, worker_id: str) -> bool:
+        """Put an interrupted job back in the queue without counting the attempt."""
+        released = await self._fetch_one(
+            query=RELEASE_JOB_QUERY,
+            values={"id": str(id), "worker_id": worker_id, "now": utc_now()},
+        )
+        return released is not None
+
+    @handle_get_database_exceptions("Job")
+    async def get_job(self, *, id: UUID) -> JobInDb:
+        """Get a job by id."""
+        job = await self._fetch_one(query=GET_JOB_BY_ID_QUERY, values={"id": str(id)})
+        if not job:
+            raise NotFoundError(entity_name="Job", entity_identifier=str(id))
+        return map_row(JobInDb, job)
+
+    @handle_get_database_exceptions("Job")
+    async def get_jobs(
+        self, *, status: Optional[JobStatus] = None, limit: int = 100
+    ) -> List[JobInDb]:
+        """Get the most recent jobs, optionally with one status."""
+        if status is None:
+            jobs = await self._fetch_all(query=GET_JOBS_QUERY, values={"limit": limit})
+        else:
+            jobs = await self._fetch_all(
+                query=GET_JOBS_BY_STATUS_QUERY,
+                values={"status": status.value, "limit": limit},
+            )
+        return map_rows(JobInDb, jobs)
+
+    @handle_get_database_exceptions("Job")
+    async def count_jobs(self) -> Dict[str, int]:
+        """Number of jobs in each status."""
+        rows = await self._fetch_all(query=COUNT_JOBS_BY_STATUS_QUERY)
+        counts = {status.value: 0 for status in JobStatus}
+        counts.update({row["status"]: row["count"] for row in rows})
+        return counts
+
+    @handle_post_database_exceptions("Job")
+    async def purge_finished(self, *, older_than: timedelta) -> int:
+        """Delete succeeded and failed jobs last updated before `older_than` ago."""
+        purged = await self._fetch_all(
+            query=PURGE_FINISHED_JOBS_QUERY, values={"before": utc_now() - older_than}
+        )
+        return len(purged)
@@ -7,16 +7,18 @@ from uuid import UUID
 import sqlite3
 from datetime import datetime
 
+from src.db.mappers import map_row, map_rows
 from src.models.payments import PaymentCreate, PaymentInDb
 from src.errors.database import NotFoundError
+from src.utils.ids import new_id
 
 DATABASE_URL = "db_model.sqlite"  # Adjust with the correct path to your SQLite file
 
 # Define raw SQL queries
 CREATE_PAYMENT_QUERY = """
-INSERT INTO payments (student_id, school_id, total_amount, school_amount, admin_amount, 
+INSERT INTO payments (id, student_id, school_id, total_amount, school_amount, admin_amount, 
                       payment_status, payment_method, transaction_reference, paid_at)
-VALUES (:student_id, :school_id, :total_amount, :school_amount, :admin_amount, 
+VALUES (:id, :student_id, :school_id, :total_amount, :school_amount, :admin_amount, 
         :payment_status, :payment_method, :transaction_reference, :paid_at)
 RETURNING id, student_id, school_id, total_amount, school_amount, admin_amount, 
           payment_status, payment_method, transaction_reference, paid_at, created_at, updated_at
@@ -59,17 +61,25 @@ class PaymentRepository:
 
     def create_payment(self, new_payment: PaymentCreate) -> PaymentInDb:
         """Create a new payment."""
-        audit_logger.info("Adding payment...", new_payment.dict())
         conn = self._get_connection()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
         try:
-            cursor.execute(CREATE_PAYMENT_QUERY, new_payment.dict())
+            cursor.execute(CREATE_PAYMENT_QUERY, {"id": new_id(), **new_payment.dict()})
             payment_data = cursor.fetchone()
             conn.commit()
-            audit_logger.info("Payment added successfully")
-            return PaymentInDb(**dict(payment_data))
+            payment = map_row(PaymentInDb, dict(payment_data))
+            audit_logger.info(
+                "Payment added",
+                extra={
+                    "action": "create",
+                    "entity": "payment",
+                    "entity_id": payment.id,
+                    "details": new_payment.dict(),
+                },
+            )
+            return payment
         except Exception as e:
             conn.rollback()
             raise e
@@ -88,7 +98,7 @@ class PaymentRepository:
             payment_data = cursor.fetchone()
             if payment_data is None:
                 raise NotFoundError(f"Payment with id {id} not found")
-            return PaymentInDb(**dict(payment_data))
+            return map_row(PaymentInDb, dict(payment_data))
         finally:
             cursor.close()
             conn.close()
@@ -102,7 +112,7 @@ class PaymentRepository:
         try:
             cursor.execute(GET_PAYMENTS_QUERY)
             payments = cursor.fetchall()
-            return [PaymentInDb(**dict(payment)) for payment in payments]
+            return map_rows(PaymentInDb, (dict(payment) for payment in payments))
         finally:
             cursor.close()
             conn.close()
@@ -121,7 +131,7 @@ class PaymentRepository:
             conn.commit()
             if payment_data is None:
                 raise NotFoundError(f"Payment with id {id} not found")
-            return PaymentInDb(**dict(payment_data))
+            return map_row(PaymentInDb, dict(payment_data))
         finally:
             cursor.close()
             conn.close()
@@ -6,13 +6,15 @@ from uuid import UUID
 
 from databases import Database
 
+from src.db.mappers import map_row, map_rows
 from src.db.repositories.base import BaseRepository
 from src.errors.database import NotFoundError
 from src.models.role import RoleCreate, RoleInDb, RoleUpdate
+from src.utils.ids import new_id
 
 CREATE_ROLE_QUERY = """
-INSERT INTO roles (name)
-VALUES (:name)
+INSERT INTO roles (id, name)
+VALUES (:id, :name)
 RETURNING id, name, created_at, updated_at, is_deleted
 """
 
@@ -55,25 +57,33 @@ class RoleRepository(BaseRepository):
 
     async def create_role(self, *, new_role: RoleCreate) -> RoleInDb:
         """Create a new role."""
-        audit_logger.info("Adding role...", new_role.model_dump())
         created_role = await self.db.fetch_one(
-            query=CREATE_ROLE_QUERY, values=new_role.model_dump()
+            query=CREATE_ROLE_QUERY, values={"id": new_id(), **new_role.model_dump()}
+        )
+        role = map_row(RoleInDb, created_role)
+        audit_logger.info(
+            "Role created",
+            extra={
+                "action": "create",
+                "entity": "role",
+                "entity_id": role.id,
+                "details": new_role.model_dump(),
+            },
         )
-        audit_logger.info("Role creation completed")
 
-        return RoleInDb(**created_role)
+        return role
 
     async def get_role(self, *, id: UUID) -> RoleInDb:
         """Get role by id."""
-        role = await self.db.fetch_one(query=GET_ROLE_BY_ID_QUERY, values={"id": id})
+        role = await self._fetch_one(query=GET_ROLE_BY_ID_QUERY, values={"id": id})
         if not role:
             raise NotFoundError(entity_name="Role")
-        return RoleInDb(**role)
+        return map_row(RoleInDb, role)
 
     async def get_roles(self) -> List[RoleInDb]:
         """Get all roles."""
-        roles = await self.db.fetch_all(query=GET_ROLES_QUERY)
-        return [RoleInDb(**role) for role in roles]
+        roles = await self._fetch_all(query=GET_ROLES_QUERY)
+        return map_rows(RoleInDb, roles)
 
     async def update_role(self, *, id: UUID, role_update: RoleUpdate) -> RoleInDb:
         """Update a role."""
@@ -82,7 +92,16 @@ class RoleRepository(BaseRepository):
         )
         if not updated_role:
             raise NotFoundError(entity_name="Role")
-        return RoleInDb(**updated_role)
+        audit_logger.info(
+            "Role updated",
+            extra={
+                "action": "update",
+                "entity": "role",
+                "entity_id": id,
+                "details": role_update.model_dump(),
+            },
+        )
+        return map_row(RoleInDb, updated_role)
 
     async def delete_role(self, *, id: UUID) -> RoleInDb:
         """Delete a role by its id."""
@@ -91,4 +110,12 @@ class RoleRepository(BaseRepository):
         )
         if not deleted_role:
             raise NotFoundError(entity_name="Role")
-        return RoleInDb(**deleted_role)
+        audit_logger.info(
+            "Role deleted",
+            extra={
+                "action": "delete",
+                "entity": "role",
+                "entity_id": id,
+            },
+        )
+        return map_row(RoleInDb, deleted_role)
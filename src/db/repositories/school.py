@@ -1,18 +1,21 @@
 """School repository."""
 
 import logging
-from typing import Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from databases import Database
 
+from src.db.mappers import map_row, map_rows
 from src.db.repositories.base import BaseRepository
+from src.decorators.db import handle_get_database_exceptions
 from src.errors.database import NotFoundError
 from src.models.schools import SchoolCreate, SchoolInDb, SchoolUpdate
+from src.utils.ids import new_id
 
 CREATE_SCHOOL_QUERY = """
-INSERT INTO schools (name, location, registration_fee, updated_at)
-VALUES (:name, :location, :registration_fee, :updated_at)
+INSERT INTO schools (id, name, location, registration_fee, updated_at)
+VALUES (:id, :name, :location, :registration_fee, :updated_at)
 RETURNING id, name, location, registration_fee, created_at, updated_at, is_deleted
 """
 
@@ -22,6 +25,19 @@ FROM schools
 WHERE id = :id AND is_deleted = FALSE
 """
 
+GET_SCHOOLS_QUERY = """
+SELECT id, name, location, registration_fee, created_at, updated_at, is_deleted
+FROM schools
+WHERE is_deleted = FALSE
+ORDER BY name
+"""
+
+GET_SCHOOLS_VERSION_QUERY = """
+SELECT COUNT(*) AS count, MAX(updated_at) AS last_updated
+FROM schools
+WHERE is_deleted = FALSE
+"""
+
 UPDATE_SCHOOL_QUERY = """
 UPDATE schools
 SET name = COALESCE(:name, name), 
@@ -51,22 +67,42 @@ class SchoolRepository(BaseRepository):
 
     async def create_school(self, *, new_school: SchoolCreate) -> SchoolInDb:
         """Create a new school."""
-        audit_logger.info("Creating school...", new_school.model_dump())
         # Ensure updated_at is set during creation
-        values = {**new_school.model_dump(), "updated_at": new_school.updated_at or None}
+        values = {"id": new_id(), **new_school.model_dump(), "updated_at": new_school.updated_at or None}
         created_school = await self.db.fetch_one(
             query=CREATE_SCHOOL_QUERY, values=values
         )
-        audit_logger.info("School creation completed")
+        school = map_row(SchoolInDb, created_school)
+        audit_logger.info(
+            "School created",
+            extra={
+                "action": "create",
+                "entity": "school",
+                "entity_id": school.id,
+                "details": new_school.model_dump(),
+            },
+        )
 
-        return SchoolInDb(**created_school)
+        return school
 
+    @handle_get_database_exceptions("School")
     async def get_school_by_id(self, *, id: UUID) -> SchoolInDb:
         """Get a school by its ID."""
-        school = await self.db.fetch_one(query=GET_SCHOOL_BY_ID_QUERY, values={"id": id})
+        school = await self._fetch_one(query=GET_SCHOOL_BY_ID_QUERY, values={"id": id})
         if not school:
-            raise NotFoundError(entity_name="School")
-        return SchoolInDb(**school)
+            raise NotFoundError(entity_name="School", entity_identifier=str(id))
+        return map_row(SchoolInDb, school)
+
+    @handle_get_database_exceptions("School")
+    async def get_schools(self) -> List[SchoolInDb]:
+        """Get all schools."""
+        schools = await self._fetch_all(query=GET_SCHOOLS_QUERY)
+        return map_rows(SchoolInDb, schools)
+
+    @handle_get_database_exceptions("School")
+    async def get_schools_version(self) -> Dict:
+        """Get the row count and latest update of the school list."""
+        return dict(await self._fetch_one(query=GET_SCHOOLS_VERSION_QUERY))
 
     async def update_school(self, *, id: UUID, school_update: SchoolUpdate) -> SchoolInDb:
         """Update a school."""
@@ -78,7 +114,7 @@ class SchoolRepository(BaseRepository):
         )
         if not updated_school:
             raise NotFoundError(entity_name="School")
-        return SchoolInDb(**updated_school)
+        return map_row(SchoolInDb, updated_school)
 
     async def delete_school(self, *, id: UUID) -> SchoolInDb:
         """Delete a school."""
@@ -87,4 +123,4 @@ class SchoolRepository(BaseRepository):
         )
         if not deleted_school:
             raise NotFoundError(entity_name="School")
-        return SchoolInDb(**deleted_school)
+        return map_row(SchoolInDb, deleted_school)
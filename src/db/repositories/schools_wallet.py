@@ -7,40 +7,81 @@ from decimal import Decimal
 
 from databases import Database
 
-from src.db.repositories.base import BaseRepository
+from src.db.mappers import map_row
+from src.db.repositories.base import BaseRepository, utc_now
+from src.decorators.db import handle_get_database_exceptions
 from src.errors.database import NotFoundError
 from src.models.schools_wallet import SchoolWalletCreate, SchoolWalletInDb, SchoolWalletUpdate
-
-CREATE_SCHOOL_WALLET_QUERY = """
-INSERT INTO school_wallets (school_admin_id, school_id, current_balance, total_earned, last_updated)
-VALUES (:school_admin_id, :school_id, :current_balance, :total_earned, :last_updated)
-RETURNING id, school_admin_id, school_id, current_balance, total_earned, last_updated, created_at, updated_at, is_deleted
+from src.models.transfer_recipients import PayoutAccount
+from src.utils.ids import new_id
+
+SCHOOL_WALLET_COLUMNS = """id, school_admin_id, school_id, current_balance, total_earned, last_updated,
+       payout_recipient_type, payout_account_number, payout_bank_code, payout_account_name,
+       created_at, updated_at, is_deleted"""
+
+# A wallet starts empty and without a payout account.
+CREATE_SCHOOL_WALLET_QUERY = f"""
+INSERT INTO school_wallets (id, school_admin_id, school_id, current_balance, total_earned, last_updated)
+VALUES (:id, :school_admin_id, :school_id, 0, 0, :now)
+RETURNING {SCHOOL_WALLET_COLUMNS}
 """
 
-GET_SCHOOL_WALLET_BY_ID_QUERY = """
-SELECT id, school_admin_id, school_id, current_balance, total_earned, last_updated, created_at, updated_at, is_deleted
+GET_SCHOOL_WALLET_BY_ID_QUERY = f"""
+SELECT {SCHOOL_WALLET_COLUMNS}
 FROM school_wallets
 WHERE id = :id AND is_deleted = FALSE
 """
 
-GET_SCHOOL_WALLET_BY_SCHOOL_ID_QUERY = """
-SELECT id, school_admin_id, school_id, current_balance, total_earned, last_updated, created_at, updated_at, is_deleted
+GET_SCHOOL_WALLET_BY_SCHOOL_ID_QUERY = f"""
+SELECT {SCHOOL_WALLET_COLUMNS}
 FROM school_wallets
 WHERE school_id = :school_id AND is_deleted = FALSE
 """
 
-UPDATE_SCHOOL_WALLET_QUERY = """
+UPDATE_SCHOOL_WALLET_QUERY = f"""
+UPDATE school_wallets
+SET school_admin_id = COALESCE(:school_admin_id, school_admin_id), updated_at = :now
+WHERE id = :id AND is_deleted = FALSE
+RETURNING {SCHOOL_WALLET_COLUMNS}
+"""
+
+SET_SCHOOL_WALLET_PAYOUT_ACCOUNT_QUERY = f"""
 UPDATE school_wallets
-SET current_balance = :current_balance, total_earned = :total_earned, last_updated = :last_updated, updated_at = NOW()
+SET payout_recipient_type = :payout_recipient_type, payout_account_number = :payout_account_number,
+    payout_bank_code = :payout_bank_code, payout_account_name = :payout_account_name,
+    updated_at = :now
 WHERE id = :id AND is_deleted = FALSE
-RETURNING id, school_admin_id, school_id, current_balance, total_earned, last_updated, created_at, updated_at, is_deleted
+RETURNING {SCHOOL_WALLET_COLUMNS}
+"""
+
+# One row per school, so concurrent settlements only queue here for the same school.
+CREDIT_SCHOOL_WALLET_QUERY = """
+UPDATE school_wallets
+SET current_balance = current_balance + :amount, total_earned = total_earned + :amount,
+    last_updated = :now, updated_at = :now
+WHERE school_id = :school_id AND is_deleted = FALSE
+RETURNING id
+"""
+
+# Checked and taken in one statement, so two withdrawals cannot both spend the same balance.
+DEBIT_SCHOOL_WALLET_QUERY = f"""
+UPDATE school_wallets
+SET current_balance = current_balance - :amount, last_updated = :now, updated_at = :now
+WHERE id = :id AND is_deleted = FALSE AND current_balance >= :amount
+RETURNING {SCHOOL_WALLET_COLUMNS}
 """
 
-DELETE_SCHOOL_WALLET_BY_ID_QUERY = """
+REFUND_SCHOOL_WALLET_QUERY = """
 UPDATE school_wallets
-SET is_deleted = TRUE
+SET current_balance = current_balance + :amount, last_updated = :now, updated_at = :now
+WHERE id = :id
+"""
+
+DELETE_SCHOOL_WALLET_BY_ID_QUERY = f"""
+UPDATE school_wallets
+SET is_deleted = TRUE, updated_at = CURRENT_TIMESTAMP
 WHERE id = :id AND is_deleted = FALSE
-RETURNING id, school_admin_id, school_id, current_balance, total_earned, last_updated, created_at, updated_at, is_deleted
+RETURNING {SCHOOL_WALLET_COLUMNS}
 """
 
 audit_logger = logging.getLogger("audit")
@@ -55,29 +96,40 @@ class SchoolWalletRepository(BaseRepository):
 
     async def create_school_wallet(self, *, new_wallet: SchoolWalletCreate) -> SchoolWalletInDb:
         """Create a new school wallet."""
-        audit_logger.info("Creating school wallet...", new_wallet.model_dump())
         created_wallet = await self.db.fetch_one(
-            query=CREATE_SCHOOL_WALLET_QUERY, values=new_wallet.model_dump()
+            query=CREATE_SCHOOL_WALLET_QUERY,
+            values={"id": new_id(), "now": utc_now(), **new_wallet.model_dump()},
+        )
+        wallet = map_row(SchoolWalletInDb, created_wallet)
+        audit_logger.info(
+            "School wallet created",
+            extra={
+                "action": "create",
+                "entity": "school_wallet",
+                "entity_id": wallet.id,
+                "details": new_wallet.model_dump(),
+            },
         )
-        audit_logger.info("School wallet creation completed")
 
-        return SchoolWalletInDb(**created_wallet)
+        return wallet
 
+    @handle_get_database_exceptions("School wallet")
     async def get_school_wallet_by_id(self, *, id: UUID) -> SchoolWalletInDb:
         """Get a school wallet by its ID."""
-        wallet = await self.db.fetch_one(query=GET_SCHOOL_WALLET_BY_ID_QUERY, values={"id": id})
+        wallet = await self._fetch_one(query=GET_SCHOOL_WALLET_BY_ID_QUERY, values={"id": id})
         if not wallet:
-            raise NotFoundError(entity_name="School Wallet")
-        return SchoolWalletInDb(**wallet)
+            raise NotFoundError(entity_name="School Wallet", entity_identifier=str(id))
+        return map_row(SchoolWalletInDb, wallet)
 
+    @handle_get_database_exceptions("School wallet")
     async def get_school_wallet_by_school_id(self, *, school_id: UUID) -> SchoolWalletInDb:
         """Get a school wallet by its school ID."""
-        wallet = await self.db.fetch_one(
+        wallet = await self._fetch_one(
             query=GET_SCHOOL_WALLET_BY_SCHOOL_ID_QUERY, values={"school_id": school_id}
         )
         if not wallet:
-            raise NotFoundError(entity_name="School Wallet")
-        return SchoolWalletInDb(**wallet)
+            raise NotFoundError(entity_name="School Wallet", entity_identifier=str(school_id))
+        return map_row(SchoolWalletInDb, wallet)
 
     async def update_school_wallet(
         self, *, id: UUID, wallet_update: SchoolWalletUpdate
@@ -85,11 +137,62 @@ class SchoolWalletRepository(BaseRepository):
         """Update a school wallet."""
         updated_wallet = await self.db.fetch_one(
             query=UPDATE_SCHOOL_WALLET_QUERY,
-            values={"id": id, **wallet_update.model_dump()},
+            values={"id": str(id), "now": utc_now(), **wallet_update.model_dump()},
+        )
+        if not updated_wallet:
+            raise NotFoundError(entity_name="School Wallet")
+        audit_logger.info(
+            "School wallet updated",
+            extra={
+                "action": "update",
+                "entity": "school_wallet",
+                "entity_id": id,
+                "details": wallet_update.model_dump(),
+            },
+        )
+        return map_row(SchoolWalletInDb, updated_wallet)
+
+    async def set_payout_account(self, *, id: UUID, account: PayoutAccount) -> SchoolWalletInDb:
+        """Replace the account a school wallet's withdrawals are paid to."""
+        updated_wallet = await self.db.fetch_one(
+            query=SET_SCHOOL_WALLET_PAYOUT_ACCOUNT_QUERY,
+            values={"id": str(id), "now": utc_now(), **account.model_dump()},
         )
         if not updated_wallet:
             raise NotFoundError(entity_name="School Wallet")
-        return SchoolWalletInDb(**updated_wallet)
+        audit_logger.info(
+            "School wallet payout account changed",
+            extra={
+                "action": "update",
+                "entity": "school_wallet",
+                "entity_id": id,
+                "details": account.model_dump(),
+            },
+        )
+        return map_row(SchoolWalletInDb, updated_wallet)
+
+    async def credit_school_wallet(self, *, school_id: UUID, amount: int) -> bool:
+        """Add a settled charge's school share in pesewas; False when the school has no wallet."""
+        credited = await self.db.fetch_one(
+            query=CREDIT_SCHOOL_WALLET_QUERY,
+            values={"school_id": str(school_id), "amount": amount, "now": utc_now()},
+        )
+        return credited is not None
+
+    async def debit_school_wallet(self, *, id: UUID, amount: int) -> Optional[SchoolWalletInDb]:
+        """Take a withdrawal in pesewas off the balance; None when the balance is too low."""
+        debited = await self.db.fetch_one(
+            query=DEBIT_SCHOOL_WALLET_QUERY,
+            values={"id": str(id), "amount": amount, "now": utc_now()},
+        )
+        return map_row(SchoolWalletInDb, debited) if debited else None
+
+    async def refund_school_wallet(self, *, id: UUID, amount: int) -> None:
+        """Put back a withdrawal that failed or was reversed."""
+        await self.db.execute(
+            query=REFUND_SCHOOL_WALLET_QUERY,
+            values={"id": str(id), "amount": amount, "now": utc_now()},
+        )
 
     async def delete_school_wallet(self, *, id: UUID) -> SchoolWalletInDb:
         """Delete a school wallet."""
@@ -98,4 +201,12 @@ class SchoolWalletRepository(BaseRepository):
         )
         if not deleted_wallet:
             raise NotFoundError(entity_name="School Wallet")
-        return SchoolWalletInDb(**deleted_wallet)
+        audit_logger.info(
+            "School wallet deleted",
+            extra={
+                "action": "delete",
+                "entity": "school_wallet",
+                "entity_id": id,
+            },
+        )
+        return map_row(SchoolWalletInDb, deleted_wallet)
@@ -5,6 +5,7 @@ from uuid import UUID
 
 from databases import Database
 
+from src.db.mappers import map_row, map_rows
 from src.db.repositories.base import BaseRepository
 from src.decorators.db import (
     handle_get_database_exceptions,
@@ -14,10 +15,11 @@ from src.errors.core import ValueError
 from src.errors.database import FailedToCreateUpdateQueryError, NotFoundError
 from src.models.settings import SettingsCreate, SettingsInDb, SettingsUpdate
 from src.utils.helpers import Helpers
+from src.utils.ids import new_id
 
 CREATE_SETTINGS_QUERY = """
-INSERT INTO settings (key, value)
-VALUES (:key, :value)
+INSERT INTO settings (id, key, value)
+VALUES (:id, :key, :value)
 RETURNING id, key, value, created_at, updated_at, is_deleted
 """
 
@@ -57,9 +59,9 @@ class SettingsRepository(BaseRepository):
     async def create_settings(self, *, new_settings: SettingsCreate) -> SettingsInDb:
         """Create new settings."""
         created_settings = await self.db.fetch_one(
-            query=CREATE_SETTINGS_QUERY, values={**new_settings.model_dump()}
+            query=CREATE_SETTINGS_QUERY, values={"id": new_id(), **new_settings.model_dump()}
         )
-        return SettingsInDb(**created_settings)
+        return map_row(SettingsInDb, created_settings)
 
     @handle_get_database_exceptions("Settings")
     async def get_setting(self, *, id: UUID = None, key: str = None) -> SettingsInDb:
@@ -70,11 +72,11 @@ class SettingsRepository(BaseRepository):
         }
         for field, (query, value) in search_criteria.items():
             if value:
-                settings_record = await self.db.fetch_one(
+                settings_record = await self._fetch_one(
                     query=query, values={field: value}
                 )
                 if settings_record:
-                    return SettingsInDb(**settings_record)
+                    return map_row(SettingsInDb, settings_record)
                 else:
                     raise NotFoundError(entity_name="Settings")
         raise ValueError("Key must be provided.")
@@ -84,8 +86,8 @@ class SettingsRepository(BaseRepository):
         self,
     ) -> List[SettingsInDb]:
         """Get all settings."""
-        settings_records = await self.db.fetch_all(query=GET_SETTINGS_QUERY)
-        return [SettingsInDb(**record) for record in settings_records]
+        settings_records = await self._fetch_all(query=GET_SETTINGS_QUERY)
+        return map_rows(SettingsInDb, settings_records)
 
     @handle_get_database_exceptions("Settings")
     async def update_setting(
@@ -117,7 +119,7 @@ class SettingsRepository(BaseRepository):
         if not updated_setting:
             raise NotFoundError(entity_name="Settings")
 
-        return SettingsInDb(**updated_setting)
+        return map_row(SettingsInDb, updated_setting)
 
     @handle_get_database_exceptions("Settings")
     async def delete_settings_by_key(self, *, key: str) -> UUID:
@@ -1,18 +1,21 @@
 """Student repository."""
 
 import logging
-from typing import Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from databases import Database
 
+from src.db.mappers import map_row, map_rows
 from src.db.repositories.base import BaseRepository
+from src.decorators.db import handle_get_database_exceptions
 from src.errors.database import NotFoundError
 from src.models.students import StudentCreate, StudentInDb, StudentUpdate
+from src.utils.ids import new_id
 
 CREATE_STUDENT_QUERY = """
-INSERT INTO students (index_number, name, dob, school_id, location, registration_paid)
-VALUES (:index_number, :name, :dob, :school_id, :location, :registration_paid)
+INSERT INTO students (id, index_number, name, dob, school_id, location, registration_paid)
+VALUES (:id, :index_number, :name, :dob, :school_id, :location, :registration_paid)
 RETURNING id, index_number, name, dob, school_id, location, registration_paid, created_at, updated_at, is_deleted
 """
 
@@ -22,6 +25,32 @@ FROM students
 WHERE id = :id AND is_deleted = FALSE
 """
 
+GET_STUDENTS_QUERY = """
+SELECT id, index_number, name, dob, school_id, location, registration_paid, created_at, updated_at, is_deleted
+FROM students
+WHERE is_deleted = FALSE
+ORDER BY name
+"""
+
+GET_STUDENTS_BY_SCHOOL_ID_QUERY = """
+SELECT id, index_number, name, dob, school_id, location, registration_paid, created_at, updated_at, is_deleted
+FROM students
+WHERE school_id = :school_id AND is_deleted = FALSE
+ORDER BY name
+"""
+
+GET_STUDENTS_VERSION_QUERY = """
+SELECT COUNT(*) AS count, MAX(updated_at) AS last_updated
+FROM students
+WHERE is_deleted = FALSE
+"""
+
+GET_STUDENTS_BY_SCHOOL_ID_VERSION_QUERY = """
+SELECT COUNT(*) AS count, MAX(updated_at) AS last_updated
+FROM students
+WHERE school_id = :school_id AND is_deleted = FALSE
+"""
+
 UPDATE_STUDENT_QUERY = """
 UPDATE students
 SET index_number = :index_number, name = :name, dob = :dob, school_id = :school_id, location = :location, 
@@ -32,7 +61,7 @@ RETURNING id, index_number, name, dob, school_id, location, registration_paid, c
 
 DELETE_STUDENT_BY_ID_QUERY = """
 UPDATE students
-SET is_deleted = TRUE
+SET is_deleted = TRUE, updated_at = CURRENT_TIMESTAMP
 WHERE id = :id AND is_deleted = FALSE
 RETURNING id, index_number, name, dob, school_id, location, registration_paid, created_at, updated_at, is_deleted
 """
@@ -49,19 +78,50 @@ class StudentRepository(BaseRepository):
 
     async def create_student(self, *, new_student: StudentCreate) -> StudentInDb:
         """Create a new student."""
-        audit_logger.info("Creating student...", new_student.model_dump())
         created_student = await self.db.fetch_one(
-            query=CREATE_STUDENT_QUERY, values=new_student.model_dump()
+            query=CREATE_STUDENT_QUERY, values={"id": new_id(), **new_student.model_dump()}
         )
-        audit_logger.info("Student creation completed")
-        return StudentInDb(**created_student)
+        student = map_row(StudentInDb, created_student)
+        audit_logger.info(
+            "Student created",
+            extra={
+                "action": "create",
+                "entity": "student",
+                "entity_id": student.id,
+                "details": new_student.model_dump(),
+            },
+        )
+        return student
 
+    @handle_get_database_exceptions("Student")
     async def get_student_by_id(self, *, id: UUID) -> StudentInDb:
         """Get a student by their ID."""
-        student = await self.db.fetch_one(query=GET_STUDENT_BY_ID_QUERY, values={"id": id})
+        student = await self._fetch_one(query=GET_STUDENT_BY_ID_QUERY, values={"id": id})
         if not student:
-            raise NotFoundError(entity_name="Student")
-        return StudentInDb(**student)
+            raise NotFoundError(entity_name="Student", entity_identifier=str(id))
+        return map_row(StudentInDb, student)
+
+    @handle_get_database_exceptions("Student")
+    async def get_students(self, *, school_id: Optional[UUID] = None) -> List[StudentInDb]:
+        """Get all students, or the students of one school."""
+        if school_id:
+            students = await self._fetch_all(
+                query=GET_STUDENTS_BY_SCHOOL_ID_QUERY, values={"school_id": school_id}
+            )
+        else:
+            students = await self._fetch_all(query=GET_STUDENTS_QUERY)
+        return map_rows(StudentInDb, students)
+
+    @handle_get_database_exceptions("Student")
+    async def get_students_version(self, *, school_id: Optional[UUID] = None) -> Dict:
+        """Get the row count and latest update of a student list."""
+        if school_id:
+            version = await self._fetch_one(
+                query=GET_STUDENTS_BY_SCHOOL_ID_VERSION_QUERY, values={"school_id": school_id}
+            )
+        else:
+            version = await self._fetch_one(query=GET_STUDENTS_VERSION_QUERY)
+        return dict(version)
 
     async def update_student(self, *, id: UUID, student_update: StudentUpdate) -> StudentInDb:
         """Update a student."""
@@ -71,7 +131,7 @@ class StudentRepository(BaseRepository):
         )
         if not updated_student:
             raise NotFoundError(entity_name="Student")
-        return StudentInDb(**updated_student)
+        return map_row(StudentInDb, updated_student)
 
     async def delete_student(self, *, id: UUID) -> StudentInDb:
         """Delete a student."""
@@ -80,4 +140,4 @@ class StudentRepository(BaseRepository):
         )
         if not deleted_student:
             raise NotFoundError(entity_name="Student")
-        return StudentInDb(**deleted_student)
+        return map_row(StudentInDb, deleted_student)
@@ -6,34 +6,70 @@ from uuid import UUID
 
 from databases import Database
 
-from src.db.repositories.base import BaseRepository
+from src.db.mappers import map_row
+from src.db.repositories.base import BaseRepository, utc_now
+from src.decorators.db import handle_get_database_exceptions
 from src.errors.database import NotFoundError
-from src.models.super_admin_wallet import SuperAdminWalletCreate, SuperAdminWalletInDb, SuperAdminWalletUpdate
+from src.models.super_admin_wallet import SuperAdminWalletCreate, SuperAdminWalletInDb
+from src.models.transfer_recipients import PayoutAccount
+from src.utils.ids import new_id
 
-CREATE_SUPER_ADMIN_WALLET_QUERY = """
-INSERT INTO super_admin_wallet (user_id, current_balance, total_earned)
-VALUES (:user_id, :current_balance, :total_earned)
-RETURNING id, user_id, current_balance, total_earned, created_at, updated_at, is_deleted
+SUPER_ADMIN_WALLET_COLUMNS = """id, user_id, current_balance, total_earned,
+       payout_recipient_type, payout_account_number, payout_bank_code, payout_account_name,
+       created_at, updated_at, is_deleted"""
+
+# A wallet starts empty and without a payout account.
+CREATE_SUPER_ADMIN_WALLET_QUERY = f"""
+INSERT INTO super_admin_wallet (id, user_id, current_balance, total_earned)
+VALUES (:id, :user_id, 0, 0)
+RETURNING {SUPER_ADMIN_WALLET_COLUMNS}
 """
 
+# Balances include the credits still in wallet_balance_stripes (see wallet_stripes.py).
 GET_SUPER_ADMIN_WALLET_BY_USER_ID_QUERY = """
-SELECT id, user_id, current_balance, total_earned, created_at, updated_at, is_deleted
-FROM super_admin_wallet
-WHERE user_id = :user_id AND is_deleted = FALSE
+SELECT w.id, w.user_id, w.current_balance + s.amount AS current_balance,
+       w.total_earned + s.amount AS total_earned, w.payout_recipient_type,
+       w.payout_account_number, w.payout_bank_code, w.payout_account_name,
+       w.created_at, w.updated_at, w.is_deleted
+FROM super_admin_wallet w
+CROSS JOIN (
+    SELECT CAST(COALESCE(SUM(amount), 0) AS BIGINT) AS amount
+    FROM wallet_balance_stripes
+    WHERE wallet_type = 'super_admin_wallet'
+      AND wallet_id = (SELECT id FROM super_admin_wallet WHERE user_id = :user_id AND is_deleted = FALSE)
+) s
+WHERE w.user_id = :user_id AND w.is_deleted = FALSE
 """
 
-UPDATE_SUPER_ADMIN_WALLET_QUERY = """
+SET_SUPER_ADMIN_WALLET_PAYOUT_ACCOUNT_QUERY = """
 UPDATE super_admin_wallet
-SET current_balance = :current_balance, total_earned = :total_earned, updated_at = NOW()
+SET payout_recipient_type = :payout_recipient_type, payout_account_number = :payout_account_number,
+    payout_bank_code = :payout_bank_code, payout_account_name = :payout_account_name,
+    updated_at = :now
 WHERE user_id = :user_id AND is_deleted = FALSE
-RETURNING id, user_id, current_balance, total_earned, created_at, updated_at, is_deleted
+RETURNING id
+"""
+
+# Checked and taken in one statement, so two withdrawals cannot both spend the same balance.
+# Credits still in stripes can be withdrawn once compacted into the row.
+DEBIT_SUPER_ADMIN_WALLET_QUERY = f"""
+UPDATE super_admin_wallet
+SET current_balance = current_balance - :amount, updated_at = :now
+WHERE id = :id AND is_deleted = FALSE AND current_balance >= :amount
+RETURNING {SUPER_ADMIN_WALLET_COLUMNS}
+"""
+
+REFUND_SUPER_ADMIN_WALLET_QUERY = """
+UPDATE super_admin_wallet
+SET current_balance = current_balance + :amount, updated_at = :now
+WHERE id = :id
 """
 
-DELETE_SUPER_ADMIN_WALLET_QUERY = """
+DELETE_SUPER_ADMIN_WALLET_QUERY = f"""
 UPDATE super_admin_wallet
-SET is_deleted = TRUE
+SET is_deleted = TRUE, updated_at = CURRENT_TIMESTAMP
 WHERE user_id = :user_id AND is_deleted = FALSE
-RETURNING id, user_id, current_balance, total_earned, created_at, updated_at, is_deleted
+RETURNING {SUPER_ADMIN_WALLET_COLUMNS}
 """
 
 audit_logger = logging.getLogger("audit")
@@ -48,29 +84,67 @@ class SuperAdminWalletRepository(BaseRepository):
 
     async def create_super_admin_wallet(self, *, new_wallet: SuperAdminWalletCreate) -> SuperAdminWalletInDb:
         """Create a new Super Admin Wallet."""
-        audit_logger.info("Creating Super Admin Wallet...", new_wallet.model_dump())
         created_wallet = await self.db.fetch_one(
-            query=CREATE_SUPER_ADMIN_WALLET_QUERY, values=new_wallet.model_dump()
+            query=CREATE_SUPER_ADMIN_WALLET_QUERY, values={"id": new_id(), **new_wallet.model_dump()}
         )
-        audit_logger.info("Super Admin Wallet creation completed")
-        return SuperAdminWalletInDb(**created_wallet)
+        wallet = map_row(SuperAdminWalletInDb, created_wallet)
+        audit_logger.info(
+            "Super Admin Wallet created",
+            extra={
+                "action": "create",
+                "entity": "super_admin_wallet",
+                "entity_id": wallet.id,
+                "details": new_wallet.model_dump(),
+            },
+        )
+        return wallet
 
+    @handle_get_database_exceptions("Super admin wallet")
     async def get_super_admin_wallet_by_user_id(self, *, user_id: UUID) -> SuperAdminWalletInDb:
         """Get a Super Admin Wallet by user ID."""
-        wallet = await self.db.fetch_one(query=GET_SUPER_ADMIN_WALLET_BY_USER_ID_QUERY, values={"user_id": user_id})
+        wallet = await self._fetch_one(query=GET_SUPER_ADMIN_WALLET_BY_USER_ID_QUERY, values={"user_id": user_id})
         if not wallet:
-            raise NotFoundError(entity_name="Super Admin Wallet")
-        return SuperAdminWalletInDb(**wallet)
+            raise NotFoundError(entity_name="Super Admin Wallet", entity_identifier=str(user_id))
+        return map_row(SuperAdminWalletInDb, wallet)
 
-    async def update_super_admin_wallet(self, *, user_id: UUID, wallet_update: SuperAdminWalletUpdate) -> SuperAdminWalletInDb:
-        """Update a Super Admin Wallet."""
-        updated_wallet = await self.db.fetch_one(
-            query=UPDATE_SUPER_ADMIN_WALLET_QUERY,
-            values={"user_id": user_id, **wallet_update.model_dump()},
+    async def set_payout_account(
+        self, *, user_id: UUID, account: PayoutAccount
+    ) -> SuperAdminWalletInDb:
+        """Replace the account a Super Admin Wallet's withdrawals are paid to."""
+        updated = await self.db.fetch_one(
+            query=SET_SUPER_ADMIN_WALLET_PAYOUT_ACCOUNT_QUERY,
+            values={"user_id": str(user_id), "now": utc_now(), **account.model_dump()},
         )
-        if not updated_wallet:
+        if not updated:
             raise NotFoundError(entity_name="Super Admin Wallet")
-        return SuperAdminWalletInDb(**updated_wallet)
+        audit_logger.info(
+            "Super Admin Wallet payout account changed",
+            extra={
+                "action": "update",
+                "entity": "super_admin_wallet",
+                "entity_id": updated["id"],
+                "details": account.model_dump(),
+            },
+        )
+        # Read back with the uncompacted credits, as every other read shows the balance.
+        return await self.get_super_admin_wallet_by_user_id(user_id=user_id)
+
+    async def debit_super_admin_wallet(
+        self, *, id: UUID, amount: int
+    ) -> Optional[SuperAdminWalletInDb]:
+        """Take a withdrawal in pesewas off the balance; None when the balance is too low."""
+        debited = await self.db.fetch_one(
+            query=DEBIT_SUPER_ADMIN_WALLET_QUERY,
+            values={"id": str(id), "amount": amount, "now": utc_now()},
+        )
+        return map_row(SuperAdminWalletInDb, debited) if debited else None
+
+    async def refund_super_admin_wallet(self, *, id: UUID, amount: int) -> None:
+        """Put back a withdrawal that failed or was reversed."""
+        await self.db.execute(
+            query=REFUND_SUPER_ADMIN_WALLET_QUERY,
+            values={"id": str(id), "amount": amount, "now": utc_now()},
+        )
 
     async def delete_super_admin_wallet(self, *, user_id: UUID) -> SuperAdminWalletInDb:
         """Delete a Super Admin Wallet."""
@@ -79,4 +153,13 @@ class SuperAdminWalletRepository(BaseRepository):
         )
         if not deleted_wallet:
             raise NotFoundError(entity_name="Super Admin Wallet")
-        return SuperAdminWalletInDb(**deleted_wallet)
+        wallet = map_row(SuperAdminWalletInDb, deleted_wallet)
+        audit_logger.info(
+            "Super Admin Wallet deleted",
+            extra={
+                "action": "delete",
+                "entity": "super_admin_wallet",
+                "entity_id": wallet.id,
+            },
+        )
+        return wallet
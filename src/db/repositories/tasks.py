@@ -1,30 +1,184 @@
 """Database Connect Tasks"""
 
+import asyncio
 import logging
+from typing import Any, Awaitable, Callable, Dict
 
-from databases import Database
+from databases import Database, DatabaseURL
 from fastapi import FastAPI
 
-from src.core.config import DATABASE_URL
+from src.core.config import (
+    DATABASE_URL,
+    DB_CONNECT_RETRIES,
+    DB_CONNECTION_IDLE_LIFETIME,
+    DB_CONNECTION_MAX_QUERIES,
+    DB_POOL_ACQUIRE_TIMEOUT,
+    DB_POOL_MAX_SIZE,
+    DB_POOL_MIN_SIZE,
+    DB_STATEMENT_TIMEOUT_MS,
+    PARTITION_MONTHS_AHEAD,
+    PARTITION_RETENTION_MONTHS,
+    REPLICA_DATABASE_URL,
+)
+from src.db.locks import advisory_lock
+from src.db.partitions import maintain_partitions
+from src.db.pool import PooledDatabase, get_pool_stats, is_postgres, register_pool_metrics
+from src.db.repositories.role import RoleRepository
+from src.db.repositories.school import SchoolRepository
+from src.db.repositories.setting import SettingsRepository
 
 app_logger = logging.getLogger("app")
 
 
+def get_database_options(url: DatabaseURL, pool_name: str = "primary") -> Dict[str, Any]:
+    """Pool options for a database url; sqlite takes none."""
+    if not is_postgres(url):
+        return {}
+    return {
+        "min_size": DB_POOL_MIN_SIZE,
+        "max_size": DB_POOL_MAX_SIZE,
+        "acquire_timeout": DB_POOL_ACQUIRE_TIMEOUT,
+        "max_inactive_connection_lifetime": DB_CONNECTION_IDLE_LIFETIME,
+        "max_queries": DB_CONNECTION_MAX_QUERIES,
+        "server_settings": {"statement_timeout": str(DB_STATEMENT_TIMEOUT_MS)},
+        "pool_name": pool_name,
+    }
+
+
+async def open_database(url: DatabaseURL, pool_name: str = "primary") -> Database:
+    """Connect a pooled database, retrying with backoff before giving up."""
+    database = PooledDatabase(url, **get_database_options(url, pool_name))
+    for attempt in range(1, DB_CONNECT_RETRIES + 1):
+        try:
+            await database.connect()
+            break
+        except Exception as e:
+            if attempt == DB_CONNECT_RETRIES:
+                raise
+            app_logger.warning(
+                f"Connecting to {pool_name} db failed (attempt {attempt}): {e}"
+            )
+            await asyncio.sleep(2**attempt)
+    register_pool_metrics(database, pool_name)
+    return database
+
+
 async def connect_database(app: FastAPI) -> None:
     """Connect to DB"""
     try:
-        database = Database(DATABASE_URL)
-        await database.connect()
-        app.state._db = database
-        app_logger.info("Connected to postgres db.")
+        app.state._db = await open_database(DATABASE_URL)
+        app_logger.info(f"Connected to {DATABASE_URL.dialect} db.")
+    except Exception as e:
+        app_logger.exception("Failed to connect to db", exc_info=e)
+        raise
+    app.state._replica_db = None
+    if REPLICA_DATABASE_URL:
+        try:
+            app.state._replica_db = await open_database(
+                DatabaseURL(REPLICA_DATABASE_URL), "replica"
+            )
+            app_logger.info("Connected to replica db.")
+        except Exception as e:
+            # Reads fall back to the primary when the replica is unavailable.
+            app_logger.exception("Failed to connect to replica db", exc_info=e)
+
+
+async def check_pool_health(database: Database) -> Dict[str, Any]:
+    """Run a trivial query through a pool and report the pool state."""
+    if database is None or not database.is_connected:
+        return {"status": "unavailable", "pool": {}}
+    try:
+        await asyncio.wait_for(
+            database.fetch_val(query="SELECT 1"), timeout=DB_POOL_ACQUIRE_TIMEOUT
+        )
+        status = "ok"
+    except Exception as e:
+        app_logger.warning(f"Database health check failed: {e}")
+        status = "unavailable"
+    return {"status": status, "pool": get_pool_stats(database)}
+
+
+async def check_database_health(app: FastAPI) -> Dict[str, Any]:
+    """Check the primary pool, and the replica pool when one is configured."""
+    health = await check_pool_health(getattr(app.state, "_db", None))
+    if REPLICA_DATABASE_URL:
+        health["replica"] = await check_pool_health(
+            getattr(app.state, "_replica_db", None)
+        )
+    return health
+
+
+async def run_on_pool_connections(
+    database: Database, work: Callable[[], Awaitable[Any]]
+) -> int:
+    """Run `work` on each of the pool's minimum connections; returns how many.
+
+    All connections are held at once, so each run gets a different one.
+    """
+    count = get_pool_stats(database).get("min_size") or 1
+    barrier = asyncio.Barrier(count)
+
+    async def run() -> None:
+        async with database.connection():
+            await barrier.wait()
+            await work()
+
+    await asyncio.gather(*(run() for _ in range(count)))
+    return count
+
+
+async def prime_database_pool(app: FastAPI) -> Dict[str, Any]:
+    """Check out and ping every minimum pool connection."""
+    database = app.state._db
+    connections = await run_on_pool_connections(
+        database, lambda: database.fetch_val(query="SELECT 1")
+    )
+    return {"connections": connections}
+
+
+async def load_reference_data(app: FastAPI) -> Dict[str, Any]:
+    """Read settings, roles and schools on every minimum pool connection.
+
+    This prepares their statements on each connection and compiles their row mappers.
+    """
+    database = app.state._db
+    counts: Dict[str, int] = {}
+
+    async def load() -> None:
+        counts["settings"] = len(await SettingsRepository(database).get_settings())
+        counts["roles"] = len(await RoleRepository(database).get_roles())
+        counts["schools"] = len(await SchoolRepository(database).get_schools())
+        await SchoolRepository(database).get_schools_version()
+
+    await run_on_pool_connections(database, load)
+    return counts
+
+
+async def maintain_partitioned_tables(app: FastAPI) -> None:
+    """Create upcoming monthly partitions and archive expired ones."""
+    if not is_postgres(DATABASE_URL):
+        return
+    try:
+        # Every gunicorn worker runs the startup handler; only one does the DDL.
+        async with advisory_lock(app.state._db, "partition-maintenance") as acquired:
+            if not acquired:
+                app_logger.info("Partition maintenance is running in another worker.")
+                return
+            await maintain_partitions(
+                app.state._db,
+                months_ahead=PARTITION_MONTHS_AHEAD,
+                retention_months=PARTITION_RETENTION_MONTHS,
+            )
     except Exception as e:
-        app_logger.exception("Failed to connect to postgresql db", exc_info=e)
+        app_logger.exception("Failed to maintain table partitions", exc_info=e)
 
 
 async def disconnect_database(app: FastAPI) -> None:
     """Close db."""
     try:
+        if getattr(app.state, "_replica_db", None) is not None:
+            await app.state._replica_db.disconnect()
         await app.state._db.disconnect()
-        app_logger.info("Disconnected from postgresql db")
+        app_logger.info("Disconnected from db")
     except Exception as e:
-        app_logger.exception("Error disconnecting from postgresql", exc_info=e)
+        app_logger.exception("Error disconnecting from db", exc_info=e)
@@ -1,18 +1,22 @@
 """Transaction repository."""
 
 import logging
-from typing import Optional
+from datetime import datetime
+from typing import List, Optional
 from uuid import UUID
 
 from databases import Database
 
+from src.db.mappers import map_row, map_rows
 from src.db.repositories.base import BaseRepository
+from src.decorators.db import handle_get_database_exceptions
 from src.errors.database import NotFoundError
 from src.models.transactions import TransactionCreate, TransactionInDb, TransactionUpdate
+from src.utils.ids import new_id
 
 CREATE_TRANSACTION_QUERY = """
-INSERT INTO transactions (amount, student_name, school_id, school_name, reference)
-VALUES (:amount, :student_name, :school_id, :school_name, :reference)
+INSERT INTO transactions (id, amount, student_name, school_id, school_name, reference)
+VALUES (:id, :amount, :student_name, :school_id, :school_name, :reference)
 RETURNING id, amount, student_name, school_id, school_name, reference, created_at, updated_at, is_deleted
 """
 
@@ -22,6 +26,14 @@ FROM transactions
 WHERE id = :id AND is_deleted = FALSE
 """
 
+# Bounding created_at lets postgres prune the monthly partitions outside the window.
+GET_TRANSACTIONS_SINCE_QUERY = """
+SELECT id, amount, student_name, school_id, school_name, reference, created_at, updated_at, is_deleted
+FROM transactions
+WHERE created_at >= :since AND is_deleted = FALSE
+ORDER BY created_at DESC
+"""
+
 UPDATE_TRANSACTION_QUERY = """
 UPDATE transactions
 SET amount = :amount, student_name = :student_name, school_id = :school_id, school_name = :school_name, reference = :reference, updated_at = NOW()
@@ -31,7 +43,7 @@ RETURNING id, amount, student_name, school_id, school_name, reference, created_a
 
 DELETE_TRANSACTION_QUERY = """
 UPDATE transactions
-SET is_deleted = TRUE
+SET is_deleted = TRUE, updated_at = CURRENT_TIMESTAMP
 WHERE id = :id AND is_deleted = FALSE
 RETURNING id, amount, student_name, school_id, school_name, reference, created_at, updated_at, is_deleted
 """
@@ -48,19 +60,36 @@ class TransactionRepository(BaseRepository):
 
     async def create_transaction(self, *, new_transaction: TransactionCreate) -> TransactionInDb:
         """Create a new transaction."""
-        audit_logger.info("Creating Transaction...", new_transaction.model_dump())
         created_transaction = await self.db.fetch_one(
-            query=CREATE_TRANSACTION_QUERY, values=new_transaction.model_dump()
+            query=CREATE_TRANSACTION_QUERY, values={"id": new_id(), **new_transaction.model_dump()}
         )
-        audit_logger.info("Transaction creation completed")
-        return TransactionInDb(**created_transaction)
+        transaction = map_row(TransactionInDb, created_transaction)
+        audit_logger.info(
+            "Transaction created",
+            extra={
+                "action": "create",
+                "entity": "transaction",
+                "entity_id": transaction.id,
+                "details": new_transaction.model_dump(),
+            },
+        )
+        return transaction
 
+    @handle_get_database_exceptions("Transaction")
     async def get_transaction_by_id(self, *, id: UUID) -> TransactionInDb:
         """Get a transaction by ID."""
-        transaction = await self.db.fetch_one(query=GET_TRANSACTION_BY_ID_QUERY, values={"id": id})
+        transaction = await self._fetch_one(query=GET_TRANSACTION_BY_ID_QUERY, values={"id": id})
         if not transaction:
-            raise NotFoundError(entity_name="Transaction")
-        return TransactionInDb(**transaction)
+            raise NotFoundError(entity_name="Transaction", entity_identifier=str(id))
+        return map_row(TransactionInDb, transaction)
+
+    @handle_get_database_exceptions("Transaction")
+    async def get_transactions(self, *, since: datetime) -> List[TransactionInDb]:
+        """Get the transactions created since a given time, newest first."""
+        transactions = await self.db.fetch_all(
+            query=GET_TRANSACTIONS_SINCE_QUERY, values={"since": since}
+        )
+        return map_rows(TransactionInDb, transactions)
 
     async def update_transaction(self, *, id: UUID, transaction_update: TransactionUpdate) -> TransactionInDb:
         """Update a transaction."""
@@ -70,7 +99,7 @@ class TransactionRepository(BaseRepository):
         )
         if not updated_transaction:
             raise NotFoundError(entity_name="Transaction")
-        return TransactionInDb(**updated_transaction)
+        return map_row(TransactionInDb, updated_transaction)
 
     async def delete_transaction(self, *, id: UUID) -> TransactionInDb:
         """Delete a transaction."""
@@ -79,4 +108,4 @@ class TransactionRepository(BaseRepository):
         )
         if not deleted_transaction:
             raise NotFoundError(entity_name="Transaction")
-        return TransactionInDb(**deleted_transaction)
+        return map_row(TransactionInDb, deleted_transaction)
@@ -0,0 +1,173 @@
+"""Transfer recipients repository module."""
+
+import logging
+from typing import Optional
+
+from databases import Database
+
+from src.db.mappers import map_row
+from src.db.repositories.base import BaseRepository, utc_now
+from src.decorators.db import (
+    handle_get_database_exceptions,
+    handle_post_database_exceptions,
+)
+from src.enums.wallet_type import WalletType
+from src.models.transfer_recipients import TransferRecipientInDb, TransferRecipientSave
+
+TRANSFER_RECIPIENT_COLUMNS = """wallet_type, wallet_id, account_number, bank_code, recipient_type,
+       currency, account_name, recipient_code, created_at, updated_at"""
+
+GET_TRANSFER_RECIPIENT_QUERY = f"""
+SELECT {TRANSFER_RECIPIENT_COLUMNS}
+FROM transfer_recipients
+WHERE wallet_type = :wallet_type AND wallet_id = :wallet_id
+  AND account_number = :account_number AND bank_code = :bank_code
+"""
+
+SAVE_TRANSFER_RECIPIENT_QUERY = f"""
+INSERT INTO transfer_recipients (wallet_type, wallet_id, account_number, bank_code,
+                                 recipient_type, currency, account_name, recipient_code,
+                                 created_at, updated_at)
+VALUES (:wallet_type, :wallet_id, :account_number, :bank_code,
+        :recipient_type, :currency, :account_name, :recipient_code, :now, :now)
+ON CONFLICT (wallet_type, wallet_id, account_number, bank_code) DO UPDATE
+SET recipient_type = excluded.recipient_type, currency = excluded.currency,
+    account_name = excluded.account_name, recipient_code = excluded.recipient_code,
+    updated_at = excluded.updated_at
+RETURNING {TRANSFER_RECIPIENT_COLUMNS}
+"""
+
+# A wallet pays out to one account; recipients for any other account are stale.
+DELETE_OTHER_TRANSFER_RECIPIENTS_QUERY = """
+DELETE FROM transfer_recipients
+WHERE wallet_type = :wallet_type AND wallet_id = :wallet_id
+  AND NOT (account_number = :account_number AND bank_code = :bank_code)
+RETURNING recipient_code
+"""
+
+DELETE_TRANSFER_RECIPIENT_QUERY = """
+DELETE FROM transfer_recipients
+WHERE wallet_type = :wallet_type AND wallet_id = :wallet_id
+  AND account_number = :account_number AND bank_code = :bank_code
+"""
+
+DELETE_WALLET_TRANSFER_RECIPIENTS_QUERY = """
+DELETE FROM transfer_recipients
+WHERE wallet_type = :wallet_type AND wallet_id = :wallet_id
+"""
+
+audit_logger = logging.getLogger("audit")
+
+
+class TransferRecipientRepository(BaseRepository):
+    """Repository for the Paystack recipient codes of wallet payout accounts."""
+
+    def __init__(self, db: Database) -> None:
+        super().__init__(db)
+
+    @handle_get_database_exceptions("Transfer recipient")
+    async def get_recipient(
+        self, *, wallet_type: WalletType, wallet_id: str, account_number: str, bank_code: str
+    ) -> Optional[TransferRecipientInDb]:
+        """Get the recipient for a wallet's account; None when there is none yet."""
+        recipient = await self._fetch_one(
+            query=GET_TRANSFER_RECIPIENT_QUERY,
+            values={
+                "wallet_type": wallet_type.value,
+                "wallet_id": str(wallet_id),
+                "account_number": account_number,
+                "bank_code": bank_code,
+            },
+        )
+        return map_row(TransferRecipientInDb, recipient) if recipient else None
+
+    @handle_post_database_exceptions("Transfer recipient")
+    async def save_recipient(self, *, recipient: TransferRecipientSave) -> TransferRecipientInDb:
+        """Store a wallet's recipient and drop those of the accounts it used before."""
+        key = {
+            "wallet_type": recipient.wallet_type.value,
+            "wallet_id": str(recipient.wallet_id),
+            "account_number": recipient.account_number,
+            "bank_code": recipient.bank_code,
+        }
+        async with self.db.transaction():
+            await self.db.execute(query=DELETE_OTHER_TRANSFER_RECIPIENTS_QUERY, values=key)
+            saved = await self.db.fetch_one(
+                query=SAVE_TRANSFER_RECIPIENT_QUERY,
+                values={
+                    **recipient.model_dump(),
+                    **key,
+                    "recipient_type": recipient.recipient_type.value,
+                    "now": utc_now(),
+                },
+            )
+        audit_logger.info(
+            "Transfer recipient saved",
+            extra={
+                "action": "create",
+                "entity": recipient.wallet_type.value,
+                "entity_id": key["wallet_id"],
+                "details": {
+                    "account_number": recipient.account_number,
+                    "bank_code": recipient.bank_code,
+                    "recipient_code": recipient.recipient_code,
+                },
+            },
+        )
+        return map_row(TransferRecipientInDb, saved)
+
+    @handle_post_database_exceptions("Transfer recipient")
+    async def invalidate(
+        self,
+        *,
+        wallet_type: WalletType,
+        wallet_id: str,
+        account_number: Optional[str] = None,
+        bank_code: Optional[str] = None,
+    ) -> None:
+        """Forget the recipient of one account, or of every account when none is given."""
+        values = {"wallet_type": wallet_type.value, "wallet_id": str(wallet_id)}
+        if account_number is None:
+            query = DELETE_WALLET_TRANSFER_RECIPIENTS_QUERY
+        else:
+            query = DELETE_TRANSFER_RECIPIENT_QUERY
+            values.update(account_number=account_number, bank_code=bank_code)
+        await self.db.execute(query=query, values=values)
+        audit_logger.info(
+            "Transfer recipient invalidated",
+            extra={
+                "action": "invalidate",
+                "entity": wallet_type.value,
+                "entity_id": values["wallet_id"],
+                "details": {"account_number": account_number, "bank_code": bank_code},
+            },
+        )
+
+    @handle_post_database_exceptions("Transfer recipient")
+    async def invalidate_other_accounts(
+        self, *, wallet_type: WalletType, wallet_id: str, account_number: str, bank_code: str
+    ) -> None:
+        """Forget the recipients of every account but the wallet's current payout account."""
+        values = {
+            "wallet_type": wallet_type.value,
+            "wallet_id": str(wallet_id),
+            "account_number": account_number,
+            "bank_code": bank_code,
+        }
+        deleted = await self.db.fetch_all(
+            query=DELETE_OTHER_TRANSFER_RECIPIENTS_QUERY, values=values
+        )
+        if deleted:
+            audit_logger.info(
+                "Transfer recipient invalidated",
+                extra={
+                    "action": "invalidate",
+                    "entity": wallet_type.value,
+                    "entity_id": values["wallet_id"],
+                    "details": {
+                        "recipient_codes": [row["recipient_code"] for row in deleted],
+                        "account_number": account_number,
+                        "bank_code": bank_code,
+                    },
+                },
+            )
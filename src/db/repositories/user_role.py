@@ -1,10 +1,12 @@
 """User Role Repository"""
 
+import logging
 from typing import List
 from uuid import UUID
 
 from databases import Database
 
+from src.db.mappers import map_row, map_rows
 from src.db.repositories.base import BaseRepository
 from src.db.repositories.role import RoleRepository
 from src.db.repositories.users import UserRepository
@@ -44,6 +46,8 @@ WHERE role_id = :role_id AND user_id = :user_id
 RETURNING user_id
 """
 
+audit_logger = logging.getLogger("audit")
+
 
 class UserRoleRepository(BaseRepository):
     """User Role Repository"""
@@ -72,7 +76,16 @@ class UserRoleRepository(BaseRepository):
             await self.user_repository.update_user_roles(
                 user_id=new_user_role["user_id"], new_role=role.name
             )
-            return UserRolesInDb(**user_role)
+            audit_logger.info(
+                "Role assigned to user",
+                extra={
+                    "action": "assign",
+                    "entity": "user_role",
+                    "entity_id": new_user_role["user_id"],
+                    "details": {"role_id": role.id, "role_name": role.name},
+                },
+            )
+            return map_row(UserRolesInDb, user_role)
 
     @handle_get_database_exceptions("User Role")
     async def get_user_roles(
@@ -86,16 +99,27 @@ class UserRoleRepository(BaseRepository):
 
         for field, (query, value) in search_criteria.items():
             if value:
-                user_roles = await self.db.fetch_all(query=query, values={field: value})
-                return [UserRolesInDb(**user_role) for user_role in user_roles]
+                user_roles = await self._fetch_all(query=query, values={field: value})
+                return map_rows(UserRolesInDb, user_roles)
 
-        user_roles = await self.db.fetch_all(query=GET_ALL_USER_ROLES_QUERY)
-        return [UserRolesInDb(**user_role) for user_role in user_roles]
+        user_roles = await self._fetch_all(query=GET_ALL_USER_ROLES_QUERY)
+        return map_rows(UserRolesInDb, user_roles)
 
     @handle_get_database_exceptions("User Role")
     async def delete_user_role(self, *, role_id: UUID, user_id: UUID) -> UUID:
         """Delete a user role by role_id and user_id."""
-        return await self.db.fetch_val(
+        deleted_user_id = await self.db.fetch_val(
             query=DELETE_USER_ROLE_BY_ROLE_ID_AND_USER_ID,
             values={"role_id": role_id, "user_id": user_id},
         )
+        if deleted_user_id is not None:
+            audit_logger.info(
+                "Role removed from user",
+                extra={
+                    "action": "unassign",
+                    "entity": "user_role",
+                    "entity_id": user_id,
+                    "details": {"role_id": role_id},
+                },
+            )
+        return deleted_user_id
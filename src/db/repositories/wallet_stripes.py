@@ -0,0 +1,144 @@
+"""Wallet balance stripes repository module.
+
+Every settlement credits the admin share to the same wallet, so crediting the wallet row
+directly would make concurrent settlements queue on its row lock. Credits go to one of
+WALLET_BALANCE_STRIPES rows per wallet instead, picked by hashing the charge reference;
+reads add the stripes to the wallet's balance and the compact-wallet-stripes job folds
+them into the wallet row.
+"""
+
+import logging
+import zlib
+from collections import defaultdict
+from typing import Dict
+
+from databases import Database
+
+from src.core.config import WALLET_BALANCE_STRIPES
+from src.db.repositories.base import BaseRepository, utc_now
+from src.decorators.db import (
+    handle_get_database_exceptions,
+    handle_post_database_exceptions,
+)
+from src.enums.wallet_type import WalletType
+
+CREDIT_WALLET_STRIPE_QUERY = """
+INSERT INTO wallet_balance_stripes (wallet_type, wallet_id, stripe, amount, updated_at)
+VALUES (:wallet_type, :wallet_id, :stripe, :amount, :now)
+ON CONFLICT (wallet_type, wallet_id, stripe) DO UPDATE
+SET amount = wallet_balance_stripes.amount + excluded.amount, updated_at = excluded.updated_at
+"""
+
+GET_WALLET_STRIPES_TOTAL_QUERY = """
+SELECT CAST(COALESCE(SUM(amount), 0) AS BIGINT) AS amount
+FROM wallet_balance_stripes
+WHERE wallet_type = :wallet_type AND wallet_id = :wallet_id
+"""
+
+DELETE_WALLET_STRIPES_QUERY = """
+DELETE FROM wallet_balance_stripes
+WHERE wallet_type = :wallet_type AND wallet_id = :wallet_id
+"""
+
+# Credits arriving while this runs wait on the deleted rows' locks, then insert fresh stripes.
+TAKE_WALLET_STRIPES_QUERY = """
+DELETE FROM wallet_balance_stripes
+WHERE wallet_type = :wallet_type
+RETURNING wallet_id, amount
+"""
+
+FOLD_WALLET_STRIPES_QUERIES = {
+    WalletType.ADMIN: """
+UPDATE admin_wallets
+SET balance = balance + :amount, updated_at = :now
+WHERE id = :wallet_id
+RETURNING id
+""",
+    WalletType.SUPER_ADMIN: """
+UPDATE super_admin_wallet
+SET current_balance = current_balance + :amount, total_earned = total_earned + :amount,
+    last_updated = :now
+WHERE id = :wallet_id
+RETURNING id
+""",
+}
+
+app_logger = logging.getLogger("app")
+audit_logger = logging.getLogger("audit")
+
+
+class WalletStripeRepository(BaseRepository):
+    """Repository for credits to the admin and super-admin wallets."""
+
+    def __init__(self, db: Database, stripes: int = WALLET_BALANCE_STRIPES) -> None:
+        super().__init__(db)
+        self.stripes = stripes
+
+    @handle_post_database_exceptions("Wallet credit")
+    async def credit(
+        self, *, wallet_type: WalletType, wallet_id: str, amount: int, key: str
+    ) -> None:
+        """Add `amount` pesewas to the wallet; `key` (the charge reference) picks the stripe."""
+        await self.db.execute(
+            query=CREDIT_WALLET_STRIPE_QUERY,
+            values={
+                "wallet_type": wallet_type.value,
+                "wallet_id": str(wallet_id),
+                "stripe": zlib.crc32(key.encode()) % self.stripes,
+                "amount": amount,
+                "now": utc_now(),
+            },
+        )
+
+    @handle_get_database_exceptions("Wallet credit")
+    async def get_uncompacted_total(self, *, wallet_type: WalletType, wallet_id: str) -> int:
+        """Credits in pesewas not yet folded into the wallet row."""
+        row = await self._fetch_one(
+            query=GET_WALLET_STRIPES_TOTAL_QUERY,
+            values={"wallet_type": wallet_type.value, "wallet_id": str(wallet_id)},
+        )
+        return row["amount"]
+
+    @handle_post_database_exceptions("Wallet credit")
+    async def discard(self, *, wallet_type: WalletType, wallet_id: str) -> None:
+        """Drop a wallet's uncompacted credits, before its balance is set outright."""
+        await self.db.execute(
+            query=DELETE_WALLET_STRIPES_QUERY,
+            values={"wallet_type": wallet_type.value, "wallet_id": str(wallet_id)},
+        )
+
+    @handle_post_database_exceptions("Wallet credit")
+    async def compact(self, *, wallet_type: WalletType) -> int:
+        """Fold every wallet's stripes into its row; returns how many wallets were updated."""
+        async with self.db.transaction():
+            rows = await self.db.fetch_all(
+                query=TAKE_WALLET_STRIPES_QUERY, values={"wallet_type": wallet_type.value}
+            )
+            totals: Dict[str, int] = defaultdict(int)
+            for row in rows:
+                # str: postgres returns uuid wallet ids, which the audit details cannot key on.
+                totals[str(row["wallet_id"])] += row["amount"]
+            now = utc_now()
+            for wallet_id, amount in totals.items():
+                folded = await self.db.fetch_one(
+                    query=FOLD_WALLET_STRIPES_QUERIES[wallet_type],
+                    values={"wallet_id": wallet_id, "amount": amount, "now": now},
+                )
+                if folded is None:
+                    # Keep the credit rather than lose it with the stripes.
+                    app_logger.error(
+                        f"No {wallet_type.value} {wallet_id} to fold {amount} of credits into"
+                    )
+                    await self.credit(
+                        wallet_type=wallet_type, wallet_id=wallet_id, amount=amount, key=wallet_id
+                    )
+        if totals:
+            audit_logger.info(
+                "Wallet credits compacted",
+                extra={
+                    "action": "compact",
+                    "entity": wallet_type.value,
+                    "details": {wallet_id: amount for wallet_id, amount in totals.items()},
+                },
+            )
+        return len(totals)
@@ -0,0 +1,143 @@
+"""Wallet withdrawals repository module.
+
+A withdrawal is taken off the wallet when it is sent and recorded under the transfer
+reference. Paystack reports the outcome later by webhook; a failed or reversed transfer
+puts the amount back through the wallet's refund.
+"""
+
+import logging
+from typing import Optional
+from uuid import UUID
+
+from databases import Database
+
+from src.db.mappers import map_row
+from src.db.repositories.base import BaseRepository, utc_now
+from src.db.repositories.schools_wallet import SchoolWalletRepository
+from src.db.repositories.super_admin_wallet import SuperAdminWalletRepository
+from src.decorators.db import handle_post_database_exceptions
+from src.enums.wallet_type import WalletType
+from src.enums.withdrawal_status import WithdrawalStatus
+from src.models.transfer_recipients import WalletWithdrawalInDb
+from src.utils.ids import new_id
+
+WALLET_WITHDRAWAL_COLUMNS = """reference, wallet_type, wallet_id, amount, reason, status,
+       created_at, updated_at"""
+
+CREATE_WALLET_WITHDRAWAL_QUERY = f"""
+INSERT INTO wallet_withdrawals (reference, wallet_type, wallet_id, amount, reason, status,
+                                created_at, updated_at)
+VALUES (:reference, :wallet_type, :wallet_id, :amount, :reason, 'pending', :now, :now)
+RETURNING {WALLET_WITHDRAWAL_COLUMNS}
+"""
+
+SUCCEED_WALLET_WITHDRAWAL_QUERY = f"""
+UPDATE wallet_withdrawals
+SET status = 'succeeded', updated_at = :now
+WHERE reference = :reference AND status = 'pending'
+RETURNING {WALLET_WITHDRAWAL_COLUMNS}
+"""
+
+# A transfer can be reversed after it succeeded, but is refunded only once.
+REFUND_WALLET_WITHDRAWAL_QUERY = f"""
+UPDATE wallet_withdrawals
+SET status = :status, updated_at = :now
+WHERE reference = :reference AND status IN ('pending', 'succeeded')
+RETURNING {WALLET_WITHDRAWAL_COLUMNS}
+"""
+
+audit_logger = logging.getLogger("audit")
+
+
+class WalletWithdrawalRepository(BaseRepository):
+    """Repository for the transfers paid out of school and super-admin wallets."""
+
+    def __init__(self, db: Database) -> None:
+        super().__init__(db)
+
+    async def _debit(self, *, wallet_type: WalletType, wallet_id: UUID, amount: int) -> bool:
+        """Take `amount` off the wallet; False when the balance is too low."""
+        if wallet_type == WalletType.SCHOOL:
+            debited = await SchoolWalletRepository(self.db).debit_school_wallet(
+                id=wallet_id, amount=amount
+            )
+        else:
+            debited = await SuperAdminWalletRepository(self.db).debit_super_admin_wallet(
+                id=wallet_id, amount=amount
+            )
+        return debited is not None
+
+    async def _refund(self, *, wallet_type: WalletType, wallet_id: UUID, amount: int) -> None:
+        """Put `amount` back on the wallet."""
+        if wallet_type == WalletType.SCHOOL:
+            await SchoolWalletRepository(self.db).refund_school_wallet(id=wallet_id, amount=amount)
+        else:
+            await SuperAdminWalletRepository(self.db).refund_super_admin_wallet(
+                id=wallet_id, amount=amount
+            )
+
+    @handle_post_database_exceptions("Wallet withdrawal")
+    async def start(
+        self, *, wallet_type: WalletType, wallet_id: UUID, amount: int, reason: str
+    ) -> Optional[WalletWithdrawalInDb]:
+        """Debit the wallet and record the withdrawal; None when the balance is too low."""
+        async with self.db.transaction():
+            if not await self._debit(wallet_type=wallet_type, wallet_id=wallet_id, amount=amount):
+                return None
+            withdrawal = await self._fetch_one(
+                query=CREATE_WALLET_WITHDRAWAL_QUERY,
+                values={
+                    "reference": new_id(),
+                    "wallet_type": wallet_type.value,
+                    "wallet_id": str(wallet_id),
+                    "amount": amount,
+                    "reason": reason,
+                    "now": utc_now(),
+                },
+            )
+        return map_row(WalletWithdrawalInDb, withdrawal)
+
+    @handle_post_database_exceptions("Wallet withdrawal")
+    async def mark_succeeded(self, *, reference: str) -> Optional[WalletWithdrawalInDb]:
+        """Mark a pending withdrawal as paid; None when it is unknown or no longer pending."""
+        withdrawal = await self._fetch_one(
+            query=SUCCEED_WALLET_WITHDRAWAL_QUERY,
+            values={"reference": reference, "now": utc_now()},
+        )
+        return map_row(WalletWithdrawalInDb, withdrawal) if withdrawal else None
+
+    @handle_post_database_exceptions("Wallet withdrawal")
+    async def refund(
+        self, *, reference: str, status: WithdrawalStatus
+    ) -> Optional[WalletWithdrawalInDb]:
+        """Close a withdrawal as failed or reversed and put its amount back on the wallet.
+
+        None when the withdrawal is unknown or was already refunded.
+        """
+        async with self.db.transaction():
+            row = await self._fetch_one(
+                query=REFUND_WALLET_WITHDRAWAL_QUERY,
+                values={"reference": reference, "status": status.value, "now": utc_now()},
+            )
+            if not row:
+                return None
+            withdrawal = map_row(WalletWithdrawalInDb, row)
+            await self._refund(
+                wallet_type=withdrawal.wallet_type,
+                wallet_id=withdrawal.wallet_id,
+                amount=withdrawal.amount,
+            )
+        audit_logger.info(
+            "Withdrawal refunded",
+            extra={
+                "action": "refund",
+                "entity": withdrawal.wallet_type.value,
+                "entity_id": withdrawal.wallet_id,
+                "details": {
+                    "reference": reference,
+                    "status": status.value,
+                    "amount": withdrawal.amount,
+                },
+            },
+        )
+        return withdrawal
@@ -0,0 +1,120 @@
+"""Route repository queries between the primary database and a read replica."""
+
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncGenerator, Iterator, List, Optional
+
+from asyncpg import CannotConnectNowError, PostgresConnectionError
+from databases import Database
+from databases.core import Connection, Transaction
+
+from src.errors.database import DatabasePoolTimeoutError
+
+_read_only: ContextVar[bool] = ContextVar("db_read_only", default=False)
+
+# Errors that mean the replica itself is unreachable; the query is retried on the primary.
+REPLICA_FALLBACK_ERRORS = (
+    OSError,
+    PostgresConnectionError,
+    CannotConnectNowError,
+    DatabasePoolTimeoutError,
+)
+
+app_logger = logging.getLogger("app")
+
+
+@contextmanager
+def read_only() -> Iterator[None]:
+    """Mark the queries issued inside the block as safe to serve from a replica."""
+    token = _read_only.set(True)
+    try:
+        yield
+    finally:
+        _read_only.reset(token)
+
+
+def is_select(query: Any) -> bool:
+    """Check whether a raw SQL query only reads."""
+    return isinstance(query, str) and query.lstrip()[:6].upper() == "SELECT"
+
+
+class DatabaseRouter:
+    """Database facade that sends read-only selects to the replica.
+
+    A router lives for one request. Once the request writes, or opens a
+    transaction, every later query goes to the primary so the request reads
+    its own writes.
+    """
+
+    def __init__(self, primary: Database, replica: Optional[Database] = None) -> None:
+        """Initialize with the primary and an optional replica."""
+        self.primary = primary
+        self.replica = replica
+        self.sticky = False
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether the primary is connected."""
+        return self.primary.is_connected
+
+    def database_for(self, query: Any) -> Database:
+        """Pick the database that should run `query`."""
+        if is_select(query):
+            if self.replica is not None and not self.sticky and _read_only.get():
+                return self.replica
+        else:
+            self.sticky = True
+        return self.primary
+
+    async def _dispatch(self, method: str, query: Any, **kwargs: Any) -> Any:
+        """Run `method` on the chosen database, falling back to the primary."""
+        database = self.database_for(query)
+        try:
+            return await getattr(database, method)(query=query, **kwargs)
+        except REPLICA_FALLBACK_ERRORS as e:
+            if database is self.primary:
+                raise
+            app_logger.warning(f"Replica query failed, retrying on primary: {e}")
+            return await getattr(self.primary, method)(query=query, **kwargs)
+
+    async def fetch_all(self, query: Any, values: Optional[dict] = None) -> List[Any]:
+        """Fetch all rows."""
+        return await self._dispatch("fetch_all", query, values=values)
+
+    async def fetch_one(self, query: Any, values: Optional[dict] = None) -> Any:
+        """Fetch one row."""
+        return await self._dispatch("fetch_one", query, values=values)
+
+    async def fetch_val(
+        self, query: Any, values: Optional[dict] = None, column: Any = 0
+    ) -> Any:
+        """Fetch a single value."""
+        return await self._dispatch("fetch_val", query, values=values, column=column)
+
+    async def execute(self, query: Any, values: Optional[dict] = None) -> Any:
+        """Execute a statement on the primary."""
+        self.sticky = True
+        return await self.primary.execute(query=query, values=values)
+
+    async def execute_many(self, query: Any, values: list) -> None:
+        """Execute a statement for each set of values on the primary."""
+        self.sticky = True
+        await self.primary.execute_many(query=query, values=values)
+
+    async def iterate(
+        self, query: Any, values: Optional[dict] = None
+    ) -> AsyncGenerator[Any, None]:
+        """Iterate over rows."""
+        async for record in self.database_for(query).iterate(query=query, values=values):
+            yield record
+
+    def connection(self) -> Connection:
+        """Return a primary connection."""
+        self.sticky = True
+        return self.primary.connection()
+
+    def transaction(self, *, force_rollback: bool = False, **kwargs: Any) -> Transaction:
+        """Open a transaction on the primary."""
+        self.sticky = True
+        return self.primary.transaction(force_rollback=force_rollback, **kwargs)
@@ -0,0 +1,86 @@
+"""Prepared-statement execution for the repositories' raw SQL constants.
+
+On postgres each `:name` query is rewritten to asyncpg's positional form once and
+run on the raw connection, whose statement cache prepares it once per connection.
+Other backends go through `databases` unchanged.
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, List, Mapping, NamedTuple, Optional, Tuple, Union
+
+from databases import Database
+
+from src.db.pool import is_postgres
+from src.db.router import REPLICA_FALLBACK_ERRORS, DatabaseRouter
+
+NAMED_PARAMETER = re.compile(r"(?<![:\w]):([A-Za-z_][A-Za-z0-9_]*)")
+
+# asyncpg connection method -> equivalent `databases` method for other backends.
+DATABASES_METHODS = {"fetchrow": "fetch_one", "fetch": "fetch_all"}
+
+
+class CompiledStatement(NamedTuple):
+    """A query in asyncpg's positional form and the order of its parameters."""
+
+    sql: str
+    names: Tuple[str, ...]
+
+
+@lru_cache(maxsize=None)
+def compile_statement(query: str) -> CompiledStatement:
+    """Rewrite `:name` parameters to `$n`, reusing the index of repeated names."""
+    names: List[str] = []
+
+    def replace(match: re.Match) -> str:
+        name = match.group(1)
+        if name not in names:
+            names.append(name)
+        return f"${names.index(name) + 1}"
+
+    return CompiledStatement(NAMED_PARAMETER.sub(replace, query), tuple(names))
+
+
+def bind_values(statement: CompiledStatement, values: Optional[dict]) -> List[Any]:
+    """Order the values for a statement; UUIDs are bound as is to the native uuid columns."""
+    values = values or {}
+    return [values[name] for name in statement.names]
+
+
+async def _run(database: Database, method: str, query: str, values: Optional[dict]) -> Any:
+    """Run a query on one database through the prepared-statement path."""
+    if not is_postgres(database.url):
+        return await getattr(database, DATABASES_METHODS[method])(query=query, values=values)
+    statement = compile_statement(query)
+    async with database.connection() as connection:
+        raw = connection.raw_connection
+        return await getattr(raw, method)(statement.sql, *bind_values(statement, values))
+
+
+async def _execute(
+    db: Union[Database, DatabaseRouter], method: str, query: str, values: Optional[dict]
+) -> Any:
+    """Pick the database for the query and run it, falling back to the primary."""
+    if not isinstance(db, DatabaseRouter):
+        return await _run(db, method, query, values)
+    database = db.database_for(query)
+    try:
+        return await _run(database, method, query, values)
+    except REPLICA_FALLBACK_ERRORS:
+        if database is db.primary:
+            raise
+        return await _run(db.primary, method, query, values)
+
+
+async def fetch_one(
+    db: Union[Database, DatabaseRouter], *, query: str, values: Optional[dict] = None
+) -> Optional[Mapping]:
+    """Fetch one row using a prepared statement."""
+    return await _execute(db, "fetchrow", query, values)
+
+
+async def fetch_all(
+    db: Union[Database, DatabaseRouter], *, query: str, values: Optional[dict] = None
+) -> List[Mapping]:
+    """Fetch all rows using a prepared statement."""
+    return await _execute(db, "fetch", query, values)
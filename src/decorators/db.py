@@ -1,5 +1,6 @@
 """Decorator for get db operations to handle database exceptions."""
 
+import logging
 from functools import wraps
 from typing import Any
 
@@ -10,10 +11,12 @@ from asyncpg import (
     UniqueViolationError,
 )
 
+from src.db.router import read_only
 from src.errors.core import InternalServerError, InvalidTokenError
 from src.errors.database import (
     AlreadyExistsError,
     BadRequestError,
+    DatabasePoolTimeoutError,
     DataTypeError,
     ForeignKeyError,
     GeneralDatabaseError,
@@ -21,9 +24,14 @@ from src.errors.database import (
     NotFoundError,
 )
 
+app_logger = logging.getLogger("app")
+
 
 def handle_get_database_exceptions(entity_name: str) -> callable:
-    """Decorator to handle database exceptions for get operations."""
+    """Decorator to handle database exceptions for get operations.
+
+    Select queries issued by the decorated method may be served by the read replica.
+    """
 
     def decorator(func: callable) -> callable:
         @wraps(func)
@@ -31,29 +39,33 @@ def handle_get_database_exceptions(entity_name: str) -> callable:
             self, *args: tuple, **kwargs: dict[str, Any]  # noqa
         ) -> callable:
             try:
-                return await func(self, *args, **kwargs)
+                with read_only():
+                    return await func(self, *args, **kwargs)
             except DataError as e:
-                print(f"DataError for {entity_name}", exc_info=True)
+                app_logger.warning(f"DataError for {entity_name}", exc_info=True)
                 raise DataTypeError(entity_name=entity_name) from e
             except PostgresError as e:
-                print(f"PostgresError for {entity_name}", exc_info=True)
+                app_logger.exception(f"PostgresError for {entity_name}")
                 raise GeneralDatabaseError(entity_name=entity_name) from e
             except ValueError as e:
-                print(f"ValueError for {entity_name}", exc_info=True)
+                app_logger.warning(f"ValueError for {entity_name}", exc_info=True)
                 raise BadRequestError(
                     f"Bad Request: Invalid details for {entity_name}"
                 ) from e
             except NotFoundError:
-                print(f"NotFoundError for {entity_name}")
+                app_logger.info(f"NotFoundError for {entity_name}")
                 raise
             except IncorrectCredentialsError:
-                print(f"Incorrect credentials for {entity_name}")
+                app_logger.warning(f"Incorrect credentials for {entity_name}")
                 raise
             except InvalidTokenError:
-                print(f"Invalid jwt token for {entity_name}")
+                app_logger.warning(f"Invalid jwt token for {entity_name}")
+                raise
+            except DatabasePoolTimeoutError:
+                app_logger.warning(f"Database pool exhausted for {entity_name}")
                 raise
             except Exception as e:
-                print(f"Unexpected error for {entity_name}", exc_info=True)
+                app_logger.exception(f"Unexpected error for {entity_name}")
                 raise InternalServerError(
                     additional_message="Unexpected error. Try again."
                 ) from e
@@ -77,7 +89,7 @@ def handle_post_database_exceptions(
             try:
                 return await func(self, *args, **kwargs)
             except UniqueViolationError as e:
-                print(f"UniqueViolationError for {entity_name}", exc_info=True)
+                app_logger.warning(f"UniqueViolationError for {entity_name}", exc_info=True)
                 if "email" in str(e):
                     raise AlreadyExistsError(entity_name="Email") from e
                 elif "referral_code" in str(e):
@@ -85,25 +97,28 @@ def handle_post_database_exceptions(
                 else:
                     raise AlreadyExistsError(entity_name=already_exists_entity) from e
             except ForeignKeyViolationError as e:
-                print(f"ForeignKeyViolationError for {entity_name}", exc_info=True)
+                app_logger.warning(f"ForeignKeyViolationError for {entity_name}", exc_info=True)
                 raise ForeignKeyError(entity_name=foreign_key_entity) from e
             except DataError as e:
-                print(f"DataError for {entity_name}", exc_info=True)
+                app_logger.warning(f"DataError for {entity_name}", exc_info=True)
                 raise DataTypeError(entity_name=entity_name) from e
             except PostgresError as e:
-                print(f"PostgresError for {entity_name}", exc_info=True)
+                app_logger.exception(f"PostgresError for {entity_name}")
                 raise GeneralDatabaseError(entity_name=entity_name) from e
             except NotFoundError:
-                print(f"NotFoundError for {entity_name}")
+                app_logger.info(f"NotFoundError for {entity_name}")
                 raise
             except IncorrectCredentialsError:
-                print(f"Incorrect credentials for {entity_name}")
+                app_logger.warning(f"Incorrect credentials for {entity_name}")
                 raise
             except InvalidTokenError:
-                print(f"Invalid jwt token for {entity_name}")
+                app_logger.warning(f"Invalid jwt token for {entity_name}")
+                raise
+            except DatabasePoolTimeoutError:
+                app_logger.warning(f"Database pool exhausted for {entity_name}")
                 raise
             except Exception as e:
-                print(f"Unexpected error for {entity_name}", exc_info=True)
+                app_logger.exception(f"Unexpected error for {entity_name}")
                 raise InternalServerError(
                     additional_message="Unexpected error. Try again."
                 ) from e
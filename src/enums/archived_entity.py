@@ -0,0 +1,16 @@
+"""Archived entity enum."""
+
+from enum import Enum
+
+
+class ArchivedEntity(str, Enum):
+    """Tables whose soft-deleted rows are moved to a `<table>_archive` table."""
+
+    PAYMENTS = "payments"
+    TRANSACTIONS = "transactions"
+    SCHOOL_WALLETS = "school_wallets"
+    STUDENTS = "students"
+    SCHOOLS = "schools"
+    ADMIN_WALLETS = "admin_wallets"
+    SUPER_ADMIN_WALLET = "super_admin_wallet"
+    SETTINGS = "settings"
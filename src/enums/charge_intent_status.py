@@ -0,0 +1,15 @@
+"""Charge intent status enum."""
+
+from enum import Enum
+
+
+class ChargeIntentStatus(str, Enum):
+    """Lifecycle of a charge sent to Paystack."""
+
+    PENDING = "pending"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    # Still not settled after CHARGE_INTENT_EXPIRE_AFTER_HOURS; reconciliation gave up.
+    EXPIRED = "expired"
+    # Paystack reported a different amount or currency; held back for a person to review.
+    MISMATCHED = "mismatched"
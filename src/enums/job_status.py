@@ -0,0 +1,12 @@
+"""Job status enum."""
+
+from enum import Enum
+
+
+class JobStatus(str, Enum):
+    """Lifecycle of a background job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
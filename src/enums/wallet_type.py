@@ -0,0 +1,11 @@
+"""Wallet type enum."""
+
+from enum import Enum
+
+
+class WalletType(str, Enum):
+    """Kinds of wallet payouts are sent from."""
+
+    SCHOOL = "school_wallet"
+    ADMIN = "admin_wallet"
+    SUPER_ADMIN = "super_admin_wallet"
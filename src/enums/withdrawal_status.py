@@ -0,0 +1,13 @@
+"""Wallet withdrawal status enum."""
+
+from enum import Enum
+
+
+class WithdrawalStatus(str, Enum):
+    """Lifecycle of a transfer paid out of a wallet."""
+
+    PENDING = "pending"
+    SUCCEEDED = "succeeded"
+    # Both put the amount back on the wallet.
+    FAILED = "failed"
+    REVERSED = "reversed"
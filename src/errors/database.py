@@ -105,3 +105,12 @@ class DataTypeError(DatabaseError):
         if entity_name:
             message += f" for {entity_name.capitalize()}"
         super().__init__(message, status.HTTP_400_BAD_REQUEST)
+
+
+class DatabasePoolTimeoutError(DatabaseError):
+    """Raised when no pooled database connection becomes free in time."""
+
+    def __init__(self) -> None:
+        """Initializes the error with a retry message."""
+        message = "Database is busy. Try again."
+        super().__init__(message, status.HTTP_503_SERVICE_UNAVAILABLE)
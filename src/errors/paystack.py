@@ -62,4 +62,50 @@ class PaystackIncorrectOTPError(PaystackError):
     """Incorrect OTP error."""
 
     def __init__(self, message: str = "Incorrect OTP.") -> None:
-        super().__init__(message, status_code=400)
\ No newline at end of file
+        super().__init__(message, status_code=400)
+
+
+class PaystackRateLimitError(PaystackError):
+    """Too many charge attempts."""
+
+    def __init__(
+        self,
+        message: str = "Too many payment attempts. Please wait and try again.",
+        retry_after: int = None,
+    ) -> None:
+        super().__init__(message, status_code=429)
+        self.retry_after = retry_after
+
+
+class PaystackWebhookSignatureError(PaystackError):
+    """Webhook body whose signature does not match."""
+
+    def __init__(self, message: str = "Invalid webhook signature.") -> None:
+        super().__init__(message, status_code=400)
+
+
+class PaystackWebhookPayloadError(PaystackError):
+    """Webhook body that is not a well-formed event."""
+
+    def __init__(self, message: str = "Invalid webhook payload.") -> None:
+        super().__init__(message, status_code=400)
+
+
+class PaystackAccountResolveError(PaystackError):
+    """Account number that Paystack could not resolve to a name."""
+
+    def __init__(
+        self,
+        message: str = "Could not resolve account name. Check the account number and bank.",
+    ) -> None:
+        super().__init__(message, status_code=422)
+
+
+class PaystackChargeMismatchError(PaystackError):
+    """Paystack settled a charge for a different amount or currency than its intent."""
+
+    def __init__(self, reference: str) -> None:
+        super().__init__(
+            f"Charge {reference} does not match its intent's amount or currency",
+            status_code=400,
+        )
@@ -3,23 +3,26 @@ from typing import Optional
 from uuid import UUID
 from datetime import datetime
 
+from src.utils.money import CedisAmount, Pesewas
+
 
 class AdminWalletBase(BaseModel):
     """Shared properties for AdminWallet."""
     admin_id: UUID
     provider: str = Field(default="Paystack", max_length=50)
     account_number: str = Field(..., max_length=50)
-    balance: float = 0.0
+    balance: Pesewas = 0
 
 
 class AdminWalletCreate(AdminWalletBase):
-    """Properties to create a new AdminWallet."""
+    """Properties to create a new AdminWallet; the balance is given in cedis."""
+    balance: CedisAmount = 0
     id: Optional[UUID] = Field(None, description="ID of the wallet")  # Optional in case it's generated at creation.
 
 
 class AdminWalletUpdate(BaseModel):
-    """Properties to update an existing AdminWallet."""
-    balance: Optional[float]
+    """Properties to update an existing AdminWallet; the balance is given in cedis."""
+    balance: Optional[CedisAmount]
 
 
 class AdminWalletInDb(BaseModel):
@@ -28,7 +31,7 @@ class AdminWalletInDb(BaseModel):
     admin_id: UUID
     provider: str = Field(..., max_length=50)
     account_number: str = Field(..., max_length=50)
-    balance: float
+    balance: Pesewas
     created_at: datetime
     updated_at: datetime
     is_deleted: bool = False
@@ -48,7 +51,7 @@ class AdminWalletPublic(BaseModel):
     admin_id: UUID
     provider: str
     account_number: str
-    balance: float
+    balance: Pesewas
     created_at: datetime
     updated_at: datetime
 
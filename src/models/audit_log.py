@@ -0,0 +1,31 @@
+"""Audit log entries."""
+
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+# Column order of audit_log inserts; AuditEntry's fields follow it.
+AUDIT_LOG_COLUMNS = (
+    "created_at",
+    "action",
+    "entity",
+    "entity_id",
+    "correlation_id",
+    "message",
+    "details",
+)
+
+
+class AuditEntry(NamedTuple):
+    """One audit_log row waiting to be written.
+
+    A tuple rather than a model: entries are built on every audited write and only
+    ever read back by the batch insert.
+    """
+
+    created_at: datetime
+    action: str
+    entity: str
+    entity_id: Optional[str]
+    correlation_id: str
+    message: str
+    details: Optional[str]
@@ -0,0 +1,41 @@
+"""Charge intent models."""
+
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from src.enums.charge_intent_status import ChargeIntentStatus
+from src.enums.network_provider import NetworkProvider
+from src.models.base import DateTimeModelMixin
+from src.utils.money import Pesewas
+
+
+class ChargeIntentBase(BaseModel):
+    """Charge intent base model."""
+
+    reference: str = Field(..., max_length=100)
+    school_id: UUID = Field(...)
+    school_name: str = Field(..., max_length=100)
+    student_name: str = Field(..., max_length=100)
+    phone_number: str = Field(..., max_length=20)
+    network_provider: NetworkProvider = Field(...)
+    amount: Pesewas = Field(..., gt=0)
+    school_amount: Pesewas = Field(..., ge=0)  # 80% amount to school
+    admin_amount: Pesewas = Field(..., ge=0)  # 20% amount to admin
+
+
+class ChargeIntentCreate(ChargeIntentBase):
+    """Charge intent create model."""
+
+    pass
+
+
+class ChargeIntentInDb(ChargeIntentBase, DateTimeModelMixin):
+    """Charge intent in db model."""
+
+    status: ChargeIntentStatus
+    paystack_transaction_id: Optional[int] = None
+    settled_at: Optional[datetime] = None
+    checked_at: Optional[datetime] = None
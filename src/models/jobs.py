@@ -0,0 +1,50 @@
+"""Background job models."""
+
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, Field, Json
+
+from src.core.config import JOB_MAX_ATTEMPTS
+from src.enums.job_status import JobStatus
+from src.models.base import DateTimeModelMixin, IDModelMixin_
+
+
+class JobBase(BaseModel):
+    """Job base model."""
+
+    name: str = Field(..., min_length=1, max_length=100)
+    priority: int = Field(0)  # Higher runs first
+    max_attempts: int = Field(JOB_MAX_ATTEMPTS, ge=1)
+
+
+class JobCreate(JobBase):
+    """Job create model."""
+
+    payload: Dict[str, Any] = Field(default_factory=dict)
+    run_at: Optional[datetime] = Field(None)  # Not before this time; now when empty
+
+
+class JobInDb(JobBase, DateTimeModelMixin, IDModelMixin_):
+    """Job in db model; payload and result are stored as JSON text."""
+
+    payload: Json[Dict[str, Any]]
+    status: JobStatus
+    attempts: int
+    run_at: datetime
+    locked_until: Optional[datetime] = None
+    locked_by: Optional[str] = None
+    last_error: Optional[str] = None
+    result: Optional[Json[Any]] = None
+
+
+class JobPublic(JobBase, DateTimeModelMixin, IDModelMixin_):
+    """Job public model."""
+
+    payload: Dict[str, Any]
+    status: JobStatus
+    attempts: int
+    run_at: datetime
+    locked_until: Optional[datetime] = None
+    last_error: Optional[str] = None
+    result: Optional[Any] = None
@@ -1,13 +1,13 @@
 """Payments model."""
 
 from datetime import datetime
-from decimal import Decimal
 from typing import Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 
 from src.models.base import DateTimeModelMixin, IDModelMixin_
+from src.utils.money import CedisAmount, Pesewas
 
 
 class PaymentBase(BaseModel):
@@ -15,9 +15,9 @@ class PaymentBase(BaseModel):
 
     student_id: UUID = Field(...)
     school_id: UUID = Field(...)
-    total_amount: Decimal = Field(..., gt=0)  # Total payment amount
-    school_amount: Decimal = Field(..., gt=0)  # 80% amount to school
-    admin_amount: Decimal = Field(..., gt=0)  # 20% amount to admin
+    total_amount: Pesewas = Field(..., gt=0)  # Total payment amount
+    school_amount: Pesewas = Field(..., gt=0)  # 80% amount to school
+    admin_amount: Pesewas = Field(..., gt=0)  # 20% amount to admin
     payment_status: str = Field(
         ...
     )  # TODO: Update to Enum with options ['pending', 'completed', 'failed']
@@ -29,9 +29,11 @@ class PaymentBase(BaseModel):
 
 
 class PaymentCreate(PaymentBase):
-    """Payment create model"""
+    """Payment create model; amounts are given in cedis"""
 
-    pass
+    total_amount: CedisAmount = Field(..., gt=0)
+    school_amount: CedisAmount = Field(..., gt=0)
+    admin_amount: CedisAmount = Field(..., gt=0)
 
 
 class PaymentUpdate(BaseModel):
@@ -50,7 +52,7 @@ class PaymentUpdate(BaseModel):
         extra = "forbid"
 
 
-class PaymentInDb(PaymentCreate, IDModelMixin_, DateTimeModelMixin):
+class PaymentInDb(PaymentBase, IDModelMixin_, DateTimeModelMixin):
     """Payment in DB model"""
 
     pass
@@ -2,7 +2,7 @@
 
 from typing import List, Optional
 
-from src.models.baseys import CoreModel
+from src.models.base import CoreModel
 
 
 class BankData(CoreModel):
@@ -1,10 +1,14 @@
 """Models for USSD payment."""
 
-from decimal import Decimal
+from typing import Optional
 from uuid import UUID
 
+from pydantic import field_validator, model_validator
+
 from src.enums.network_provider import NetworkProvider
 from src.models.base import CoreModel
+from src.utils.money import CedisAmount
+from src.utils.phone_numbers import detect_provider, parse_ghana_number
 
 
 class CreateUSSDPaymentResponse(CoreModel):
@@ -22,5 +26,22 @@ class CreateVotingUSSDPayment(CoreModel):
     school_name: str
     school_id: UUID
     student_name: str
-    amount: Decimal
-    network_provider: NetworkProvider
+    amount: CedisAmount
+    network_provider: Optional[NetworkProvider] = None
+
+    @field_validator("phone_number")
+    def validate_phone_number(cls, value: str) -> str:
+        """Reject numbers that are not valid Ghana numbers."""
+        value = value.strip()
+        if parse_ghana_number(value) is None:
+            raise ValueError("Invalid Ghana phone number.")
+        return value
+
+    @model_validator(mode="after")
+    def fill_network_provider(self) -> "CreateVotingUSSDPayment":
+        """Detect the provider from the number when it is not given."""
+        if self.network_provider is None:
+            self.network_provider = detect_provider(self.phone_number)
+            if self.network_provider is None:
+                raise ValueError("Could not detect the network provider; please provide it.")
+        return self
@@ -1,9 +1,12 @@
 """Paystack transaction model."""
 
-from decimal import Decimal
-from pydantic import field_validator
+from functools import cached_property
+from typing import Dict
+
+from pydantic import ConfigDict
 
 from src.models.base import CoreModel
+from src.utils.money import Pesewas
 
 
 class CustomerData(CoreModel):
@@ -12,9 +15,23 @@ class CustomerData(CoreModel):
     email: str
 
 
+# variable_name of the custom fields create_ussd_payment attaches to a charge.
+SCHOOL_NAME_FIELD = "School name"
+STUDENT_NAME_FIELD = "Student name"
+SCHOOL_ID_FIELD = "School ID"
+AMOUNT_PAID_FIELD = "Amount paid"
+SCHOOL_AMOUNT_FIELD = "School amount"
+ADMIN_AMOUNT_FIELD = "Admin amount"
+NETWORK_PROVIDER_FIELD = "Network provider"
+PHONE_NUMBER_FIELD = "Phone Number"
+
+
 class CustomField(CoreModel):
     """Custom field for paystack."""
 
+    # Amounts come back as JSON numbers; keep their text so Decimal sees the exact digits.
+    model_config = ConfigDict(coerce_numbers_to_str=True)
+
     display_name: str
     variable_name: str
     value: str
@@ -23,7 +40,12 @@ class CustomField(CoreModel):
 class Metadata(CoreModel):
     """Metadata for paystack."""
 
-    custom_fields: list[CustomField]
+    custom_fields: list[CustomField] = []
+
+    @cached_property
+    def fields(self) -> Dict[str, str]:
+        """Custom field values by variable name, built once per event."""
+        return {field.variable_name: field.value for field in self.custom_fields}
 
 
 class Authorization(CoreModel):
@@ -41,16 +63,9 @@ class SuccessfulTransaction(CoreModel):
     id: int
     status: str
     reference: str
-    amount: Decimal
+    amount: Pesewas
     paid_at: str
     currency: str
     created_at: str
     customer: CustomerData
     metadata: Metadata
-
-    @field_validator(
-        "amount",
-    )
-    def divide_amount_by_100(cls, v: Decimal) -> Decimal:
-        """Divide the amount by 100."""
-        return v / 100
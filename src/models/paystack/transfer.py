@@ -1,16 +1,18 @@
 """Paystack model for transfer request."""
 
-from decimal import Decimal
-from pydantic import field_validator
+from typing import Optional
 
 from src.models.base import CoreModel
+from src.utils.money import Pesewas
 
 
 class TransferRequest(CoreModel):
     """A model for withdrawing funds."""
 
-    amount: Decimal
+    amount: Pesewas
     reason: str
+    # Given when the transfer is recorded first, so its webhook can be matched; else generated.
+    reference: Optional[str] = None
 
 
 class TransferResponseData(CoreModel):
@@ -19,7 +21,7 @@ class TransferResponseData(CoreModel):
     reference: str
     integration: int
     domain: str
-    amount: Decimal
+    amount: Pesewas
     currency: str
     source: str
     reason: str
@@ -42,7 +44,7 @@ class TransferResponse(CoreModel):
 class TransferWebhookData(CoreModel):
     """A model for the transfer webhook data."""
 
-    amount: Decimal
+    amount: Pesewas
     currency: str
     domain: str
     id: int
@@ -52,13 +54,6 @@ class TransferWebhookData(CoreModel):
     status: str
     transfer_code: str
 
-    @field_validator(
-        "amount",
-    )
-    def divide_amount_by_100(cls, v: Decimal) -> Decimal:
-        """Divide the amount by 100."""
-        return v / 100
-
 
 class TransferSuccessEvent(CoreModel):
     """A model for the transfer success event."""
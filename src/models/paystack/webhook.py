@@ -0,0 +1,28 @@
+"""Paystack webhook event models."""
+
+from typing import Literal, Union
+
+from pydantic import Field
+from typing_extensions import Annotated
+
+from src.models.base import CoreModel
+from src.models.paystack.transaction import SuccessfulTransaction
+from src.models.paystack.transfer import TransferWebhookData
+
+
+class ChargeSuccessEvent(CoreModel):
+    """A completed charge, e.g. a USSD prompt the payer approved."""
+
+    event: Literal["charge.success"]
+    data: SuccessfulTransaction
+
+
+class TransferEvent(CoreModel):
+    """The outcome of a transfer to a recipient."""
+
+    event: Literal["transfer.success", "transfer.failed", "transfer.reversed"]
+    data: TransferWebhookData
+
+
+# The `event` name picks the model, so the body is validated in one pass.
+WebhookEvent = Annotated[Union[ChargeSuccessEvent, TransferEvent], Field(discriminator="event")]
@@ -5,6 +5,7 @@ from datetime import datetime
 from pydantic import BaseModel, Field
 
 from src.models.base import DateTimeModelMixin, IDModelMixin_, IsDeletedModelMixin
+from src.utils.money import CedisAmount, Pesewas
 
 
 class SchoolBase(BaseModel):
@@ -12,14 +13,14 @@ class SchoolBase(BaseModel):
 
     name: str = Field(..., min_length=2, max_length=100)
     location: str = Field(..., min_length=2, max_length=100)
-    registration_fee: float = Field(..., gt=0)
+    registration_fee: Pesewas = Field(..., gt=0)
     updated_at: Optional[datetime]  # This field can be auto-updated on each update operation
 
 
 class SchoolCreate(SchoolBase):
-    """School create model"""
-    
-    pass
+    """School create model; the registration fee is given in cedis"""
+
+    registration_fee: CedisAmount = Field(..., gt=0)
 
 
 class SchoolUpdate(BaseModel):
@@ -27,7 +28,7 @@ class SchoolUpdate(BaseModel):
 
     name: Optional[str] = Field(None, min_length=2, max_length=100)
     location: Optional[str] = Field(None, min_length=2, max_length=100)
-    registration_fee: Optional[float] = Field(None, gt=0)
+    registration_fee: Optional[CedisAmount] = Field(None, gt=0)
     updated_at: datetime = Field(default_factory=datetime.now)  # Set updated_at during updates
 
     class Config:
@@ -37,7 +38,7 @@ class SchoolUpdate(BaseModel):
         extra = "forbid"
 
 
-class SchoolInDb(SchoolCreate, IsDeletedModelMixin, IDModelMixin_, DateTimeModelMixin):
+class SchoolInDb(SchoolBase, IsDeletedModelMixin, IDModelMixin_, DateTimeModelMixin):
     """School in DB model"""
     
     updated_at: datetime  # Ensure this is stored in the database
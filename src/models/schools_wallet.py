@@ -1,37 +1,42 @@
 """Schools wallet model."""
 
 from datetime import datetime
-from decimal import Decimal
 from typing import Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 
 from src.models.base import DateTimeModelMixin, IDModelMixin_, IsDeletedModelMixin
+from src.models.transfer_recipients import PayoutAccountMixin
+from src.utils.money import Pesewas
 
 
-class SchoolWalletBase(BaseModel):
+class SchoolWalletBase(PayoutAccountMixin):
     """School Wallet base model"""
 
     school_admin_id: UUID = Field(...)
     school_id: UUID = Field(...)
-    current_balance: Decimal = Field(..., ge=0.00)
-    total_earned: Decimal = Field(..., ge=0.00)
+    current_balance: Pesewas = Field(..., ge=0)
+    total_earned: Pesewas = Field(..., ge=0)
     last_updated: datetime = Field(...)
 
 
-class SchoolWalletCreate(SchoolWalletBase):
-    """School Wallet create model"""
+class SchoolWalletCreate(BaseModel):
+    """School Wallet create model; the wallet starts empty"""
 
-    pass
+    school_admin_id: UUID = Field(...)
+    school_id: UUID = Field(...)
+
+    class Config:
+        """Configurations for the class"""
+
+        extra = "forbid"
 
 
 class SchoolWalletUpdate(BaseModel):
-    """School Wallet update model"""
+    """School Wallet update model; balances only move with settlements and withdrawals"""
 
-    current_balance: Optional[Decimal] = Field(None, ge=0.00)
-    total_earned: Optional[Decimal] = Field(None, ge=0.00)
-    last_updated: Optional[datetime] = None
+    school_admin_id: Optional[UUID] = None
 
     class Config:
         """Configurations for the class"""
@@ -42,7 +47,7 @@ class SchoolWalletUpdate(BaseModel):
 
 
 class SchoolWalletInDb(
-    SchoolWalletCreate, IDModelMixin_, DateTimeModelMixin, IsDeletedModelMixin
+    SchoolWalletBase, IDModelMixin_, DateTimeModelMixin, IsDeletedModelMixin
 ):
     """School Wallet in DB model"""
 
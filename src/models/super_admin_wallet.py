@@ -1,43 +1,35 @@
 """Super admin wallet."""
 
-from decimal import Decimal
-from typing import Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 
 from src.models.base import DateTimeModelMixin, IDModelMixin_, IsDeletedModelMixin
+from src.models.transfer_recipients import PayoutAccountMixin
+from src.utils.money import Pesewas
 
 
-class SuperAdminWalletBase(BaseModel):
+class SuperAdminWalletBase(PayoutAccountMixin):
     """SuperAdmin Wallet base model"""
 
     user_id: UUID = Field(...)
-    current_balance: Decimal = Field(..., ge=0.00)
-    total_earned: Decimal = Field(..., ge=0.00)
+    current_balance: Pesewas = Field(..., ge=0)
+    total_earned: Pesewas = Field(..., ge=0)
 
 
-class SuperAdminWalletCreate(SuperAdminWalletBase):
-    """SuperAdmin Wallet create model"""
+class SuperAdminWalletCreate(BaseModel):
+    """SuperAdmin Wallet create model; the wallet starts empty"""
 
-    pass
-
-
-class SuperAdminWalletUpdate(BaseModel):
-    """SuperAdmin Wallet update model"""
-
-    current_balance: Optional[Decimal] = Field(None, ge=0.00)
-    total_earned: Optional[Decimal] = Field(None, ge=0.00)
+    user_id: UUID = Field(...)
 
     class Config:
         """Configurations for the class"""
 
-        validate_assignment = True
         extra = "forbid"
 
 
 class SuperAdminWalletInDb(
-    SuperAdminWalletCreate, IDModelMixin_, DateTimeModelMixin, IsDeletedModelMixin
+    SuperAdminWalletBase, IDModelMixin_, DateTimeModelMixin, IsDeletedModelMixin
 ):
     """SuperAdmin Wallet in DB model"""
 
@@ -1,12 +1,12 @@
 """Transaction models"""
 
-from decimal import Decimal
 from typing import Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 
 from src.models.base import DateTimeModelMixin, IDModelMixin_, IsDeletedModelMixin
+from src.utils.money import CedisAmount, Pesewas
 
 
 class TransactionBase(BaseModel):
@@ -16,24 +16,24 @@ class TransactionBase(BaseModel):
     student_name: str = Field(...)
     school_id: UUID = Field(...)
     school_name: str = Field(...)
-    amount: Decimal = Field(..., gt=0)
+    amount: Pesewas = Field(..., gt=0)
     reference: str = Field(..., min_length=5, max_length=50)
 
 
 class TransactionCreate(TransactionBase):
-    """Transaction create model"""
+    """Transaction create model; the amount is given in cedis"""
 
-    pass
+    amount: CedisAmount = Field(..., gt=0)
 
 
 class TransactionUpdate(BaseModel):
     """Transaction update model"""
 
-    amount: Optional[Decimal] = Field(None, gt=0)
+    amount: Optional[CedisAmount] = Field(None, gt=0)
     student_name: Optional[str] = Field(None)
     school_id: Optional[UUID] = None
     school_name: Optional[str] = Field(None)
-    amount: Optional[Decimal] = Field(None, gt=0)
+    amount: Optional[CedisAmount] = Field(None, gt=0)
 
     class Config:
         """Configurations for the class"""
@@ -44,7 +44,7 @@ class TransactionUpdate(BaseModel):
 
 
 class TransactionInDb(
-    TransactionCreate, IsDeletedModelMixin, IDModelMixin_, DateTimeModelMixin
+    TransactionBase, IsDeletedModelMixin, IDModelMixin_, DateTimeModelMixin
 ):
     """Transaction in DB model"""
 
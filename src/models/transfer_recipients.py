@@ -0,0 +1,78 @@
+"""Transfer recipient registry models."""
+
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.enums.paystack import RecipientTransferCreateType
+from src.enums.wallet_type import WalletType
+from src.enums.withdrawal_status import WithdrawalStatus
+from src.models.base import DateTimeModelMixin
+from src.utils.money import CedisAmount, Pesewas
+
+
+class TransferRecipientBase(BaseModel):
+    """The Paystack recipient created for a wallet's payout account."""
+
+    wallet_type: WalletType = Field(...)
+    wallet_id: UUID = Field(...)
+    account_number: str = Field(..., max_length=50)
+    bank_code: str = Field(..., max_length=20)
+    recipient_type: RecipientTransferCreateType = Field(...)
+    currency: str = Field("GHS", max_length=3)
+    account_name: Optional[str] = Field(None, max_length=100)
+    recipient_code: str = Field(..., max_length=50)
+
+
+class TransferRecipientSave(TransferRecipientBase):
+    """Transfer recipient save model."""
+
+    pass
+
+
+class TransferRecipientInDb(TransferRecipientBase, DateTimeModelMixin):
+    """Transfer recipient in db model."""
+
+    pass
+
+
+class PayoutAccountMixin(BaseModel):
+    """The account a wallet's withdrawals are paid to; unset until it is given."""
+
+    # Stored and bound as the plain value.
+    model_config = ConfigDict(use_enum_values=True)
+
+    payout_recipient_type: Optional[RecipientTransferCreateType] = None
+    payout_account_number: Optional[str] = Field(None, max_length=50)
+    payout_bank_code: Optional[str] = Field(None, max_length=20)
+    payout_account_name: Optional[str] = Field(None, max_length=100)
+
+
+class PayoutAccount(PayoutAccountMixin):
+    """A new payout account for a wallet; every field is required."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    payout_recipient_type: RecipientTransferCreateType = Field(...)
+    payout_account_number: str = Field(..., max_length=50)
+    payout_bank_code: str = Field(..., max_length=20)
+    payout_account_name: str = Field(..., max_length=100)
+
+
+class WalletWithdrawal(BaseModel):
+    """A withdrawal from a wallet to its payout account; the amount is given in cedis."""
+
+    amount: CedisAmount = Field(..., gt=0)
+    reason: str = Field(..., max_length=100)
+
+
+class WalletWithdrawalInDb(DateTimeModelMixin):
+    """A withdrawal sent to Paystack, keyed by its transfer reference."""
+
+    reference: str = Field(..., max_length=100)
+    wallet_type: WalletType = Field(...)
+    wallet_id: UUID = Field(...)
+    amount: Pesewas = Field(...)
+    reason: str = Field(..., max_length=100)
+    status: WithdrawalStatus = Field(...)
@@ -1,9 +1,8 @@
 """Auth  module."""
 
 from datetime import datetime, timedelta
-
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from src.core.config import (
     ACCESS_TOKEN_EXPIRE_MINUTES,
@@ -13,11 +12,25 @@ from src.core.config import (
 )
 from src.errors.core import InvalidTokenError
 
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
+
+
+@lru_cache(maxsize=None)
+def get_pwd_context() -> "CryptContext":
+    """Password hashing context; passlib is imported on first use."""
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
 
 class AuthService:
     """Auth service."""
 
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    @property
+    def pwd_context(self) -> "CryptContext":
+        """Shared password hashing context."""
+        return get_pwd_context()
 
     def create_access_token(
         self, data: dict, expires_delta: timedelta | None = None
@@ -29,6 +42,8 @@ class AuthService:
         else:
             expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
         to_encode.update({"exp": expire})
+        from jose import jwt
+
         encoded_jwt = jwt.encode(to_encode, key=SECRET_KEY, algorithm=ALGORITHM)
         return encoded_jwt
 
@@ -37,6 +52,8 @@ class AuthService:
         to_encode = data.copy()
         expire = datetime.utcnow() + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
         to_encode.update({"exp": expire})
+        from jose import jwt
+
         encoded_jwt = jwt.encode(to_encode, key=SECRET_KEY, algorithm=ALGORITHM)
         return encoded_jwt
 
@@ -47,12 +64,16 @@ class AuthService:
 
     async def get_token_data(self, token: str) -> dict:
         """Gets token data"""
+        from jose import jwt
+
         return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
 
     async def verify_token(
         self, token: str, credentials_exception: Exception = InvalidTokenError()
     ) -> str:
         """Verifies tokens."""
+        from jose import JWTError, jwt
+
         try:
             payload = jwt.decode(token, SECRET_KEY, algorithms=ALGORITHM)
             user_id = payload.get("user_id")
@@ -0,0 +1,173 @@
+"""Settlement of charge intents, and reconciliation of those whose webhook never arrived."""
+
+import logging
+from datetime import timedelta
+from typing import Dict, Optional
+
+from src.core.config import SETTLEMENT_ADMIN_WALLET_ID
+from src.db.repositories.base import utc_now
+from src.db.repositories.charge_intents import ChargeIntentRepository
+from src.db.repositories.schools_wallet import SchoolWalletRepository
+from src.db.repositories.wallet_stripes import WalletStripeRepository
+from src.enums.wallet_type import WalletType
+from src.errors.paystack import PaystackChargeMismatchError
+from src.models.charge_intents import ChargeIntentInDb
+from src.services.paystack import PaystackService
+from src.utils.money import CURRENCY, format_cedis
+
+app_logger = logging.getLogger("app")
+audit_logger = logging.getLogger("audit")
+
+# Paystack transaction statuses after which the charge can no longer succeed.
+FAILED_TRANSACTION_STATUSES = frozenset({"failed", "abandoned", "reversed"})
+
+# Status codes /transaction/verify answers, with `"status": false`, for a reference it does
+# not know: the charge never reached Paystack.
+NOT_FOUND_STATUS_CODES = frozenset({400, 404})
+
+
+async def settle_charge(
+    charge_intents: ChargeIntentRepository,
+    *,
+    reference: str,
+    amount: int,
+    currency: str,
+    paystack_transaction_id: Optional[int] = None,
+    admin_wallet_id: str = SETTLEMENT_ADMIN_WALLET_ID,
+) -> Optional[ChargeIntentInDb]:
+    """Settle a pending intent and credit its shares to the school and admin wallets.
+
+    One transaction, so a charge is credited exactly when it is settled. Returns None when
+    the intent is unknown or was already settled. When Paystack's `amount` or `currency`
+    differ from the intent's, nothing is credited: the intent is marked mismatched and
+    PaystackChargeMismatchError raised.
+    """
+    db = charge_intents.db
+    async with db.transaction():
+        intent = mismatched = None
+        if currency == CURRENCY:
+            intent = await charge_intents.settle(
+                reference=reference,
+                amount=amount,
+                paystack_transaction_id=paystack_transaction_id,
+            )
+        if intent is None:
+            # Still pending here means Paystack was paid a different amount or currency.
+            mismatched = await charge_intents.mark_mismatched(
+                reference=reference, paystack_transaction_id=paystack_transaction_id
+            )
+        else:
+            if not await SchoolWalletRepository(db).credit_school_wallet(
+                school_id=intent.school_id, amount=intent.school_amount
+            ):
+                app_logger.warning(
+                    f"School {intent.school_id} has no wallet; its share of {reference} stays on the intent"
+                )
+            if admin_wallet_id:
+                await WalletStripeRepository(db).credit(
+                    wallet_type=WalletType.ADMIN,
+                    wallet_id=admin_wallet_id,
+                    amount=intent.admin_amount,
+                    key=reference,
+                )
+            else:
+                app_logger.error(
+                    f"SETTLEMENT_ADMIN_WALLET_ID is not set; the admin share of {reference} "
+                    "stays on the intent"
+                )
+    if mismatched is not None:
+        app_logger.error(
+            f"Paystack paid {format_cedis(amount)} {currency} for charge {reference}, "
+            f"which is {format_cedis(mismatched.amount)} {CURRENCY}; held as mismatched, nothing credited"
+        )
+        audit_logger.info(
+            "Charge mismatched",
+            extra={
+                "action": "mismatch",
+                "entity": "charge_intent",
+                "entity_id": reference,
+                "details": {
+                    "amount": mismatched.amount,
+                    "paid_amount": amount,
+                    "paid_currency": currency,
+                    "paystack_transaction_id": paystack_transaction_id,
+                },
+            },
+        )
+        raise PaystackChargeMismatchError(reference)
+    if intent is not None:
+        # Only once committed; a rolled-back settlement must not leave an audit record.
+        audit_logger.info(
+            "Charge settled",
+            extra={
+                "action": "settle",
+                "entity": "charge_intent",
+                "entity_id": reference,
+                "details": {
+                    "school_id": intent.school_id,
+                    "amount": intent.amount,
+                    "school_amount": intent.school_amount,
+                    "admin_amount": intent.admin_amount,
+                    "paystack_transaction_id": paystack_transaction_id,
+                },
+            },
+        )
+    return intent
+
+
+async def reconcile_charge_intents(
+    charge_intents: ChargeIntentRepository,
+    paystack_service: PaystackService,
+    *,
+    age: timedelta,
+    max_age: timedelta,
+    limit: int,
+) -> Dict[str, int]:
+    """Ask Paystack about intents still pending after `age` and settle or fail them.
+
+    An intent Paystack does not know is failed, and one Paystack still has not settled after
+    `max_age` is expired. Every other intent is marked checked, so the next run starts with the ones
+    asked about least recently. Returns how many intents were settled, failed, expired,
+    mismatched or left pending.
+    """
+    counts = {"settled": 0, "failed": 0, "expired": 0, "mismatched": 0, "pending": 0}
+    for intent in await charge_intents.get_intents_older_than(age=age, limit=limit):
+        response = await paystack_service.verify_transaction(intent.reference)
+        try:
+            body = response.json()
+        except Exception:
+            body = {}  # Unreachable or not JSON; try again next round
+        not_found = (
+            body.get("status") is False and response.status_code in NOT_FOUND_STATUS_CODES
+        )
+        data = body.get("data") or {}
+        transaction_status = data.get("status")
+        if transaction_status == "success":
+            try:
+                await settle_charge(
+                    charge_intents,
+                    reference=intent.reference,
+                    amount=data.get("amount"),
+                    currency=data.get("currency"),
+                    paystack_transaction_id=data.get("id"),
+                )
+            except PaystackChargeMismatchError:
+                counts["mismatched"] += 1
+                continue
+            counts["settled"] += 1
+        elif transaction_status in FAILED_TRANSACTION_STATUSES or not_found:
+            await charge_intents.mark_failed(reference=intent.reference)
+            counts["failed"] += 1
+        elif body and utc_now() - intent.created_at > max_age:
+            await charge_intents.mark_expired(reference=intent.reference)
+            app_logger.warning(
+                f"Paystack still reports charge {intent.reference} as {transaction_status} "
+                f"after {max_age}; marked expired"
+            )
+            counts["expired"] += 1
+        else:
+            await charge_intents.mark_checked(reference=intent.reference)
+            counts["pending"] += 1
+    if any(counts.values()):
+        app_logger.info(f"Reconciled charge intents: {counts}")
+    return counts
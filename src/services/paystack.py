@@ -1,16 +1,19 @@
 """Paystack service module."""
 
-import hashlib
-import hmac
-from typing import Any
+import logging
+from typing import Any, Optional
 
 import httpx
 from fastapi import HTTPException
 
+from src.db.repositories.charge_intents import ChargeIntentRepository
+from src.models.charge_intents import ChargeIntentCreate
 from src.models.paystack.payment import CreateVotingUSSDPayment
 from src.core.config import PAYSTACK_BASE_URL, PAYSTACK_SECRET_KEY
+from src.enums.paystack import AvailableBankCountries
 from src.errors.paystack import (
     PaystackAccountNumberError,
+    PaystackAccountResolveError,
     PaystackError,
     PaystackIncorrectOTPError,
     PaystackInvalidProviderError,
@@ -19,9 +22,31 @@ from src.errors.paystack import (
     PaystackMinTransactionLimitError,
     PaystackSystemMalfunctionError,
 )
+from src.models.paystack.bank import BankAccountVerificationResponse, RetrieveBanksResponse
 from src.models.paystack.charge import ChargeOTPVerifyRequest, ChargeResponse
+from src.models.paystack.transaction import (
+    ADMIN_AMOUNT_FIELD,
+    AMOUNT_PAID_FIELD,
+    NETWORK_PROVIDER_FIELD,
+    PHONE_NUMBER_FIELD,
+    SCHOOL_AMOUNT_FIELD,
+    SCHOOL_ID_FIELD,
+    SCHOOL_NAME_FIELD,
+    STUDENT_NAME_FIELD,
+)
 from src.models.paystack.transfer import TransferRequest, TransferResponse
+from src.models.paystack.transfer_recipient import (
+    TransferRecipientCreate,
+    TransferRecipientResponse,
+)
+from src.services.paystack_client import get_paystack_client
+from src.services.paystack_lookups import account_name_cache, bank_list_cache
+from src.services.paystack_webhook import verify_webhook_signature
+from src.services.ussd_guard import ussd_charge_guard
 from src.utils.helpers import Helpers
+from src.utils.money import CURRENCY, PESEWAS_PER_CEDI, format_cedis, split_payment
+
+app_logger = logging.getLogger("app")
 
 
 class PaystackService:
@@ -35,23 +60,67 @@ class PaystackService:
     async def create_ussd_payment(
         self,
         create_payment: CreateVotingUSSDPayment,
+        charge_intents: ChargeIntentRepository,
     ) -> ChargeResponse:
         """This function creates a mobile money payment transaction using the Paystack API with the specified email and amount."""
-        if create_payment.amount < 1:
-            raise HTTPException(status_code=400, detail="Amount must be greater than 0")
-        url = f"{self.base_url}charge"
-        reference = Helpers.generate_transaction_id(
-            create_payment.phone_number, create_payment.student_name
+        if create_payment.amount < PESEWAS_PER_CEDI:
+            raise HTTPException(status_code=400, detail="Amount must be at least 1 GHS")
+        return await ussd_charge_guard.run(
+            create_payment,
+            lambda: self._charge_ussd_payment(create_payment, charge_intents),
+        )
+
+    async def _charge_ussd_payment(
+        self,
+        create_payment: CreateVotingUSSDPayment,
+        charge_intents: ChargeIntentRepository,
+    ) -> ChargeResponse:
+        """Record the charge intent, then send the mobile money charge to Paystack."""
+        reference = Helpers.generate_transaction_id()
+        school_amount, admin_amount = split_payment(create_payment.amount)
+        # Written first, so a webhook arriving before Paystack answers still finds it.
+        await charge_intents.create_intent(
+            new_intent=ChargeIntentCreate(
+                reference=reference,
+                school_id=create_payment.school_id,
+                school_name=create_payment.school_name,
+                student_name=create_payment.student_name,
+                phone_number=create_payment.phone_number,
+                network_provider=create_payment.network_provider,
+                amount=create_payment.amount,
+                school_amount=school_amount,
+                admin_amount=admin_amount,
+            )
         )
+        try:
+            return await self._send_ussd_charge(
+                create_payment, reference, school_amount, admin_amount
+            )
+        except PaystackError as e:
+            # Only a definite rejection fails the intent. A timeout or a 5xx may follow a
+            # charge Paystack accepted, so those stay pending for reconcile-charges to ask.
+            if e.status_code < 500:
+                await charge_intents.mark_failed(reference=reference)
+            raise
+
+    async def _send_ussd_charge(
+        self,
+        create_payment: CreateVotingUSSDPayment,
+        reference: str,
+        school_amount: int,
+        admin_amount: int,
+    ) -> ChargeResponse:
+        """Send the mobile money charge to Paystack."""
+        url = f"{self.base_url}charge"
         headers = {
             "Authorization": f"Bearer {self.secret_key}",
             "Content-Type": "application/json",
         }
 
         data = {
-            "amount": float(create_payment.amount) * 100,
+            "amount": create_payment.amount,
             "email": "QuiverTech1@gmail.com",
-            "currency": "GHS",
+            "currency": CURRENCY,
             "mobile_money": {
                 "phone": create_payment.phone_number,
                 "provider": create_payment.network_provider.value,
@@ -60,67 +129,67 @@ class PaystackService:
                 "custom_fields": [
                     {
                         "display_name": "School name",
-                        "variable_name": "School name",
+                        "variable_name": SCHOOL_NAME_FIELD,
                         "value": create_payment.school_name,
                     },
                     {
                         "display_name": "Student name",
-                        "variable_name": "Student name",
+                        "variable_name": STUDENT_NAME_FIELD,
                         "value": create_payment.student_name,
                     },
                     {
                         "display_name": "School ID",
-                        "variable_name": "School ID",
+                        "variable_name": SCHOOL_ID_FIELD,
                         "value": str(create_payment.school_id),
                     },
                     {
                         "display_name": "Total amount",
-                        "variable_name": "Amount paid",
-                        "value": float(create_payment.amount),
+                        "variable_name": AMOUNT_PAID_FIELD,
+                        "value": format_cedis(create_payment.amount),
                     },
                     {
                         "display_name": "School amount",
-                        "variable_name": "School amount",
-                        "value": float(create_payment.amount) * 0.8,
+                        "variable_name": SCHOOL_AMOUNT_FIELD,
+                        "value": format_cedis(school_amount),
                     },
                     {
                         "display_name": "Admin amount",
-                        "variable_name": "Admin amount",
-                        "value": float(create_payment.amount) * 0.2,
+                        "variable_name": ADMIN_AMOUNT_FIELD,
+                        "value": format_cedis(admin_amount),
                     },
                     {
                         "display_name": "Network provider",
-                        "variable_name": "Network provider",
+                        "variable_name": NETWORK_PROVIDER_FIELD,
                         "value": create_payment.network_provider.value,
                     },
                     {
                         "display_name": "Phone Number",
-                        "variable_name": "Phone Number",
+                        "variable_name": PHONE_NUMBER_FIELD,
                         "value": create_payment.phone_number,
                     },
                 ]
             },
             "reference": reference,
         }
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=headers, json=data)
-            response_data: dict[str, Any] = response.json()
-            print(response_data)
+        client = get_paystack_client()
+        response = await client.post(url, headers=headers, json=data)
+        response_data: dict[str, Any] = response.json()
+        app_logger.debug("Paystack charge response", extra={"paystack_response": response_data})
 
-            if response.status_code != 200 or not response_data.get("status"):
-                error_message = response_data.get("message", "Unknown error occurred")
-                if "invalid provider" in error_message.lower():
-                    raise PaystackInvalidProviderError()
-                elif "maximum amount" in error_message.lower():
-                    raise PaystackMaxTransactionLimitError()
-                elif "minimum amount you may send" in error_message.lower():
-                    raise PaystackMinTransactionLimitError()
-                else:
-                    raise PaystackError("Unexpected error", response.status_code)
+        if response.status_code != 200 or not response_data.get("status"):
+            error_message = response_data.get("message", "Unknown error occurred")
+            if "invalid provider" in error_message.lower():
+                raise PaystackInvalidProviderError()
+            elif "maximum amount" in error_message.lower():
+                raise PaystackMaxTransactionLimitError()
+            elif "minimum amount you may send" in error_message.lower():
+                raise PaystackMinTransactionLimitError()
+            else:
+                raise PaystackError("Unexpected error", response.status_code)
 
-            response.raise_for_status()
+        response.raise_for_status()
 
-            return ChargeResponse(**response_data)
+        return ChargeResponse(**response_data)
 
     async def verify_ussd_otp_payment(
         self, otp_data: ChargeOTPVerifyRequest
@@ -136,20 +205,20 @@ class PaystackService:
             "otp": otp_data.otp,
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=headers, json=data)
-            response_data: dict[str, Any] = response.json()
-            print(response_data)
+        client = get_paystack_client()
+        response = await client.post(url, headers=headers, json=data)
+        response_data: dict[str, Any] = response.json()
+        app_logger.debug("Paystack OTP response", extra={"paystack_response": response_data})
 
-            if response.status_code != 200 or not response_data.get("status"):
-                error_message = response_data.get("message", "Unknown error occurred")
-                if "The otp provided is incorrect" in error_message.lower():
-                    raise PaystackIncorrectOTPError()
-                else:
-                    raise PaystackError("Unexpected error", response.status_code)
+        if response.status_code != 200 or not response_data.get("status"):
+            error_message = response_data.get("message", "Unknown error occurred")
+            if "The otp provided is incorrect" in error_message.lower():
+                raise PaystackIncorrectOTPError()
+            else:
+                raise PaystackError("Unexpected error", response.status_code)
 
-            response.raise_for_status()
-            return ChargeResponse(**response_data)
+        response.raise_for_status()
+        return ChargeResponse(**response_data)
 
     async def verify_transaction(self, reference: str) -> httpx.Response:
         """This function verifies a paystack transaction. It returns the status of the transaction."""
@@ -159,19 +228,98 @@ class PaystackService:
                 "Authorization": f"Bearer {self.secret_key}",
                 "Content-Type": "application/json",
             }
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, headers=headers)
-                return response
+            client = get_paystack_client()
+            response = await client.get(url, headers=headers)
+            return response
         except Exception as e:
-            print(e)
+            app_logger.warning(f"Verifying Paystack transaction {reference} failed: {e!r}")
 
-    async def verify_webhook_signature(self, payload: dict, signature: str) -> bool:
+    async def verify_webhook_signature(self, payload: bytes, signature: Optional[str]) -> bool:
         """This function verifies the signature of a webhook payload."""
-        computed_signature = hmac.new(
-            PAYSTACK_SECRET_KEY.encode(), msg=payload, digestmod=hashlib.sha512
-        ).hexdigest()
+        return verify_webhook_signature(payload, signature)
+
+    async def list_banks(
+        self,
+        country: AvailableBankCountries = AvailableBankCountries.GHANA,
+        currency: str = "GHS",
+    ) -> RetrieveBanksResponse:
+        """Return the banks Paystack supports in a country, from the cache when possible."""
+
+        async def fetch() -> dict[str, Any]:
+            client = get_paystack_client()
+            response = await client.get(
+                f"{self.base_url}bank",
+                headers={"Authorization": f"Bearer {self.secret_key}"},
+                params={"country": country.value, "currency": currency},
+            )
+            response_data: dict[str, Any] = response.json()
+            if response.status_code != 200 or not response_data.get("status"):
+                raise PaystackError("Unexpected error", response.status_code)
+            return response_data
+
+        response_data = await bank_list_cache.get(f"banks:{country.value}:{currency}", fetch)
+        return RetrieveBanksResponse(**response_data)
+
+    async def resolve_account_number(
+        self, account_number: str, bank_code: str
+    ) -> BankAccountVerificationResponse:
+        """Return the name on a bank account, from the cache when possible."""
+        if not account_number:
+            raise PaystackAccountNumberError()
+
+        async def fetch() -> dict[str, Any]:
+            client = get_paystack_client()
+            response = await client.get(
+                f"{self.base_url}bank/resolve",
+                headers={"Authorization": f"Bearer {self.secret_key}"},
+                params={"account_number": account_number, "bank_code": bank_code},
+            )
+            response_data: dict[str, Any] = response.json()
+            if response.status_code == 422 or (
+                response.status_code == 200 and not response_data.get("data")
+            ):
+                raise PaystackAccountResolveError()
+            if response.status_code != 200 or not response_data.get("status"):
+                raise PaystackError("Unexpected error", response.status_code)
+            return response_data
 
-        return computed_signature == signature
+        response_data = await account_name_cache.get(
+            f"account:{bank_code}:{account_number}", fetch
+        )
+        return BankAccountVerificationResponse(**response_data)
+
+    async def create_transfer_recipient(
+        self, recipient: TransferRecipientCreate
+    ) -> TransferRecipientResponse:
+        """Create a transfer recipient for a bank or mobile money account."""
+        url = f"{self.base_url}transferrecipient"
+        headers = {
+            "Authorization": f"Bearer {self.secret_key}",
+            "Content-Type": "application/json",
+        }
+        payload = {
+            "type": recipient.type.value,
+            "name": recipient.name,
+            "account_number": recipient.account_number,
+            "bank_code": recipient.bank_code,
+            "currency": recipient.currency,
+        }
+
+        client = get_paystack_client()
+        response = await client.post(url, headers=headers, json=payload)
+        response_data: dict[str, Any] = response.json()
+        app_logger.debug(
+            "Paystack transfer recipient response", extra={"paystack_response": response_data}
+        )
+
+        if response.status_code not in (200, 201) or not response_data.get("status"):
+            error_message = response_data.get("message", "Unknown error occurred")
+            if "account number" in error_message.lower():
+                raise PaystackAccountNumberError(error_message)
+            else:
+                raise PaystackError("Unexpected error", response.status_code)
+
+        return TransferRecipientResponse(**response_data)
 
     async def initiate_transfer(
         self,
@@ -186,33 +334,36 @@ class PaystackService:
         }
         payload = {
             "source": "balance",
-            "amount": transfer_data.amount * 100,  # Paystack expects amount in pesewas
-            "reference": await Helpers.generate_uuid(),
+            "amount": transfer_data.amount,
+            "reference": transfer_data.reference or await Helpers.generate_uuid(),
             "recipient": recipient_code,
             "reason": transfer_data.reason,
         }
-        print(payload)
+        app_logger.info(
+            "Initiating Paystack transfer",
+            extra={"transfer_reference": payload["reference"], "amount": payload["amount"]},
+        )
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=headers, json=payload)
-            response_data: dict[str, Any] = response.json()
-            print(response_data)
+        client = get_paystack_client()
+        response = await client.post(url, headers=headers, json=payload)
+        response_data: dict[str, Any] = response.json()
+        app_logger.debug("Paystack transfer response", extra={"paystack_response": response_data})
 
-            if response.status_code != 200 or not response_data.get("status"):
-                error_message = response_data.get("message", "Unknown error occurred")
-                if "System Malfunction" in error_message:
-                    raise PaystackSystemMalfunctionError()
-                elif "account number" in error_message.lower():
-                    raise PaystackAccountNumberError()
-                elif "maximum amount" in error_message.lower():
-                    raise PaystackMaxTransactionLimitError()
-                elif "minimum amount you may send" in error_message.lower():
-                    raise PaystackMinTransactionLimitError()
-                elif "recipient specified is invalid" in error_message.lower():
-                    raise PaystackInvalidTransferRecipientError()
-                else:
-                    raise PaystackError("Unexpected error", response.status_code)
-
-            response.raise_for_status()
-
-            return TransferResponse(**response_data)
+        if response.status_code != 200 or not response_data.get("status"):
+            error_message = response_data.get("message", "Unknown error occurred")
+            if "System Malfunction" in error_message:
+                raise PaystackSystemMalfunctionError()
+            elif "account number" in error_message.lower():
+                raise PaystackAccountNumberError()
+            elif "maximum amount" in error_message.lower():
+                raise PaystackMaxTransactionLimitError()
+            elif "minimum amount you may send" in error_message.lower():
+                raise PaystackMinTransactionLimitError()
+            elif "recipient specified is invalid" in error_message.lower():
+                raise PaystackInvalidTransferRecipientError()
+            else:
+                raise PaystackError("Unexpected error", response.status_code)
+
+        response.raise_for_status()
+
+        return TransferResponse(**response_data)
@@ -0,0 +1,89 @@
+"""Shared HTTP client for the Paystack API, so connections and TLS sessions are reused."""
+
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+
+from src.core.config import PAYSTACK_BASE_URL, PAYSTACK_KEEPALIVE_EXPIRY
+
+# Consecutive failed calls after which Paystack is reported as degraded.
+DEGRADED_AFTER_FAILURES = 3
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+class PaystackHealth:
+    """Outcome of recent Paystack calls, recorded as they happen rather than probed."""
+
+    def __init__(self) -> None:
+        """Start with no calls recorded."""
+        self.consecutive_failures = 0
+        self.last_success: Optional[float] = None
+        self.last_failure: Optional[float] = None
+
+    def record(self, ok: bool) -> None:
+        """Record one call."""
+        if ok:
+            self.consecutive_failures = 0
+            self.last_success = time.time()
+        else:
+            self.consecutive_failures += 1
+            self.last_failure = time.time()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Status for the readiness endpoint."""
+        degraded = self.consecutive_failures >= DEGRADED_AFTER_FAILURES
+        return {
+            "status": "degraded" if degraded else "ok",
+            "consecutive_failures": self.consecutive_failures,
+            "last_success": self.last_success,
+            "last_failure": self.last_failure,
+        }
+
+
+paystack_health = PaystackHealth()
+
+
+class HealthTrackingTransport(httpx.AsyncHTTPTransport):
+    """Transport that records connection errors and 5xx answers in paystack_health."""
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send the request and record its outcome."""
+        try:
+            response = await super().handle_async_request(request)
+        except httpx.TransportError:
+            paystack_health.record(False)
+            raise
+        paystack_health.record(response.status_code < 500)
+        return response
+
+
+def get_paystack_client() -> httpx.AsyncClient:
+    """Return this worker's Paystack client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            transport=HealthTrackingTransport(
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=PAYSTACK_KEEPALIVE_EXPIRY,
+                )
+            )
+        )
+    return _client
+
+
+async def warm_paystack_client(timeout: float) -> int:
+    """Resolve and connect to PAYSTACK_BASE_URL; returns the status of the probe request."""
+    response = await get_paystack_client().get(PAYSTACK_BASE_URL, timeout=timeout)
+    return response.status_code
+
+
+async def close_paystack_client() -> None:
+    """Close the client and its pooled connections."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
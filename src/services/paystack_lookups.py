@@ -0,0 +1,201 @@
+"""TTL cache for Paystack lookups that rarely change: bank lists and resolved account names.
+
+Entries live in memory and, when PAYSTACK_CACHE_SQLITE_PATH is set, in a sqlite file too, so a
+restarted worker (or another worker on the host) starts warm instead of calling Paystack again.
+
+- A hit older than `refresh_after` of its TTL is served as is and refreshed in the background.
+- Concurrent misses for one key share a single Paystack call.
+- Failed lookups are not cached.
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from src.core.config import (
+    PAYSTACK_ACCOUNT_CACHE_TTL_SECONDS,
+    PAYSTACK_BANKS_CACHE_TTL_SECONDS,
+    PAYSTACK_CACHE_REFRESH_AFTER,
+    PAYSTACK_CACHE_SQLITE_PATH,
+)
+from src.core.metrics import Counter
+
+app_logger = logging.getLogger("app")
+
+PAYSTACK_CACHE_LOOKUPS = Counter(
+    "paystack_cache_lookups_total",
+    "Paystack lookup cache requests by cache and outcome (hit, disk_hit, miss, refresh).",
+)
+
+# (value, stored at, expires at); times are wall clock so they mean the same after a restart.
+Entry = Tuple[Any, float, float]
+
+
+class SqliteLookupStore:
+    """Cache entries in a sqlite file; every operation runs off the event loop."""
+
+    def __init__(self, path: str) -> None:
+        """Create the table if needed."""
+        self.path = path
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS paystack_lookups "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, stored REAL NOT NULL, expires REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open an autocommit connection."""
+        return sqlite3.connect(self.path, timeout=5, isolation_level=None)
+
+    def _get(self, key: str) -> Optional[Entry]:
+        """Read a live entry."""
+        connection = self._connect()
+        try:
+            row = connection.execute(
+                "SELECT value, stored, expires FROM paystack_lookups WHERE key = ? AND expires > ?",
+                (key, time.time()),
+            ).fetchone()
+        finally:
+            connection.close()
+        return (json.loads(row[0]), row[1], row[2]) if row else None
+
+    def _set(self, key: str, entry: Entry) -> None:
+        """Write an entry and drop expired ones."""
+        value, stored, expires = entry
+        connection = self._connect()
+        try:
+            connection.execute("DELETE FROM paystack_lookups WHERE expires <= ?", (stored,))
+            connection.execute(
+                "INSERT OR REPLACE INTO paystack_lookups (key, value, stored, expires) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), stored, expires),
+            )
+        finally:
+            connection.close()
+
+    async def get(self, key: str) -> Optional[Entry]:
+        """Return the live entry for `key`, if any."""
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, entry: Entry) -> None:
+        """Store the entry for `key`."""
+        await asyncio.to_thread(self._set, key, entry)
+
+
+class LookupCache:
+    """Memory cache in front of an optional sqlite store, with refresh-ahead and coalescing.
+
+    Values must be JSON-serializable; callers cache the decoded Paystack response.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl: float,
+        store: Optional[SqliteLookupStore] = None,
+        refresh_after: float = PAYSTACK_CACHE_REFRESH_AFTER,
+        max_entries: int = 10_000,
+    ) -> None:
+        """Initialize an empty cache; `refresh_after` is a fraction of `ttl`."""
+        self.name = name
+        self.ttl = ttl
+        self.store = store
+        self.refresh_after = refresh_after
+        self.max_entries = max_entries
+        self._entries: Dict[str, Entry] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._refreshes: Set[asyncio.Task] = set()
+
+    async def get(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value for `key`, calling `fetch` on a miss."""
+        now = time.time()
+        entry = self._entries.get(key)
+        if entry is not None and entry[2] > now:
+            value, stored, _ = entry
+            if now - stored >= self.ttl * self.refresh_after and key not in self._inflight:
+                PAYSTACK_CACHE_LOOKUPS.inc(cache=self.name, outcome="refresh")
+                task = asyncio.create_task(self._refresh(key, fetch))
+                self._refreshes.add(task)
+                task.add_done_callback(self._refreshes.discard)
+            else:
+                PAYSTACK_CACHE_LOOKUPS.inc(cache=self.name, outcome="hit")
+            return value
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            PAYSTACK_CACHE_LOOKUPS.inc(cache=self.name, outcome="hit")
+            return await asyncio.shield(inflight)
+        return await self._load(key, fetch, use_store=True)
+
+    async def _load(self, key: str, fetch: Callable[[], Awaitable[Any]], use_store: bool) -> Any:
+        """Load `key` once for every caller waiting on it: from the store, else from `fetch`."""
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            # Another worker, or this one before a restart, may have stored it.
+            entry = await self.store.get(key) if use_store and self.store is not None else None
+            if entry is not None:
+                PAYSTACK_CACHE_LOOKUPS.inc(cache=self.name, outcome="disk_hit")
+                value = entry[0]
+            else:
+                if use_store:
+                    PAYSTACK_CACHE_LOOKUPS.inc(cache=self.name, outcome="miss")
+                value = await fetch()
+                now = time.time()
+                entry = (value, now, now + self.ttl)
+                if self.store is not None:
+                    await self.store.set(key, entry)
+            self._remember(key, entry)
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Waiters re-raise it; don't warn when there are none.
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            if not future.done():
+                future.cancel()
+            del self._inflight[key]
+
+    async def _refresh(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> None:
+        """Reload an entry that is still valid; on failure it is served until it expires."""
+        try:
+            await self._load(key, fetch, use_store=False)
+        except Exception as e:
+            app_logger.warning(f"Refreshing {self.name} cache entry {key} failed: {e!r}")
+
+    def _remember(self, key: str, entry: Entry) -> None:
+        """Keep `entry` in memory, making room by dropping expired entries (or all of them)."""
+        if key not in self._entries and len(self._entries) >= self.max_entries:
+            now = time.time()
+            for stale in [k for k, (_, _, expires) in self._entries.items() if expires <= now]:
+                del self._entries[stale]
+            if len(self._entries) >= self.max_entries:
+                self._entries.clear()
+        self._entries[key] = entry
+
+    async def close(self) -> None:
+        """Wait for background refreshes to finish."""
+        if self._refreshes:
+            await asyncio.gather(*self._refreshes, return_exceptions=True)
+
+
+def create_lookup_store() -> Optional[SqliteLookupStore]:
+    """Sqlite store when configured, otherwise memory only."""
+    if PAYSTACK_CACHE_SQLITE_PATH:
+        return SqliteLookupStore(PAYSTACK_CACHE_SQLITE_PATH)
+    return None
+
+
+_store = create_lookup_store()
+bank_list_cache = LookupCache("banks", PAYSTACK_BANKS_CACHE_TTL_SECONDS, _store)
+account_name_cache = LookupCache("account_names", PAYSTACK_ACCOUNT_CACHE_TTL_SECONDS, _store)
+
+
+async def close_lookup_caches() -> None:
+    """Let background refreshes finish before the Paystack client is closed."""
+    await asyncio.gather(bank_list_cache.close(), account_name_cache.close())
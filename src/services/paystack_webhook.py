@@ -0,0 +1,47 @@
+"""Paystack webhook decoding: read the body once, check its signature, parse it once."""
+
+import hashlib
+import hmac
+from typing import Optional
+
+import orjson
+from pydantic import TypeAdapter, ValidationError
+from starlette.requests import Request
+
+from src.core.config import PAYSTACK_SECRET_KEY
+from src.errors.paystack import PaystackWebhookPayloadError, PaystackWebhookSignatureError
+from src.models.paystack.webhook import WebhookEvent
+
+_SECRET = PAYSTACK_SECRET_KEY.encode()
+
+# orjson then validate_python measured faster here than pydantic's own validate_json
+# (benchmarks/bench_webhook_decoding.py); either way the body is parsed once.
+_event_adapter = TypeAdapter(WebhookEvent)
+
+
+def verify_webhook_signature(body: bytes, signature: Optional[str]) -> bool:
+    """Check the x-paystack-signature header: the HMAC-SHA512 of the raw body."""
+    if not signature:
+        return False
+    expected = hmac.new(_SECRET, msg=body, digestmod=hashlib.sha512).hexdigest()
+    return hmac.compare_digest(expected, signature)
+
+
+def decode_webhook_event(body: bytes) -> Optional[WebhookEvent]:
+    """Parse a webhook body into its event model; None for events the app does not handle."""
+    try:
+        return _event_adapter.validate_python(orjson.loads(body))
+    except orjson.JSONDecodeError as e:
+        raise PaystackWebhookPayloadError() from e
+    except ValidationError as e:
+        if all(error["type"] == "union_tag_invalid" for error in e.errors()):
+            return None
+        raise PaystackWebhookPayloadError() from e
+
+
+async def read_webhook_event(request: Request) -> Optional[WebhookEvent]:
+    """Read, verify and decode a webhook request."""
+    body = await request.body()
+    if not verify_webhook_signature(body, request.headers.get("x-paystack-signature")):
+        raise PaystackWebhookSignatureError()
+    return decode_webhook_event(body)
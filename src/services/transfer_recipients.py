@@ -0,0 +1,195 @@
+"""Paystack transfer recipients for wallet payouts, created once per account and reused."""
+
+import logging
+from typing import Optional
+from uuid import UUID
+
+from src.db.repositories.transfer_recipients import TransferRecipientRepository
+from src.db.repositories.wallet_withdrawals import WalletWithdrawalRepository
+from src.enums.wallet_type import WalletType
+from src.enums.withdrawal_status import WithdrawalStatus
+from src.errors.core import ValueError
+from src.errors.paystack import PaystackError, PaystackInvalidTransferRecipientError
+from src.models.paystack.transfer import TransferRequest, TransferResponse
+from src.models.paystack.transfer_recipient import TransferRecipientCreate
+from src.models.transfer_recipients import (
+    PayoutAccountMixin,
+    TransferRecipientSave,
+    WalletWithdrawal,
+    WalletWithdrawalInDb,
+)
+from src.services.paystack import PaystackService
+from src.utils.money import format_cedis
+
+app_logger = logging.getLogger("app")
+
+
+def payout_recipient(wallet: PayoutAccountMixin) -> TransferRecipientCreate:
+    """The wallet's payout account as Paystack takes a transfer recipient."""
+    if not (
+        wallet.payout_recipient_type
+        and wallet.payout_account_number
+        and wallet.payout_bank_code
+        and wallet.payout_account_name
+    ):
+        raise ValueError("The wallet has no payout account")
+    return TransferRecipientCreate(
+        type=wallet.payout_recipient_type,
+        account_number=wallet.payout_account_number,
+        bank_code=wallet.payout_bank_code,
+        name=wallet.payout_account_name,
+    )
+
+
+async def get_recipient_code(
+    recipients: TransferRecipientRepository,
+    paystack_service: PaystackService,
+    *,
+    wallet_type: WalletType,
+    wallet_id: UUID,
+    recipient: TransferRecipientCreate,
+) -> str:
+    """Return the wallet's recipient code for the account, creating it on Paystack first if needed.
+
+    Two payouts racing to create the same recipient are harmless: Paystack answers a
+    repeat with the existing recipient and the save is an upsert.
+    """
+    saved = await recipients.get_recipient(
+        wallet_type=wallet_type,
+        wallet_id=wallet_id,
+        account_number=recipient.account_number,
+        bank_code=recipient.bank_code,
+    )
+    if saved is not None:
+        return saved.recipient_code
+
+    created = await paystack_service.create_transfer_recipient(recipient)
+    await recipients.save_recipient(
+        recipient=TransferRecipientSave(
+            wallet_type=wallet_type,
+            wallet_id=wallet_id,
+            account_number=recipient.account_number,
+            bank_code=recipient.bank_code,
+            recipient_type=recipient.type,
+            currency=recipient.currency,
+            account_name=created.data.details.account_name,
+            recipient_code=created.data.recipient_code,
+        )
+    )
+    return created.data.recipient_code
+
+
+async def pay_out(
+    recipients: TransferRecipientRepository,
+    paystack_service: PaystackService,
+    *,
+    wallet_type: WalletType,
+    wallet_id: UUID,
+    recipient: TransferRecipientCreate,
+    transfer_data: TransferRequest,
+) -> TransferResponse:
+    """Send a transfer from a wallet to its payout account.
+
+    With the recipient already registered this is one Paystack call. A recipient Paystack
+    no longer accepts is forgotten, created again and the transfer retried once.
+    """
+    recipient_code = await get_recipient_code(
+        recipients,
+        paystack_service,
+        wallet_type=wallet_type,
+        wallet_id=wallet_id,
+        recipient=recipient,
+    )
+    try:
+        return await paystack_service.initiate_transfer(recipient_code, transfer_data)
+    except PaystackInvalidTransferRecipientError:
+        app_logger.warning(
+            f"Paystack rejected recipient {recipient_code} of {wallet_type.value} {wallet_id}; "
+            "creating it again"
+        )
+        await recipients.invalidate(
+            wallet_type=wallet_type,
+            wallet_id=wallet_id,
+            account_number=recipient.account_number,
+            bank_code=recipient.bank_code,
+        )
+        recipient_code = await get_recipient_code(
+            recipients,
+            paystack_service,
+            wallet_type=wallet_type,
+            wallet_id=wallet_id,
+            recipient=recipient,
+        )
+        return await paystack_service.initiate_transfer(recipient_code, transfer_data)
+
+
+async def withdraw(
+    recipients: TransferRecipientRepository,
+    withdrawals: WalletWithdrawalRepository,
+    paystack_service: PaystackService,
+    *,
+    wallet_type: WalletType,
+    wallet_id: UUID,
+    recipient: TransferRecipientCreate,
+    withdrawal: WalletWithdrawal,
+) -> TransferResponse:
+    """Take a withdrawal off the wallet's balance and pay it out.
+
+    A transfer Paystack rejects is refunded at once. After a timeout or a 5xx the money
+    may have left, so the wallet stays debited until the transfer's webhook says otherwise.
+    """
+    started = await withdrawals.start(
+        wallet_type=wallet_type,
+        wallet_id=wallet_id,
+        amount=withdrawal.amount,
+        reason=withdrawal.reason,
+    )
+    if started is None:
+        raise ValueError("The wallet balance is too low")
+    try:
+        return await pay_out(
+            recipients,
+            paystack_service,
+            wallet_type=wallet_type,
+            wallet_id=wallet_id,
+            recipient=recipient,
+            transfer_data=TransferRequest(
+                amount=withdrawal.amount, reason=withdrawal.reason, reference=started.reference
+            ),
+        )
+    except PaystackError as e:
+        if e.status_code < 500:
+            await withdrawals.refund(reference=started.reference, status=WithdrawalStatus.FAILED)
+            raise
+        app_logger.error(
+            f"Withdrawal {started.reference} of {withdrawal.amount} pesewas from "
+            f"{wallet_type.value} {wallet_id} may have been sent; the wallet stays debited: "
+            f"{e.message}"
+        )
+        raise
+    except Exception:
+        app_logger.exception(
+            f"Withdrawal {started.reference} of {withdrawal.amount} pesewas from "
+            f"{wallet_type.value} {wallet_id} may have been sent; the wallet stays debited"
+        )
+        raise
+
+
+async def settle_withdrawal(
+    withdrawals: WalletWithdrawalRepository, *, event: str, reference: str
+) -> Optional[WalletWithdrawalInDb]:
+    """Record the outcome of a transfer Paystack reported by webhook.
+
+    A failed or reversed transfer is refunded to its wallet once. Returns None for a
+    reference that is unknown or already settled.
+    """
+    if event == "transfer.success":
+        return await withdrawals.mark_succeeded(reference=reference)
+    status = WithdrawalStatus.REVERSED if event == "transfer.reversed" else WithdrawalStatus.FAILED
+    refunded = await withdrawals.refund(reference=reference, status=status)
+    if refunded is not None:
+        app_logger.warning(
+            f"Transfer {reference} {status.value}; {format_cedis(refunded.amount)} GHS put back on "
+            f"{refunded.wallet_type.value} {refunded.wallet_id}"
+        )
+    return refunded
@@ -0,0 +1,308 @@
+"""Rate limiting and duplicate suppression for USSD charge initiation."""
+
+import asyncio
+import json
+import math
+import os
+import sqlite3
+import tempfile
+import time
+from typing import Awaitable, Callable, Dict, Optional, Tuple, Union
+
+from src.core.config import (
+    USSD_DEDUP_WINDOW_SECONDS,
+    USSD_GUARD_SQLITE_PATH,
+    USSD_RATE_LIMIT_CAPACITY,
+    USSD_RATE_LIMIT_REFILL_SECONDS,
+    WEB_CONCURRENCY,
+    WORKER_MEMORY_MB,
+)
+from src.core.server import worker_count
+from src.errors.paystack import PaystackRateLimitError
+from src.models.paystack.charge import ChargeResponse
+from src.models.paystack.payment import CreateVotingUSSDPayment
+from src.utils.formatters import Formatters
+
+# Marker for a charge another worker has started but not finished.
+PENDING = "pending"
+
+# How long a duplicate waits for another worker's in-flight charge.
+PENDING_WAIT_SECONDS = 15.0
+PENDING_POLL_SECONDS = 0.2
+
+# Buckets kept in memory before the full ones are dropped.
+MAX_MEMORY_BUCKETS = 10_000
+
+ClaimState = Union[None, str, dict]
+
+
+def rate_limit_key(create_payment: CreateVotingUSSDPayment) -> str:
+    """Token bucket key: phone number and school."""
+    phone = Formatters.format_ghanaian_number_with_plus(create_payment.phone_number)
+    return f"{phone}:{create_payment.school_id}"
+
+
+def dedup_key(create_payment: CreateVotingUSSDPayment) -> str:
+    """Duplicate request key: phone number, student and amount."""
+    phone = Formatters.format_ghanaian_number_with_plus(create_payment.phone_number)
+    student = " ".join(create_payment.student_name.lower().split())
+    return f"{phone}:{student}:{create_payment.amount}"
+
+
+class MemoryGuardStore:
+    """Guard state held in this process."""
+
+    def __init__(self) -> None:
+        """Initialize empty buckets and charges."""
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._charges: Dict[str, Tuple[float, Optional[dict]]] = {}
+
+    async def take_token(self, key: str, capacity: int, refill_seconds: float) -> float:
+        """Take a token; returns 0 when allowed, else seconds until the next token."""
+        now = time.monotonic()
+        tokens, updated = self._buckets.get(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - updated) / refill_seconds)
+        if tokens < 1:
+            self._buckets[key] = (tokens, now)
+            return (1 - tokens) * refill_seconds
+        self._buckets[key] = (tokens - 1, now)
+        if len(self._buckets) > MAX_MEMORY_BUCKETS:
+            self._evict_buckets(now, capacity, refill_seconds)
+        return 0
+
+    async def claim(self, key: str, window: float) -> ClaimState:
+        """Return the live charge for `key`, or mark it pending and return None."""
+        now = time.monotonic()
+        self._evict(now)
+        entry = self._charges.get(key)
+        if entry and entry[0] > now:
+            return entry[1] if entry[1] is not None else PENDING
+        self._charges[key] = (now + window, None)
+        return None
+
+    async def get(self, key: str) -> ClaimState:
+        """Return the live charge for `key` without claiming it."""
+        entry = self._charges.get(key)
+        if not entry or entry[0] <= time.monotonic():
+            return None
+        return entry[1] if entry[1] is not None else PENDING
+
+    async def complete(self, key: str, response: dict, window: float) -> None:
+        """Store the charge response for the rest of the window."""
+        self._charges[key] = (time.monotonic() + window, response)
+
+    async def release(self, key: str) -> None:
+        """Forget a charge that failed so it can be retried."""
+        self._charges.pop(key, None)
+
+    def _evict(self, now: float) -> None:
+        """Drop expired charges."""
+        for key in [k for k, (expires, _) in self._charges.items() if expires <= now]:
+            del self._charges[key]
+
+    def _evict_buckets(self, now: float, capacity: int, refill_seconds: float) -> None:
+        """Drop buckets that have refilled; a missing bucket starts full anyway."""
+        stale = now - capacity * refill_seconds
+        for key in [k for k, (_, updated) in self._buckets.items() if updated <= stale]:
+            del self._buckets[key]
+
+
+class SqliteGuardStore:
+    """Guard state in a sqlite file shared by the workers on one host.
+
+    Stands in for a shared store such as Redis; every operation is one short
+    IMMEDIATE transaction run off the event loop.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Create the tables if needed."""
+        self.path = path
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS ussd_buckets "
+                "(key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS ussd_charges "
+                "(key TEXT PRIMARY KEY, response TEXT, expires REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open an autocommit connection; transactions are explicit."""
+        return sqlite3.connect(self.path, timeout=5, isolation_level=None)
+
+    def _transaction(self, work: Callable[[sqlite3.Connection], object]) -> object:
+        """Run `work` in an IMMEDIATE transaction."""
+        connection = self._connect()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            result = work(connection)
+            connection.execute("COMMIT")
+            return result
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+        finally:
+            connection.close()
+
+    async def take_token(self, key: str, capacity: int, refill_seconds: float) -> float:
+        """Take a token; returns 0 when allowed, else seconds until the next token."""
+
+        def work(connection: sqlite3.Connection) -> float:
+            now = time.time()
+            row = connection.execute(
+                "SELECT tokens, updated FROM ussd_buckets WHERE key = ?", (key,)
+            ).fetchone()
+            tokens, updated = row if row else (capacity, now)
+            tokens = min(capacity, tokens + (now - updated) / refill_seconds)
+            wait = 0.0
+            if tokens < 1:
+                wait = (1 - tokens) * refill_seconds
+            else:
+                tokens -= 1
+            connection.execute(
+                "INSERT OR REPLACE INTO ussd_buckets (key, tokens, updated) VALUES (?, ?, ?)",
+                (key, tokens, now),
+            )
+            return wait
+
+        return await asyncio.to_thread(self._transaction, work)
+
+    async def claim(self, key: str, window: float) -> ClaimState:
+        """Return the live charge for `key`, or mark it pending and return None."""
+
+        def work(connection: sqlite3.Connection) -> ClaimState:
+            now = time.time()
+            connection.execute("DELETE FROM ussd_charges WHERE expires <= ?", (now,))
+            row = connection.execute(
+                "SELECT response FROM ussd_charges WHERE key = ?", (key,)
+            ).fetchone()
+            if row:
+                return json.loads(row[0]) if row[0] else PENDING
+            connection.execute(
+                "INSERT INTO ussd_charges (key, response, expires) VALUES (?, NULL, ?)",
+                (key, now + window),
+            )
+            return None
+
+        return await asyncio.to_thread(self._transaction, work)
+
+    async def get(self, key: str) -> ClaimState:
+        """Return the live charge for `key` without claiming it."""
+
+        def work(connection: sqlite3.Connection) -> ClaimState:
+            row = connection.execute(
+                "SELECT response FROM ussd_charges WHERE key = ? AND expires > ?",
+                (key, time.time()),
+            ).fetchone()
+            if not row:
+                return None
+            return json.loads(row[0]) if row[0] else PENDING
+
+        return await asyncio.to_thread(self._transaction, work)
+
+    async def complete(self, key: str, response: dict, window: float) -> None:
+        """Store the charge response for the rest of the window."""
+        await asyncio.to_thread(
+            self._transaction,
+            lambda connection: connection.execute(
+                "INSERT OR REPLACE INTO ussd_charges (key, response, expires) VALUES (?, ?, ?)",
+                (key, json.dumps(response), time.time() + window),
+            ),
+        )
+
+    async def release(self, key: str) -> None:
+        """Forget a charge that failed so it can be retried."""
+        await asyncio.to_thread(
+            self._transaction,
+            lambda connection: connection.execute(
+                "DELETE FROM ussd_charges WHERE key = ?", (key,)
+            ),
+        )
+
+
+class UssdChargeGuard:
+    """Runs a USSD charge at most once per duplicate window and within the rate limit."""
+
+    def __init__(
+        self,
+        store: Union[MemoryGuardStore, SqliteGuardStore],
+        capacity: int = USSD_RATE_LIMIT_CAPACITY,
+        refill_seconds: float = USSD_RATE_LIMIT_REFILL_SECONDS,
+        window: float = USSD_DEDUP_WINDOW_SECONDS,
+    ) -> None:
+        """Initialize with a state store and limits."""
+        self.store = store
+        self.capacity = capacity
+        self.refill_seconds = refill_seconds
+        self.window = window
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    async def run(
+        self,
+        create_payment: CreateVotingUSSDPayment,
+        charge: Callable[[], Awaitable[ChargeResponse]],
+    ) -> ChargeResponse:
+        """Return the response of an identical recent charge, or run `charge`."""
+        key = dedup_key(create_payment)
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        state = await self.store.claim(key, self.window)
+        if state == PENDING:
+            return await self._wait_for(key)
+        if state is not None:
+            return ChargeResponse(**state)
+
+        wait = await self.store.take_token(
+            rate_limit_key(create_payment), self.capacity, self.refill_seconds
+        )
+        if wait:
+            await self.store.release(key)
+            raise PaystackRateLimitError(retry_after=math.ceil(wait))
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            response = await charge()
+        except Exception as e:
+            await self.store.release(key)
+            future.set_exception(e)
+            future.exception()  # Waiters re-raise it; don't warn when there are none.
+            raise
+        else:
+            await self.store.complete(key, response.model_dump(), self.window)
+            future.set_result(response)
+            return response
+        finally:
+            del self._inflight[key]
+
+    async def _wait_for(self, key: str) -> ChargeResponse:
+        """Wait for another worker to finish the identical charge."""
+        deadline = time.monotonic() + PENDING_WAIT_SECONDS
+        while time.monotonic() < deadline:
+            await asyncio.sleep(PENDING_POLL_SECONDS)
+            state = await self.store.get(key)
+            if state is None:
+                break
+            if state != PENDING:
+                return ChargeResponse(**state)
+        raise PaystackRateLimitError("This payment is already being processed.", retry_after=5)
+
+
+def create_guard_store() -> Union[MemoryGuardStore, SqliteGuardStore]:
+    """Sqlite store shared by the workers on this host; memory only with a single worker.
+
+    Per-process state would let each worker hand out its own tokens and run its own
+    copy of a duplicate charge.
+    """
+    if USSD_GUARD_SQLITE_PATH:
+        return SqliteGuardStore(USSD_GUARD_SQLITE_PATH)
+    if worker_count(WEB_CONCURRENCY, WORKER_MEMORY_MB) > 1:
+        return SqliteGuardStore(os.path.join(tempfile.gettempdir(), "shsportal-ussd-guard.db"))
+    return MemoryGuardStore()
+
+
+ussd_charge_guard = UssdChargeGuard(create_guard_store())
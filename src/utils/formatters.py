@@ -7,6 +7,8 @@ import secrets
 
 from fastapi import UploadFile
 
+from src.utils.phone_numbers import parse_ghana_number
+
 
 class Formatters:
     """Formatters class"""
@@ -14,6 +16,9 @@ class Formatters:
     @staticmethod
     def format_ghanaian_number_with_plus(phone_number: str) -> str:
         """Format Ghanaian phone number."""
+        parsed = parse_ghana_number(phone_number)
+        if parsed:
+            return parsed.e164
         if phone_number.startswith("+233"):
             return phone_number
         elif len(phone_number) == 9:
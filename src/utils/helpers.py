@@ -1,13 +1,12 @@
 """Helper functions for the project"""
 
 import random
-import re
 import secrets
-import time
-import uuid
 from datetime import datetime
 from typing import Any, Dict, Optional
 
+from src.utils.ids import new_id, uuid7
+
 
 
 class Helpers:
@@ -15,8 +14,8 @@ class Helpers:
 
     @staticmethod
     async def generate_uuid() -> str:
-        """Generate uuid for user id."""
-        return str(uuid.uuid4())
+        """Generate a time-ordered uuid for a new id or reference."""
+        return new_id()
 
     @staticmethod
     async def generate_urlsafe_token() -> str:
@@ -24,15 +23,9 @@ class Helpers:
         return secrets.token_urlsafe()
 
     @staticmethod
-    def generate_transaction_id(phone_number: str, nominee_id: uuid.UUID) -> str:
-        """Create a unique input string by combining the email and telegram ID."""
-        current_time = str(time.time())
-        unique_input = f"{phone_number}-{nominee_id}-{current_time}"
-        namespace = uuid.NAMESPACE_OID
-        unique_hash = uuid.uuid5(namespace, unique_input).hex
-        allowed_id = re.sub(r"[^a-zA-Z0-9-.=]", "-", unique_hash)
-
-        return allowed_id
+    def generate_transaction_id() -> str:
+        """Create a payment reference: a UUIDv7 as 32 hex characters, which Paystack accepts."""
+        return uuid7().hex
 
     @staticmethod
     def generate_update_entity_query(
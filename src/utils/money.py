@@ -0,0 +1,68 @@
+"""Money helpers shared by charges and settlement.
+
+Amounts are whole pesewas (`int`) everywhere inside the service: in models, in the BIGINT
+money columns and in Paystack payloads, which take the lowest currency unit. Cedis only
+appear at the API edge, where request bodies give amounts in cedis (`CedisAmount`) and
+responses render pesewas as cedi strings such as "10.05".
+"""
+
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+from typing import Any, Tuple
+
+from pydantic import BeforeValidator, PlainSerializer, WithJsonSchema
+from typing_extensions import Annotated
+
+PESEWAS_PER_CEDI = 100
+
+# The only currency charges are taken in.
+CURRENCY = "GHS"
+
+# The platform's share of every payment, in basis points; the school gets the rest.
+ADMIN_SHARE_BASIS_POINTS = 2_000
+
+
+def to_pesewas(cedis: Any) -> int:
+    """Convert a cedi amount (number or numeric string) to pesewas, rounding half up."""
+    try:
+        # Through str so a float keeps the digits it prints with: 10.05 -> 1005, not 1004.
+        amount = Decimal(str(cedis))
+    except InvalidOperation:
+        raise ValueError(f"Invalid amount: {cedis!r}") from None
+    if isinstance(cedis, bool) or not amount.is_finite():
+        raise ValueError(f"Invalid amount: {cedis!r}")
+    return int((amount * PESEWAS_PER_CEDI).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+def to_cedis(pesewas: int) -> Decimal:
+    """Pesewas as cedis with two places, e.g. 1005 -> Decimal("10.05")."""
+    return Decimal(pesewas).scaleb(-2)
+
+
+def format_cedis(pesewas: int) -> str:
+    """Pesewas as a cedi string, e.g. 1005 -> "10.05"."""
+    return str(to_cedis(pesewas))
+
+
+def split_payment(total: int) -> Tuple[int, int]:
+    """Split a payment in pesewas into (school_amount, admin_amount), summing to `total`.
+
+    The admin share is rounded half up to the pesewa and the school gets the remainder.
+    """
+    admin_amount = (total * ADMIN_SHARE_BASIS_POINTS + 5_000) // 10_000
+    return total - admin_amount, admin_amount
+
+
+# An amount held in pesewas and rendered in JSON as cedis.
+Pesewas = Annotated[
+    int,
+    PlainSerializer(format_cedis, return_type=str, when_used="json"),
+    WithJsonSchema({"type": "string", "examples": ["10.05"]}, mode="serialization"),
+]
+
+# An amount given in cedis by an API client, held in pesewas once validated.
+CedisAmount = Annotated[
+    int,
+    BeforeValidator(to_pesewas),
+    PlainSerializer(format_cedis, return_type=str, when_used="json"),
+    WithJsonSchema({"anyOf": [{"type": "number"}, {"type": "string"}], "examples": ["10.05"]}),
+]
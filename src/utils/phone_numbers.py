@@ -0,0 +1,74 @@
+"""Ghana phone number normalization, validation and provider detection."""
+
+import re
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+from src.enums.network_provider import NetworkProvider
+
+# Mobile prefixes (the two digits after the trunk 0 or +233) and their mobile money provider.
+PROVIDER_PREFIXES = {
+    "24": NetworkProvider.MTN,
+    "25": NetworkProvider.MTN,
+    "53": NetworkProvider.MTN,
+    "54": NetworkProvider.MTN,
+    "55": NetworkProvider.MTN,
+    "59": NetworkProvider.MTN,
+    "20": NetworkProvider.VODAFONE,
+    "50": NetworkProvider.VODAFONE,
+    "23": NetworkProvider.AIRTEL,
+    "26": NetworkProvider.AIRTEL,
+    "27": NetworkProvider.AIRTEL,
+    "56": NetworkProvider.AIRTEL,
+    "57": NetworkProvider.AIRTEL,
+}
+
+# The mobile ranges of phonenumbers' GH metadata. Numbers in any other shape (other
+# international prefixes, landlines, typos) go through phonenumbers itself.
+_FAST_PATH = re.compile(r"(?:\+?233|0)?((?:2[0346-9]\d|25[67]|5[03-7]\d|59[1-9])\d{6})")
+_SEPARATORS = re.compile(r"[\s\-().]")
+
+CACHE_SIZE = 65536
+
+
+class GhanaPhoneNumber(NamedTuple):
+    """A valid Ghana phone number."""
+
+    e164: str
+    provider: Optional[NetworkProvider]
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_ghana_number(phone_number: str) -> Optional[GhanaPhoneNumber]:
+    """Normalize and validate a Ghana mobile number; None when it is not one."""
+    cleaned = _SEPARATORS.sub("", phone_number)
+    match = _FAST_PATH.fullmatch(cleaned)
+    if match:
+        national = match.group(1)
+        return GhanaPhoneNumber("+233" + national, PROVIDER_PREFIXES.get(national[:2]))
+    return _parse_slow(cleaned)
+
+
+def _parse_slow(phone_number: str) -> Optional[GhanaPhoneNumber]:
+    """Validate with phonenumbers' metadata; imported on first use."""
+    import phonenumbers
+
+    try:
+        parsed = phonenumbers.parse(phone_number, "GH")
+    except phonenumbers.NumberParseException:
+        return None
+    # Region and number type stand in for the geocoder, whose data takes ~0.4 s to import.
+    if (
+        not phonenumbers.is_valid_number(parsed)
+        or phonenumbers.region_code_for_number(parsed) != "GH"
+        or phonenumbers.number_type(parsed) != phonenumbers.PhoneNumberType.MOBILE
+    ):
+        return None
+    national = str(parsed.national_number)
+    return GhanaPhoneNumber("+233" + national, PROVIDER_PREFIXES.get(national[:2]))
+
+
+def detect_provider(phone_number: str) -> Optional[NetworkProvider]:
+    """Mobile money provider of a Ghana number, if known."""
+    parsed = parse_ghana_number(phone_number)
+    return parsed.provider if parsed else None
@@ -72,7 +72,7 @@ def create_schools_table():
             id TEXT PRIMARY KEY,
             name TEXT NOT NULL,
             location TEXT NOT NULL,
-            registration_fee REAL DEFAULT 0.00,
+            registration_fee INTEGER DEFAULT 0,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
     ''')
@@ -83,8 +83,8 @@ def create_schools_table():
         INSERT INTO schools (id, name, location, registration_fee, created_at)
         VALUES (?, ?, ?, ?, ?)
     ''', [
-        ("0f85a9b0-f3da-41e6-9b3b-9a0cdb29fbbb", "Springfield High School", "Accra", 50.00, datetime.now()),
-        ("1f45c3a2-c1b8-4e19-9b5d-529b0a7187cb", "Riverbank Academy", "Kumasi", 30.00, datetime.now())
+        ("0f85a9b0-f3da-41e6-9b3b-9a0cdb29fbbb", "Springfield High School", "Accra", 5000, datetime.now()),
+        ("1f45c3a2-c1b8-4e19-9b5d-529b0a7187cb", "Riverbank Academy", "Kumasi", 3000, datetime.now())
     ])
     conn.commit()
 
@@ -2,9 +2,9 @@
 
 import os
 
-import phonenumbers
 import validators
-from phonenumbers import NumberParseException, geocoder
+
+from src.utils.phone_numbers import parse_ghana_number
 
 
 class Validators:
@@ -22,18 +22,8 @@ class Validators:
 
     @staticmethod
     def is_valid_phonenumber(phone_number: str) -> bool:
-        """Validate a phone number."""
-        try:
-            parsed_number = phonenumbers.parse(phone_number, "GH")
-            if not phonenumbers.is_valid_number(parsed_number):
-                return False
-
-            if geocoder.description_for_number(parsed_number, "en") != "Ghana":
-                return False
-
-            return True
-        except NumberParseException:
-            return False
+        """Validate a Ghana phone number."""
+        return parse_ghana_number(phone_number) is not None
 
     @staticmethod
     def is_image_file(file_path: str) -> bool:
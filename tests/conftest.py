@@ -0,0 +1,57 @@
+"""Shared fixtures: sqlite databases standing in for postgres."""
+
+import os
+import pathlib
+import shutil
+import subprocess
+import sys
+from typing import AsyncIterator, Callable
+
+import pytest
+import pytest_asyncio
+from databases import Database
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture(scope="session")
+def migrated_sqlite(tmp_path_factory) -> pathlib.Path:
+    """A sqlite file with every migration applied, built once per session."""
+    path = tmp_path_factory.mktemp("schema") / "schema.db"
+    subprocess.run(
+        [sys.executable, "-m", "alembic", "upgrade", "head"],
+        cwd=ROOT,
+        env={**os.environ, "DATABASE_URL": f"sqlite:///{path}"},
+        check=True,
+        capture_output=True,
+    )
+    return path
+
+
+@pytest.fixture
+def sqlite_url(tmp_path) -> Callable[[str], str]:
+    """Build the url of a sqlite file in the test's temporary directory."""
+    return lambda name: f"sqlite:///{tmp_path / name}.db"
+
+
+@pytest_asyncio.fixture
+async def connect(sqlite_url) -> AsyncIterator[Callable]:
+    """Connect to sqlite databases by name; they are disconnected after the test."""
+    databases = []
+
+    async def open_database(name: str) -> Database:
+        database = Database(sqlite_url(name))
+        await database.connect()
+        databases.append(database)
+        return database
+
+    yield open_database
+    for database in databases:
+        await database.disconnect()
+
+
+@pytest_asyncio.fixture
+async def db(connect, migrated_sqlite, tmp_path) -> Database:
+    """A connected copy of the migrated sqlite database."""
+    shutil.copy(migrated_sqlite, tmp_path / "app.db")
+    return await connect("app")
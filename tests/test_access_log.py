@@ -0,0 +1,49 @@
+"""Tests for the access log middleware."""
+
+import logging
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+from src.api.access_log import AccessLogMiddleware
+
+
+def create_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/readyz")
+    async def readyz():
+        return JSONResponse({"status": "warming_up"}, status_code=503)
+
+    @app.get("/broken")
+    async def broken():
+        return JSONResponse({"detail": "down"}, status_code=503)
+
+    # Log nothing by sampling, so only the requests that must be logged are.
+    return AccessLogMiddleware(app, sample_rate=0.0)
+
+
+async def get(path: str) -> httpx.Response:
+    transport = httpx.ASGITransport(app=create_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(path)
+
+
+@pytest.mark.asyncio
+async def test_server_errors_are_logged_as_errors(caplog):
+    with caplog.at_level(logging.INFO, logger="request"):
+        response = await get("/broken")
+
+    assert response.status_code == 503
+    assert [record.levelno for record in caplog.records] == [logging.ERROR]
+
+
+@pytest.mark.asyncio
+async def test_probe_503_while_warming_up_is_not_an_error(caplog):
+    with caplog.at_level(logging.INFO, logger="request"):
+        response = await get("/readyz")
+
+    assert response.status_code == 503
+    assert caplog.records == []
@@ -0,0 +1,160 @@
+"""Tests for routing repository queries between the primary and a read replica."""
+
+import httpx
+import pytest
+import pytest_asyncio
+from databases import Database
+from fastapi import Depends, FastAPI
+
+from src.api.dependencies.database import get_database_router, get_repository
+from src.db.repositories.base import BaseRepository
+from src.db.router import DatabaseRouter
+from src.decorators.db import handle_get_database_exceptions
+from src.errors.core import InternalServerError
+
+CREATE_ITEMS_QUERY = "CREATE TABLE items (name TEXT NOT NULL)"
+ADD_ITEM_QUERY = "INSERT INTO items (name) VALUES (:name)"
+GET_ITEMS_QUERY = "SELECT name FROM items ORDER BY name"
+
+
+class ItemRepository(BaseRepository):
+    """A repository with one routed read, one unrouted read and a write."""
+
+    @handle_get_database_exceptions("Item")
+    async def get_items(self) -> list:
+        return [row["name"] for row in await self._fetch_all(query=GET_ITEMS_QUERY)]
+
+    async def get_items_from_primary(self) -> list:
+        return [row["name"] for row in await self._fetch_all(query=GET_ITEMS_QUERY)]
+
+    async def add_item(self, *, name: str) -> None:
+        await self.db.execute(query=ADD_ITEM_QUERY, values={"name": name})
+
+
+async def create_items(database: Database, name: str) -> Database:
+    """Create the items table holding one row named after the database."""
+    await database.execute(query=CREATE_ITEMS_QUERY)
+    await database.execute(query=ADD_ITEM_QUERY, values={"name": name})
+    return database
+
+
+@pytest_asyncio.fixture
+async def primary(connect) -> Database:
+    return await create_items(await connect("primary"), "primary")
+
+
+@pytest_asyncio.fixture
+async def replica(connect) -> Database:
+    return await create_items(await connect("replica"), "replica")
+
+
+@pytest.mark.asyncio
+async def test_decorated_read_goes_to_replica(primary, replica):
+    repo = ItemRepository(DatabaseRouter(primary, replica))
+
+    assert await repo.get_items() == ["replica"]
+
+
+@pytest.mark.asyncio
+async def test_undecorated_read_stays_on_primary(primary, replica):
+    repo = ItemRepository(DatabaseRouter(primary, replica))
+
+    assert await repo.get_items_from_primary() == ["primary"]
+
+
+@pytest.mark.asyncio
+async def test_read_falls_back_to_primary_when_replica_is_unreachable(
+    primary, replica, monkeypatch
+):
+    async def unreachable(*args, **kwargs):
+        raise ConnectionRefusedError("replica is down")
+
+    monkeypatch.setattr(replica, "fetch_all", unreachable)
+    repo = ItemRepository(DatabaseRouter(primary, replica))
+
+    assert await repo.get_items() == ["primary"]
+
+
+@pytest.mark.asyncio
+async def test_replica_query_errors_are_not_retried(primary, replica):
+    await replica.execute(query="DROP TABLE items")
+    repo = ItemRepository(DatabaseRouter(primary, replica))
+
+    with pytest.raises(InternalServerError):
+        await repo.get_items()
+
+
+@pytest.mark.asyncio
+async def test_reads_after_a_write_stay_on_primary(primary, replica):
+    repo = ItemRepository(DatabaseRouter(primary, replica))
+
+    await repo.add_item(name="new")
+
+    assert await repo.get_items() == ["new", "primary"]
+
+
+@pytest.mark.asyncio
+async def test_reads_after_a_transaction_stay_on_primary(primary, replica):
+    router = DatabaseRouter(primary, replica)
+
+    async with router.transaction():
+        pass
+
+    assert await ItemRepository(router).get_items() == ["primary"]
+
+
+def create_app(primary: Database, replica: Database = None) -> FastAPI:
+    """An app whose routes use the database dependencies like the real routers."""
+    app = FastAPI()
+    app.state._db = primary
+    app.state._replica_db = replica
+
+    @app.get("/items")
+    async def get_items(repo: ItemRepository = Depends(get_repository(ItemRepository))):
+        return await repo.get_items()
+
+    @app.post("/items")
+    async def add_item(
+        writer: ItemRepository = Depends(get_repository(ItemRepository)),
+        reader: ItemRepository = Depends(get_repository(ItemRepository)),
+    ):
+        await writer.add_item(name="new")
+        return await reader.get_items()
+
+    @app.get("/router")
+    async def get_router(db=Depends(get_database_router)):
+        return type(db).__name__
+
+    return app
+
+
+async def request(app: FastAPI, method: str, path: str) -> httpx.Response:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.request(method, path)
+
+
+@pytest.mark.asyncio
+async def test_request_reads_from_replica(primary, replica):
+    response = await request(create_app(primary, replica), "GET", "/items")
+
+    assert response.json() == ["replica"]
+
+
+@pytest.mark.asyncio
+async def test_request_reads_its_own_writes(primary, replica):
+    app = create_app(primary, replica)
+
+    response = await request(app, "POST", "/items")
+
+    assert response.json() == ["new", "primary"]
+    # The next request starts with a fresh router and reads from the replica again.
+    assert (await request(app, "GET", "/items")).json() == ["replica"]
+
+
+@pytest.mark.asyncio
+async def test_primary_is_used_without_a_replica(primary):
+    app = create_app(primary)
+
+    assert (await request(app, "GET", "/router")).json() == "Database"
+    assert (await request(app, "GET", "/items")).json() == ["primary"]
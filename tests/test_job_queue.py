@@ -0,0 +1,201 @@
+"""Tests for the database-backed job queue and its workers, on sqlite."""
+
+from datetime import timedelta
+
+import pytest
+from databases import Database
+from fastapi import FastAPI
+
+from src.core.config import JOB_RETRY_BASE_SECONDS, JOB_RETRY_MAX_SECONDS
+from src.core.job_queue import JobWorkers, enqueue_job, retry_delay
+from src.db.repositories.base import utc_now
+from src.db.repositories.jobs import JobRepository
+from src.enums.job_status import JobStatus
+
+VISIBILITY_TIMEOUT = 30.0
+
+
+def create_workers(db: Database) -> JobWorkers:
+    app = FastAPI()
+    app.state._db = db
+    return JobWorkers(
+        app,
+        concurrency=1,
+        poll_interval=0.01,
+        visibility_timeout=VISIBILITY_TIMEOUT,
+        shutdown_grace=0.1,
+    )
+
+
+async def expire_lease(db: Database, job_id) -> None:
+    """Make a running job's lease run out, as if its worker died."""
+    await db.execute(
+        query="UPDATE jobs SET locked_until = :past WHERE id = :id",
+        values={"past": utc_now() - timedelta(seconds=1), "id": str(job_id)},
+    )
+
+
+async def make_due(db: Database, job_id) -> None:
+    """Skip the retry delay of a queued job."""
+    await db.execute(
+        query="UPDATE jobs SET run_at = :past WHERE id = :id",
+        values={"past": utc_now() - timedelta(seconds=1), "id": str(job_id)},
+    )
+
+
+async def claim(repository: JobRepository, worker_id: str, limit: int = 10) -> list:
+    return await repository.claim(
+        worker_id=worker_id, visibility_timeout=VISIBILITY_TIMEOUT, limit=limit
+    )
+
+
+def test_retry_delay_doubles_up_to_the_cap():
+    assert retry_delay(1) == JOB_RETRY_BASE_SECONDS
+    assert retry_delay(2) == 2 * JOB_RETRY_BASE_SECONDS
+    assert retry_delay(3) == 4 * JOB_RETRY_BASE_SECONDS
+    assert retry_delay(100) == JOB_RETRY_MAX_SECONDS
+
+
+@pytest.mark.asyncio
+async def test_claim_takes_due_jobs_best_first(db):
+    repository = JobRepository(db)
+    low = await enqueue_job(db, "low")
+    high = await enqueue_job(db, "high", priority=10)
+    await enqueue_job(db, "later", run_at=utc_now() + timedelta(hours=1))
+
+    [first] = await claim(repository, "worker-1", limit=1)
+    jobs = [first, *await claim(repository, "worker-1")]
+
+    assert [job.id for job in jobs] == [high.id, low.id]
+    assert all(job.status == JobStatus.RUNNING for job in jobs)
+    assert all(job.locked_by == "worker-1" and job.attempts == 1 for job in jobs)
+
+
+@pytest.mark.asyncio
+async def test_claim_skips_jobs_leased_by_another_worker(db):
+    repository = JobRepository(db)
+    leased = await enqueue_job(db, "leased")
+    await claim(repository, "worker-1")
+    free = await enqueue_job(db, "free")
+
+    jobs = await claim(repository, "worker-2")
+
+    assert [job.id for job in jobs] == [free.id]
+    assert (await repository.get_job(id=leased.id)).locked_by == "worker-1"
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_is_claimed_again(db):
+    repository = JobRepository(db)
+    job = await enqueue_job(db, "job")
+    await claim(repository, "worker-1")
+    await expire_lease(db, job.id)
+
+    [reclaimed] = await claim(repository, "worker-2")
+
+    assert reclaimed.id == job.id
+    assert reclaimed.locked_by == "worker-2"
+    assert reclaimed.attempts == 2
+    # The first worker lost the job and can no longer record it.
+    assert not await repository.renew_lease(
+        id=job.id, worker_id="worker-1", visibility_timeout=VISIBILITY_TIMEOUT
+    )
+    assert not await repository.complete(id=job.id, worker_id="worker-1")
+    assert await repository.complete(id=job.id, worker_id="worker-2", result={"ok": True})
+    assert (await repository.get_job(id=job.id)).status == JobStatus.SUCCEEDED
+
+
+@pytest.mark.asyncio
+async def test_release_does_not_count_the_attempt(db):
+    repository = JobRepository(db)
+    job = await enqueue_job(db, "job")
+    await claim(repository, "worker-1")
+
+    assert await repository.release(id=job.id, worker_id="worker-1")
+
+    [reclaimed] = await claim(repository, "worker-2")
+    assert reclaimed.attempts == 1
+
+
+@pytest.mark.asyncio
+async def test_failing_job_backs_off_until_it_fails_for_good(db):
+    repository = JobRepository(db)
+    workers = create_workers(db)
+    calls = []
+
+    async def flaky(app, payload):
+        calls.append(payload)
+        raise RuntimeError("upstream is down")
+
+    workers.add_handler("flaky", flaky)
+    job = await enqueue_job(db, "flaky", {"n": 1}, max_attempts=3)
+
+    for attempt in (1, 2):
+        before = utc_now()
+        [claimed] = await claim(repository, "worker-1")
+        await workers._process(repository, "worker-1", claimed)
+
+        retrying = await repository.get_job(id=job.id)
+        assert retrying.status == JobStatus.QUEUED
+        assert retrying.attempts == attempt
+        assert "upstream is down" in retrying.last_error
+        delay = (retrying.run_at - before).total_seconds()
+        assert retry_delay(attempt) <= delay < retry_delay(attempt) + 5
+        assert await claim(repository, "worker-1") == []  # Not due before the delay
+        await make_due(db, job.id)
+
+    [claimed] = await claim(repository, "worker-1")
+    await workers._process(repository, "worker-1", claimed)
+
+    failed = await repository.get_job(id=job.id)
+    assert failed.status == JobStatus.FAILED
+    assert failed.attempts == 3
+    assert calls == [{"n": 1}] * 3
+    assert await claim(repository, "worker-1") == []
+
+
+@pytest.mark.asyncio
+async def test_job_whose_last_attempt_lost_its_lease_fails(db):
+    repository = JobRepository(db)
+    workers = create_workers(db)
+    calls = []
+
+    async def handler(app, payload):
+        calls.append(payload)
+
+    workers.add_handler("job", handler)
+    job = await enqueue_job(db, "job", max_attempts=1)
+    await claim(repository, "worker-1")
+    await expire_lease(db, job.id)
+
+    [reclaimed] = await claim(repository, "worker-2")
+    await workers._process(repository, "worker-2", reclaimed)
+
+    failed = await repository.get_job(id=job.id)
+    assert failed.status == JobStatus.FAILED
+    assert failed.last_error == "Lease expired on the last attempt"
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_workers_run_queued_jobs(db):
+    repository = JobRepository(db)
+    workers = create_workers(db)
+
+    async def double(app, payload):
+        return payload["n"] * 2
+
+    workers.add_handler("double", double)
+    job = await enqueue_job(db, "double", {"n": 21})
+    workers.start()
+    try:
+        for _ in range(200):
+            done = await repository.get_job(id=job.id)
+            if done.status == JobStatus.SUCCEEDED:
+                break
+            await workers._sleep(0.01)
+    finally:
+        await workers.stop()
+
+    assert done.status == JobStatus.SUCCEEDED
+    assert done.result == 42